@@ -0,0 +1,177 @@
+"""Prometheus-style instrumentation shared across the backend.
+
+- ``request_metrics_middleware`` times every HTTP request under its route
+  template (``/trades/leagues/{league_id}/submit-v2``, not the concrete
+  path), so label cardinality stays bounded.
+- ``instrument_engine`` counts and times SQL statements through engine
+  events and charges them to the request that issued them.
+- ``observe_stage`` times named stages of background work (live-scoring
+  ingest, scoring recalculation, SSE fan-out, Monte Carlo runs).
+
+``prometheus_client`` is optional. Without it every helper is a no-op and
+``render_metrics`` returns None, which the ``/metrics`` endpoint reports as
+503.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+except ImportError:  # pragma: no cover
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4"
+    Counter = None  # type: ignore[assignment]
+    Gauge = None  # type: ignore[assignment]
+    Histogram = None  # type: ignore[assignment]
+    generate_latest = None  # type: ignore[assignment]
+
+
+PROMETHEUS_ENABLED = Counter is not None and Histogram is not None and generate_latest is not None
+
+UNMATCHED_ROUTE = "unmatched"
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+_STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+_QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250, 500)
+
+if PROMETHEUS_ENABLED:
+    HTTP_REQUESTS_TOTAL = Counter(
+        "ffpi_http_requests_total",
+        "HTTP requests by method, route template and status code.",
+        ["method", "route", "status"],
+    )
+    HTTP_REQUEST_LATENCY_SECONDS = Histogram(
+        "ffpi_http_request_latency_seconds",
+        "HTTP request latency in seconds by method and route template.",
+        ["method", "route"],
+        buckets=_LATENCY_BUCKETS,
+    )
+    DB_QUERIES_PER_REQUEST = Histogram(
+        "ffpi_db_queries_per_request",
+        "SQL statements executed per HTTP request.",
+        ["method", "route"],
+        buckets=_QUERY_COUNT_BUCKETS,
+    )
+    DB_QUERY_SECONDS_PER_REQUEST = Histogram(
+        "ffpi_db_query_seconds_per_request",
+        "Time spent executing SQL per HTTP request, in seconds.",
+        ["method", "route"],
+        buckets=_LATENCY_BUCKETS,
+    )
+    DB_QUERIES_TOTAL = Counter(
+        "ffpi_db_queries_total",
+        "SQL statements executed, inside or outside of requests.",
+    )
+    STAGE_LATENCY_SECONDS = Histogram(
+        "ffpi_stage_latency_seconds",
+        "Latency of instrumented background stages in seconds.",
+        ["stage", "outcome"],
+        buckets=_STAGE_BUCKETS,
+    )
+    SSE_CLIENTS = Gauge(
+        "ffpi_sse_clients",
+        "Connected live-scoring SSE clients.",
+    )
+
+
+# Query totals for the request running in this context. The middleware sets
+# a fresh dict per request; engine events run in the worker thread that
+# executes the endpoint, which inherits this context, and add to that dict.
+_REQUEST_DB_STATS: ContextVar[dict[str, float] | None] = ContextVar("request_db_stats", default=None)
+_INSTRUMENTED_ENGINES: set[int] = set()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("metrics_query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.get("metrics_query_started_at")
+    elapsed = time.perf_counter() - started.pop() if started else 0.0
+    stats = _REQUEST_DB_STATS.get()
+    if stats is not None:
+        stats["queries"] += 1
+        stats["seconds"] += elapsed
+    if PROMETHEUS_ENABLED:
+        DB_QUERIES_TOTAL.inc()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach query count/time listeners to ``engine`` (once per engine)."""
+    if id(engine) in _INSTRUMENTED_ENGINES:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    _INSTRUMENTED_ENGINES.add(id(engine))
+
+
+def current_request_db_stats() -> dict[str, float] | None:
+    """Query count and seconds so far for the current request, if any."""
+    stats = _REQUEST_DB_STATS.get()
+    return dict(stats) if stats is not None else None
+
+
+def route_template(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+async def request_metrics_middleware(request, call_next):
+    """Record latency, status and SQL totals per route template."""
+    stats = {"queries": 0, "seconds": 0.0}
+    token = _REQUEST_DB_STATS.set(stats)
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - started
+        _REQUEST_DB_STATS.reset(token)
+        if PROMETHEUS_ENABLED:
+            method = request.method.upper()
+            route = route_template(request.scope)
+            HTTP_REQUESTS_TOTAL.labels(method=method, route=route, status=str(status_code)).inc()
+            HTTP_REQUEST_LATENCY_SECONDS.labels(method=method, route=route).observe(elapsed)
+            DB_QUERIES_PER_REQUEST.labels(method=method, route=route).observe(stats["queries"])
+            DB_QUERY_SECONDS_PER_REQUEST.labels(method=method, route=route).observe(stats["seconds"])
+
+
+def record_stage_latency(stage: str, seconds: float, *, outcome: str = "ok") -> None:
+    if PROMETHEUS_ENABLED:
+        STAGE_LATENCY_SECONDS.labels(stage=stage, outcome=outcome).observe(max(0.0, seconds))
+
+
+@contextmanager
+def observe_stage(stage: str) -> Iterator[None]:
+    """Time the enclosed block as ``stage``; exceptions are recorded as errors.
+
+    Usable as a decorator as well as a ``with`` block.
+    """
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        record_stage_latency(stage, time.perf_counter() - started, outcome=outcome)
+
+
+def set_sse_client_count(count: int) -> None:
+    if PROMETHEUS_ENABLED:
+        SSE_CLIENTS.set(count)
+
+
+def render_metrics() -> tuple[bytes, str] | None:
+    """Exposition payload and content type, or None without prometheus_client."""
+    if not PROMETHEUS_ENABLED:
+        return None
+    return generate_latest(), CONTENT_TYPE_LATEST
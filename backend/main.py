@@ -1,3 +1,4 @@
+import hmac
 import os
 import sys
 import logging
@@ -24,6 +25,7 @@ if __name__ == "__main__" or __package__ in (None, ""):
     models = importlib.import_module("backend.models")
     dbmod = importlib.import_module("backend.database")
     secmod = importlib.import_module("backend.core.security")
+    metrics = importlib.import_module("backend.core.metrics")
     # load routers package and each submodule explicitly
     routers_pkg = importlib.import_module("backend.routers")
     # the package itself may not yet have attributes for each router, so import
@@ -70,6 +72,7 @@ else:
     from . import models
     from .database import engine, SessionLocal
     from .core.security import get_password_hash, check_is_commissioner
+    from .core import metrics
     from .services import live_scoring_watchdog_service as watchdog_service
     from .services import live_scoring_polling_service as polling_service
     from .services import player_news_scheduler_service
@@ -420,6 +423,13 @@ async def add_security_headers(request, call_next):
 
     return response
 
+
+# --- 2b. METRICS ---
+# Registered last so it wraps every other middleware: latency and SQL totals
+# are recorded per route template for the whole request.
+metrics.instrument_engine(engine)
+app.middleware("http")(metrics.request_metrics_middleware)
+
 # --- 3. CONNECT ROUTERS ---
 # We remove 'prefix' here because your individual router files 
 # (e.g., auth.py, team.py) should define them internally.
@@ -498,4 +508,21 @@ def health_check(request: Request):
         return Response(status_code=200 if db_ok else 503)
     if db_ok:
         return payload
-    return JSONResponse(status_code=503, content=payload)
\ No newline at end of file
+    return JSONResponse(status_code=503, content=payload)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics_endpoint(request: Request):
+    # Scrapers do not carry user sessions; set METRICS_AUTH_TOKEN to require
+    # "Authorization: Bearer <token>" on this endpoint.
+    expected_token = os.getenv("METRICS_AUTH_TOKEN")
+    if expected_token and not hmac.compare_digest(
+        request.headers.get("Authorization", ""), f"Bearer {expected_token}"
+    ):
+        return JSONResponse(status_code=401, content={"detail": "Invalid metrics token"})
+
+    rendered = metrics.render_metrics()
+    if rendered is None:
+        return JSONResponse(status_code=503, content={"detail": "Prometheus exporter is unavailable in this runtime"})
+    content, media_type = rendered
+    return Response(content=content, media_type=media_type)
\ No newline at end of file
@@ -20,11 +20,14 @@ from .scripts.apply_mfl_draft_backfill_sheet import run_apply_mfl_draft_backfill
 from .scripts.extract_mfl_history import run_mfl_history_extract
 from .scripts.extract_mfl_html_reports import run_extract_mfl_html_reports
 from .scripts.finalize_week import run_finalization
+from .scripts.process_waivers import run_waiver_cycle
 from .scripts.import_mfl_csv import run_import_mfl_csv
 from .scripts.load_mfl_html_normalized import run_load_mfl_html_normalized
+from .scripts.mfl_html_pipeline import run_mfl_html_pipeline
 from .scripts.normalize_mfl_html_records import run_normalize_mfl_html_records
 from .scripts.prepare_mfl_draft_backfill_sheet import run_prepare_mfl_draft_backfill_sheet
 from .scripts.reconcile_mfl_import import run_reconcile_mfl_import
+from .scripts.replay_live_scoring import run_live_scoring_replay
 from .scripts.restore_mfl_archive import run_restore_mfl_archive
 from .scripts.resolve_mfl_draft_backfill_names import run_resolve_mfl_draft_backfill_names
 from .scripts.scaffold_mfl_manual_csv import run_scaffold_mfl_manual_csv
@@ -196,6 +199,25 @@ def audit_invalid_players(
     show_default=True,
     help="Cap for server-provided Retry-After delay.",
 )
+@click.option(
+    "--resume/--no-resume",
+    default=False,
+    show_default=True,
+    help="Keep a content-hash manifest and skip reports already extracted.",
+)
+@click.option(
+    "--refresh-from-season",
+    type=int,
+    default=None,
+    help="With --resume, seasons from this year on are always re-checked (default: current year).",
+)
+@click.option(
+    "--max-concurrency",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Concurrent report requests; all workers share one throttle.",
+)
 def extract_mfl_history(
     start_year: int,
     end_year: int,
@@ -211,6 +233,9 @@ def extract_mfl_history(
     cooldown_after_burst_seconds: float,
     burst_threshold: int,
     max_retry_after_seconds: float,
+    resume: bool,
+    refresh_from_season: int | None,
+    max_concurrency: int,
 ):
     """Extract MFL exports into normalized CSV files for migration."""
     report_type_list = [part.strip() for part in report_types.split(",") if part.strip()]
@@ -229,12 +254,16 @@ def extract_mfl_history(
         cooldown_after_burst_seconds=cooldown_after_burst_seconds,
         burst_threshold=burst_threshold,
         max_retry_after_seconds=max_retry_after_seconds,
+        resume=resume,
+        refresh_from_season=refresh_from_season,
+        max_concurrency=max_concurrency,
     )
 
     click.echo("MFL extraction summary")
     click.echo(f"- Seasons requested: {summary['requested_seasons'][0]}..{summary['requested_seasons'][-1]}")
     click.echo(f"- Reports extracted: {summary['extracted_reports']}")
     click.echo(f"- Seasons skipped (missing league id): {summary['skipped_missing_league_id']}")
+    click.echo(f"- Reports skipped (unchanged): {summary['skipped_unchanged_reports']}")
     click.echo(f"- Failed report pulls: {summary['failed_reports']}")
     click.echo(f"- Retry attempts: {summary['retry_attempts']}")
     click.echo(f"- Throttled retries: {summary['throttled_retries']}")
@@ -408,6 +437,225 @@ def load_mfl_html_normalized(
         click.echo(f"- Warnings: {len(summary['warnings'])}")
 
 
+@cli.command("mfl-html-pipeline")
+@click.option(
+    "--input-root",
+    type=click.Path(file_okay=False, dir_okay=True, exists=True),
+    required=True,
+    help="Output root of extract-mfl-html-reports.",
+)
+@click.option(
+    "--source-format",
+    type=click.Choice(["csv", "html"]),
+    default="csv",
+    show_default=True,
+    help="Parse the extracted per-report CSVs or re-parse the archived raw HTML.",
+)
+@click.option("--start-year", type=int, default=None, help="Optional first season year filter.")
+@click.option("--end-year", type=int, default=None, help="Optional last season year filter.")
+@click.option(
+    "--report-keys",
+    type=str,
+    default="league_champions,league_awards,franchise_records,player_records,matchup_records,all_time_series_records,season_records,career_records,record_streaks",
+    show_default=True,
+    help="Comma-separated report keys to parse.",
+)
+@click.option("--apply", "apply_changes", is_flag=True, default=False, help="Write rows (default is dry-run).")
+@click.option(
+    "--truncate-before-load",
+    is_flag=True,
+    default=False,
+    help="Delete existing mfl_html_record_facts rows before loading (apply mode only).",
+)
+@click.option("--target-league-id", type=int, default=None, help="App league_id to associate with fact rows.")
+@click.option("--max-workers", type=int, default=None, help="Parser processes (default: CPU count).")
+def mfl_html_pipeline(
+    input_root: str,
+    source_format: str,
+    start_year: int | None,
+    end_year: int | None,
+    report_keys: str,
+    apply_changes: bool,
+    truncate_before_load: bool,
+    target_league_id: int | None,
+    max_workers: int | None,
+):
+    """Parse, normalize and load MFL HTML record reports in one pass."""
+    if truncate_before_load and not apply_changes:
+        raise click.UsageError("--truncate-before-load requires --apply")
+
+    summary = run_mfl_html_pipeline(
+        input_root=input_root,
+        source_format=source_format,
+        start_year=start_year,
+        end_year=end_year,
+        report_keys=[part.strip() for part in report_keys.split(",") if part.strip()],
+        dry_run=not apply_changes,
+        truncate_before_load=truncate_before_load,
+        target_league_id=target_league_id,
+        max_workers=max_workers,
+    )
+
+    load = summary["load"]
+    click.echo("MFL HTML pipeline summary")
+    click.echo(f"- Mode: {'apply' if apply_changes else 'dry-run'}")
+    click.echo(f"- Source format: {summary['source_format']}")
+    click.echo(f"- Files parsed: {summary['files_parsed']}")
+    click.echo(f"- Files skipped: {summary['files_skipped']}")
+    click.echo(f"- Rows seen: {load['rows_seen']}")
+    click.echo(f"- Rows inserted: {load['rows_inserted']}")
+    click.echo(f"- Rows skipped (existing): {load['rows_skipped_existing']}")
+    if summary["warnings"]:
+        click.echo(f"- Warnings: {len(summary['warnings'])}")
+
+
+@cli.command("rebuild-mfl-history-read-model")
+@click.option(
+    "--dataset-key",
+    type=str,
+    default=None,
+    help="Only re-project one dataset (for example html_league_champions_normalized).",
+)
+def rebuild_mfl_history_read_model(dataset_key: str | None):
+    """Re-project mfl_html_record_facts into the typed history read model."""
+    from .services.league_history_record_service import rebuild_history_record_rows
+
+    db = SessionLocal()
+    try:
+        count = rebuild_history_record_rows(db, dataset_key=dataset_key)
+        db.commit()
+    finally:
+        db.close()
+    click.echo(f"Projected {count} history record rows ({dataset_key or 'all datasets'}).")
+
+
+@cli.command("rebuild-head-to-head")
+@click.option("--league-id", type=int, default=None, help="Only rebuild one league (default: every league).")
+def rebuild_head_to_head(league_id: int | None):
+    """Rebuild head-to-head season aggregates from completed matchups."""
+    from .services.head_to_head_service import refresh_head_to_head_aggregates
+
+    db = SessionLocal()
+    try:
+        league_ids = [league_id] if league_id is not None else [row.id for row in db.query(models.League.id).all()]
+        count = 0
+        for target_league_id in league_ids:
+            count += refresh_head_to_head_aggregates(db, league_id=target_league_id)
+        db.commit()
+    finally:
+        db.close()
+    click.echo(f"Rebuilt {count} head-to-head pair-season rows across {len(league_ids)} league(s).")
+
+
+@cli.command("rebuild-ownership-spans")
+@click.option("--league-id", type=int, default=None, help="Only rebuild one league (default: every league).")
+def rebuild_ownership_spans(league_id: int | None):
+    """Rebuild player ownership spans from transaction history."""
+    from .services.transaction_service import refresh_ownership_spans
+
+    db = SessionLocal()
+    try:
+        league_ids = [league_id] if league_id is not None else [row.id for row in db.query(models.League.id).all()]
+        count = 0
+        for target_league_id in league_ids:
+            count += refresh_ownership_spans(db, league_id=target_league_id)
+        db.commit()
+    finally:
+        db.close()
+    click.echo(f"Rebuilt {count} ownership spans across {len(league_ids)} league(s).")
+
+
+@cli.command("rebuild-ledger-balances")
+@click.option("--league-id", type=int, default=None, help="Only check one league (default: every league).")
+@click.option("--verify", is_flag=True, default=False, help="Report drift against the ledger without rebuilding.")
+@click.option("--json-output", is_flag=True, default=False, help="Print the per-league result as JSON.")
+def rebuild_ledger_balances(league_id: int | None, verify: bool, json_output: bool):
+    """Verify or rebuild materialized owner ledger balances from the ledger."""
+    from .services.ledger_service import rebuild_owner_ledger_balances, verify_owner_ledger_balances
+
+    db = SessionLocal()
+    results = []
+    try:
+        league_ids = [league_id] if league_id is not None else [row.id for row in db.query(models.League.id).all()]
+        for target_league_id in league_ids:
+            mismatches = verify_owner_ledger_balances(db, league_id=target_league_id)
+            result = {"league_id": target_league_id, "mismatches": mismatches, "rebuilt_rows": None}
+            if mismatches and not verify:
+                result["rebuilt_rows"] = rebuild_owner_ledger_balances(db, league_id=target_league_id)
+            results.append(result)
+        if not verify:
+            db.commit()
+    finally:
+        db.close()
+
+    if json_output:
+        click.echo(_json.dumps(results, indent=2))
+        return
+    drifted = [result for result in results if result["mismatches"]]
+    for result in drifted:
+        action = "reported" if verify else f"rebuilt {result['rebuilt_rows']} row(s)"
+        click.echo(f"League {result['league_id']}: {len(result['mismatches'])} mismatched balance(s), {action}.")
+    click.echo(f"Checked {len(results)} league(s); {len(drifted)} with drift.")
+    if verify and drifted:
+        raise SystemExit(1)
+
+
+@cli.command("replay-live-scoring")
+@click.option(
+    "--raw-root",
+    type=click.Path(file_okay=False, dir_okay=True, exists=True),
+    default=None,
+    help="Raw scoreboard archive to replay (default: LIVE_SCORING_RAW_RESPONSE_DIR or backend/data/ingest_raw).",
+)
+@click.option("--year", type=int, default=None, help="Only replay scoreboards for this season.")
+@click.option("--week", type=int, default=None, help="Only replay scoreboards for this week.")
+@click.option(
+    "--speed",
+    type=float,
+    default=0.0,
+    show_default=True,
+    help="Replay speed multiplier over the recorded capture times (0 = back-to-back).",
+)
+@click.option("--limit", type=int, default=None, help="Replay at most this many scoreboards.")
+@click.option("--dry-run", is_flag=True, default=False, help="Parse and fingerprint only; skip the database writes.")
+@click.option("--json-output", type=click.Path(dir_okay=False, writable=True), default=None, help="Write the full report to a JSON file.")
+def replay_live_scoring(
+    raw_root: str | None,
+    year: int | None,
+    week: int | None,
+    speed: float,
+    limit: int | None,
+    dry_run: bool,
+    json_output: str | None,
+):
+    """Replay archived scoreboards through live-scoring ingest and report latencies."""
+    try:
+        report = run_live_scoring_replay(
+            raw_root=raw_root,
+            year=year,
+            week=week,
+            speed=speed,
+            limit=limit,
+            dry_run=dry_run,
+        )
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    click.echo(
+        f"Replayed {report['frames_replayed']}/{report['frames_found']} scoreboards "
+        f"in {report['wall_time_ms'] / 1000:.2f}s ({report['frames_per_second']} frames/s), "
+        f"{report['publishes']} publishes, {report['queries']['total']} queries."
+    )
+    for stage, stats in report["stage_latency_ms"].items():
+        click.echo(f"  {stage:<20} p50={stats['p50']:.1f}ms p95={stats['p95']:.1f}ms p99={stats['p99']:.1f}ms max={stats['max']:.1f}ms")
+    end_to_end = report["end_to_end_publish_ms"]
+    click.echo(f"  {'end_to_end_publish':<20} p50={end_to_end['p50']:.1f}ms p95={end_to_end['p95']:.1f}ms p99={end_to_end['p99']:.1f}ms max={end_to_end['max']:.1f}ms")
+    if json_output:
+        with open(json_output, "w", encoding="utf-8") as handle:
+            _json.dump(report, handle, indent=2, sort_keys=True)
+        click.echo(f"Report written to {json_output}")
+
+
 @cli.command("archive-mfl-html-exports")
 @click.option(
     "--input-root",
@@ -657,6 +905,7 @@ def restore_mfl_archive(
 @click.option("--start-year", type=int, required=True, help="First season year to import.")
 @click.option("--end-year", type=int, required=True, help="Last season year to import.")
 @click.option("--apply", "apply_changes", is_flag=True, default=False, help="Write changes (default dry-run).")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=None, help="Stream reports this many rows at a time, bulk-inserting and committing each chunk (bounded memory for large multi-season imports).")
 def import_mfl_csv(
     source_mode: str,
     input_root: str | None,
@@ -665,11 +914,15 @@ def import_mfl_csv(
     start_year: int,
     end_year: int,
     apply_changes: bool,
+    chunk_size: int | None,
 ):
     """Import normalized MFL CSV files into app tables with validation."""
     if source_mode == "csv" and not input_root:
         raise click.UsageError("--input-root is required when --source-mode=csv")
 
+    def _echo_progress(report_type: str, rows_processed: int) -> None:
+        click.echo(f"  {report_type}: {rows_processed} rows processed")
+
     summary = run_import_mfl_csv(
         input_root=input_root,
         target_league_id=target_league_id,
@@ -678,6 +931,8 @@ def import_mfl_csv(
         dry_run=not apply_changes,
         source_mode=source_mode,
         source_league_id=source_league_id,
+        chunk_size=chunk_size,
+        progress=_echo_progress if chunk_size else None,
     )
 
     click.echo("MFL import summary")
@@ -1266,6 +1521,47 @@ def finalize_week_command(league_id: int, week: int, season: int, season_year: i
     )
 
 
+@cli.command("process-waivers")
+@click.option(
+    "--league-id",
+    type=int,
+    default=None,
+    help="Only process this league (default: every league with pending claims).",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Resolve claims and report the outcome without writing it.",
+)
+@click.option(
+    "--json-output",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Write the full report to a JSON file.",
+)
+def process_waivers_command(league_id: int | None, dry_run: bool, json_output: str | None):
+    """Resolve pending waiver claims: highest FAAB bid first, then waiver priority."""
+    reports = run_waiver_cycle(league_id, dry_run=dry_run)
+    for report in reports:
+        if report["skipped_reason"]:
+            click.echo(f"league={report['league_id']} skipped: {report['skipped_reason']}")
+            continue
+        click.echo(
+            f"league={report['league_id']}{' (dry run)' if dry_run else ''} "
+            f"awarded={report['awarded_count']} rejected={report['rejected_count']}"
+        )
+        for award in report["awarded"]:
+            click.echo(
+                f"  + owner={award['owner_id']} player={award['player_id']} bid={award['bid_amount']}"
+                + (f" drop={award['drop_player_id']}" if award["drop_player_id"] else "")
+            )
+    if json_output:
+        with open(json_output, "w", encoding="utf-8") as handle:
+            _json.dump(reports, handle, indent=2, sort_keys=True, default=str)
+        click.echo(f"Report written to {json_output}")
+
+
 # ====== VALIDATION COMMAND GROUP ======
 @cli.group("validate")
 def validate_group():
@@ -1,5 +1,6 @@
 from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Float, JSON, Numeric, DateTime, func, UniqueConstraint, Index, event
-from sqlalchemy.orm import relationship
+from sqlalchemy import and_
+from sqlalchemy.orm import Session, relationship
 # import backend.database explicitly so the module is always named backend.database
 import importlib
 Base = importlib.import_module("backend.database").Base
@@ -628,6 +629,44 @@ class Matchup(Base):
     home_team = relationship("User", foreign_keys=[home_team_id], back_populates="home_matches")
     away_team = relationship("User", foreign_keys=[away_team_id], back_populates="away_matches")
 
+class HeadToHeadSeasonAggregate(Base):
+    """Completed-matchup totals for one owner pair in one season.
+
+    ``owner_a_id`` is always the lower user id and ``a_*``/``b_*`` columns are
+    from each side's perspective. Season 0 collects matchups stored without a
+    season. Opening/closing streaks let seasons be chained into all-time
+    streaks without re-reading matchups; a tie ends a streak.
+    """
+
+    __tablename__ = "head_to_head_season_aggregates"
+    __table_args__ = (
+        UniqueConstraint("league_id", "season", "owner_a_id", "owner_b_id", name="uq_h2h_league_season_pair"),
+        Index("ix_h2h_league_pair", "league_id", "owner_a_id", "owner_b_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    league_id = Column(Integer, ForeignKey("leagues.id"), nullable=False)
+    season = Column(Integer, nullable=False, default=0)
+    owner_a_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    owner_b_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    games = Column(Integer, nullable=False, default=0)
+    a_wins = Column(Integer, nullable=False, default=0)
+    b_wins = Column(Integer, nullable=False, default=0)
+    ties = Column(Integer, nullable=False, default=0)
+    a_points = Column(Float, nullable=False, default=0.0)
+    b_points = Column(Float, nullable=False, default=0.0)
+    biggest_margin = Column(Float, nullable=False, default=0.0)
+    biggest_margin_winner_id = Column(Integer, nullable=True)
+    biggest_margin_week = Column(Integer, nullable=True)
+    opening_streak_owner_id = Column(Integer, nullable=True)
+    opening_streak_length = Column(Integer, nullable=False, default=0)
+    closing_streak_owner_id = Column(Integer, nullable=True)
+    closing_streak_length = Column(Integer, nullable=False, default=0)
+    longest_streak_owner_id = Column(Integer, nullable=True)
+    longest_streak_length = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
 # --- 7. SCORING RULES ---
 class ScoringRule(Base):
     __tablename__ = "scoring_rules"
@@ -834,6 +873,121 @@ def _prevent_ledger_delete(mapper, connection, target):
     raise ValueError("economic_ledger is append-only and does not allow deletes")
 
 
+class OwnerLedgerBalance(Base):
+    """Running ledger totals for one owner, currency and season.
+
+    Maintained in the same flush that inserts ``EconomicLedger`` rows (see
+    ``_apply_ledger_balance_deltas``), so reads never have to re-aggregate the
+    ledger. Season 0 collects entries stored without a season. ``issued_total``
+    is credits with no sending owner (allocations), ``spent_total`` debits with
+    no receiving owner (bids, fees) and ``keeper_lock_total`` the KEEPER_LOCK
+    share of ``debit_total``. ``manage.py rebuild-ledger-balances`` verifies or
+    rebuilds the table from the ledger.
+    """
+
+    __tablename__ = "owner_ledger_balances"
+    __table_args__ = (
+        UniqueConstraint("league_id", "owner_id", "currency_type", "season_year", name="uq_owner_ledger_balance"),
+        Index("ix_owner_ledger_balances_league_currency", "league_id", "currency_type", "season_year"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    league_id = Column(Integer, ForeignKey("leagues.id"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    currency_type = Column(String, nullable=False)
+    season_year = Column(Integer, nullable=False, default=0)
+    credit_total = Column(Integer, nullable=False, default=0)
+    debit_total = Column(Integer, nullable=False, default=0)
+    credit_count = Column(Integer, nullable=False, default=0)
+    debit_count = Column(Integer, nullable=False, default=0)
+    issued_total = Column(Integer, nullable=False, default=0)
+    spent_total = Column(Integer, nullable=False, default=0)
+    keeper_lock_total = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+LEDGER_BALANCE_COUNTERS = (
+    "credit_total",
+    "debit_total",
+    "credit_count",
+    "debit_count",
+    "issued_total",
+    "spent_total",
+    "keeper_lock_total",
+)
+
+
+def ledger_balance_deltas(entries) -> dict:
+    """Fold ledger entries into per-(league, owner, currency, season) counter deltas."""
+    deltas: dict = {}
+
+    def _bucket(entry, owner_id):
+        key = (int(entry.league_id), int(owner_id), entry.currency_type, int(entry.season_year or 0))
+        if key not in deltas:
+            deltas[key] = dict.fromkeys(LEDGER_BALANCE_COUNTERS, 0)
+        return deltas[key]
+
+    for entry in entries:
+        amount = int(entry.amount or 0)
+        if entry.to_owner_id is not None:
+            bucket = _bucket(entry, entry.to_owner_id)
+            bucket["credit_total"] += amount
+            bucket["credit_count"] += 1
+            if entry.from_owner_id is None:
+                bucket["issued_total"] += amount
+        if entry.from_owner_id is not None:
+            bucket = _bucket(entry, entry.from_owner_id)
+            bucket["debit_total"] += amount
+            bucket["debit_count"] += 1
+            if entry.to_owner_id is None:
+                bucket["spent_total"] += amount
+            if entry.transaction_type == "KEEPER_LOCK":
+                bucket["keeper_lock_total"] += amount
+    return deltas
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_ledger_balance_deltas(session, flush_context):
+    # session.new still holds the pre-flush inserts here; the ledger is
+    # append-only, so inserts are the only changes to fold in.
+    entries = [obj for obj in session.new if isinstance(obj, EconomicLedger)]
+    if not entries:
+        return
+    table = OwnerLedgerBalance.__table__
+    connection = session.connection()
+    key_columns = ["league_id", "owner_id", "currency_type", "season_year"]
+    dialect = connection.dialect.name
+    for key, delta in ledger_balance_deltas(entries).items():
+        row = dict(zip(key_columns, key))
+        if dialect in ("postgresql", "sqlite"):
+            # One atomic upsert per key, so concurrent first writes for the
+            # same owner add up instead of colliding on uq_owner_ledger_balance.
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            statement = dialect_insert(table).values(**row, **delta)
+            connection.execute(
+                statement.on_conflict_do_update(
+                    index_elements=key_columns,
+                    set_={
+                        **{name: table.c[name] + statement.excluded[name] for name in delta},
+                        "updated_at": func.now(),
+                    },
+                )
+            )
+            continue
+
+        key_filter = and_(*(table.c[name] == value for name, value in row.items()))
+        result = connection.execute(
+            table.update()
+            .where(key_filter)
+            .values({**{name: table.c[name] + value for name, value in delta.items()}, "updated_at": func.now()})
+        )
+        if result.rowcount == 0:
+            connection.execute(table.insert().values(**row, **delta))
+
+
 # --- 9. TRANSACTION HISTORY ---
 class TransactionHistory(Base):
     __tablename__ = "transaction_history"
@@ -854,6 +1008,37 @@ class TransactionHistory(Base):
     old_owner = relationship("User", foreign_keys=[old_owner_id])
     new_owner = relationship("User", foreign_keys=[new_owner_id])
 
+
+class PlayerOwnershipSpan(Base):
+    """Interval during which one owner held a player, derived from transaction history.
+
+    One span per history row that hands the player to an owner, covering
+    ``[started_at, ended_at)``; ``ended_at`` is the timestamp of the next
+    history row for the same league and player (NULL while still owned).
+    ``transaction_type`` is the acquiring row's type and ``ended_by`` the
+    type of the row that closed the span. Rebuilt per player by
+    ``transaction_service.refresh_ownership_spans`` whenever history is
+    written.
+    """
+
+    __tablename__ = "player_ownership_spans"
+    __table_args__ = (
+        Index("ix_ownership_spans_league_player_start", "league_id", "player_id", "started_at"),
+        Index("ix_ownership_spans_league_window", "league_id", "started_at", "ended_at"),
+        Index("ix_ownership_spans_player_owner", "player_id", "owner_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    league_id = Column(Integer, ForeignKey("leagues.id"), nullable=False)
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    ended_at = Column(DateTime(timezone=True), nullable=True)
+    transaction_type = Column(String, nullable=False)
+    ended_by = Column(String, nullable=True)
+    start_transaction_id = Column(Integer, ForeignKey("transaction_history.id"), nullable=False)
+    end_transaction_id = Column(Integer, ForeignKey("transaction_history.id"), nullable=True)
+
 # --- 9. BUG REPORTS ---
 class BugReport(Base):
     __tablename__ = "bug_reports"
@@ -1070,6 +1255,37 @@ class MflHtmlRecordFact(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 
+class MflHistoryRecordRow(Base):
+    """Typed projection of one MflHtmlRecordFact, kept for sorted history reads.
+
+    Sort columns mirror the JSON fallbacks used by the history endpoints
+    (``record_year`` falls back to ``season``, missing values sort as -1).
+    """
+
+    __tablename__ = "mfl_history_record_rows"
+    __table_args__ = (
+        Index("ix_mfl_history_row_dataset_target_year", "dataset_key", "target_league_id", "record_year"),
+        Index("ix_mfl_history_row_dataset_source_year", "dataset_key", "source_league_id", "record_year"),
+        Index("ix_mfl_history_row_dataset_target_points", "dataset_key", "target_league_id", "points"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    fact_id = Column(Integer, ForeignKey("mfl_html_record_facts.id", ondelete="CASCADE"), nullable=False, unique=True)
+    dataset_key = Column(String(80), nullable=False)
+    target_league_id = Column(Integer, ForeignKey("leagues.id"), nullable=True)
+    source_league_id = Column(String(32), nullable=True)
+    record_year = Column(Integer, nullable=False, default=-1)
+    season = Column(Integer, nullable=True)
+    record_week = Column(Integer, nullable=True)
+    wins = Column(Integer, nullable=True)
+    points = Column(Float, nullable=True)
+    owner_name = Column(String, nullable=True)
+    team_name = Column(String, nullable=True)
+    team_key = Column(String, nullable=True)
+
+    fact = relationship("MflHtmlRecordFact")
+
+
 class MflIngestionRun(Base):
     __tablename__ = "mfl_ingestion_runs"
     __table_args__ = (
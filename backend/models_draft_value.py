@@ -9,6 +9,9 @@ Base = importlib.import_module("backend.database").Base
 # --- 1. PLAYER ID MAPPINGS ---
 class PlayerIDMapping(Base):
     __tablename__ = "player_id_mappings"
+    __table_args__ = (
+        UniqueConstraint("player_id", name="uq_player_id_mapping_player"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
     yahoo_id = Column(String, nullable=True)
@@ -19,6 +22,9 @@ class PlayerIDMapping(Base):
 # --- 2. PLATFORM PROJECTIONS (RAW FACT TABLE) ---
 class PlatformProjection(Base):
     __tablename__ = "platform_projections"
+    __table_args__ = (
+        UniqueConstraint("player_id", "source", "season", name="uq_platform_projection_player_source_season"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     player_id = Column(Integer, ForeignKey("players.id"), nullable=True)
     source = Column(String, nullable=False)  # e.g., 'Yahoo', 'ESPN', 'DraftSharks'
@@ -13,6 +13,13 @@ from ..services import admin_audit_service
 
 router = APIRouter(prefix="/admin/drafts", tags=["Admin Drafts"])
 
+SOURCE_LABELS = {
+    "espn": "ESPN",
+    "draftsharks": "DraftSharks",
+    "fantasynerds": "FantasyNerds",
+    "yahoo": "Yahoo",
+}
+
 
 class RefreshDraftValuesPayload(BaseModel):
     season: int
@@ -32,6 +39,8 @@ class RefreshDraftValuesPayload(BaseModel):
     fantasynerds_min_players: int = 150
     fantasynerds_min_auction_coverage: float = 0.80
     fantasynerds_min_minmax_coverage: float = 0.50
+    source_timeout_seconds: float = Field(default=180.0, gt=0)
+    source_retries: int = Field(default=1, ge=0)
 
 
 @router.post("/refresh-values")
@@ -56,161 +65,170 @@ def refresh_draft_values(
     }
 
 
-def _run_draft_values_refresh(payload: RefreshDraftValuesPayload) -> None:
-    """
-    Background task: extract -> load per-source -> aggregate consensus.
-    Errors in individual sources are logged but do not abort the run so that
-    one failing site cannot block the others.
-    """
-    logger = logging.getLogger("admin_drafts.refresh_draft_values")
-
-    repo_root = Path(__file__).resolve().parents[2]
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
+def _build_source_specs(payload: RefreshDraftValuesPayload, results: dict[str, str]) -> list:
+    """One extraction spec per requested source; each returns a normalized frame."""
+    import pandas as pd
 
-    from backend.database import SessionLocal
-    from etl.load.load_to_postgres import load_normalized_source_to_db
+    from etl.extract.orchestrator import SourceSpec
 
     season = payload.season
     sources = [s.lower() for s in payload.sources]
-    results: dict[str, str] = {}
+    spec_options = {
+        "timeout_seconds": payload.source_timeout_seconds,
+        "retries": payload.source_retries,
+    }
+    specs: list[SourceSpec] = []
 
     if "espn" in sources:
-        try:
+
+        def _extract_espn():
             if payload.espn_league_id and payload.espn_s2 and payload.espn_swid:
                 from etl.extract.extract_espn import fetch_espn_top300_with_auth
 
-                norm_df = fetch_espn_top300_with_auth(
+                return fetch_espn_top300_with_auth(
                     year=season,
                     league_id=payload.espn_league_id,
                     espn_s2=payload.espn_s2,
                     swid=payload.espn_swid,
                 )
-                source_label = "ESPN"
-            else:
-                from etl.extract.extract_espn import scrape_espn_top_300, transform_espn_top_300
+            from etl.extract.extract_espn import scrape_espn_top_300, transform_espn_top_300
 
-                raw = scrape_espn_top_300(season=season, is_ppr=True)
-                norm_df = transform_espn_top_300(raw) if raw is not None else None
-                source_label = "ESPN"
+            raw = scrape_espn_top_300(season=season, is_ppr=True)
+            return transform_espn_top_300(raw) if raw is not None else None
 
-            if norm_df is not None and not norm_df.empty:
-                load_normalized_source_to_db(norm_df, season=season, source=source_label)
-                results["espn"] = f"loaded {len(norm_df)} players"
-                logger.info("ESPN: loaded %d players for season %d", len(norm_df), season)
-            else:
-                results["espn"] = "no data returned"
-                logger.warning("ESPN: extractor returned no data for season %d", season)
-        except Exception as exc:
-            results["espn"] = f"error: {exc}"
-            logger.exception("ESPN extraction failed: %s", exc)
+        specs.append(SourceSpec("espn", _extract_espn, **spec_options))
 
     if "draftsharks" in sources:
-        try:
+
+        def _extract_draftsharks():
             from etl.extract.extract_draftsharks import (
                 scrape_draft_sharks_auction_values,
                 transform_draftsharks_auction_values,
             )
 
             raw = scrape_draft_sharks_auction_values()
-            if raw is not None and not raw.empty:
-                norm_df = transform_draftsharks_auction_values(raw)
-                if not norm_df.empty:
-                    load_normalized_source_to_db(norm_df, season=season, source="DraftSharks")
-                    results["draftsharks"] = f"loaded {len(norm_df)} players"
-                    logger.info("DraftSharks: loaded %d players for season %d", len(norm_df), season)
-                else:
-                    results["draftsharks"] = "transform produced empty DataFrame"
-            else:
-                results["draftsharks"] = "no data returned"
-                logger.warning("DraftSharks: scraper returned no data")
-        except Exception as exc:
-            results["draftsharks"] = f"error: {exc}"
-            logger.exception("DraftSharks extraction failed: %s", exc)
+            if raw is None or raw.empty:
+                return None
+            return transform_draftsharks_auction_values(raw)
 
-    if "fantasynerds" in sources:
-        try:
-            from etl.extract.extract_fantasynerds import (
-                evaluate_fantasynerds_quality,
-                fetch_fantasynerds_auction_values,
-                transform_fantasynerds_auction_values,
-            )
+        specs.append(SourceSpec("draftsharks", _extract_draftsharks, **spec_options))
 
-            api_key = payload.fantasynerds_api_key or os.getenv("FANTASYNERDS_API_KEY")
-            if not api_key:
-                raise ValueError("missing FantasyNerds API key")
+    if "fantasynerds" in sources:
+        api_key = payload.fantasynerds_api_key or os.getenv("FANTASYNERDS_API_KEY")
+        if not api_key:
+            results["fantasynerds"] = "error: missing FantasyNerds API key"
+        else:
+
+            def _extract_fantasynerds():
+                from etl.extract.extract_fantasynerds import (
+                    fetch_fantasynerds_auction_values,
+                    transform_fantasynerds_auction_values,
+                )
 
-            raw = fetch_fantasynerds_auction_values(
-                api_key=api_key,
-                teams=payload.fantasynerds_teams,
-                budget=payload.fantasynerds_budget,
-                scoring_format=payload.fantasynerds_format,
-            )
-            norm_df = transform_fantasynerds_auction_values(raw)
-
-            if payload.enforce_fantasynerds_precheck:
-                report = evaluate_fantasynerds_quality(
-                    norm_df,
-                    min_players=payload.fantasynerds_min_players,
-                    min_auction_coverage=payload.fantasynerds_min_auction_coverage,
-                    min_minmax_coverage=payload.fantasynerds_min_minmax_coverage,
+                raw = fetch_fantasynerds_auction_values(
+                    api_key=api_key,
+                    teams=payload.fantasynerds_teams,
+                    budget=payload.fantasynerds_budget,
+                    scoring_format=payload.fantasynerds_format,
                 )
-                if not report.passed:
-                    results["fantasynerds"] = "blocked by precheck: " + "; ".join(report.errors)
-                    logger.error(
-                        "FantasyNerds precheck blocked load for season %d: %s",
-                        season,
-                        report.errors,
-                    )
-                    norm_df = None
-
-            if norm_df is not None and not norm_df.empty:
-                load_normalized_source_to_db(norm_df, season=season, source="FantasyNerds")
-                results["fantasynerds"] = f"loaded {len(norm_df)} players"
-                logger.info("FantasyNerds: loaded %d players for season %d", len(norm_df), season)
-            elif "fantasynerds" not in results:
-                results["fantasynerds"] = "no data returned"
-                logger.warning("FantasyNerds: extractor returned no data")
-        except Exception as exc:
-            results["fantasynerds"] = f"error: {exc}"
-            logger.exception("FantasyNerds extraction failed: %s", exc)
+                return transform_fantasynerds_auction_values(raw)
+
+            specs.append(SourceSpec("fantasynerds", _extract_fantasynerds, **spec_options))
 
     if payload.include_yahoo:
-        try:
+
+        def _extract_yahoo():
             from etl.extract.extract_yahoo import fetch_yahoo_top_players, transform_yahoo_players
 
             players = fetch_yahoo_top_players(max_players=100)
-            if players:
-                import pandas as pd
-
-                norm_df = pd.DataFrame(transform_yahoo_players(players))
-                if payload.enforce_yahoo_precheck:
-                    from etl.extract.extract_yahoo_precheck import evaluate_yahoo_quality
-
-                    report = evaluate_yahoo_quality(
-                        norm_df,
-                        min_players=payload.yahoo_min_players,
-                        min_adp_coverage=payload.yahoo_min_adp_coverage,
-                    )
-                    if not report.passed:
-                        results["yahoo"] = "blocked by precheck: " + "; ".join(report.errors)
-                        logger.error(
-                            "Yahoo precheck blocked load for season %d: %s",
-                            season,
-                            report.errors,
-                        )
-                        norm_df = None
-                if norm_df is not None and not norm_df.empty:
-                    load_normalized_source_to_db(norm_df, season=season, source="Yahoo")
-                    results["yahoo"] = f"loaded {len(norm_df)} players"
-                    logger.info("Yahoo: loaded %d players for season %d", len(norm_df), season)
-                elif "yahoo" not in results:
-                    results["yahoo"] = "transform produced empty DataFrame"
+            if not players:
+                return None
+            return pd.DataFrame(transform_yahoo_players(players))
+
+        specs.append(SourceSpec("yahoo", _extract_yahoo, **spec_options))
+
+    return specs
+
+
+def _precheck_errors(source: str, norm_df, payload: RefreshDraftValuesPayload) -> list[str]:
+    if source == "fantasynerds" and payload.enforce_fantasynerds_precheck:
+        from etl.extract.extract_fantasynerds import evaluate_fantasynerds_quality
+
+        report = evaluate_fantasynerds_quality(
+            norm_df,
+            min_players=payload.fantasynerds_min_players,
+            min_auction_coverage=payload.fantasynerds_min_auction_coverage,
+            min_minmax_coverage=payload.fantasynerds_min_minmax_coverage,
+        )
+        return [] if report.passed else list(report.errors)
+    if source == "yahoo" and payload.enforce_yahoo_precheck:
+        from etl.extract.extract_yahoo_precheck import evaluate_yahoo_quality
+
+        report = evaluate_yahoo_quality(
+            norm_df,
+            min_players=payload.yahoo_min_players,
+            min_adp_coverage=payload.yahoo_min_adp_coverage,
+        )
+        return [] if report.passed else list(report.errors)
+    return []
+
+
+def _run_draft_values_refresh(payload: RefreshDraftValuesPayload) -> None:
+    """
+    Background task: extract (all sources concurrently) -> load per-source as
+    each extract finishes -> aggregate consensus.
+    Errors in individual sources are logged but do not abort the run so that
+    one failing site cannot block the others.
+    """
+    logger = logging.getLogger("admin_drafts.refresh_draft_values")
+
+    repo_root = Path(__file__).resolve().parents[2]
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+    from backend.database import SessionLocal
+    from etl.extract.orchestrator import iter_source_extractions
+    from etl.load.load_to_postgres import load_normalized_source_to_db
+
+    season = payload.season
+    results: dict[str, str] = {}
+
+    specs = _build_source_specs(payload, results)
+    for result in iter_source_extractions(specs, snapshot_key=str(season)):
+        source = result.name
+        label = SOURCE_LABELS[source]
+        if not result.ok:
+            if result.error:
+                results[source] = f"{result.status}: {result.error}"
+                logger.error("%s extraction failed (%s): %s", label, result.status, result.error)
             else:
-                results["yahoo"] = "no data returned"
+                results[source] = "no data returned"
+                logger.warning("%s: extractor returned no data for season %d", label, season)
+            continue
+
+        try:
+            norm_df = result.frame
+            errors = _precheck_errors(source, norm_df, payload)
+            if errors:
+                results[source] = "blocked by precheck: " + "; ".join(errors)
+                logger.error("%s precheck blocked load for season %d: %s", label, season, errors)
+                continue
+
+            load_normalized_source_to_db(norm_df, season=season, source=label)
+            results[source] = f"loaded {len(norm_df)} players"
+            if result.status != "fetched":
+                results[source] += f" ({result.status})"
+            logger.info(
+                "%s: loaded %d players for season %d (%s in %.1fs)",
+                label,
+                len(norm_df),
+                season,
+                result.status,
+                result.elapsed_seconds,
+            )
         except Exception as exc:
-            results["yahoo"] = f"error: {exc}"
-            logger.exception("Yahoo extraction failed: %s", exc)
+            results[source] = f"error: {exc}"
+            logger.exception("%s load failed: %s", label, exc)
 
     try:
         from etl.services.consensus_service import build_and_store_consensus_draft_values
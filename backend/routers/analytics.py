@@ -12,6 +12,8 @@ from .. import models
 # import organizer helper from team router for roster-strength computation
 from .team import organize_roster
 from ..services.player_service import normalize_display_name as _normalize_player_name
+from ..services.free_agent_pool_service import get_owned_player_ids
+from ..services.head_to_head_service import load_head_to_head_seasons, summarize_pairs
 from ..services.season_outlook_service import build_post_draft_outlook
 from ..schemas.season_outlook import PostDraftOutlookResponse
 
@@ -959,7 +961,8 @@ def get_rivalry_graph(
 ):
     """Return nodes/edges describing manager rivalries in a league.
 
-    Edges include head-to-head games and trade counts between owners.
+    Edges include head-to-head games and trade counts between owners, plus
+    ties, points, streaks and biggest margin from the head-to-head store.
     """
     # collect users in the league (for node labels)
     owners = (
@@ -969,42 +972,8 @@ def get_rivalry_graph(
     )
     nodes = [{"id": o.id, "label": o.username or f"{o.id}"} for o in owners if o.id is not None]
 
-    # gather completed matchups
-    matchup_rows = (
-        db.query(models.Matchup)
-        .filter(models.Matchup.league_id == league_id, models.Matchup.is_completed == True)
-        .all()
-    )
-
-    # aggregate head-to-head results keyed by sorted pair
-    results: dict = {}
-    for m in matchup_rows:
-        key = _sorted_owner_pair(m.home_team_id, m.away_team_id)
-        if key is None:
-            continue
-
-        home_id = _safe_int(m.home_team_id)
-        away_id = _safe_int(m.away_team_id)
-        if home_id is None or away_id is None:
-            continue
-
-        if key not in results:
-            results[key] = {"games": 0, "a_wins": 0, "b_wins": 0}
-        results[key]["games"] += 1
-        home_score = float(m.home_score or 0.0)
-        away_score = float(m.away_score or 0.0)
-
-        if home_score > away_score:
-            # home wins counts toward the smaller id (a) if sorted
-            if key[0] == home_id:
-                results[key]["a_wins"] += 1
-            else:
-                results[key]["b_wins"] += 1
-        elif away_score > home_score:
-            if key[0] == away_id:
-                results[key]["a_wins"] += 1
-            else:
-                results[key]["b_wins"] += 1
+    # head-to-head totals per owner pair, combined from the per-season store
+    results = summarize_pairs(load_head_to_head_seasons(db, league_id=league_id))
 
     # gather trade counts from transaction history
     trade_rows = (
@@ -1037,6 +1006,22 @@ def get_rivalry_graph(
                 "target": b,
                 "games": stats["games"],
                 "wins": {a: stats["a_wins"], b: stats["b_wins"]},
+                "ties": stats["ties"],
+                "points": {a: stats["a_points"], b: stats["b_points"]},
+                "current_streak": {
+                    "owner_id": stats["current_streak_owner_id"],
+                    "length": stats["current_streak_length"],
+                },
+                "longest_streak": {
+                    "owner_id": stats["longest_streak_owner_id"],
+                    "length": stats["longest_streak_length"],
+                },
+                "biggest_margin": {
+                    "margin": stats["biggest_margin"],
+                    "winner_id": stats["biggest_margin_winner_id"],
+                    "season": stats["biggest_margin_season"],
+                    "week": stats["biggest_margin_week"],
+                },
                 "trades": trades.get(pair, 0),
             }
         )
@@ -1431,13 +1416,8 @@ def get_waiver_opportunities(
     """
     resolved_season = _resolved_season(season)
 
-    # Find all player IDs currently owned in this league (via draft or active transactions)
-    owned_player_ids = {
-        row[0]
-        for row in db.query(models.DraftPick.player_id)
-        .filter(models.DraftPick.league_id == league_id)
-        .all()
-    }
+    # Start from the shared free-agent pool's owned set (draft + waiver rosters)
+    owned_player_ids = get_owned_player_ids(db, league_id)
 
     # Also include players added via waiver and not subsequently dropped
     waiver_adds = (
@@ -1,5 +1,9 @@
 from typing import Any, List
+from dataclasses import dataclass
 from datetime import datetime, timezone
+import asyncio
+import hashlib
+import json
 import logging
 import math
 import os
@@ -8,25 +12,27 @@ import time
 from collections import deque
 from threading import Lock
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from jose import JWTError
 import pandas as pd
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
-try:
-    from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
-except ImportError:  # pragma: no cover
-    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4"
-    Counter = None  # type: ignore[assignment]
-    Histogram = None  # type: ignore[assignment]
-    generate_latest = None  # type: ignore[assignment]
-
 # Internal Imports
+from ..core.metrics import (
+    CONTENT_TYPE_LATEST,
+    PROMETHEUS_ENABLED,
+    Counter,
+    Histogram,
+    generate_latest,
+    observe_stage,
+)
 from ..database import SessionLocal, get_db
 import models
 from ..schemas.draft import HistoricalRankingResponse
 from ..services.ledger_service import owner_draft_budget_total, owner_has_incoming_credits
+from ..services.free_agent_pool_service import note_player_acquired
 from ..services.player_service import normalize_display_name as _normalize_player_name
 from ..services.draft_rankings_service import get_historical_rankings as get_historical_rankings_service
 from ..core.security import get_current_user
@@ -35,11 +41,21 @@ from ..services.validation_service import (
     validate_draft_pick_dynamic_rules,
 )
 from ..services.league_position_service import is_position_allowed_for_league
+from ..services.monte_carlo_input_snapshots import invalidate_monte_carlo_inputs, load_monte_carlo_inputs
+from ..services.draft_simulation_jobs import (
+    FINISHED_STATES,
+    SimulationJob,
+    SimulationJobError,
+    SimulationJobQueue,
+    SimulationQueueFullError,
+    get_simulation_job_queue,
+)
 from etl.transform.monte_carlo_simulation import (
-    build_monte_carlo_inputs_from_db,
     SimulationConfig,
     key_target_probabilities,
+    monte_carlo_inputs_fingerprint,
     run_monte_carlo_draft_simulation,
+    simulation_config_fingerprint,
     summarize_team_distribution,
 )
 from ..core import security
@@ -433,6 +449,9 @@ def _model_serving_error(
     )
 
 
+_SIMULATION_EVENTS_POLL_SECONDS = 0.5
+_SIMULATION_EVENTS_KEEPALIVE_SECONDS = 15.0
+
 _MODEL_SERVING_OBS_LOCK = Lock()
 _MODEL_SERVING_LATENCIES_MS: deque[float] = deque(maxlen=500)
 _MODEL_SERVING_COUNTERS = {
@@ -441,7 +460,7 @@ _MODEL_SERVING_COUNTERS = {
     "fallback_count": 0,
 }
 
-_PROMETHEUS_ENABLED = Counter is not None and Histogram is not None and generate_latest is not None
+_PROMETHEUS_ENABLED = PROMETHEUS_ENABLED
 if _PROMETHEUS_ENABLED:
     _MODEL_SERVING_REQUESTS_TOTAL = Counter(
         "ffpi_model_serving_requests_total",
@@ -937,20 +956,22 @@ def predict_model_recommendations(
     )
 
 
-@router.post("/draft/simulation")
-def run_draft_simulation(
-    payload: DraftSimulationRequest,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-):
-    logger.info(
-        "draft_simulation.request user_id=%s perspective_owner_id=%s iterations=%s teams_count=%s",
-        current_user.id,
-        payload.perspective_owner_id,
-        payload.iterations,
-        payload.teams_count,
-    )
+@dataclass(frozen=True)
+class _DraftSimulationPlan:
+    league_id: int
+    perspective_owner_id: int
+    requested_by_user_id: int
+    iterations: int
+    target_key_players: int
+    config: SimulationConfig
+
 
+def _plan_draft_simulation(
+    payload: DraftSimulationRequest,
+    db: Session,
+    current_user: models.User,
+) -> _DraftSimulationPlan:
+    """Validate a simulation request and resolve its league-bounded config."""
     if not current_user.league_id:
         raise HTTPException(status_code=400, detail="User must belong to a league")
 
@@ -972,15 +993,6 @@ def run_draft_simulation(
     if not perspective_owner:
         raise HTTPException(status_code=404, detail="Perspective owner not found in league")
 
-    try:
-        simulation_inputs = build_monte_carlo_inputs_from_db(
-            db,
-            league_id=current_user.league_id,
-            ranking_season=datetime.now().year,
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-
     league_sim_config = _resolve_simulation_league_config(db, int(current_user.league_id))
 
     safe_iterations = max(50, min(int(payload.iterations), 10000))
@@ -1006,25 +1018,24 @@ def run_draft_simulation(
         focal_risk_tolerance=float(strategy.risk_tolerance),
         focal_player_reliability_weight=float(strategy.player_reliability_weight),
     )
+    return _DraftSimulationPlan(
+        league_id=int(current_user.league_id),
+        perspective_owner_id=perspective_owner_id,
+        requested_by_user_id=int(current_user.id),
+        iterations=safe_iterations,
+        target_key_players=safe_target_key_players,
+        config=simulation_config,
+    )
 
-    try:
-        result = run_monte_carlo_draft_simulation(
-            draft_results_df=simulation_inputs.draft_results_df,
-            players_df=simulation_inputs.players_df,
-            historical_rankings_df=simulation_inputs.historical_rankings_df,
-            budget_df=simulation_inputs.budget_df,
-            config=simulation_config,
-        )
-    except Exception as exc:
-        logger.exception(
-            "draft_simulation.failed user_id=%s perspective_owner_id=%s",
-            current_user.id,
-            perspective_owner_id,
-        )
-        raise HTTPException(
-            status_code=500,
-            detail=f"Simulation failed. {str(exc) or 'Please try again.'}",
-        )
+
+def _summarize_draft_simulation(
+    db: Session,
+    plan: _DraftSimulationPlan,
+    result: Any,
+    bid_stats_map: dict[int, dict[str, float | int]],
+) -> dict[str, Any]:
+    perspective_owner_id = plan.perspective_owner_id
+    simulation_config = plan.config
 
     focal_summary: dict[str, Any] = {}
     if not result.owner_summary.empty:
@@ -1048,13 +1059,13 @@ def run_draft_simulation(
             ]
             .drop_duplicates(subset=["player_id"])
             .sort_values("predicted_auction_value", ascending=False)
-            .head(safe_target_key_players)
+            .head(plan.target_key_players)
         )
         probability_df = key_target_probabilities(
             result.draft_picks,
             owner_id=perspective_owner_id,
             target_player_ids=top_targets["player_id"].tolist(),
-            iterations=safe_iterations,
+            iterations=plan.iterations,
         )
         merge_cols = ["player_id", "player_name", "predicted_auction_value"]
         if pos_col:
@@ -1067,7 +1078,7 @@ def run_draft_simulation(
 
         # avg_bid sourced from live draft_picks aggregates (already computed above)
         avg_bid_lookup: dict[int, float] = {
-            pid: float(bs["avg_bid"]) for pid, bs in simulation_inputs.bid_stats_map.items()
+            pid: float(bs["avg_bid"]) for pid, bs in bid_stats_map.items()
         }
 
         # Derive rival bidders per target player across simulation iterations
@@ -1091,7 +1102,7 @@ def run_draft_simulation(
                 owner_name_map = {
                     u.id: (u.team_name or u.username or f"Owner {u.id}")
                     for u in db.query(models.User).filter(
-                        models.User.league_id == current_user.league_id,
+                        models.User.league_id == plan.league_id,
                         models.User.is_superuser == False,
                     ).all()
                 }
@@ -1140,17 +1151,10 @@ def run_draft_simulation(
         float(league_owner_means["avg_projected_points"].mean()) if not league_owner_means.empty else 0.0
     )
 
-    logger.info(
-        "draft_simulation.success user_id=%s perspective_owner_id=%s simulation_runs=%s",
-        current_user.id,
-        perspective_owner_id,
-        safe_iterations,
-    )
-
     return {
         "perspective_owner_id": perspective_owner_id,
-        "league_id": current_user.league_id,
-        "iterations": safe_iterations,
+        "league_id": plan.league_id,
+        "iterations": plan.iterations,
         "focal_owner_summary": focal_summary,
         "focal_points_distribution": focal_distribution,
         "key_target_probabilities": key_target_rows,
@@ -1167,6 +1171,252 @@ def run_draft_simulation(
         },
     }
 
+
+@router.post("/draft/simulation")
+def run_draft_simulation(
+    payload: DraftSimulationRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    logger.info(
+        "draft_simulation.request user_id=%s perspective_owner_id=%s iterations=%s teams_count=%s",
+        current_user.id,
+        payload.perspective_owner_id,
+        payload.iterations,
+        payload.teams_count,
+    )
+
+    plan = _plan_draft_simulation(payload, db, current_user)
+
+    try:
+        simulation_inputs = load_monte_carlo_inputs(
+            db,
+            league_id=plan.league_id,
+            ranking_season=datetime.now().year,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    try:
+        with observe_stage("draft_simulation.monte_carlo"):
+            result = run_monte_carlo_draft_simulation(
+                draft_results_df=simulation_inputs.draft_results_df,
+                players_df=simulation_inputs.players_df,
+                historical_rankings_df=simulation_inputs.historical_rankings_df,
+                budget_df=simulation_inputs.budget_df,
+                config=plan.config,
+            )
+    except Exception as exc:
+        logger.exception(
+            "draft_simulation.failed user_id=%s perspective_owner_id=%s",
+            current_user.id,
+            plan.perspective_owner_id,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"Simulation failed. {str(exc) or 'Please try again.'}",
+        )
+
+    summary = _summarize_draft_simulation(db, plan, result, simulation_inputs.bid_stats_map)
+
+    logger.info(
+        "draft_simulation.success user_id=%s perspective_owner_id=%s simulation_runs=%s",
+        current_user.id,
+        plan.perspective_owner_id,
+        plan.iterations,
+    )
+    return summary
+
+
+def _simulation_progress_reporter(
+    queue: SimulationJobQueue,
+    job: SimulationJob,
+    perspective_owner_id: int,
+):
+    """Progress callback folding streamed team metrics into running means."""
+    totals = {"focal_points": 0.0, "focal_spend": 0.0, "focal_rows": 0, "league_points": 0.0, "league_rows": 0}
+
+    def _report(completed_iterations: int, new_rows: list[dict[str, object]]) -> None:
+        for row in new_rows:
+            points = float(row.get("projected_points") or 0.0)
+            totals["league_points"] += points
+            totals["league_rows"] += 1
+            if int(row.get("owner_id") or 0) == perspective_owner_id:
+                totals["focal_points"] += points
+                totals["focal_spend"] += float(row.get("total_spend") or 0.0)
+                totals["focal_rows"] += 1
+        focal_rows = totals["focal_rows"] or 1
+        league_rows = totals["league_rows"] or 1
+        queue.report_progress(
+            job,
+            completed_iterations,
+            {
+                "focal_avg_projected_points": round(totals["focal_points"] / focal_rows, 3),
+                "focal_avg_total_spend": round(totals["focal_spend"] / focal_rows, 3),
+                "league_avg_projected_points": round(totals["league_points"] / league_rows, 3),
+            },
+        )
+
+    return _report
+
+
+def _run_draft_simulation_job(job: SimulationJob, plan: _DraftSimulationPlan) -> dict[str, Any]:
+    queue = get_simulation_job_queue()
+    db = SessionLocal()
+    try:
+        try:
+            simulation_inputs = load_monte_carlo_inputs(
+                db,
+                league_id=plan.league_id,
+                ranking_season=datetime.now().year,
+            )
+        except ValueError as exc:
+            raise SimulationJobError(str(exc), status_code=400) from exc
+
+        inputs_fingerprint = monte_carlo_inputs_fingerprint(simulation_inputs)
+        config_fingerprint = simulation_config_fingerprint(plan.config)
+        cached = queue.cached_result(plan.league_id, inputs_fingerprint, config_fingerprint)
+        if cached is not None:
+            queue.mark_cache_hit(job)
+            return cached
+
+        started_at = time.perf_counter()
+        try:
+            with observe_stage("draft_simulation.monte_carlo"):
+                result = run_monte_carlo_draft_simulation(
+                    draft_results_df=simulation_inputs.draft_results_df,
+                    players_df=simulation_inputs.players_df,
+                    historical_rankings_df=simulation_inputs.historical_rankings_df,
+                    budget_df=simulation_inputs.budget_df,
+                    config=plan.config,
+                    progress=_simulation_progress_reporter(queue, job, plan.perspective_owner_id),
+                )
+        except Exception:
+            logger.exception(
+                "draft_simulation.job_failed job_id=%s perspective_owner_id=%s",
+                job.id,
+                plan.perspective_owner_id,
+            )
+            raise
+        summary = _summarize_draft_simulation(db, plan, result, simulation_inputs.bid_stats_map)
+        queue.store_result(plan.league_id, inputs_fingerprint, config_fingerprint, summary)
+        logger.info(
+            "draft_simulation.job_success job_id=%s perspective_owner_id=%s simulation_runs=%s elapsed_ms=%.2f",
+            job.id,
+            plan.perspective_owner_id,
+            plan.iterations,
+            (time.perf_counter() - started_at) * 1000.0,
+        )
+        return summary
+    finally:
+        db.close()
+
+
+def _get_accessible_simulation_job(job_id: str, current_user: models.User) -> SimulationJob:
+    queue = get_simulation_job_queue()
+    job = queue.get(job_id)
+    visible = job is not None and job.league_id == current_user.league_id and (
+        current_user.is_superuser
+        or current_user.is_commissioner
+        or current_user.id == job.owner_id
+        or queue.is_requester(job, current_user.id)
+    )
+    if not visible:
+        raise HTTPException(status_code=404, detail="Simulation job not found")
+    return job
+
+
+@router.post("/draft/simulation/jobs", status_code=202)
+def submit_draft_simulation_job(
+    payload: DraftSimulationRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Queue a simulation; identical in-flight requests share one job."""
+    plan = _plan_draft_simulation(payload, db, current_user)
+    request_key = hashlib.sha256(
+        f"{plan.league_id}:{simulation_config_fingerprint(plan.config)}".encode("utf-8")
+    ).hexdigest()
+    queue = get_simulation_job_queue()
+    try:
+        job, coalesced = queue.submit(
+            request_key,
+            lambda job: _run_draft_simulation_job(job, plan),
+            league_id=plan.league_id,
+            owner_id=plan.perspective_owner_id,
+            requested_by_user_id=plan.requested_by_user_id,
+            total_iterations=plan.iterations,
+        )
+    except SimulationQueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+
+    logger.info(
+        "draft_simulation.job_submitted job_id=%s user_id=%s perspective_owner_id=%s iterations=%s coalesced=%s",
+        job.id,
+        current_user.id,
+        plan.perspective_owner_id,
+        plan.iterations,
+        coalesced,
+    )
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "coalesced": coalesced,
+        "status_url": f"/draft/simulation/jobs/{job.id}",
+        "events_url": f"/draft/simulation/jobs/{job.id}/events",
+    }
+
+
+@router.get("/draft/simulation/jobs/{job_id}")
+def get_draft_simulation_job(
+    job_id: str,
+    current_user: models.User = Depends(get_current_user),
+):
+    job = _get_accessible_simulation_job(job_id, current_user)
+    return get_simulation_job_queue().snapshot(job.id)
+
+
+async def _simulation_job_event_stream(job_id: str):
+    queue = get_simulation_job_queue()
+    last_version = -1
+    idle_seconds = 0.0
+    while True:
+        snapshot = queue.snapshot(job_id)
+        if snapshot is None:
+            yield "event: failed\ndata: {\"error\":\"Simulation job expired\"}\n\n"
+            return
+        if snapshot["status"] in FINISHED_STATES:
+            yield f"event: {snapshot['status']}\ndata: {json.dumps(snapshot, default=str, separators=(',', ':'))}\n\n"
+            return
+        if snapshot["version"] != last_version:
+            last_version = snapshot["version"]
+            idle_seconds = 0.0
+            yield f"event: progress\ndata: {json.dumps(snapshot, default=str, separators=(',', ':'))}\n\n"
+        elif idle_seconds >= _SIMULATION_EVENTS_KEEPALIVE_SECONDS:
+            idle_seconds = 0.0
+            yield ": keepalive\n\n"
+        await asyncio.sleep(_SIMULATION_EVENTS_POLL_SECONDS)
+        idle_seconds += _SIMULATION_EVENTS_POLL_SECONDS
+
+
+@router.get("/draft/simulation/jobs/{job_id}/events", response_class=StreamingResponse)
+async def stream_draft_simulation_job(
+    job_id: str,
+    current_user: models.User = Depends(get_current_user),
+):
+    """SSE stream of job progress; ends with a ``completed`` or ``failed`` event."""
+    job = _get_accessible_simulation_job(job_id, current_user)
+    return StreamingResponse(
+        _simulation_job_event_stream(job.id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache, no-transform",
+            "X-Accel-Buffering": "no",
+            "Connection": "keep-alive",
+        },
+    )
+
+
 @router.post("/draft-pick")
 async def draft_player(pick: DraftPickCreate, db: Session = Depends(get_db)):
     boundary_report = validate_draft_pick_boundary(
@@ -1292,6 +1542,11 @@ async def draft_player(pick: DraftPickCreate, db: Session = Depends(get_db)):
     db.add(new_pick)
     db.commit()
     db.refresh(new_pick)
+    note_player_acquired(db, league_id=owner.league_id, player_id=new_pick.player_id)
+    if owner.league_id:
+        # cached simulation inputs and results were built from the previous draft board
+        invalidate_monte_carlo_inputs(owner.league_id)
+        get_simulation_job_queue().invalidate_league(int(owner.league_id))
 
     # 3. REAL-TIME MAGIC (The new addition!)
     # Notify all connected users that a pick was made!
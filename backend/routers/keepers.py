@@ -15,6 +15,7 @@ from ..core.security import get_current_user, get_current_active_admin
 from ..services import keeper_service
 from ..services.player_service import normalize_display_name as _normalize_player_name
 from ..services.ledger_service import record_ledger_entry
+from ..services.monte_carlo_input_snapshots import invalidate_monte_carlo_inputs
 from ..services.league_position_service import (
     get_active_positions_for_league,
     normalize_player_position,
@@ -252,41 +253,28 @@ def get_my_keepers(
         raise HTTPException(status_code=400, detail="User not in a league")
     season = _current_keeper_season(db, current_user.league_id)
 
-    # fetch existing selections
-    keepers = (
-        db.query(models.Keeper)
-        .filter(
-            models.Keeper.owner_id == current_user.id,
-            models.Keeper.season == season,
-        )
-        .all()
-    )
+    evaluation = keeper_service.evaluate_league_keepers(
+        db, current_user.league_id, season, owner_ids=[current_user.id]
+    ).get(current_user.id)
+    keepers = evaluation["keepers"] if evaluation else []
     selections = [KeeperSelectionSchema(
-        player_id=k.player_id,
-        keep_cost=float(k.keep_cost),
-        years_kept_count=k.years_kept_count,
-        status=k.status,
-        approved_by_commish=k.approved_by_commish,
+        player_id=k["player_id"],
+        keep_cost=float(k["keep_cost"]),
+        years_kept_count=k["years_kept_count"],
+        status=k["status"],
+        approved_by_commish=k["approved_by_commish"],
     ) for k in keepers]
-
-    recs = keeper_service.compute_surplus_recommendations(db, current_user.id, season)
-    recommended = [RecommendedSchema(**r) for r in recs]
+    recommended = [RecommendedSchema(**r) for r in (evaluation["recommended"] if evaluation else [])]
 
     rules = db.query(models.KeeperRules).filter(models.KeeperRules.league_id == current_user.league_id).first()
     max_allowed = rules.max_keepers if rules else 3
     max_years = rules.max_years_per_player if rules else 1
-    
-    ineligible_ids: list[int] = []
-    if rules and rules.max_years_per_player is not None:
-        # any player whose years_kept_count >= max should be flagged
-        limit = rules.max_years_per_player
-        ineligible_ids = [k.player_id for k in keepers if k.years_kept_count >= limit]
 
     # Build set of selected player IDs for quick lookup
-    selected_player_ids = {k.player_id for k in keepers}
+    selected_player_ids = {k["player_id"] for k in keepers}
     
     # Build dict of keeper info by player_id for eligibility checking
-    keeper_by_player_id = {k.player_id: k for k in keepers}
+    keeper_by_player_id = {k["player_id"]: k for k in keepers}
     active_positions = set(get_active_positions_for_league(db, current_user.league_id))
     
     # Fetch draft picks (the pool of available players to keep)
@@ -311,15 +299,11 @@ def get_my_keepers(
         
         is_selected = pick.player_id in selected_player_ids
         keeper_info = keeper_by_player_id.get(pick.player_id)
-        years_kept = keeper_info.years_kept_count if keeper_info else 0
+        years_kept = (keeper_info["years_kept_count"] or 0) if keeper_info else 0
         
         # Determine eligibility
-        is_eligible = True
-        reason_ineligible = None
-        
-        if max_years is not None and years_kept > 0 and years_kept >= max_years:
-            is_eligible = False
-            reason_ineligible = f"Already designated as keeper for {years_kept} year(s); max allowed is {max_years}"
+        reason_ineligible = keeper_service.keeper_ineligibility_reason(years_kept, max_years)
+        is_eligible = reason_ineligible is None
         
         available_players.append(AvailablePlayerSchema(
             player_id=pick.player_id,
@@ -344,9 +328,9 @@ def get_my_keepers(
         available_players=available_players,
         selected_count=len(selections),
         max_allowed=max_allowed,
-        estimated_budget=keeper_service.project_budget(db, current_user.id),
-        effective_budget=keeper_service.get_effective_budget(db, current_user.id),
-        ineligible=ineligible_ids,
+        estimated_budget=evaluation["estimated_budget"] if evaluation else 0,
+        effective_budget=evaluation["effective_budget"] if evaluation else 0,
+        ineligible=evaluation["ineligible"] if evaluation else [],
     )
 
 @router.post("/")
@@ -393,6 +377,14 @@ def save_my_keepers(
         .all()
     }
 
+    rule = db.query(models.KeeperRules).filter(models.KeeperRules.league_id == current_user.league_id).first()
+    flags_by_candidate = keeper_service.compute_keeper_flags_bulk(
+        db,
+        current_user.league_id,
+        [(player_id, current_user.id) for player_id in player_ids],
+        rule,
+    )
+
     for p in request.players:
         if p.player_id in override_player_ids:
             continue
@@ -412,9 +404,7 @@ def save_my_keepers(
             keep_cost=p.keep_cost,
             status="pending",
         )
-        # compute flags
-        rule = db.query(models.KeeperRules).filter(models.KeeperRules.league_id == current_user.league_id).first()
-        flags = keeper_service.compute_keeper_flags(db, current_user.league_id, p.player_id, current_user.id, rule)
+        flags = flags_by_candidate[(p.player_id, current_user.id)]
         k.flag_waiver = flags.get("flag_waiver", False)
         k.flag_trade = flags.get("flag_trade", False)
         k.flag_drop = flags.get("flag_drop", False)
@@ -494,6 +484,10 @@ class OwnerKeepersOut(BaseModel):
     owner_id: int
     username: Optional[str]
     selections: List[KeeperSelectionSchema]
+    recommended: List[RecommendedSchema] = []
+    ineligible: List[int] = []
+    estimated_budget: Optional[int] = None
+    effective_budget: Optional[int] = None
 
 @router.get("/admin", response_model=List[OwnerKeepersOut])
 def list_all_keepers(
@@ -504,18 +498,29 @@ def list_all_keepers(
     if not current_user.is_commissioner:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Commissioner required")
     season = _current_keeper_season(db, current_user.league_id)
-    all_keepers = db.query(models.Keeper).filter(models.Keeper.league_id == current_user.league_id, models.Keeper.season == season).all()
-    result: dict[int, OwnerKeepersOut] = {}
-    for k in all_keepers:
-        entry = result.setdefault(k.owner_id, OwnerKeepersOut(owner_id=k.owner_id, username=k.owner.username if k.owner else None, selections=[]))
-        entry.selections.append(KeeperSelectionSchema(
-            player_id=k.player_id,
-            keep_cost=float(k.keep_cost),
-            years_kept_count=k.years_kept_count,
-            status=k.status,
-            approved_by_commish=k.approved_by_commish,
-        ))
-    return list(result.values())
+    evaluation = keeper_service.evaluate_league_keepers(db, current_user.league_id, season)
+    return [
+        OwnerKeepersOut(
+            owner_id=entry["owner_id"],
+            username=entry["username"],
+            selections=[
+                KeeperSelectionSchema(
+                    player_id=k["player_id"],
+                    keep_cost=float(k["keep_cost"]),
+                    years_kept_count=k["years_kept_count"],
+                    status=k["status"],
+                    approved_by_commish=k["approved_by_commish"],
+                )
+                for k in entry["keepers"]
+            ],
+            recommended=[RecommendedSchema(**r) for r in entry["recommended"]],
+            ineligible=entry["ineligible"],
+            estimated_budget=entry["estimated_budget"],
+            effective_budget=entry["effective_budget"],
+        )
+        for entry in evaluation.values()
+        if entry["keepers"]
+    ]
 
 @router.post("/admin/{owner_id}/veto")
 def veto_owner_list(
@@ -978,6 +983,7 @@ async def import_economic_history_csv(
         db.rollback()
     else:
         db.commit()
+        invalidate_monte_carlo_inputs(current_user.league_id)
 
     return EconomicImportResult(
         dry_run=dry_run,
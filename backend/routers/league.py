@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy import desc, or_, func, case
+from sqlalchemy import desc, or_
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
@@ -9,13 +9,22 @@ from urllib.parse import parse_qs, urlparse
 from ..database import get_db
 from .. import models
 from ..core.security import get_current_user, check_is_commissioner # Use our new auth system
-from ..services.ledger_service import owner_balance, owner_draft_budget_total, owner_has_incoming_credits, record_ledger_entry
+from ..services.ledger_service import (
+    owner_balance,
+    owner_balance_summaries,
+    owner_draft_budget_total,
+    owner_has_incoming_credits,
+    record_ledger_entry,
+)
 from ..services.standings_service import owner_standings_sort_key
 from ..services.history_owner_gap_service import build_history_owner_gap_report
 from ..services import league_history_enrichment_service as history_enrichment_service
+from ..services import league_history_record_service as history_record_service
+from ..services import head_to_head_service
 from ..services.player_service import normalize_display_name as _normalize_player_name
 from ..services.player_news_service import sentiment_from_text as _sentiment_from_text
 from ..services.commissioner_deadline_service import parse_commissioner_deadline
+from ..services.monte_carlo_input_snapshots import invalidate_monte_carlo_inputs
 from ..services.validation_service import (
     validate_league_settings_boundary,
     validate_league_settings_dynamic_rules,
@@ -815,19 +824,12 @@ def get_waiver_budgets(league_id: int, db: Session = Depends(get_db)):
         )
         legacy_by_owner = {r.owner_id: r for r in legacy_records}
 
+        faab_summaries = owner_balance_summaries(db, league_id=league_id, currency_type="FAAB")
+
         response: list[WaiverBudgetSchema] = []
         for user in users:
-            incoming_total = (
-                db.query(func.coalesce(func.sum(models.EconomicLedger.amount), 0))
-                .filter(
-                    models.EconomicLedger.league_id == league_id,
-                    models.EconomicLedger.currency_type == "FAAB",
-                    models.EconomicLedger.to_owner_id == user.id,
-                )
-                .scalar()
-            )
-
-            owner_has_credit_history = int(incoming_total or 0) > 0
+            summary = faab_summaries.get(user.id)
+            owner_has_credit_history = summary is not None and summary["incoming"] > 0
             legacy = legacy_by_owner.get(user.id)
             if not owner_has_credit_history and legacy is not None:
                 response.append(
@@ -840,38 +842,13 @@ def get_waiver_budgets(league_id: int, db: Session = Depends(get_db)):
                 )
                 continue
 
-            starting_budget = (
-                db.query(func.coalesce(func.sum(models.EconomicLedger.amount), 0))
-                .filter(
-                    models.EconomicLedger.league_id == league_id,
-                    models.EconomicLedger.currency_type == "FAAB",
-                    models.EconomicLedger.to_owner_id == user.id,
-                    models.EconomicLedger.from_owner_id.is_(None),
-                )
-                .scalar()
-            )
-            spent_budget = (
-                db.query(func.coalesce(func.sum(models.EconomicLedger.amount), 0))
-                .filter(
-                    models.EconomicLedger.league_id == league_id,
-                    models.EconomicLedger.currency_type == "FAAB",
-                    models.EconomicLedger.from_owner_id == user.id,
-                    models.EconomicLedger.to_owner_id.is_(None),
-                )
-                .scalar()
-            )
-
+            summary = summary or {"issued": 0, "spent": 0, "balance": 0}
             response.append(
                 WaiverBudgetSchema(
                     owner_id=user.id,
-                    starting_budget=int(starting_budget or 0),
-                    remaining_budget=owner_balance(
-                        db,
-                        league_id=league_id,
-                        owner_id=user.id,
-                        currency_type="FAAB",
-                    ),
-                    spent_budget=int(spent_budget or 0),
+                    starting_budget=summary["issued"],
+                    remaining_budget=summary["balance"],
+                    spent_budget=summary["spent"],
                 )
             )
 
@@ -1507,6 +1484,7 @@ def update_league_budgets(
             ))
 
     db.commit()
+    invalidate_monte_carlo_inputs(league_id)
     return {"message": "Budgets updated", "year": year}
 
 
@@ -1563,27 +1541,13 @@ def get_ledger_statement(
         .all()
     )
 
-    balance_query = db.query(func.coalesce(func.sum(
-        case(
-            (models.EconomicLedger.to_owner_id == target_owner_id, models.EconomicLedger.amount),
-            else_=0,
-        ) - case(
-            (models.EconomicLedger.from_owner_id == target_owner_id, models.EconomicLedger.amount),
-            else_=0,
-        )
-    ), 0)).filter(
-        models.EconomicLedger.league_id == league_id,
-        or_(
-            models.EconomicLedger.to_owner_id == target_owner_id,
-            models.EconomicLedger.from_owner_id == target_owner_id,
-        ),
+    balance = owner_balance(
+        db,
+        league_id=league_id,
+        owner_id=target_owner_id,
+        currency_type=currency_type or None,
+        season_year=season_year,
     )
-    if currency_type:
-        balance_query = balance_query.filter(models.EconomicLedger.currency_type == currency_type)
-    if season_year is not None:
-        balance_query = balance_query.filter(models.EconomicLedger.season_year == season_year)
-
-    balance = int(balance_query.scalar() or 0)
 
     payload_entries = []
     for entry in entries:
@@ -1972,6 +1936,38 @@ def _sorted_record_json(
     )
 
 
+def _history_record_page(
+    db: Session,
+    *,
+    dataset_key: str,
+    league_id: int,
+    order: str,
+    limit: int | None,
+    offset: int,
+    default_limit: int | None = None,
+) -> List[Dict[str, Any]]:
+    # limit and offset arrive validated by the endpoints' Query(ge=...) bounds.
+    resolved_limit = limit if limit is not None else default_limit
+
+    if history_record_service.history_read_model_ready(db, dataset_key):
+        return history_record_service.fetch_history_records(
+            db,
+            dataset_key=dataset_key,
+            league_id=league_id,
+            order=order,
+            limit=resolved_limit,
+            offset=offset,
+        )
+
+    # Facts loaded before the read model existed: sort the JSON in Python
+    # until `manage.py rebuild-mfl-history-read-model` has been run.
+    records = _historical_records_query(db, dataset_key=dataset_key, league_id=league_id).all()
+    data = _sorted_record_json(records, sort_keys=[order, "season"])
+    if resolved_limit is None:
+        return data[offset:]
+    return data[offset:offset + resolved_limit]
+
+
 @router.get("/{league_id}/history/team-owner-map")
 def get_history_team_owner_map(
     league_id: int,
@@ -2206,6 +2202,8 @@ def get_history_owner_gap_report(
 @router.get("/{league_id}/history/champions")
 def get_league_champions(
     league_id: int,
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
@@ -2213,13 +2211,14 @@ def get_league_champions(
     if not current_user.is_superuser and int(current_user.league_id or 0) != int(league_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
     mfl_league_id = str(league_id)
-    records = _historical_records_query(
+    data = _history_record_page(
         db,
         dataset_key="html_league_champions_normalized",
         league_id=league_id,
-    ).all()
-
-    data = _sorted_record_json(records, sort_keys=["record_year", "season"])
+        order="record_year",
+        limit=limit,
+        offset=offset,
+    )
     return HistoricalRecordsResponse(
         dataset_key="html_league_champions_normalized",
         league_id=mfl_league_id,
@@ -2231,6 +2230,8 @@ def get_league_champions(
 @router.get("/{league_id}/history/awards")
 def get_league_awards(
     league_id: int,
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
@@ -2238,13 +2239,14 @@ def get_league_awards(
     if not current_user.is_superuser and int(current_user.league_id or 0) != int(league_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
     mfl_league_id = str(league_id)
-    records = _historical_records_query(
+    data = _history_record_page(
         db,
         dataset_key="html_league_awards_normalized",
         league_id=league_id,
-    ).all()
-
-    data = _sorted_record_json(records, sort_keys=["record_year", "season"])
+        order="record_year",
+        limit=limit,
+        offset=offset,
+    )
     return HistoricalRecordsResponse(
         dataset_key="html_league_awards_normalized",
         league_id=mfl_league_id,
@@ -2256,6 +2258,8 @@ def get_league_awards(
 @router.get("/{league_id}/history/records/franchise")
 def get_franchise_records(
     league_id: int,
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
@@ -2263,13 +2267,14 @@ def get_franchise_records(
     if not current_user.is_superuser and int(current_user.league_id or 0) != int(league_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
     mfl_league_id = str(league_id)
-    records = _historical_records_query(
+    data = _history_record_page(
         db,
         dataset_key="html_franchise_records_normalized",
         league_id=league_id,
-    ).all()
-
-    data = _sorted_record_json(records, sort_keys=["record_year", "season"])
+        order="record_year",
+        limit=limit,
+        offset=offset,
+    )
     return HistoricalRecordsResponse(
         dataset_key="html_franchise_records_normalized",
         league_id=mfl_league_id,
@@ -2281,6 +2286,8 @@ def get_franchise_records(
 @router.get("/{league_id}/history/records/player")
 def get_player_records(
     league_id: int,
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
@@ -2288,13 +2295,15 @@ def get_player_records(
     if not current_user.is_superuser and int(current_user.league_id or 0) != int(league_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
     mfl_league_id = str(league_id)
-    records = _historical_records_query(
+    data = _history_record_page(
         db,
         dataset_key="html_player_records_normalized",
         league_id=league_id,
-    ).all()
-
-    data = _sorted_record_json(records, sort_keys=["record_year", "season"], limit=100)
+        order="record_year",
+        limit=limit,
+        offset=offset,
+        default_limit=100,
+    )
     return HistoricalRecordsResponse(
         dataset_key="html_player_records_normalized",
         league_id=mfl_league_id,
@@ -2336,6 +2345,43 @@ def get_matchup_records(
     )
 
 
+def _head_to_head_series_records(db: Session, *, league_id: int) -> List[Dict[str, Any]] | None:
+    """All-time series rows built from the head-to-head store.
+
+    Returns None when the league's matchups do not cover every season present
+    in the MFL all-time series facts, so those leagues keep the MFL records.
+    """
+    season_rows = head_to_head_service.load_head_to_head_seasons(db, league_id=league_id)
+    if not season_rows:
+        return None
+
+    covered_seasons = {row["season"] for row in season_rows}
+    fact_seasons = {
+        season
+        for (season,) in _historical_records_query(
+            db,
+            dataset_key="html_all_time_series_normalized",
+            league_id=league_id,
+        )
+        .with_entities(models.MflHtmlRecordFact.season)
+        .distinct()
+        if season is not None
+    }
+    if not fact_seasons <= covered_seasons:
+        return None
+
+    owners = (
+        db.query(models.User.id, models.User.username, models.User.team_name)
+        .filter(models.User.league_id == league_id)
+        .all()
+    )
+    return head_to_head_service.build_all_time_series_records(
+        head_to_head_service.summarize_pairs(season_rows),
+        owner_names={int(o.id): o.username or f"{o.id}" for o in owners},
+        team_names={int(o.id): o.team_name or o.username or f"Team {o.id}" for o in owners},
+    )
+
+
 @router.get("/{league_id}/history/records/all-time-series")
 def get_all_time_series_records(
     league_id: int,
@@ -2346,6 +2392,17 @@ def get_all_time_series_records(
     if not current_user.is_superuser and int(current_user.league_id or 0) != int(league_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
     mfl_league_id = str(league_id)
+
+    aggregate_rows = _head_to_head_series_records(db, league_id=league_id)
+    if aggregate_rows is not None:
+        data = aggregate_rows[:200]
+        return HistoricalRecordsResponse(
+            dataset_key="html_all_time_series_normalized",
+            league_id=mfl_league_id,
+            records=data,
+            count=len(data),
+        )
+
     records = _historical_records_query(
         db,
         dataset_key="html_all_time_series_normalized",
@@ -2546,6 +2603,8 @@ def _answer_history_question(*, db: Session, league_id: int, question: str) -> D
 @router.get("/{league_id}/history/records/season")
 def get_season_records(
     league_id: int,
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
@@ -2553,13 +2612,14 @@ def get_season_records(
     if not current_user.is_superuser and int(current_user.league_id or 0) != int(league_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
     mfl_league_id = str(league_id)
-    records = _historical_records_query(
+    data = _history_record_page(
         db,
         dataset_key="html_season_records_normalized",
         league_id=league_id,
-    ).all()
-
-    data = _sorted_record_json(records, sort_keys=["record_year", "season"])
+        order="record_year",
+        limit=limit,
+        offset=offset,
+    )
     return HistoricalRecordsResponse(
         dataset_key="html_season_records_normalized",
         league_id=mfl_league_id,
@@ -2571,6 +2631,8 @@ def get_season_records(
 @router.get("/{league_id}/history/records/career")
 def get_career_records(
     league_id: int,
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
@@ -2578,13 +2640,14 @@ def get_career_records(
     if not current_user.is_superuser and int(current_user.league_id or 0) != int(league_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
     mfl_league_id = str(league_id)
-    records = _historical_records_query(
+    data = _history_record_page(
         db,
         dataset_key="html_career_records_normalized",
         league_id=league_id,
-    ).all()
-
-    data = _sorted_record_json(records, sort_keys=["wins", "season"])
+        order="wins",
+        limit=limit,
+        offset=offset,
+    )
     return HistoricalRecordsResponse(
         dataset_key="html_career_records_normalized",
         league_id=mfl_league_id,
@@ -2596,6 +2659,8 @@ def get_career_records(
 @router.get("/{league_id}/history/records/streaks")
 def get_record_streaks(
     league_id: int,
+    limit: int | None = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
@@ -2603,13 +2668,15 @@ def get_record_streaks(
     if not current_user.is_superuser and int(current_user.league_id or 0) != int(league_id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
     mfl_league_id = str(league_id)
-    records = _historical_records_query(
+    data = _history_record_page(
         db,
         dataset_key="html_record_streaks_normalized",
         league_id=league_id,
-    ).all()
-
-    data = _sorted_record_json(records, sort_keys=["record_year", "season"], limit=100)
+        order="record_year",
+        limit=limit,
+        offset=offset,
+        default_limit=100,
+    )
     return HistoricalRecordsResponse(
         dataset_key="html_record_streaks_normalized",
         league_id=mfl_league_id,
@@ -2,7 +2,6 @@ from datetime import UTC, datetime
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
 from ..core.security import get_current_user, check_is_commissioner
 from ..database import get_db
@@ -14,11 +13,16 @@ from ..services.validation_service import (
 from ..services.commissioner_deadline_service import enforce_commissioner_deadline
 from ..services.commissioner_deadline_service import parse_commissioner_deadline
 from ..services.player_service import normalize_display_name as _normalize_player_name
-from ..services.trade_validation_service import (
-    TradeAssetInput,
-    TradeValidationContext,
-    validate_trade_request,
+from ..services.trade_context_service import (
+    TradeCandidate,
+    build_trade_validation_context,
+    load_trade_snapshot,
+    missing_player_ownership,
+    trade_player_ids,
+    validate_trades_batch,
 )
+from ..services.trade_analyzer_service import DEFAULT_TRADE_SHAPES, analyze_trades
+from ..services.trade_validation_service import validate_trade_request
 from ..services.trade_execution_service import execute_trade_v2_approval
 from ..services.trade_event_service import record_trade_event
 from ..services.trade_notification_service import (
@@ -55,6 +59,31 @@ class TradeSubmissionCreate(BaseModel):
     proposal_note: str | None = None
 
 
+class TradeCandidateCreate(BaseModel):
+    team_a_id: int
+    team_b_id: int
+    assets_from_a: list[TradeAssetCreate]
+    assets_from_b: list[TradeAssetCreate]
+
+
+class TradeBatchValidationRequest(BaseModel):
+    candidates: list[TradeCandidateCreate]
+
+
+MAX_TRADE_BATCH_CANDIDATES = 500
+
+
+class TradeAnalysisRequest(BaseModel):
+    partner_user_ids: list[int] | None = None
+    shapes: list[str] = list(DEFAULT_TRADE_SHAPES)
+    season: int | None = None
+    limit: int = 25
+    min_partner_delta: float = 0.0
+
+
+MAX_TRADE_ANALYSIS_RESULTS = 100
+
+
 class TradeReviewAction(BaseModel):
     commissioner_comments: str | None = None
 
@@ -181,6 +210,35 @@ def propose_trade(
     return {"message": "Trade proposal submitted.", "trade_id": proposal.id}
 
 
+@router.post("/analyze")
+def analyze_trade_options(
+    payload: TradeAnalysisRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Rank player swaps with league partners by projected starting-lineup gain."""
+    if not current_user.league_id:
+        raise HTTPException(status_code=400, detail="You must be in a league to analyze trades.")
+    if not 1 <= payload.limit <= MAX_TRADE_ANALYSIS_RESULTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"limit must be between 1 and {MAX_TRADE_ANALYSIS_RESULTS}.",
+        )
+    try:
+        return analyze_trades(
+            db,
+            league_id=current_user.league_id,
+            owner_id=current_user.id,
+            partner_ids=payload.partner_user_ids,
+            shapes=payload.shapes,
+            season=payload.season,
+            limit=payload.limit,
+            min_partner_delta=payload.min_partner_delta,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 class TradeWindowSettings(BaseModel):
     trade_start_at: str | None = None   # ISO-8601 UTC string
     trade_end_at: str | None = None     # ISO-8601 UTC string
@@ -304,125 +362,27 @@ def submit_trade_v2(
             detail="You must submit trades as team A (team_a_id must be your team).",
         )
 
-    teams = (
-        db.query(models.User)
-        .filter(
-            models.User.id.in_([payload.team_a_id, payload.team_b_id]),
-            models.User.league_id == league_id,
-        )
-        .all()
+    snapshot = load_trade_snapshot(
+        db,
+        league_id,
+        [payload.team_a_id, payload.team_b_id],
+        trade_player_ids(payload.assets_from_a, payload.assets_from_b),
     )
-    if len(teams) != 2:
+    if len(snapshot.team_ids) != 2:
         raise HTTPException(status_code=404, detail="Both trade teams must exist in the league.")
 
-    settings = (
-        db.query(models.LeagueSettings)
-        .filter(models.LeagueSettings.league_id == league_id)
-        .first()
-    )
     enforce_commissioner_deadline(
-        deadline_value=settings.trade_deadline if settings else None,
+        deadline_value=snapshot.rules.trade_deadline,
         closed_message_prefix="Trade proposals are closed by commissioner rule",
     )
 
-    all_player_ids = {
-        int(player_id)
-        for player_id in [
-            *(asset.player_id for asset in payload.assets_from_a),
-            *(asset.player_id for asset in payload.assets_from_b),
-        ]
-        if player_id is not None
-    }
-    player_rows = (
-        db.query(models.Player.id, models.Player.position)
-        .filter(models.Player.id.in_(all_player_ids))
-        .all()
-    ) if all_player_ids else []
-    player_positions_by_id = {int(player_id): str(position or "") for player_id, position in player_rows}
-
-    roster_sizes_rows = (
-        db.query(models.DraftPick.owner_id, func.count(models.DraftPick.id))
-        .filter(
-            models.DraftPick.league_id == league_id,
-            models.DraftPick.owner_id.in_([payload.team_a_id, payload.team_b_id]),
-            models.DraftPick.player_id.isnot(None),
-        )
-        .group_by(models.DraftPick.owner_id)
-        .all()
-    )
-    roster_sizes = {int(owner_id): int(count) for owner_id, count in roster_sizes_rows}
-    roster_sizes.setdefault(payload.team_a_id, 0)
-    roster_sizes.setdefault(payload.team_b_id, 0)
-
-    pick_rows = (
-        db.query(models.DraftPick.id, models.DraftPick.owner_id)
-        .filter(
-            models.DraftPick.league_id == league_id,
-            models.DraftPick.owner_id.in_([payload.team_a_id, payload.team_b_id]),
-        )
-        .all()
-    )
-    owned_pick_ids_by_team: dict[int, set[int]] = {
-        payload.team_a_id: set(),
-        payload.team_b_id: set(),
-    }
-    for pick_id, owner_id in pick_rows:
-        if owner_id in owned_pick_ids_by_team:
-            owned_pick_ids_by_team[int(owner_id)].add(int(pick_id))
-
-    team_budget_map = {int(team.id): float(team.future_draft_budget or 0) for team in teams}
-
-    assets_from_a = [
-        TradeAssetInput(
-            asset_type=asset.asset_type,
-            player_id=asset.player_id,
-            draft_pick_id=asset.draft_pick_id,
-            amount=asset.amount,
-            season_year=asset.season_year,
-            position=player_positions_by_id.get(int(asset.player_id or 0)),
-        )
-        for asset in payload.assets_from_a
-    ]
-    assets_from_b = [
-        TradeAssetInput(
-            asset_type=asset.asset_type,
-            player_id=asset.player_id,
-            draft_pick_id=asset.draft_pick_id,
-            amount=asset.amount,
-            season_year=asset.season_year,
-            position=player_positions_by_id.get(int(asset.player_id or 0)),
-        )
-        for asset in payload.assets_from_b
-    ]
-
-    current_season = (
-        db.query(models.League.current_season)
-        .filter(models.League.id == league_id)
-        .scalar()
-    )
-    if current_season is None:
-        current_season = datetime.now(UTC).year
-
     validation_report = validate_trade_request(
-        TradeValidationContext(
+        build_trade_validation_context(
+            snapshot,
             team_a_id=payload.team_a_id,
             team_b_id=payload.team_b_id,
-            assets_from_a=assets_from_a,
-            assets_from_b=assets_from_b,
-            roster_sizes=roster_sizes,
-            max_roster_size=int((settings.roster_size if settings else 14) or 14),
-            min_roster_size=1,
-            available_draft_dollars=team_budget_map,
-            owned_pick_ids_by_team=owned_pick_ids_by_team,
-            suppressed_positions=set(),
-            player_positions_by_id=player_positions_by_id,
-            trade_start_at=settings.trade_start_at if settings else None,
-            trade_end_at=(settings.trade_end_at if settings else None) or parse_commissioner_deadline(settings.trade_deadline if settings else None),
-            allow_playoff_trades=settings.allow_playoff_trades if (settings and settings.allow_playoff_trades is not None) else True,
-            is_playoff=False,
-            max_future_year_offset=2,
-            current_season=int(current_season),
-            now=datetime.now(UTC),
+            assets_from_a=payload.assets_from_a,
+            assets_from_b=payload.assets_from_b,
         )
     )
     if not validation_report.valid:
@@ -430,53 +390,21 @@ def submit_trade_v2(
 
     # Validate player ownership at submission time so unexecutable trades
     # do not enter the pending queue.
-    player_ids_from_a = {
-        int(asset.player_id)
-        for asset in payload.assets_from_a
-        if (asset.asset_type or "").strip().upper() == "PLAYER" and asset.player_id is not None
-    }
-    player_ids_from_b = {
-        int(asset.player_id)
-        for asset in payload.assets_from_b
-        if (asset.asset_type or "").strip().upper() == "PLAYER" and asset.player_id is not None
-    }
-    involved_player_ids = player_ids_from_a | player_ids_from_b
-    if involved_player_ids:
-        ownership_rows = (
-            db.query(models.DraftPick.player_id, models.DraftPick.owner_id)
-            .filter(
-                models.DraftPick.league_id == league_id,
-                models.DraftPick.owner_id.in_([payload.team_a_id, payload.team_b_id]),
-                models.DraftPick.player_id.in_(involved_player_ids),
+    missing_for_a = missing_player_ownership(snapshot, team_id=payload.team_a_id, assets=payload.assets_from_a)
+    missing_for_b = missing_player_ownership(snapshot, team_id=payload.team_b_id, assets=payload.assets_from_b)
+    if missing_for_a or missing_for_b:
+        detail_parts: list[str] = []
+        if missing_for_a:
+            detail_parts.append(
+                f"Team {payload.team_a_id} does not own player(s): "
+                + ", ".join(str(pid) for pid in sorted(missing_for_a))
             )
-            .all()
-        )
-        owned_player_ids_by_team: dict[int, set[int]] = {
-            int(payload.team_a_id): set(),
-            int(payload.team_b_id): set(),
-        }
-        for player_id, owner_id in ownership_rows:
-            if player_id is None:
-                continue
-            owner_id_int = int(owner_id)
-            if owner_id_int in owned_player_ids_by_team:
-                owned_player_ids_by_team[owner_id_int].add(int(player_id))
-
-        missing_for_a = player_ids_from_a - owned_player_ids_by_team[int(payload.team_a_id)]
-        missing_for_b = player_ids_from_b - owned_player_ids_by_team[int(payload.team_b_id)]
-        if missing_for_a or missing_for_b:
-            detail_parts: list[str] = []
-            if missing_for_a:
-                detail_parts.append(
-                    f"Team {payload.team_a_id} does not own player(s): "
-                    + ", ".join(str(pid) for pid in sorted(missing_for_a))
-                )
-            if missing_for_b:
-                detail_parts.append(
-                    f"Team {payload.team_b_id} does not own player(s): "
-                    + ", ".join(str(pid) for pid in sorted(missing_for_b))
-                )
-            raise HTTPException(status_code=400, detail="; ".join(detail_parts))
+        if missing_for_b:
+            detail_parts.append(
+                f"Team {payload.team_b_id} does not own player(s): "
+                + ", ".join(str(pid) for pid in sorted(missing_for_b))
+            )
+        raise HTTPException(status_code=400, detail="; ".join(detail_parts))
 
     trade = models.Trade(
         league_id=league_id,
@@ -542,6 +470,49 @@ def submit_trade_v2(
     }
 
 
+@router.post("/leagues/{league_id}/validate-batch")
+def validate_trade_batch(
+    league_id: int,
+    payload: TradeBatchValidationRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Validate hypothetical trades without submitting them (trade-finder tools).
+
+    Every candidate is checked against one snapshot of the league, so the
+    cost is a fixed number of queries plus in-memory checks per candidate.
+    """
+    if not current_user.league_id or current_user.league_id != league_id:
+        raise HTTPException(status_code=403, detail="You do not have access to this league.")
+    if len(payload.candidates) > MAX_TRADE_BATCH_CANDIDATES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_TRADE_BATCH_CANDIDATES} candidate trades can be validated per request.",
+        )
+
+    reports = validate_trades_batch(
+        db,
+        league_id,
+        [
+            TradeCandidate(
+                team_a_id=candidate.team_a_id,
+                team_b_id=candidate.team_b_id,
+                assets_from_a=candidate.assets_from_a,
+                assets_from_b=candidate.assets_from_b,
+            )
+            for candidate in payload.candidates
+        ],
+    )
+    return {
+        "league_id": league_id,
+        "valid_count": sum(1 for report in reports if report.valid),
+        "results": [
+            {"index": index, "valid": report.valid, "errors": report.errors}
+            for index, report in enumerate(reports)
+        ],
+    }
+
+
 def _serialize_trade_assets(trade: models.Trade):
     assets_from_a = []
     assets_from_b = []
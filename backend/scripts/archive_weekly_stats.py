@@ -1,8 +1,12 @@
 import sys
 import os
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
-import time
+from pathlib import Path
 import requests
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from database import SessionLocal, engine
 import models
@@ -15,6 +19,11 @@ ESPN_SUMMARY_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/s
 
 ALLOWED_POSITIONS = {"QB", "RB", "WR", "TE", "K"}
 
+# Raw ESPN payloads for completed games never change, so the backfill keeps
+# them on disk by event id and re-runs skip the network entirely.
+SUMMARY_CACHE_DIR = Path(__file__).resolve().parents[1] / "data" / "espn_summary_cache"
+DEFAULT_MAX_WORKERS = 8
+
 
 def get_json(url, params=None, timeout=30):
     response = requests.get(url, params=params, timeout=timeout)
@@ -22,16 +31,6 @@ def get_json(url, params=None, timeout=30):
     return response.json()
 
 
-def fetch_event_ids(season, week, season_type=2):
-    params = {
-        "year": season,
-        "week": week,
-        "seasontype": season_type,
-    }
-    data = get_json(ESPN_SCOREBOARD_URL, params=params)
-    return [event.get("id") for event in data.get("events", []) if event.get("id")]
-
-
 def parse_stats_from_summary(summary_json):
     results = []
     players = summary_json.get("boxscore", {}).get("players", [])
@@ -65,102 +64,273 @@ def parse_stats_from_summary(summary_json):
     return results
 
 
-def resolve_player(db: Session, espn_id, name, position, team_abbr):
-    player = db.query(models.Player).filter(models.Player.espn_id == espn_id).first()
-    if player:
-        return player
-
-    player = models.Player(
-        name=name,
-        position=position,
-        nfl_team=team_abbr,
-        espn_id=espn_id,
-        bye_week=None,
-    )
-    db.add(player)
-    db.flush()
-    return player
-
-
-def store_weekly_stat(db: Session, player, season, week, stats_map, source="espn"):
-    fantasy_points = None
+def _extract_fantasy_points(stats_map):
     for key in ("fantasyPoints", "fantasyPointsPPR", "fantasyPoints_ppr"):
         if key in stats_map:
             try:
-                fantasy_points = float(stats_map[key])
+                return float(stats_map[key])
             except (TypeError, ValueError):
-                fantasy_points = None
-            break
-
-    existing = db.query(models.PlayerWeeklyStat).filter(
-        models.PlayerWeeklyStat.player_id == player.id,
-        models.PlayerWeeklyStat.season == season,
-        models.PlayerWeeklyStat.week == week,
-        models.PlayerWeeklyStat.source == source,
-    ).first()
-
-    if existing:
-        existing.stats = stats_map
-        existing.fantasy_points = fantasy_points
-        existing.created_at = datetime.now(UTC).isoformat()
-        return False
-
-    entry = models.PlayerWeeklyStat(
-        player_id=player.id,
-        season=season,
-        week=week,
-        fantasy_points=fantasy_points,
-        stats=stats_map,
-        source=source,
-        created_at=datetime.now(UTC).isoformat(),
+                return None
+    return None
+
+
+def _read_cached_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_json(path, payload):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle)
+    tmp_path.replace(path)
+
+
+def _summary_is_final(summary_json):
+    competitions = summary_json.get("header", {}).get("competitions", [])
+    return bool(competitions) and bool(
+        competitions[0].get("status", {}).get("type", {}).get("completed")
     )
-    db.add(entry)
-    return True
 
 
-def archive_week(season, week, season_type=2):
+def fetch_event_ids_cached(season, week, season_type=2, cache_dir=SUMMARY_CACHE_DIR):
+    """Scoreboard event ids; cached once every event in the week is final."""
+    path = Path(cache_dir) / "scoreboard" / f"{season}_{season_type}_{week}.json"
+    cached = _read_cached_json(path)
+    if cached is not None:
+        return cached
+
+    data = get_json(
+        ESPN_SCOREBOARD_URL,
+        params={"year": season, "week": week, "seasontype": season_type},
+    )
+    events = data.get("events", [])
+    event_ids = [event.get("id") for event in events if event.get("id")]
+    if events and all(event.get("status", {}).get("type", {}).get("completed") for event in events):
+        _write_cached_json(path, event_ids)
+    return event_ids
+
+
+def fetch_summary_cached(event_id, cache_dir=SUMMARY_CACHE_DIR):
+    """Return ``(summary_json, from_cache)``; only final games are cached."""
+    path = Path(cache_dir) / "summaries" / f"{event_id}.json"
+    cached = _read_cached_json(path)
+    if cached is not None:
+        return cached, True
+
+    summary = get_json(ESPN_SUMMARY_URL, params={"event": event_id})
+    if _summary_is_final(summary):
+        _write_cached_json(path, summary)
+    return summary, False
+
+
+def _name_key(name):
+    return " ".join(re.sub(r"[^a-z0-9 ]", "", str(name or "").lower()).split())
+
+
+class PlayerIndex:
+    """In-memory ESPN-id and name lookups for players, built with one query.
+
+    Players without an ESPN id are matched by (normalized name, position)
+    when that pair is unique, and get the ESPN id attached. Anything else is
+    created as a new player.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.by_espn_id = {}
+        self.by_name = {}
+        ambiguous = set()
+        for player in db.query(models.Player).all():
+            if player.espn_id:
+                self.by_espn_id[str(player.espn_id)] = player
+                continue
+            key = (_name_key(player.name), (player.position or "").upper())
+            if key in self.by_name:
+                ambiguous.add(key)
+            self.by_name[key] = player
+        for key in ambiguous:
+            self.by_name.pop(key, None)
+        self.created = 0
+        self.linked = 0
+
+    def resolve(self, espn_id, name, position, team_abbr):
+        player = self.by_espn_id.get(espn_id)
+        if player is not None:
+            return player
+
+        player = self.by_name.pop((_name_key(name), (position or "").upper()), None)
+        if player is not None:
+            player.espn_id = espn_id
+            self.linked += 1
+        else:
+            player = models.Player(
+                name=name,
+                position=position,
+                nfl_team=team_abbr,
+                espn_id=espn_id,
+                bye_week=None,
+            )
+            self.db.add(player)
+            self.created += 1
+        self.by_espn_id[espn_id] = player
+        return player
+
+
+def bulk_store_weekly_stats(db: Session, player_index, season, week, items, source="espn"):
+    """Upsert parsed stat rows for one week with one select, one insert and one update.
+
+    Returns ``(created, updated)``. A player seen in several stat groups
+    keeps the last group's stats.
+    """
+    latest = {}
+    for item in items:
+        player = player_index.resolve(item["espn_id"], item["name"], item["position"], item["team"])
+        latest[player] = item["stats"]
+    if not latest:
+        return 0, 0
+    db.flush()
+
+    stats_by_player_id = {int(player.id): stats_map for player, stats_map in latest.items()}
+    existing_ids = dict(
+        db.query(models.PlayerWeeklyStat.player_id, models.PlayerWeeklyStat.id).filter(
+            models.PlayerWeeklyStat.player_id.in_(list(stats_by_player_id)),
+            models.PlayerWeeklyStat.season == season,
+            models.PlayerWeeklyStat.week == week,
+            models.PlayerWeeklyStat.source == source,
+        )
+    )
+
+    created_at = datetime.now(UTC).isoformat()
+    inserts = []
+    updates = []
+    for player_id, stats_map in stats_by_player_id.items():
+        values = {
+            "stats": stats_map,
+            "fantasy_points": _extract_fantasy_points(stats_map),
+            "created_at": created_at,
+        }
+        if player_id in existing_ids:
+            updates.append({"id": existing_ids[player_id], **values})
+        else:
+            inserts.append(
+                {"player_id": player_id, "season": season, "week": week, "source": source, **values}
+            )
+
+    if inserts:
+        db.execute(insert(models.PlayerWeeklyStat), inserts)
+    if updates:
+        db.execute(update(models.PlayerWeeklyStat), updates)
+    return len(inserts), len(updates)
+
+
+def _fetch_and_parse(event_id, cache_dir):
+    summary, from_cache = fetch_summary_cached(event_id, cache_dir=cache_dir)
+    return parse_stats_from_summary(summary), from_cache
+
+
+def backfill_weekly_stats(
+    season,
+    weeks,
+    season_type=2,
+    max_workers=DEFAULT_MAX_WORKERS,
+    cache_dir=SUMMARY_CACHE_DIR,
+    source="espn",
+):
+    """Archive several weeks: summaries fetched concurrently, cached, bulk-upserted.
+
+    Each week is committed on its own. A game whose summary cannot be
+    fetched is reported and skipped; re-running picks it up while every
+    cached game is read from disk.
+    """
     models.Base.metadata.create_all(bind=engine)
     db = SessionLocal()
+    report = {
+        "season": season,
+        "weeks": [],
+        "created": 0,
+        "updated": 0,
+        "events": 0,
+        "cached_summaries": 0,
+        "failed_events": [],
+        "players_created": 0,
+        "players_linked": 0,
+    }
 
     try:
-        event_ids = fetch_event_ids(season, week, season_type=season_type)
-        print(f"📅 ESPN events for {season} week {week}: {len(event_ids)}")
-
-        created = 0
-        updated = 0
-        for event_id in event_ids:
-            summary = get_json(ESPN_SUMMARY_URL, params={"event": event_id})
-            stats = parse_stats_from_summary(summary)
-
-            for item in stats:
-                player = resolve_player(
-                    db,
-                    item["espn_id"],
-                    item["name"],
-                    item["position"],
-                    item["team"],
-                )
-                if store_weekly_stat(db, player, season, week, item["stats"]):
-                    created += 1
-                else:
-                    updated += 1
+        player_index = PlayerIndex(db)
+        with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as executor:
+            for week in weeks:
+                event_ids = fetch_event_ids_cached(season, week, season_type=season_type, cache_dir=cache_dir)
+                futures = {
+                    executor.submit(_fetch_and_parse, event_id, cache_dir): event_id
+                    for event_id in event_ids
+                }
+                items_by_event = {}
+                for future in as_completed(futures):
+                    event_id = futures[future]
+                    try:
+                        items, from_cache = future.result()
+                    except Exception as exc:
+                        report["failed_events"].append({"week": week, "event_id": event_id, "error": str(exc)})
+                        continue
+                    items_by_event[event_id] = items
+                    report["cached_summaries"] += int(from_cache)
 
-            time.sleep(0.1)
+                # Store in scoreboard order so duplicate players resolve the
+                # same way as the serial archive.
+                items = [item for event_id in event_ids for item in items_by_event.get(event_id, [])]
+                created, updated = bulk_store_weekly_stats(db, player_index, season, week, items, source=source)
+                db.commit()
 
-        db.commit()
-        print(f"✅ Archived weekly stats: {created} added, {updated} updated")
-    except Exception as exc:
+                report["weeks"].append(
+                    {"week": week, "events": len(event_ids), "created": created, "updated": updated}
+                )
+                report["events"] += len(event_ids)
+                report["created"] += created
+                report["updated"] += updated
+                print(f"📅 {season} week {week}: {len(event_ids)} events, {created} added, {updated} updated")
+
+        report["players_created"] = player_index.created
+        report["players_linked"] = player_index.linked
+        return report
+    except Exception:
         db.rollback()
-        print(f"❌ Weekly archive failed: {exc}")
+        raise
     finally:
         db.close()
 
 
+def archive_week(season, week, season_type=2):
+    try:
+        report = backfill_weekly_stats(season, [week], season_type=season_type)
+    except Exception as exc:
+        print(f"❌ Weekly archive failed: {exc}")
+        return
+    print(f"✅ Archived weekly stats: {report['created']} added, {report['updated']} updated")
+    for failure in report["failed_events"]:
+        print(f"⚠️ Event {failure['event_id']} skipped: {failure['error']}")
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 3:
-        print("Usage: python archive_weekly_stats.py <season> <week>")
+        print("Usage: python archive_weekly_stats.py <season> <week> [<end_week>]")
         sys.exit(1)
 
     season_arg = int(sys.argv[1])
     week_arg = int(sys.argv[2])
-    archive_week(season_arg, week_arg)
+    if len(sys.argv) > 3:
+        backfill_report = backfill_weekly_stats(season_arg, range(week_arg, int(sys.argv[3]) + 1))
+        print(
+            f"✅ Backfilled {len(backfill_report['weeks'])} weeks: "
+            f"{backfill_report['created']} added, {backfill_report['updated']} updated, "
+            f"{backfill_report['cached_summaries']}/{backfill_report['events']} summaries from cache"
+        )
+        for failure in backfill_report["failed_events"]:
+            print(f"⚠️ Week {failure['week']} event {failure['event_id']} skipped: {failure['error']}")
+    else:
+        archive_week(season_arg, week_arg)
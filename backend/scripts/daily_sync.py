@@ -47,6 +47,7 @@ def sync_nfl_reality():
     # Collect the set of local player IDs confirmed active in this feed run.
     # Used after the loop to deactivate players absent from the current roster.
     seen_player_ids: set[int] = set()
+    identity_index = player_service.PlayerIdentityIndex.from_db(db)
 
     for _, row in active_players.iterrows():
         name = row.get('display_name') or row.get('player_name') or row.get('first_name')
@@ -74,6 +75,7 @@ def sync_nfl_reality():
             name=name,
             position=position,
             nfl_team=team,
+            index=identity_index,
         )
         if player:
             # Update ESPN ID if we have it and it's missing from the record
@@ -83,6 +85,7 @@ def sync_nfl_reality():
             if player.nfl_team != team:
                 print(f"🚀 Trade Alert: {player.name} moved from {player.nfl_team} to {team}")
                 player.nfl_team = team
+            identity_index.add(player)
             upsert_player_season(
                 db,
                 player_id=int(player.id),
@@ -8,10 +8,13 @@ normalization per report type.
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
 import random
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -72,6 +75,7 @@ class ExtractSummary:
     retry_attempts: int
     throttled_retries: int
     unresolved_failures: int
+    skipped_unchanged_reports: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -83,6 +87,7 @@ class ExtractSummary:
             "retry_attempts": self.retry_attempts,
             "throttled_retries": self.throttled_retries,
             "unresolved_failures": self.unresolved_failures,
+            "skipped_unchanged_reports": self.skipped_unchanged_reports,
         }
 
 
@@ -101,21 +106,39 @@ class AdaptiveThrottle:
     last_request_monotonic: float = 0.0
     total_retries: int = 0
     throttled_retries: int = 0
+    paused_until_monotonic: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def wait_for_slot(self) -> None:
-        if self.min_interval_seconds <= 0:
-            self.last_request_monotonic = time.monotonic()
-            return
-
-        now = time.monotonic()
-        elapsed = now - self.last_request_monotonic if self.last_request_monotonic else self.min_interval_seconds
-        sleep_for = self.min_interval_seconds - elapsed
-        if sleep_for > 0:
-            time.sleep(sleep_for)
-        self.last_request_monotonic = time.monotonic()
+        # Slots are reserved under the lock so concurrent workers still space
+        # requests by min_interval_seconds and all honour a 429 pause.
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self.paused_until_monotonic)
+                if self.min_interval_seconds > 0 and self.last_request_monotonic:
+                    start_at = max(start_at, self.last_request_monotonic + self.min_interval_seconds)
+                self.last_request_monotonic = start_at
+
+            sleep_for = start_at - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            with self._lock:
+                if self.paused_until_monotonic <= time.monotonic():
+                    return
 
     def record_success(self) -> None:
-        self.consecutive_429 = 0
+        with self._lock:
+            self.consecutive_429 = 0
+
+    def record_throttled(self) -> None:
+        with self._lock:
+            self.consecutive_429 += 1
+
+    def pause(self, seconds: float) -> None:
+        """Hold every worker's next request for ``seconds`` (429 backoff is global)."""
+        with self._lock:
+            self.paused_until_monotonic = max(self.paused_until_monotonic, time.monotonic() + seconds)
 
     def backoff_seconds(self, *, attempt_index: int, retry_after_header: str | None) -> float:
         retry_after_seconds: float | None = None
@@ -140,9 +163,10 @@ class AdaptiveThrottle:
         return delay
 
     def record_retry(self, *, was_throttle: bool) -> None:
-        self.total_retries += 1
-        if was_throttle:
-            self.throttled_retries += 1
+        with self._lock:
+            self.total_retries += 1
+            if was_throttle:
+                self.throttled_retries += 1
 
 
 def _as_list(value: Any) -> list[Any]:
@@ -562,7 +586,7 @@ def _fetch_json(
             )
 
             if response.status_code == 429:
-                throttle.consecutive_429 += 1
+                throttle.record_throttled()
                 if attempt > throttle.max_retries_per_request:
                     response.raise_for_status()
 
@@ -575,7 +599,7 @@ def _fetch_json(
                     f"[retry] season={season} type={report_type} status=429 "
                     f"attempt={attempt}/{throttle.max_retries_per_request} sleep={delay:.1f}s"
                 )
-                time.sleep(delay)
+                throttle.pause(delay)
                 continue
 
             if 500 <= response.status_code <= 599:
@@ -610,6 +634,129 @@ def _fetch_json(
     raise RuntimeError(f"request failed without response for season={season} type={report_type}")
 
 
+MANIFEST_FILENAME = "_manifest.json"
+
+
+def _payload_hash(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _manifest_key(season: int, report_type: str) -> str:
+    return f"{season}/{report_type}"
+
+
+def _load_manifest(output_base: Path) -> dict[str, Any]:
+    path = output_base / MANIFEST_FILENAME
+    if not path.exists():
+        return {"reports": {}}
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        print(f"[warn] ignoring unreadable manifest {path}")
+        return {"reports": {}}
+    manifest.setdefault("reports", {})
+    return manifest
+
+
+def _save_manifest(output_base: Path, manifest: dict[str, Any]) -> None:
+    # Write-then-rename so an interrupted run never leaves a torn manifest.
+    path = output_base / MANIFEST_FILENAME
+    tmp_path = path.with_suffix(".json.tmp")
+    _write_json(tmp_path, manifest)
+    tmp_path.replace(path)
+
+
+def _manifest_entry_is_complete(output_base: Path, entry: dict[str, Any] | None) -> bool:
+    if not entry or entry.get("status") != "ok":
+        return False
+    raw_path = output_base / str(entry.get("raw_path", ""))
+    csv_path = output_base / str(entry.get("csv_path", ""))
+    if not raw_path.is_file() or not csv_path.is_file():
+        return False
+    try:
+        payload = json.loads(raw_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return _payload_hash(payload) == entry.get("content_sha256")
+
+
+def _extract_report(
+    *,
+    season: int,
+    league_id: str,
+    report_type: str,
+    output_base: Path,
+    timeout_seconds: int,
+    session_cookie: str | None,
+    session: requests.Session,
+    throttle: AdaptiveThrottle,
+    previous_entry: dict[str, Any] | None,
+) -> dict[str, Any]:
+    extracted_at = datetime.now(timezone.utc).isoformat()
+    payload = _fetch_json(
+        season=season,
+        league_id=league_id,
+        report_type=report_type,
+        timeout_seconds=timeout_seconds,
+        session_cookie=session_cookie,
+        session=session,
+        throttle=throttle,
+    )
+
+    if report_type == "draftResults":
+        try:
+            auction_payload = _fetch_json(
+                season=season,
+                league_id=league_id,
+                report_type="auctionResults",
+                timeout_seconds=timeout_seconds,
+                session_cookie=session_cookie,
+                session=session,
+                throttle=throttle,
+            )
+            if isinstance(auction_payload, dict) and "error" not in auction_payload:
+                payload["_auction_results_fallback"] = auction_payload
+        except Exception:  # noqa: BLE001
+            # Not all seasons/leagues expose auction results.
+            pass
+
+    raw_relpath = Path("raw") / report_type / f"{season}.json"
+    csv_relpath = Path(report_type) / f"{season}.csv"
+    content_sha256 = _payload_hash(payload)
+
+    if previous_entry and _manifest_entry_is_complete(output_base, previous_entry):
+        if previous_entry.get("content_sha256") == content_sha256:
+            return {**previous_entry, "outcome": "unchanged"}
+
+    _write_json(output_base / raw_relpath, payload)
+
+    normalizer = NORMALIZERS.get(report_type)
+    if normalizer is None:
+        rows = [
+            {
+                **_meta(season, league_id, report_type, extracted_at),
+                "payload_json": json.dumps(payload, separators=(",", ":")),
+            }
+        ]
+    else:
+        rows = normalizer(payload, season, league_id, extracted_at)
+
+    _write_csv(output_base / csv_relpath, rows)
+    return {
+        "outcome": "extracted",
+        "status": "ok",
+        "season": season,
+        "league_id": league_id,
+        "report_type": report_type,
+        "content_sha256": content_sha256,
+        "rows": len(rows),
+        "raw_path": raw_relpath.as_posix(),
+        "csv_path": csv_relpath.as_posix(),
+        "extracted_at_utc": extracted_at,
+    }
+
+
 def run_mfl_history_extract(
     *,
     start_year: int,
@@ -626,13 +773,28 @@ def run_mfl_history_extract(
     cooldown_after_burst_seconds: float = 15.0,
     burst_threshold: int = 3,
     max_retry_after_seconds: float = 300.0,
+    resume: bool = False,
+    refresh_from_season: int | None = None,
+    max_concurrency: int = 1,
 ) -> dict[str, Any]:
+    """Extract MFL reports for each season into raw JSON and normalized CSV.
+
+    With ``resume=True`` a per-(season, report_type) manifest with content
+    hashes is kept in ``output_root/_manifest.json``. Completed reports for
+    seasons before ``refresh_from_season`` (default: the current year) are
+    skipped without a request; newer seasons are re-fetched but only
+    rewritten when their content hash changed. ``max_concurrency`` workers
+    share one throttle, so request spacing and 429 backoff stay global.
+    """
     output_base = Path(output_root)
     report_types = report_types or DEFAULT_REPORT_TYPES
     seasons = list(range(start_year, end_year + 1))
+    if refresh_from_season is None:
+        refresh_from_season = datetime.now(timezone.utc).year
 
     extracted_reports = 0
     skipped_missing_league_id = 0
+    skipped_unchanged_reports = 0
     failed_reports = 0
     unresolved_failures: list[dict[str, Any]] = []
 
@@ -647,8 +809,10 @@ def run_mfl_history_extract(
         max_retry_after_seconds=max_retry_after_seconds,
     )
 
-    session = requests.Session()
+    manifest = _load_manifest(output_base) if resume else {"reports": {}}
+    manifest_lock = threading.Lock()
 
+    jobs: list[tuple[int, str, str]] = []
     for season in seasons:
         league_id = KNOWN_LEAGUE_BY_SEASON.get(season)
         if not league_id:
@@ -657,72 +821,96 @@ def run_mfl_history_extract(
             continue
 
         for report_type in report_types:
-            extracted_at = datetime.now(timezone.utc).isoformat()
-            try:
-                payload = _fetch_json(
-                    season=season,
-                    league_id=league_id,
-                    report_type=report_type,
-                    timeout_seconds=timeout_seconds,
-                    session_cookie=session_cookie,
-                    session=session,
-                    throttle=throttle,
-                )
-
-                if report_type == "draftResults":
-                    try:
-                        auction_payload = _fetch_json(
-                            season=season,
-                            league_id=league_id,
-                            report_type="auctionResults",
-                            timeout_seconds=timeout_seconds,
-                            session_cookie=session_cookie,
-                            session=session,
-                            throttle=throttle,
-                        )
-                        if isinstance(auction_payload, dict) and "error" not in auction_payload:
-                            payload["_auction_results_fallback"] = auction_payload
-                    except Exception:  # noqa: BLE001
-                        # Not all seasons/leagues expose auction results.
-                        pass
-
-                raw_path = output_base / "raw" / report_type / f"{season}.json"
-                _write_json(raw_path, payload)
-
-                normalizer = NORMALIZERS.get(report_type)
-                if normalizer is None:
-                    rows = [
-                        {
-                            **_meta(season, league_id, report_type, extracted_at),
-                            "payload_json": json.dumps(payload, separators=(",", ":")),
-                        }
-                    ]
+            entry = manifest["reports"].get(_manifest_key(season, report_type))
+            if (
+                resume
+                and season < refresh_from_season
+                and entry
+                and entry.get("league_id") == league_id
+                and _manifest_entry_is_complete(output_base, entry)
+            ):
+                print(f"[skip] season={season} type={report_type} already extracted")
+                skipped_unchanged_reports += 1
+                continue
+            jobs.append((season, league_id, report_type))
+
+    # requests.Session is not guaranteed thread-safe; one per worker thread.
+    thread_state = threading.local()
+    sessions: list[requests.Session] = []
+
+    def _session() -> requests.Session:
+        session = getattr(thread_state, "session", None)
+        if session is None:
+            session = requests.Session()
+            thread_state.session = session
+            with manifest_lock:
+                sessions.append(session)
+        return session
+
+    def _run_job(job: tuple[int, str, str]) -> tuple[tuple[int, str, str], dict[str, Any] | None, Exception | None]:
+        season, league_id, report_type = job
+        key = _manifest_key(season, report_type)
+        try:
+            result = _extract_report(
+                season=season,
+                league_id=league_id,
+                report_type=report_type,
+                output_base=output_base,
+                timeout_seconds=timeout_seconds,
+                session_cookie=session_cookie,
+                session=_session(),
+                throttle=throttle,
+                previous_entry=manifest["reports"].get(key) if resume else None,
+            )
+        except Exception as exc:  # noqa: BLE001
+            return job, None, exc
+
+        if resume:
+            entry = {k: v for k, v in result.items() if k != "outcome"}
+            with manifest_lock:
+                manifest["reports"][key] = entry
+                manifest["updated_at_utc"] = datetime.now(timezone.utc).isoformat()
+                _save_manifest(output_base, manifest)
+        return job, result, None
+
+    if max_concurrency <= 1:
+        outcomes = map(_run_job, jobs)
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="mfl-extract")
+        outcomes = executor.map(_run_job, jobs)
+
+    try:
+        for (season, league_id, report_type), result, exc in outcomes:
+            if exc is None and result is not None:
+                if result["outcome"] == "unchanged":
+                    print(f"[unchanged] season={season} type={report_type}")
+                    skipped_unchanged_reports += 1
                 else:
-                    rows = normalizer(payload, season, league_id, extracted_at)
-
-                csv_path = output_base / report_type / f"{season}.csv"
-                _write_csv(csv_path, rows)
-                print(f"[ok] season={season} type={report_type} rows={len(rows)}")
-                extracted_reports += 1
-            except Exception as exc:  # noqa: BLE001
-                failed_reports += 1
-                print(f"[error] season={season} type={report_type} {exc}")
-                unresolved_failures.append(
-                    {
-                        "season": season,
-                        "league_id": league_id,
-                        "report_type": report_type,
-                        "error": str(exc),
-                        "failed_at_utc": datetime.now(timezone.utc).isoformat(),
-                    }
-                )
-                if "football7.myfantasyleague.com" in str(exc):
-                    print(
-                        "[hint] legacy host football7.myfantasyleague.com did not resolve; "
-                        "capture this season via manual export/snapshot and import as CSV"
-                    )
+                    print(f"[ok] season={season} type={report_type} rows={result['rows']}")
+                    extracted_reports += 1
+                continue
 
-    session.close()
+            failed_reports += 1
+            print(f"[error] season={season} type={report_type} {exc}")
+            unresolved_failures.append(
+                {
+                    "season": season,
+                    "league_id": league_id,
+                    "report_type": report_type,
+                    "error": str(exc),
+                    "failed_at_utc": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+            if "football7.myfantasyleague.com" in str(exc):
+                print(
+                    "[hint] legacy host football7.myfantasyleague.com did not resolve; "
+                    "capture this season via manual export/snapshot and import as CSV"
+                )
+    finally:
+        if max_concurrency > 1:
+            executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
 
     summary = ExtractSummary(
         requested_seasons=seasons,
@@ -733,6 +921,7 @@ def run_mfl_history_extract(
         retry_attempts=throttle.total_retries,
         throttled_retries=throttle.throttled_retries,
         unresolved_failures=len(unresolved_failures),
+        skipped_unchanged_reports=skipped_unchanged_reports,
     )
 
     summary_path = output_base / "_run_summary.json"
@@ -748,4 +937,4 @@ def run_mfl_history_extract(
         },
     )
 
-    return summary.to_dict()
\ No newline at end of file
+    return summary.to_dict()
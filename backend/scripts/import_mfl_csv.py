@@ -4,20 +4,29 @@ Issue #258 baseline:
 - Validate CSV structure.
 - Map players and draft results into existing models.
 - Provide dry-run summary and safe apply mode.
+
+Passing ``chunk_size`` streams every report instead of loading it whole:
+rows are resolved against in-memory owner/player indexes, picks, matchups
+and transactions are bulk-inserted per chunk, and (outside dry-run) each
+chunk is committed, so multi-season imports run in bounded memory.
 """
 
 from __future__ import annotations
 
 import csv
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from backend import models
 from backend.database import SessionLocal
+from backend.services.head_to_head_service import refresh_head_to_head_aggregates
 from backend.services.player_service import canonical_player_identity
+from backend.services.transaction_service import refresh_ownership_spans
 
 
 REQUIRED_COLUMNS: dict[str, list[str]] = {
@@ -36,6 +45,11 @@ DB_DATASET_KEYS: dict[str, set[str]] = {
     "transactions": {"html_transactions_normalized"},
 }
 
+DEFAULT_STREAM_CHUNK_SIZE = 1000
+
+# (report_type, rows processed so far) after each streamed chunk.
+ProgressCallback = Callable[[str, int], None]
+
 
 @dataclass
 class ImportSummary:
@@ -85,20 +99,23 @@ class ImportSummary:
         }
 
 
-def _read_csv(path: Path) -> list[dict[str, str]]:
+def _iter_csv(path: Path) -> Iterator[dict[str, str]]:
     with path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        return [dict(row) for row in reader]
+        for row in csv.DictReader(handle):
+            yield dict(row)
 
 
-def _load_report_rows(
+def _read_csv(path: Path) -> list[dict[str, str]]:
+    return list(_iter_csv(path))
+
+
+def _iter_report_rows(
     *,
     input_root: Path,
     report_type: str,
     seasons: list[int],
     summary: ImportSummary,
-) -> list[dict[str, str]]:
-    rows: list[dict[str, str]] = []
+) -> Iterator[dict[str, str]]:
     required = REQUIRED_COLUMNS.get(report_type, [])
 
     for season in seasons:
@@ -109,8 +126,7 @@ def _load_report_rows(
             continue
 
         summary.files_checked += 1
-        file_rows = _read_csv(path)
-        for row in file_rows:
+        for row in _iter_csv(path):
             summary.rows_validated += 1
             missing = [col for col in required if (row.get(col) or "").strip() == ""]
             if missing:
@@ -119,20 +135,35 @@ def _load_report_rows(
                     f"invalid {report_type} row season={season}: missing columns {missing}"
                 )
                 continue
-            rows.append(row)
+            yield row
 
-    return rows
 
+def _load_report_rows(
+    *,
+    input_root: Path,
+    report_type: str,
+    seasons: list[int],
+    summary: ImportSummary,
+) -> list[dict[str, str]]:
+    return list(
+        _iter_report_rows(
+            input_root=input_root,
+            report_type=report_type,
+            seasons=seasons,
+            summary=summary,
+        )
+    )
 
-def _load_report_rows_from_db(
+
+def _iter_report_rows_from_db(
     *,
     db: Session,
     report_type: str,
     seasons: list[int],
     summary: ImportSummary,
     source_league_id: str | None,
-) -> list[dict[str, str]]:
-    rows: list[dict[str, str]] = []
+    batch_size: int | None = None,
+) -> Iterator[dict[str, str]]:
     required = REQUIRED_COLUMNS.get(report_type, [])
     dataset_keys = DB_DATASET_KEYS.get(report_type, set())
     season_set = set(seasons)
@@ -143,8 +174,9 @@ def _load_report_rows_from_db(
         facts_query = facts_query.filter(models.MflHtmlRecordFact.dataset_key.in_(dataset_keys))
     if source_league_id:
         facts_query = facts_query.filter(models.MflHtmlRecordFact.league_id == source_league_id)
+    facts = facts_query.yield_per(batch_size) if batch_size else facts_query.all()
 
-    for fact in facts_query.all():
+    for fact in facts:
         record = fact.record_json or {}
         if not isinstance(record, dict):
             continue
@@ -175,7 +207,7 @@ def _load_report_rows_from_db(
             )
             continue
 
-        rows.append(row)
+        yield row
 
     for season in seasons:
         if season in matched_seasons:
@@ -184,7 +216,35 @@ def _load_report_rows_from_db(
             summary.files_missing += 1
             summary.warnings.append(f"missing db rows: report={report_type} season={season}")
 
-    return rows
+
+def _load_report_rows_from_db(
+    *,
+    db: Session,
+    report_type: str,
+    seasons: list[int],
+    summary: ImportSummary,
+    source_league_id: str | None,
+) -> list[dict[str, str]]:
+    return list(
+        _iter_report_rows_from_db(
+            db=db,
+            report_type=report_type,
+            seasons=seasons,
+            summary=summary,
+            source_league_id=source_league_id,
+        )
+    )
+
+
+def _iter_chunks(rows: Iterable[dict[str, str]], chunk_size: int | None) -> Iterator[list[dict[str, str]]]:
+    if not chunk_size:
+        chunk = list(rows)
+        if chunk:
+            yield chunk
+        return
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
 
 
 def _safe_int(value: str | None) -> int | None:
@@ -227,7 +287,7 @@ def _build_owner_map(
     db: Session,
     *,
     target_league_id: int,
-    franchise_rows: list[dict[str, str]],
+    franchise_rows: Iterable[dict[str, str]],
 ) -> dict[tuple[int, str], int]:
     users = (
         db.query(models.User)
@@ -299,8 +359,8 @@ def _build_franchise_division_map(
 
 
 def _build_playoff_week_map(
-    schedule_rows: list[dict[str, str]],
-    franchise_rows: list[dict[str, str]],
+    schedule_rows: Iterable[dict[str, str]],
+    franchise_rows: Iterable[dict[str, str]],
 ) -> dict[tuple[int, int], bool]:
     franchise_counts: dict[int, int] = {}
     for row in franchise_rows:
@@ -330,6 +390,316 @@ def _build_playoff_week_map(
     return playoff_week_map
 
 
+def _existing_draft_pick_keys(db: Session, target_league_id: int) -> set[tuple]:
+    pick = models.DraftPick
+    return {
+        (
+            int(year or 0),
+            int(owner_id or 0),
+            int(player_id or 0),
+            int(round_num or 0),
+            int(pick_num or 0),
+            str(session_id or ""),
+            int(league_id or 0),
+        )
+        for year, owner_id, player_id, round_num, pick_num, session_id, league_id in db.query(
+            pick.year,
+            pick.owner_id,
+            pick.player_id,
+            pick.round_num,
+            pick.pick_num,
+            pick.session_id,
+            pick.league_id,
+        ).filter(pick.league_id == target_league_id)
+    }
+
+
+def _existing_matchup_keys(db: Session, target_league_id: int) -> set[tuple[int, int, int, int, int]]:
+    matchup = models.Matchup
+    return {
+        (int(league_id or 0), int(season), int(week), int(home_team_id), int(away_team_id))
+        for league_id, season, week, home_team_id, away_team_id in db.query(
+            matchup.league_id,
+            matchup.season,
+            matchup.week,
+            matchup.home_team_id,
+            matchup.away_team_id,
+        ).filter(matchup.league_id == target_league_id)
+        if season is not None and week is not None and home_team_id is not None and away_team_id is not None
+    }
+
+
+def _existing_transaction_keys(db: Session, target_league_id: int) -> set[tuple]:
+    history = models.TransactionHistory
+    return {
+        (
+            int(league_id or 0),
+            int(season),
+            int(player_id or 0),
+            str(old_owner_id or ""),
+            str(new_owner_id or ""),
+            str(transaction_type or ""),
+        )
+        for league_id, season, player_id, old_owner_id, new_owner_id, transaction_type in db.query(
+            history.league_id,
+            history.season,
+            history.player_id,
+            history.old_owner_id,
+            history.new_owner_id,
+            history.transaction_type,
+        ).filter(history.league_id == target_league_id)
+        if season is not None
+    }
+
+
+def _resolve_player_chunk(
+    db: Session,
+    rows: list[dict[str, str]],
+    *,
+    player_index: dict[tuple[str, str, str], int],
+    mfl_player_to_local: dict[tuple[int, str], int],
+    summary: ImportSummary,
+) -> None:
+    new_players: dict[tuple[str, str, str], models.Player] = {}
+    pending: list[tuple[tuple[int, str], tuple[str, str, str]]] = []
+
+    for row in rows:
+        season = _safe_int(row.get("season"))
+        mfl_player_id = (row.get("player_mfl_id") or "").strip()
+        if season is None or not mfl_player_id:
+            continue
+
+        name = (row.get("player_name") or "").strip()
+        position = (row.get("position") or "").strip().upper()
+        nfl_team = (row.get("nfl_team") or "").strip().upper()
+        if not name or not position or not nfl_team:
+            summary.rows_invalid += 1
+            continue
+
+        key = canonical_player_identity(name, position, nfl_team)
+        existing_id = player_index.get(key)
+        if existing_id is not None:
+            summary.players_matched += 1
+            mfl_player_to_local[(season, mfl_player_id)] = existing_id
+            continue
+
+        if key in new_players:
+            summary.players_matched += 1
+        else:
+            new_players[key] = models.Player(
+                name=name,
+                position=position,
+                nfl_team=nfl_team,
+                adp=0.0,
+                projected_points=0.0,
+            )
+            summary.players_inserted += 1
+        pending.append(((season, mfl_player_id), key))
+
+    if not new_players:
+        return
+
+    # One flush per chunk assigns ids to every player first seen in it.
+    db.add_all(new_players.values())
+    db.flush()
+    for key, player in new_players.items():
+        player_index[key] = int(player.id)
+    for mfl_key, key in pending:
+        mfl_player_to_local[mfl_key] = player_index[key]
+
+
+def _draft_pick_values(
+    row: dict[str, str],
+    *,
+    target_league_id: int,
+    owner_map: dict[tuple[int, str], int],
+    mfl_player_to_local: dict[tuple[int, str], int],
+    existing_keys: set[tuple],
+    summary: ImportSummary,
+) -> dict[str, Any] | None:
+    season = _safe_int(row.get("season"))
+    franchise_id = (row.get("franchise_id") or "").strip()
+    player_mfl_id = (row.get("player_mfl_id") or "").strip()
+    if season is None or not franchise_id or not player_mfl_id:
+        summary.draft_picks_skipped += 1
+        return None
+
+    owner_id = owner_map.get((season, franchise_id))
+    if owner_id is None:
+        summary.skipped_missing_owner_map += 1
+        summary.draft_picks_skipped += 1
+        return None
+
+    player_id = mfl_player_to_local.get((season, player_mfl_id))
+    if player_id is None:
+        summary.skipped_missing_player_map += 1
+        summary.draft_picks_skipped += 1
+        return None
+
+    round_num = _safe_int(row.get("round")) or 0
+    pick_num = _safe_int(row.get("pick_number")) or 0
+    session_id = f"MFL_{season}"
+    key = (season, owner_id, player_id, round_num, pick_num, session_id, target_league_id)
+    if key in existing_keys:
+        summary.draft_picks_skipped += 1
+        return None
+
+    existing_keys.add(key)
+    summary.draft_picks_inserted += 1
+    return {
+        "year": season,
+        "round_num": round_num if round_num > 0 else None,
+        "pick_num": pick_num if pick_num > 0 else None,
+        "amount": _safe_amount(row.get("winning_bid")),
+        "session_id": session_id,
+        "owner_id": owner_id,
+        "player_id": player_id,
+        "league_id": target_league_id,
+        "current_status": "BENCH",
+    }
+
+
+def _matchup_values(
+    row: dict[str, str],
+    *,
+    target_league_id: int,
+    owner_map: dict[tuple[int, str], int],
+    division_map: dict[tuple[int, str], str | None],
+    playoff_week_map: dict[tuple[int, int], bool],
+    existing_keys: set[tuple[int, int, int, int, int]],
+    summary: ImportSummary,
+) -> dict[str, Any] | None:
+    season = _safe_int(row.get("season"))
+    week = _safe_int(row.get("week"))
+    home_franchise_id = (row.get("home_franchise_id") or "").strip()
+    away_franchise_id = (row.get("away_franchise_id") or "").strip()
+    if season is None or week is None or not home_franchise_id or not away_franchise_id:
+        summary.matchups_skipped += 1
+        return None
+
+    if home_franchise_id.upper() == "BYE" or away_franchise_id.upper() == "BYE":
+        summary.matchups_skipped += 1
+        summary.bye_matchups_skipped += 1
+        return None
+
+    home_team_id = owner_map.get((season, home_franchise_id))
+    away_team_id = owner_map.get((season, away_franchise_id))
+    if home_team_id is None or away_team_id is None:
+        summary.skipped_missing_owner_map += 1
+        summary.matchups_skipped += 1
+        summary.warnings.append(
+            f"missing owner map for matchup season={season} week={week} home={home_franchise_id} away={away_franchise_id}"
+        )
+        return None
+
+    key = (target_league_id, season, week, home_team_id, away_team_id)
+    if key in existing_keys:
+        summary.matchups_skipped += 1
+        return None
+
+    home_score = _safe_float(row.get("home_score"))
+    away_score = _safe_float(row.get("away_score"))
+    is_completed = home_score is not None and away_score is not None
+    home_division = division_map.get((season, home_franchise_id))
+    away_division = division_map.get((season, away_franchise_id))
+
+    existing_keys.add(key)
+    summary.matchups_inserted += 1
+    return {
+        "league_id": target_league_id,
+        "season": season,
+        "week": week,
+        "home_team_id": home_team_id,
+        "away_team_id": away_team_id,
+        "home_score": home_score or 0.0,
+        "away_score": away_score or 0.0,
+        "is_completed": is_completed,
+        "game_status": "FINAL" if is_completed else "NOT_STARTED",
+        "is_playoff": playoff_week_map.get((season, week), False),
+        "is_division_matchup": bool(home_division and away_division and home_division == away_division),
+        "is_rivalry_week": False,
+    }
+
+
+def _transaction_values(
+    row: dict[str, str],
+    *,
+    target_league_id: int,
+    owner_map: dict[tuple[int, str], int],
+    mfl_player_to_local: dict[tuple[int, str], int],
+    existing_keys: set[tuple],
+    summary: ImportSummary,
+) -> dict[str, Any] | None:
+    season = _safe_int(row.get("season"))
+    franchise_id = (row.get("franchise_id") or "").strip()
+    player_mfl_id = (row.get("player_mfl_id") or "").strip()
+    transaction_type = (row.get("transaction_type") or "").strip().lower()
+    if season is None or not franchise_id or not player_mfl_id or not transaction_type:
+        summary.transactions_skipped += 1
+        return None
+
+    owner_id = owner_map.get((season, franchise_id))
+    if owner_id is None:
+        summary.skipped_missing_owner_map += 1
+        summary.transactions_skipped += 1
+        return None
+
+    player_id = mfl_player_to_local.get((season, player_mfl_id))
+    if player_id is None:
+        summary.skipped_missing_player_map += 1
+        summary.transactions_skipped += 1
+        return None
+
+    # Determine old_owner_id and new_owner_id based on transaction type
+    # - waiver_add: new_owner_id = owner_id, old_owner_id = None
+    # - waiver_drop / drop: old_owner_id = owner_id, new_owner_id = None
+    # - trade: depends on transaction context (for now, both point to owner_id)
+    # - draft: owner_id is the new owner, old_owner_id = None
+    old_owner_id = None
+    new_owner_id = None
+
+    if transaction_type in ("waiver_add", "draft"):
+        new_owner_id = owner_id
+    elif transaction_type in ("waiver_drop", "drop"):
+        old_owner_id = owner_id
+    elif transaction_type == "trade":
+        # For trades, we only know one franchise_id; old_owner_id and new_owner_id would require more context
+        # For now, assume owner_id is the new owner (acquired the player)
+        new_owner_id = owner_id
+    else:
+        # unknown transaction type
+        summary.transactions_skipped += 1
+        summary.warnings.append(f"Unknown transaction_type: {transaction_type}")
+        return None
+
+    amount_str = (row.get("amount") or "").strip()
+    amount = _safe_amount(amount_str) if amount_str else 0
+
+    notes = f"Type: {transaction_type}"
+    if amount:
+        notes += f", Amount: ${amount}"
+    week = _safe_int(row.get("week"))
+    if week:
+        notes += f", Week: {week}"
+
+    key = (target_league_id, season, player_id, str(old_owner_id or ""), str(new_owner_id or ""), transaction_type)
+    if key in existing_keys:
+        summary.transactions_skipped += 1
+        return None
+
+    existing_keys.add(key)
+    summary.transactions_inserted += 1
+    return {
+        "league_id": target_league_id,
+        "season": season,
+        "player_id": player_id,
+        "old_owner_id": old_owner_id,
+        "new_owner_id": new_owner_id,
+        "transaction_type": transaction_type,
+        "notes": notes,
+    }
+
+
 def run_import_mfl_csv(
     *,
     input_root: str | None,
@@ -339,7 +709,16 @@ def run_import_mfl_csv(
     dry_run: bool = True,
     source_mode: str = "db",
     source_league_id: str | None = None,
+    chunk_size: int | None = None,
+    progress: ProgressCallback | None = None,
 ) -> dict[str, Any]:
+    """Import franchises, players, draft picks, matchups and transactions.
+
+    Without ``chunk_size`` every report is processed as one batch in a single
+    transaction. With it, reports are streamed ``chunk_size`` rows at a time;
+    each chunk is bulk-inserted and, unless ``dry_run``, committed before the
+    next is read, and ``progress`` is called after every chunk.
+    """
     seasons = list(range(start_year, end_year + 1))
     summary = ImportSummary(
         input_root=input_root or "db:mfl_html_record_facts",
@@ -352,6 +731,8 @@ def run_import_mfl_csv(
         raise ValueError("source_mode must be either 'csv' or 'db'")
     if source_mode == "csv" and not input_root:
         raise ValueError("input_root is required when source_mode='csv'")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
     if source_mode == "csv":
         import warnings
         warnings.warn(
@@ -364,329 +745,146 @@ def run_import_mfl_csv(
 
     root = Path(input_root) if input_root else None
     db = SessionLocal()
-    try:
+    # Streamed db-mode reads run on their own session so per-chunk commits on
+    # ``db`` do not close the open fact cursor.
+    source_db = SessionLocal() if source_mode == "db" and chunk_size else db
+
+    def report_rows(report_type: str, report_summary: ImportSummary) -> Iterator[dict[str, str]]:
         if source_mode == "db":
-            franchise_rows = _load_report_rows_from_db(
-                db=db,
-                report_type="franchises",
-                seasons=seasons,
-                summary=summary,
-                source_league_id=source_league_id,
-            )
-            player_rows = _load_report_rows_from_db(
-                db=db,
-                report_type="players",
-                seasons=seasons,
-                summary=summary,
-                source_league_id=source_league_id,
-            )
-            draft_rows = _load_report_rows_from_db(
-                db=db,
-                report_type="draftResults",
-                seasons=seasons,
-                summary=summary,
-                source_league_id=source_league_id,
-            )
-            schedule_rows = _load_report_rows_from_db(
-                db=db,
-                report_type="schedule",
+            return _iter_report_rows_from_db(
+                db=source_db,
+                report_type=report_type,
                 seasons=seasons,
-                summary=summary,
-                source_league_id=source_league_id,
-            )
-            transaction_rows = _load_report_rows_from_db(
-                db=db,
-                report_type="transactions",
-                seasons=seasons,
-                summary=summary,
+                summary=report_summary,
                 source_league_id=source_league_id,
+                batch_size=chunk_size,
             )
+        return _iter_report_rows(
+            input_root=root,
+            report_type=report_type,
+            seasons=seasons,
+            summary=report_summary,
+        )
+
+    def checkpoint(report_type: str, rows_processed: int) -> None:
+        if chunk_size and not dry_run:
+            db.commit()
         else:
-            franchise_rows = _load_report_rows(
-                input_root=root,
-                report_type="franchises",
-                seasons=seasons,
-                summary=summary,
-            )
-            player_rows = _load_report_rows(
-                input_root=root,
-                report_type="players",
-                seasons=seasons,
-                summary=summary,
-            )
-            draft_rows = _load_report_rows(
-                input_root=root,
-                report_type="draftResults",
-                seasons=seasons,
-                summary=summary,
-            )
-            schedule_rows = _load_report_rows(
-                input_root=root,
-                report_type="schedule",
-                seasons=seasons,
-                summary=summary,
-            )
-            transaction_rows = _load_report_rows(
-                input_root=root,
-                report_type="transactions",
-                seasons=seasons,
-                summary=summary,
-            )
+            db.flush()
+        if progress is not None:
+            progress(report_type, rows_processed)
 
+    try:
+        # Franchise rows are one per team-season and feed every index below.
+        franchise_rows = list(report_rows("franchises", summary))
         owner_map = _build_owner_map(
             db,
             target_league_id=target_league_id,
             franchise_rows=franchise_rows,
         )
         division_map = _build_franchise_division_map(franchise_rows)
-        playoff_week_map = _build_playoff_week_map(schedule_rows, franchise_rows)
 
-        player_index = _build_existing_player_index(db)
+        player_index = {key: int(player.id) for key, player in _build_existing_player_index(db).items()}
         mfl_player_to_local: dict[tuple[int, str], int] = {}
 
-        for row in player_rows:
-            season = _safe_int(row.get("season"))
-            mfl_player_id = (row.get("player_mfl_id") or "").strip()
-            if season is None or not mfl_player_id:
-                continue
-
-            name = (row.get("player_name") or "").strip()
-            position = (row.get("position") or "").strip().upper()
-            nfl_team = (row.get("nfl_team") or "").strip().upper()
-            if not name or not position or not nfl_team:
-                summary.rows_invalid += 1
-                continue
-
-            key = canonical_player_identity(name, position, nfl_team)
-            existing = player_index.get(key)
-            if existing is None:
-                existing = models.Player(
-                    name=name,
-                    position=position,
-                    nfl_team=nfl_team,
-                    adp=0.0,
-                    projected_points=0.0,
-                )
-                db.add(existing)
-                db.flush()
-                player_index[key] = existing
-                summary.players_inserted += 1
-            else:
-                summary.players_matched += 1
-
-            mfl_player_to_local[(season, mfl_player_id)] = int(existing.id)
-
-        existing_pick_keys = {
-            (
-                int(row.year or 0),
-                int(row.owner_id or 0),
-                int(row.player_id or 0),
-                int(row.round_num or 0),
-                int(row.pick_num or 0),
-                str(row.session_id or ""),
-                int(row.league_id or 0),
-            )
-            for row in db.query(models.DraftPick).filter(models.DraftPick.league_id == target_league_id).all()
-        }
-
-        for row in draft_rows:
-            season = _safe_int(row.get("season"))
-            franchise_id = (row.get("franchise_id") or "").strip()
-            player_mfl_id = (row.get("player_mfl_id") or "").strip()
-            if season is None or not franchise_id or not player_mfl_id:
-                summary.draft_picks_skipped += 1
-                continue
-
-            owner_id = owner_map.get((season, franchise_id))
-            if owner_id is None:
-                summary.skipped_missing_owner_map += 1
-                summary.draft_picks_skipped += 1
-                continue
-
-            player_id = mfl_player_to_local.get((season, player_mfl_id))
-            if player_id is None:
-                summary.skipped_missing_player_map += 1
-                summary.draft_picks_skipped += 1
-                continue
-
-            round_num = _safe_int(row.get("round")) or 0
-            pick_num = _safe_int(row.get("pick_number")) or 0
-            session_id = f"MFL_{season}"
-            key = (season, owner_id, player_id, round_num, pick_num, session_id, target_league_id)
-            if key in existing_pick_keys:
-                summary.draft_picks_skipped += 1
-                continue
-
-            amount = _safe_amount(row.get("winning_bid"))
-            db.add(
-                models.DraftPick(
-                    year=season,
-                    round_num=round_num if round_num > 0 else None,
-                    pick_num=pick_num if pick_num > 0 else None,
-                    amount=amount,
-                    session_id=session_id,
-                    owner_id=owner_id,
-                    player_id=player_id,
-                    league_id=target_league_id,
-                    current_status="BENCH",
-                )
-            )
-            existing_pick_keys.add(key)
-            summary.draft_picks_inserted += 1
-
-        existing_matchup_keys = {
-            (
-                int(row.league_id or 0),
-                int(row.season or 0),
-                int(row.week or 0),
-                int(row.home_team_id or 0),
-                int(row.away_team_id or 0),
+        processed = 0
+        for chunk in _iter_chunks(report_rows("players", summary), chunk_size):
+            _resolve_player_chunk(
+                db,
+                chunk,
+                player_index=player_index,
+                mfl_player_to_local=mfl_player_to_local,
+                summary=summary,
             )
-            for row in db.query(models.Matchup)
-            .filter(models.Matchup.league_id == target_league_id)
-            .all()
-            if row.season is not None and row.week is not None and row.home_team_id is not None and row.away_team_id is not None
-        }
-
-        for row in schedule_rows:
-            season = _safe_int(row.get("season"))
-            week = _safe_int(row.get("week"))
-            home_franchise_id = (row.get("home_franchise_id") or "").strip()
-            away_franchise_id = (row.get("away_franchise_id") or "").strip()
-            if season is None or week is None or not home_franchise_id or not away_franchise_id:
-                summary.matchups_skipped += 1
-                continue
-
-            if home_franchise_id.upper() == "BYE" or away_franchise_id.upper() == "BYE":
-                summary.matchups_skipped += 1
-                summary.bye_matchups_skipped += 1
-                continue
-
-            home_team_id = owner_map.get((season, home_franchise_id))
-            away_team_id = owner_map.get((season, away_franchise_id))
-            if home_team_id is None or away_team_id is None:
-                summary.skipped_missing_owner_map += 1
-                summary.matchups_skipped += 1
-                summary.warnings.append(
-                    f"missing owner map for matchup season={season} week={week} home={home_franchise_id} away={away_franchise_id}"
+            processed += len(chunk)
+            checkpoint("players", processed)
+        player_index.clear()
+
+        existing_pick_keys = _existing_draft_pick_keys(db, target_league_id)
+        processed = 0
+        for chunk in _iter_chunks(report_rows("draftResults", summary), chunk_size):
+            values = [
+                value
+                for row in chunk
+                if (
+                    value := _draft_pick_values(
+                        row,
+                        target_league_id=target_league_id,
+                        owner_map=owner_map,
+                        mfl_player_to_local=mfl_player_to_local,
+                        existing_keys=existing_pick_keys,
+                        summary=summary,
+                    )
                 )
-                continue
-
-            key = (target_league_id, season, week, home_team_id, away_team_id)
-            if key in existing_matchup_keys:
-                summary.matchups_skipped += 1
-                continue
-
-            home_score = _safe_float(row.get("home_score"))
-            away_score = _safe_float(row.get("away_score"))
-            is_completed = home_score is not None and away_score is not None
-            home_division = division_map.get((season, home_franchise_id))
-            away_division = division_map.get((season, away_franchise_id))
-
-            db.add(
-                models.Matchup(
-                    league_id=target_league_id,
-                    season=season,
-                    week=week,
-                    home_team_id=home_team_id,
-                    away_team_id=away_team_id,
-                    home_score=home_score or 0.0,
-                    away_score=away_score or 0.0,
-                    is_completed=is_completed,
-                    game_status="FINAL" if is_completed else "NOT_STARTED",
-                    is_playoff=playoff_week_map.get((season, week), False),
-                    is_division_matchup=bool(home_division and away_division and home_division == away_division),
-                    is_rivalry_week=False,
+                is not None
+            ]
+            if values:
+                db.execute(insert(models.DraftPick), values)
+            processed += len(chunk)
+            checkpoint("draftResults", processed)
+        existing_pick_keys.clear()
+
+        # Playoff weeks are inferred from matchup counts per week, which needs
+        # one counting pass over the schedule before rows are inserted.
+        playoff_week_map = _build_playoff_week_map(
+            report_rows(
+                "schedule",
+                ImportSummary(input_root=summary.input_root, target_league_id=target_league_id, dry_run=dry_run, seasons=seasons),
+            ),
+            franchise_rows,
+        )
+        existing_matchup_keys = _existing_matchup_keys(db, target_league_id)
+        processed = 0
+        for chunk in _iter_chunks(report_rows("schedule", summary), chunk_size):
+            values = [
+                value
+                for row in chunk
+                if (
+                    value := _matchup_values(
+                        row,
+                        target_league_id=target_league_id,
+                        owner_map=owner_map,
+                        division_map=division_map,
+                        playoff_week_map=playoff_week_map,
+                        existing_keys=existing_matchup_keys,
+                        summary=summary,
+                    )
                 )
-            )
-            existing_matchup_keys.add(key)
-            summary.matchups_inserted += 1
+                is not None
+            ]
+            if values:
+                db.execute(insert(models.Matchup), values)
+            processed += len(chunk)
+            checkpoint("schedule", processed)
+        existing_matchup_keys.clear()
+        if summary.matchups_inserted:
+            refresh_head_to_head_aggregates(db, league_id=target_league_id, seasons=seasons)
 
         # ====== LOAD TRANSACTIONS ======
-        existing_transaction_keys = {
-            (
-                int(row.league_id or 0),
-                int(row.season or 0),
-                int(row.player_id or 0),
-                str(row.old_owner_id or ""),
-                str(row.new_owner_id or ""),
-                str(row.transaction_type or ""),
-            )
-            for row in db.query(models.TransactionHistory).filter(models.TransactionHistory.league_id == target_league_id).all()
-            if row.season is not None
-        }
-
-        for row in transaction_rows:
-            season = _safe_int(row.get("season"))
-            franchise_id = (row.get("franchise_id") or "").strip()
-            player_mfl_id = (row.get("player_mfl_id") or "").strip()
-            transaction_type = (row.get("transaction_type") or "").strip().lower()
-            if season is None or not franchise_id or not player_mfl_id or not transaction_type:
-                summary.transactions_skipped += 1
-                continue
-
-            owner_id = owner_map.get((season, franchise_id))
-            if owner_id is None:
-                summary.skipped_missing_owner_map += 1
-                summary.transactions_skipped += 1
-                continue
-
-            player_id = mfl_player_to_local.get((season, player_mfl_id))
-            if player_id is None:
-                summary.skipped_missing_player_map += 1
-                summary.transactions_skipped += 1
-                continue
-
-            # Determine old_owner_id and new_owner_id based on transaction type
-            # - waiver_add: new_owner_id = owner_id, old_owner_id = None
-            # - waiver_drop / drop: old_owner_id = owner_id, new_owner_id = None
-            # - trade: depends on transaction context (for now, both point to owner_id)
-            # - draft: owner_id is the new owner, old_owner_id = None
-            old_owner_id = None
-            new_owner_id = None
-
-            if transaction_type in ("waiver_add", "draft"):
-                new_owner_id = owner_id
-            elif transaction_type in ("waiver_drop", "drop"):
-                old_owner_id = owner_id
-            elif transaction_type == "trade":
-                # For trades, we only know one franchise_id; old_owner_id and new_owner_id would require more context
-                # For now, assume owner_id is the new owner (acquired the player)
-                new_owner_id = owner_id
-            else:
-                # unknown transaction type
-                summary.transactions_skipped += 1
-                summary.warnings.append(f"Unknown transaction_type: {transaction_type}")
-                continue
-
-            amount_str = (row.get("amount") or "").strip()
-            amount = _safe_amount(amount_str) if amount_str else 0
-
-            notes = f"Type: {transaction_type}"
-            if amount:
-                notes += f", Amount: ${amount}"
-            week = _safe_int(row.get("week"))
-            if week:
-                notes += f", Week: {week}"
-
-            key = (target_league_id, season, player_id, str(old_owner_id or ""), str(new_owner_id or ""), transaction_type)
-            if key in existing_transaction_keys:
-                summary.transactions_skipped += 1
-                continue
-
-            db.add(
-                models.TransactionHistory(
-                    league_id=target_league_id,
-                    season=season,
-                    player_id=player_id,
-                    old_owner_id=old_owner_id,
-                    new_owner_id=new_owner_id,
-                    transaction_type=transaction_type,
-                    notes=notes,
+        existing_transaction_keys = _existing_transaction_keys(db, target_league_id)
+        processed = 0
+        for chunk in _iter_chunks(report_rows("transactions", summary), chunk_size):
+            values = [
+                value
+                for row in chunk
+                if (
+                    value := _transaction_values(
+                        row,
+                        target_league_id=target_league_id,
+                        owner_map=owner_map,
+                        mfl_player_to_local=mfl_player_to_local,
+                        existing_keys=existing_transaction_keys,
+                        summary=summary,
+                    )
                 )
-            )
-            existing_transaction_keys.add(key)
-            summary.transactions_inserted += 1
+                is not None
+            ]
+            if values:
+                db.execute(insert(models.TransactionHistory), values)
+            processed += len(chunk)
+            checkpoint("transactions", processed)
+        if summary.transactions_inserted:
+            refresh_ownership_spans(db, league_id=target_league_id)
 
         if dry_run:
             db.rollback()
@@ -698,4 +896,6 @@ def run_import_mfl_csv(
         db.rollback()
         raise
     finally:
-        db.close()
\ No newline at end of file
+        if source_db is not db:
+            source_db.close()
+        db.close()
@@ -1,7 +1,8 @@
 """Load normalized MFL HTML record datasets into Postgres.
 
 The loader ingests CSVs produced by `normalize-mfl-html-records` into a
-single fact table for downstream querying.
+single fact table for downstream querying, and projects each fact into the
+typed `mfl_history_record_rows` read model used by the history endpoints.
 """
 
 from __future__ import annotations
@@ -18,6 +19,7 @@ import pandas as pd
 
 from backend import models
 from backend.database import SessionLocal
+from backend.services.league_history_record_service import build_history_record_row
 
 
 @dataclass
@@ -55,6 +57,105 @@ def _row_fingerprint(dataset_key: str, row: dict[str, Any]) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
+def _row_fingerprints(dataset_key: str, frame: pd.DataFrame) -> list[str]:
+    """Column-wise ``_row_fingerprint`` for every row of ``frame``.
+
+    Each column is JSON-encoded once and the per-row payloads are assembled
+    from the encoded pieces in sorted-key order, which yields byte-identical
+    input to ``json.dumps(..., sort_keys=True)`` and therefore the same digests.
+    """
+    if frame.empty:
+        return []
+
+    columns = sorted(str(column) for column in frame.columns)
+    encoded_columns: list[list[str]] = []
+    for column in columns:
+        key_json = json.dumps(column)
+        encoded_columns.append(
+            [
+                f"{key_json}: {json.dumps(_json_safe(value), default=str)}"
+                for value in frame[column].tolist()
+            ]
+        )
+
+    prefix = '{"dataset_key": ' + json.dumps(dataset_key) + ', "row": {'
+    fingerprints: list[str] = []
+    for pieces in zip(*encoded_columns):
+        payload = prefix + ", ".join(pieces) + "}}"
+        fingerprints.append(hashlib.sha256(payload.encode("utf-8")).hexdigest())
+    return fingerprints
+
+
+def _build_record_fact(
+    *,
+    dataset_key: str,
+    safe_row: dict[str, Any],
+    fingerprint: str,
+    target_league_id: int | None,
+) -> models.MflHtmlRecordFact:
+    return models.MflHtmlRecordFact(
+        dataset_key=dataset_key,
+        season=_safe_int(safe_row.get("season")),
+        target_league_id=target_league_id,
+        league_id=str(safe_row.get("league_id") or "").strip() or None,
+        source_endpoint=str(safe_row.get("source_endpoint") or "").strip() or None,
+        source_url=str(safe_row.get("source_url") or "").strip() or None,
+        extracted_at_utc=str(safe_row.get("extracted_at_utc") or "").strip() or None,
+        normalization_version=str(safe_row.get("normalization_version") or "v1").strip(),
+        row_fingerprint=fingerprint,
+        record_json=safe_row,
+    )
+
+
+def load_normalized_frame(
+    db: Any,
+    *,
+    dataset_key: str,
+    frame: pd.DataFrame,
+    target_league_id: int | None,
+    summary: LoadSummary,
+    seen_fingerprints: set[tuple[str, str]],
+    lookup_batch_size: int = 500,
+) -> None:
+    """Insert new rows of one normalized frame, skipping known fingerprints.
+
+    Existing fingerprints are looked up in batches rather than one query per
+    row. The caller owns the transaction.
+    """
+    rows = frame.to_dict(orient="records")
+    summary.rows_seen += len(rows)
+    fingerprints = _row_fingerprints(dataset_key, frame)
+
+    existing: set[str] = set()
+    unique_fingerprints = list(dict.fromkeys(fingerprints))
+    for start in range(0, len(unique_fingerprints), lookup_batch_size):
+        batch = unique_fingerprints[start:start + lookup_batch_size]
+        existing.update(
+            fingerprint
+            for (fingerprint,) in db.query(models.MflHtmlRecordFact.row_fingerprint)
+            .filter(models.MflHtmlRecordFact.dataset_key == dataset_key)
+            .filter(models.MflHtmlRecordFact.row_fingerprint.in_(batch))
+            .all()
+        )
+
+    for row, fingerprint in zip(rows, fingerprints):
+        fp_key = (dataset_key, fingerprint)
+        if fingerprint in existing or fp_key in seen_fingerprints:
+            summary.rows_skipped_existing += 1
+            continue
+        seen_fingerprints.add(fp_key)
+
+        record = _build_record_fact(
+            dataset_key=dataset_key,
+            safe_row=_json_safe(row),
+            fingerprint=fingerprint,
+            target_league_id=target_league_id,
+        )
+        db.add(record)
+        db.add(build_history_record_row(record))
+        summary.rows_inserted += 1
+
+
 def _file_sha256(path: Path) -> str:
     digest = hashlib.sha256()
     with path.open("rb") as handle:
@@ -157,6 +258,7 @@ def run_load_mfl_html_normalized(
     db = SessionLocal()
     try:
         if truncate_before_load and not dry_run:
+            db.query(models.MflHistoryRecordRow).delete(synchronize_session=False)
             db.query(models.MflHtmlRecordFact).delete(synchronize_session=False)
             db.flush()
 
@@ -222,19 +324,14 @@ def run_load_mfl_html_normalized(
                         continue
                     seen_fingerprints.add(fp_key)
 
-                    record = models.MflHtmlRecordFact(
+                    record = _build_record_fact(
                         dataset_key=dataset_key,
-                        season=_safe_int(safe_row.get("season")),
+                        safe_row=safe_row,
+                        fingerprint=fingerprint,
                         target_league_id=target_league_id,
-                        league_id=str(safe_row.get("league_id") or "").strip() or None,
-                        source_endpoint=str(safe_row.get("source_endpoint") or "").strip() or None,
-                        source_url=str(safe_row.get("source_url") or "").strip() or None,
-                        extracted_at_utc=str(safe_row.get("extracted_at_utc") or "").strip() or None,
-                        normalization_version=str(safe_row.get("normalization_version") or "v1").strip(),
-                        row_fingerprint=fingerprint,
-                        record_json=safe_row,
                     )
                     db.add(record)
+                    db.add(build_history_record_row(record))
                     summary.rows_inserted += 1
 
                 summary.files_loaded += 1
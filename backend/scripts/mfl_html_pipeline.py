@@ -0,0 +1,277 @@
+"""Parse, normalize and load MFL HTML record reports in one pass.
+
+Pipeline mode for `extract-mfl-html-reports` -> `normalize-mfl-html-records`
+-> `load-mfl-html-normalized`. Each (report, season) file is parsed and
+normalized in a process pool, and the normalized frames are handed to the
+loader in memory instead of being written to and re-read from CSV. The
+loader fingerprints each frame column-wise and checks existing fingerprints
+in batches.
+
+Frames are round-tripped through an in-memory CSV buffer after each stage so
+values (and therefore row fingerprints) are identical to the file-based
+path; re-running either path over the same archive inserts nothing new.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from backend import models
+from backend.database import SessionLocal
+from backend.scripts import extract_mfl_html_reports as html_reports
+from backend.scripts.load_mfl_html_normalized import LoadSummary, load_normalized_frame
+from backend.scripts.normalize_mfl_html_records import (
+    DEFAULT_REPORT_KEYS,
+    NORMALIZERS,
+    REPORT_TO_DATASET,
+    _to_int,
+)
+
+
+@dataclass
+class PipelineSummary:
+    input_root: str
+    source_format: str
+    files_parsed: int = 0
+    files_skipped: int = 0
+    rows_normalized_by_dataset: dict[str, int] = field(default_factory=dict)
+    warnings: list[str] = field(default_factory=list)
+    load: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "input_root": self.input_root,
+            "source_format": self.source_format,
+            "files_parsed": self.files_parsed,
+            "files_skipped": self.files_skipped,
+            "rows_normalized_by_dataset": self.rows_normalized_by_dataset,
+            "warnings": self.warnings,
+            "load": self.load,
+        }
+
+
+def _csv_round_trip(frame: pd.DataFrame) -> pd.DataFrame:
+    buffer = StringIO()
+    frame.to_csv(buffer, index=False)
+    buffer.seek(0)
+    return pd.read_csv(buffer)
+
+
+def _read_report_frame(path: Path, *, report_key: str, season: int | None, source_format: str) -> pd.DataFrame:
+    if source_format == "csv":
+        return pd.read_csv(path)
+
+    # Raw HTML archived by extract-mfl-html-reports; the record reports parse
+    # without network access, so this is safe to run in a worker process.
+    league_id = html_reports.KNOWN_LEAGUE_BY_SEASON.get(season or 0, "")
+    host = html_reports.KNOWN_HOST_BY_SEASON.get(season or 0)
+    url = (
+        html_reports._build_report_url(host=host, season=season, league_id=league_id, report_key=report_key)
+        if host and season
+        else ""
+    )
+    extracted_at_utc = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc).isoformat()
+    frame = html_reports._extract_report_table(
+        path.read_text(encoding="utf-8"),
+        report_key=report_key,
+        season=season,
+        league_id=league_id,
+        timeout_seconds=0,
+    )
+    annotated = html_reports._annotate_frame(
+        frame,
+        season=season,
+        league_id=league_id,
+        report_key=report_key,
+        url=url,
+        extracted_at_utc=extracted_at_utc,
+    )
+    return _csv_round_trip(annotated)
+
+
+def _parse_report_file(task: tuple[str, str, int | None, str]) -> dict[str, Any]:
+    """Worker: parse and normalize one report file. Must stay picklable."""
+    report_key, path_text, season, source_format = task
+    path = Path(path_text)
+    try:
+        frame = _read_report_frame(path, report_key=report_key, season=season, source_format=source_format)
+    except Exception as exc:  # noqa: BLE001
+        return {"path": path_text, "error": f"failed reading {path}: {exc}"}
+    if frame.empty:
+        return {"path": path_text, "error": f"empty source file: {path}"}
+
+    try:
+        normalized = NORMALIZERS[report_key](frame)
+        if not normalized.empty:
+            normalized = _csv_round_trip(normalized)
+    except Exception as exc:  # noqa: BLE001
+        return {"path": path_text, "error": f"failed normalizing {path}: {exc}"}
+    return {"path": path_text, "dataset_key": REPORT_TO_DATASET[report_key], "frame": normalized}
+
+
+def _collect_tasks(
+    in_root: Path,
+    *,
+    report_keys: list[str],
+    source_format: str,
+    start_year: int | None,
+    end_year: int | None,
+    warnings: list[str],
+) -> list[tuple[str, str, int | None, str]]:
+    tasks: list[tuple[str, str, int | None, str]] = []
+    for report_key in report_keys:
+        if report_key not in REPORT_TO_DATASET:
+            raise ValueError(f"unsupported report key: {report_key}")
+        if source_format == "html":
+            report_dir, pattern = in_root / "raw" / report_key, "*.html"
+        else:
+            report_dir, pattern = in_root / report_key, "*.csv"
+        if not report_dir.exists():
+            warnings.append(f"missing report directory: {report_dir}")
+            continue
+
+        for path in sorted(report_dir.glob(pattern)):
+            year = _to_int(path.stem)
+            if start_year is not None and (year is None or year < start_year):
+                continue
+            if end_year is not None and (year is None or year > end_year):
+                continue
+            tasks.append((report_key, str(path), year, source_format))
+    return tasks
+
+
+def run_mfl_html_pipeline(
+    *,
+    input_root: str,
+    source_format: str = "csv",
+    start_year: int | None = None,
+    end_year: int | None = None,
+    report_keys: list[str] | None = None,
+    dry_run: bool = True,
+    truncate_before_load: bool = False,
+    target_league_id: int | None = None,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """Parse + normalize every report file under ``input_root`` and load it.
+
+    ``source_format="csv"`` reads the per-report CSVs written by
+    `extract-mfl-html-reports`; ``"html"`` re-parses the raw HTML it archived
+    under ``raw/``. ``max_workers=1`` parses in-process.
+    """
+    if source_format not in ("csv", "html"):
+        raise ValueError(f"unsupported source format: {source_format}")
+
+    in_root = Path(input_root)
+    if not in_root.exists():
+        raise ValueError(f"input root does not exist: {in_root}")
+
+    summary = PipelineSummary(
+        input_root=str(in_root),
+        source_format=source_format,
+        rows_normalized_by_dataset={dataset: 0 for dataset in REPORT_TO_DATASET.values()},
+    )
+    tasks = _collect_tasks(
+        in_root,
+        report_keys=report_keys or DEFAULT_REPORT_KEYS,
+        source_format=source_format,
+        start_year=start_year,
+        end_year=end_year,
+        warnings=summary.warnings,
+    )
+
+    load_summary = LoadSummary(
+        input_roots=[str(in_root)],
+        dry_run=dry_run,
+        truncate_before_load=truncate_before_load,
+        target_league_id=target_league_id,
+    )
+
+    metadata_db = SessionLocal()
+    run = models.MflIngestionRun(
+        pipeline_stage="load_html_normalized",
+        source_system="mfl",
+        target_league_id=target_league_id,
+        status="running",
+        dry_run=dry_run,
+        truncate_before_load=truncate_before_load,
+        input_roots=load_summary.input_roots,
+        command="mfl-html-pipeline",
+        notes=f"MFL HTML pipeline ({source_format} source)",
+    )
+    metadata_db.add(run)
+    metadata_db.commit()
+    metadata_db.refresh(run)
+    load_summary.run_id = run.id
+
+    db = SessionLocal()
+    executor: ProcessPoolExecutor | None = None
+    try:
+        if truncate_before_load and not dry_run:
+            db.query(models.MflHistoryRecordRow).delete(synchronize_session=False)
+            db.query(models.MflHtmlRecordFact).delete(synchronize_session=False)
+            db.flush()
+
+        if max_workers == 1 or len(tasks) <= 1:
+            results = map(_parse_report_file, tasks)
+        else:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            # Results come back in task order, so the load order (and the
+            # first-seen winner for duplicate rows) matches the CSV path.
+            results = executor.map(_parse_report_file, tasks, chunksize=4)
+
+        seen_fingerprints: set[tuple[str, str]] = set()
+        for result in results:
+            if "error" in result:
+                summary.files_skipped += 1
+                summary.warnings.append(result["error"])
+                continue
+
+            summary.files_parsed += 1
+            load_summary.files_seen += 1
+            dataset_key = result["dataset_key"]
+            frame = result["frame"]
+            summary.rows_normalized_by_dataset[dataset_key] += len(frame)
+            load_normalized_frame(
+                db,
+                dataset_key=dataset_key,
+                frame=frame,
+                target_league_id=target_league_id,
+                summary=load_summary,
+                seen_fingerprints=seen_fingerprints,
+            )
+            load_summary.files_loaded += 1
+
+        if dry_run:
+            db.rollback()
+        else:
+            db.commit()
+
+        summary.load = load_summary.to_dict()
+        run.status = "completed"
+        run.completed_at = datetime.now(timezone.utc)
+        run.summary_json = summary.to_dict()
+        metadata_db.add(run)
+        metadata_db.commit()
+        return summary.to_dict()
+    except Exception as exc:
+        db.rollback()
+        summary.load = load_summary.to_dict()
+        run.status = "failed"
+        run.completed_at = datetime.now(timezone.utc)
+        run.notes = str(exc)
+        run.summary_json = summary.to_dict()
+        metadata_db.add(run)
+        metadata_db.commit()
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        db.close()
+        metadata_db.close()
@@ -1,22 +1,46 @@
 # backend/scripts/process_waivers.py
+from __future__ import annotations
+
+import argparse
+import json
+
 from backend.database import SessionLocal
-import models
+from backend.services.waiver_processing_service import pending_waiver_league_ids, process_waiver_claims
+
+
+def run_waiver_cycle(league_id: int | None = None, *, dry_run: bool = False) -> list[dict]:
+    """Process pending waiver claims for one league, or every league with claims.
 
-def run_waiver_cycle(league_id):
+    Each league is resolved and committed in its own transaction, so a failure
+    in one league leaves the others' results in place.
+    """
     db = SessionLocal()
-    # 1. Get all pending claims for this week, sorted by creation time
-    claims = db.query(models.WaiverClaim).filter(models.WaiverClaim.league_id == league_id).all()
-    
-    # 2. Get Waiver Priority (Inverse of standings)
-    # This ensures the "fastest clicker" doesn't win, but the most needy team does
-    priority_list = db.query(models.User).filter(models.User.league_id == league_id).order_by(models.User.wins.asc()).all()
-    
-    for owner in priority_list:
-        # Find this owner's highest-ranked claim that is still available
-        owner_claims = [c for c in claims if c.owner_id == owner.id]
-        for claim in owner_claims:
-            # Logic: If player still a free agent, swap them and move owner to end of priority
-            print(f"Processing claim for {owner.username}: Adding Player {claim.player_id}")
-            break 
-
-    db.commit()
+    try:
+        league_ids = [league_id] if league_id is not None else pending_waiver_league_ids(db)
+        reports = []
+        for target_league_id in league_ids:
+            try:
+                report = process_waiver_claims(db, league_id=target_league_id, dry_run=dry_run)
+                if dry_run:
+                    db.rollback()
+                else:
+                    db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            reports.append(report)
+        return reports
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Process pending waiver claims (FAAB, then waiver priority).")
+    parser.add_argument("--league-id", type=int, default=None, help="Only process this league")
+    parser.add_argument("--dry-run", action="store_true", help="Report the outcome without writing it")
+    args = parser.parse_args()
+    print(json.dumps(run_waiver_cycle(args.league_id, dry_run=args.dry_run), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
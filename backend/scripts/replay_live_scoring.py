@@ -0,0 +1,293 @@
+"""Replay archived ESPN scoreboards through the live-scoring ingest chain.
+
+Feeds the raw scoreboards captured under ``backend/data/ingest_raw`` (either
+the segmented archive or legacy one-file-per-response snapshots) through
+`run_live_scoreboard_ingest_with_controls` in capture order, threading the
+scoreboard fingerprint between frames the way the poll cycle does, and
+publishing a score update on the live-scoring event bus whenever downstream
+updates ran. The report has per-stage latency percentiles, queries issued
+(per frame and per stage) and end-to-end time from frame start until the
+event reaches an SSE subscriber queue.
+
+Runs against whatever ``DATABASE_URL`` points at; use a local copy. Frames
+already ingested there are skipped by the persisted idempotency guard, so
+benchmark against a fresh copy each run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+from sqlalchemy import event
+
+from backend.services import live_scoring_event_bus as event_bus
+from backend.services import live_scoring_ingest_service as ingest
+from backend.services.live_scoring_polling_service import ACTIVE_PHASES, _detect_state_transitions
+from backend.services.live_scoring_sources import PRIMARY_SCOREBOARD_SOURCE
+from backend.services.raw_payload_archive import RawPayloadArchive
+
+PUBLISH_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class ReplayFrame:
+    captured_at: datetime
+    year: int
+    week: int | None
+    ref: str
+    payload: dict[str, Any]
+
+
+def _parse_scoreboard_key(key: str) -> tuple[int, int | None] | None:
+    year_text, _, week_text = key.partition("_")
+    try:
+        year = int(year_text)
+        week = None if week_text in ("", "all") else int(week_text)
+    except ValueError:
+        return None
+    return year, week
+
+
+def _archive_frames(root: Path) -> Iterator[ReplayFrame]:
+    archive = RawPayloadArchive(root)
+    for entry, payload in archive.replay(source=PRIMARY_SCOREBOARD_SOURCE):
+        parsed = _parse_scoreboard_key(entry.key)
+        if parsed is None:
+            continue
+        yield ReplayFrame(
+            captured_at=datetime.fromisoformat(entry.captured_at),
+            year=parsed[0],
+            week=parsed[1],
+            ref=f"{root / entry.segment}.jsonl.gz#{entry.offset}",
+            payload=payload,
+        )
+
+
+def _file_frames(root: Path) -> Iterator[ReplayFrame]:
+    marker = f"_{PRIMARY_SCOREBOARD_SOURCE}_"
+    # File names start with a sortable UTC timestamp, so name order is capture order.
+    for path in sorted(root.glob(f"*{marker}*.json")):
+        stamp, _, key = path.stem.partition(marker)
+        parsed = _parse_scoreboard_key(key)
+        if parsed is None:
+            continue
+        try:
+            captured_at = datetime.strptime(stamp, "%Y%m%dT%H%M%S%fZ").replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+        yield ReplayFrame(
+            captured_at=captured_at,
+            year=parsed[0],
+            week=parsed[1],
+            ref=str(path),
+            payload=ingest.load_raw_payload(str(path)),
+        )
+
+
+def load_replay_frames(
+    raw_root: Path,
+    *,
+    year: int | None = None,
+    week: int | None = None,
+    limit: int | None = None,
+) -> list[ReplayFrame]:
+    """Archived scoreboards under ``raw_root`` (both formats), oldest first."""
+    frames = [*_archive_frames(raw_root), *_file_frames(raw_root)]
+    frames = [
+        frame
+        for frame in frames
+        if (year is None or frame.year == year) and (week is None or frame.week == week)
+    ]
+    frames.sort(key=lambda frame: frame.captured_at)
+    return frames[:limit] if limit is not None else frames
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(values)
+
+    def nearest_rank(pct: float) -> float:
+        idx = max(0, min(len(ordered) - 1, math.ceil(pct * len(ordered)) - 1))
+        return round(float(ordered[idx]), 3)
+
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 3),
+        "p50": nearest_rank(0.50),
+        "p95": nearest_rank(0.95),
+        "p99": nearest_rank(0.99),
+        "max": round(float(ordered[-1]), 3),
+    }
+
+
+@contextmanager
+def _count_queries(engine: Any) -> Iterator[Counter]:
+    counts: Counter = Counter()
+
+    def _before_cursor_execute(*_args: Any, **_kwargs: Any) -> None:
+        counts[ingest.current_ingest_stage() or "other"] += 1
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield counts
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+class _PublishProbe:
+    """An SSE subscriber on a private event loop that times bus delivery."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._previous_loop = event_bus._loop
+        self._queue: asyncio.Queue | None = None
+
+    def __enter__(self) -> "_PublishProbe":
+        self._thread.start()
+        event_bus.set_event_loop(self._loop)
+
+        async def _subscribe() -> asyncio.Queue:
+            return event_bus.subscribe()
+
+        self._queue = asyncio.run_coroutine_threadsafe(_subscribe(), self._loop).result()
+        return self
+
+    def publish(self, event_payload: dict[str, Any]) -> float:
+        assert self._queue is not None
+        started = time.perf_counter()
+        event_bus.publish_from_thread(event_payload)
+        asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(self._queue.get(), PUBLISH_TIMEOUT_SECONDS),
+            self._loop,
+        ).result()
+        return (time.perf_counter() - started) * 1000
+
+    def __exit__(self, *_exc: Any) -> None:
+        if self._queue is not None:
+            event_bus.unsubscribe(self._queue)
+        event_bus._loop = self._previous_loop
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def run_live_scoring_replay(
+    *,
+    raw_root: str | None = None,
+    year: int | None = None,
+    week: int | None = None,
+    speed: float = 0.0,
+    limit: int | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Replay archived scoreboards and report latency/query statistics.
+
+    ``speed`` scales the recorded gaps between captures (``60`` replays a
+    one-hour window in a minute); ``0`` replays back-to-back.
+    """
+    root = Path(raw_root) if raw_root else ingest._raw_response_root()
+    if not root.exists():
+        raise ValueError(f"raw response root does not exist: {root}")
+    frames = load_replay_frames(root, year=year, week=week, limit=limit)
+
+    engine = ingest.SessionLocal.kw["bind"]
+    stage_samples: dict[str, list[float]] = {}
+    ingest_ms: list[float] = []
+    queries_per_frame: list[float] = []
+    publish_ms: list[float] = []
+    end_to_end_ms: list[float] = []
+    mode_counts: Counter = Counter()
+    failures: list[dict[str, Any]] = []
+    fingerprints: dict[tuple[int, int | None], str | None] = {}
+    game_states: dict[tuple[int, int | None], dict[str, str]] = {}
+
+    replay_started = time.perf_counter()
+    first_capture = frames[0].captured_at if frames else None
+    with _count_queries(engine) as query_counts, _PublishProbe() as probe:
+        for frame in frames:
+            if speed > 0 and first_capture is not None:
+                due = (frame.captured_at - first_capture).total_seconds() / speed
+                delay = due - (time.perf_counter() - replay_started)
+                if delay > 0:
+                    time.sleep(delay)
+
+            key = (frame.year, frame.week)
+            queries_before = sum(query_counts.values())
+            frame_started = time.perf_counter()
+            try:
+                result = ingest.run_live_scoreboard_ingest_with_controls(
+                    year=frame.year,
+                    week=frame.week,
+                    dry_run=dry_run,
+                    inspect_event_contracts_enabled=False,
+                    change_guard_fingerprint=fingerprints.get(key),
+                    scoreboard_payload=frame.payload,
+                )
+            except Exception as exc:  # noqa: BLE001
+                failures.append({"ref": frame.ref, "error": f"{type(exc).__name__}: {exc}"})
+                continue
+            ingest_ms.append((time.perf_counter() - frame_started) * 1000)
+            queries_per_frame.append(sum(query_counts.values()) - queries_before)
+            mode_counts[str(result.get("mode"))] += 1
+            for stage, elapsed in result.get("stage_timings_ms", {}).items():
+                stage_samples.setdefault(stage, []).append(elapsed)
+
+            current_states = dict(result.get("game_states") or {})
+            transitions = _detect_state_transitions(game_states.get(key, {}), current_states)
+            fingerprints[key] = result.get("scoreboard_fingerprint")
+            game_states[key] = current_states
+
+            if result.get("downstream_updates_triggered"):
+                active_games = sum(1 for value in current_states.values() if value in ACTIVE_PHASES)
+                publish_ms.append(
+                    probe.publish(
+                        event_bus.build_score_update_event(
+                            year=frame.year,
+                            week=frame.week,
+                            active_games=active_games,
+                            is_active_window=active_games > 0,
+                            state_transitions=transitions,
+                            scoreboard_fingerprint=result.get("scoreboard_fingerprint"),
+                            matchup_projection_snapshots=result.get("reconciliation", {}).get(
+                                "matchup_projection_snapshots"
+                            ),
+                        )
+                    )
+                )
+                end_to_end_ms.append((time.perf_counter() - frame_started) * 1000)
+
+    wall_time_ms = (time.perf_counter() - replay_started) * 1000
+    frames_replayed = len(ingest_ms)
+    return {
+        "raw_root": str(root),
+        "dry_run": dry_run,
+        "speed": speed,
+        "frames_found": len(frames),
+        "frames_replayed": frames_replayed,
+        "frames_failed": len(failures),
+        "mode_counts": dict(mode_counts),
+        "publishes": len(publish_ms),
+        "wall_time_ms": round(wall_time_ms, 3),
+        "frames_per_second": round(frames_replayed / (wall_time_ms / 1000), 3) if wall_time_ms > 0 else 0.0,
+        "ingest_latency_ms": _percentiles(ingest_ms),
+        "stage_latency_ms": {stage: _percentiles(samples) for stage, samples in sorted(stage_samples.items())},
+        "publish_latency_ms": _percentiles(publish_ms),
+        "end_to_end_publish_ms": _percentiles(end_to_end_ms),
+        "queries": {
+            "total": sum(query_counts.values()),
+            "per_frame": _percentiles(queries_per_frame),
+            "by_stage": dict(sorted(query_counts.items())),
+        },
+        "failures": failures,
+    }
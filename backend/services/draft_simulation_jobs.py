@@ -0,0 +1,277 @@
+"""Background job queue for draft Monte Carlo simulations.
+
+Simulations run on a small, bounded thread pool instead of inside request
+handlers. Each submission is keyed by its request (league, perspective owner
+and simulation config): while a job for a key is queued or running, identical
+submissions attach to it instead of starting another run, and their users
+are added to the job's requesters. Finished results
+are cached by (league, inputs fingerprint, config fingerprint), so a repeat
+request over unchanged draft data completes without simulating again.
+
+Jobs expose a monotonically increasing ``version`` that bumps on every
+progress report, so SSE streams can poll cheaply for changes.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+FINISHED_STATES = frozenset({JOB_COMPLETED, JOB_FAILED})
+
+
+class SimulationQueueFullError(RuntimeError):
+    """Raised when the queue already holds its maximum of unfinished jobs."""
+
+
+class SimulationJobError(RuntimeError):
+    """A job failure with an HTTP-style status code for API consumers."""
+
+    def __init__(self, message: str, status_code: int = 500):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class SimulationJob:
+    id: str
+    key: str
+    league_id: int
+    owner_id: int
+    requested_by_user_id: int
+    total_iterations: int
+    requester_user_ids: set[int] = field(default_factory=set)
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    completed_iterations: int = 0
+    partial: dict[str, Any] = field(default_factory=dict)
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    error_status_code: int | None = None
+    cache_hit: bool = False
+    coalesced_requests: int = 0
+    version: int = 0
+
+    def snapshot(self, *, include_result: bool = True) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "job_id": self.id,
+            "status": self.status,
+            "league_id": self.league_id,
+            "perspective_owner_id": self.owner_id,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": {
+                "completed_iterations": self.completed_iterations,
+                "total_iterations": self.total_iterations,
+                "fraction": round(self.completed_iterations / self.total_iterations, 4)
+                if self.total_iterations
+                else 0.0,
+            },
+            "partial": dict(self.partial),
+            "cache_hit": self.cache_hit,
+            "coalesced_requests": self.coalesced_requests,
+            "version": self.version,
+        }
+        if self.error is not None:
+            payload["error"] = self.error
+            payload["error_status_code"] = self.error_status_code
+        if include_result and self.result is not None:
+            payload["result"] = self.result
+        return payload
+
+
+JobRunner = Callable[[SimulationJob], dict[str, Any]]
+
+
+class SimulationJobQueue:
+    def __init__(
+        self,
+        *,
+        max_workers: int = 2,
+        max_pending: int = 16,
+        result_ttl_seconds: float = 900.0,
+        max_cached_results: int = 64,
+        max_finished_jobs: int = 256,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl_seconds = result_ttl_seconds
+        self.max_cached_results = max_cached_results
+        self.max_finished_jobs = max_finished_jobs
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._jobs: OrderedDict[str, SimulationJob] = OrderedDict()
+        self._inflight: dict[str, str] = {}
+        # (league_id, inputs fingerprint, config fingerprint) -> (stored_at, result)
+        self._results: OrderedDict[tuple[int, str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="draft-simulation")
+        return self._executor
+
+    def submit(
+        self,
+        key: str,
+        runner: JobRunner,
+        *,
+        league_id: int,
+        owner_id: int,
+        requested_by_user_id: int,
+        total_iterations: int,
+    ) -> tuple[SimulationJob, bool]:
+        """Queue ``runner`` for ``key``; returns (job, coalesced)."""
+        with self._lock:
+            inflight_id = self._inflight.get(key)
+            if inflight_id is not None:
+                job = self._jobs[inflight_id]
+                job.coalesced_requests += 1
+                job.requester_user_ids.add(requested_by_user_id)
+                job.version += 1
+                return job, True
+
+            if len(self._inflight) >= self.max_pending:
+                raise SimulationQueueFullError("Too many draft simulations are queued. Try again shortly.")
+
+            job = SimulationJob(
+                id=uuid.uuid4().hex,
+                key=key,
+                league_id=league_id,
+                owner_id=owner_id,
+                requested_by_user_id=requested_by_user_id,
+                total_iterations=total_iterations,
+                requester_user_ids={requested_by_user_id},
+            )
+            self._jobs[job.id] = job
+            self._inflight[key] = job.id
+            self._trim_finished_jobs()
+            executor = self._get_executor()
+        executor.submit(self._execute, job, runner)
+        return job, False
+
+    def _execute(self, job: SimulationJob, runner: JobRunner) -> None:
+        with self._lock:
+            job.status = JOB_RUNNING
+            job.started_at = time.time()
+            job.version += 1
+        try:
+            result = runner(job)
+        except SimulationJobError as exc:
+            self._finish(job, error=str(exc), error_status_code=exc.status_code)
+        except Exception as exc:  # noqa: BLE001 - surfaced on the job
+            self._finish(job, error=f"Simulation failed. {str(exc) or 'Please try again.'}", error_status_code=500)
+        else:
+            self._finish(job, result=result)
+
+    def _finish(
+        self,
+        job: SimulationJob,
+        *,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+        error_status_code: int | None = None,
+    ) -> None:
+        with self._lock:
+            job.status = JOB_FAILED if error is not None else JOB_COMPLETED
+            job.result = result
+            job.error = error
+            job.error_status_code = error_status_code
+            if error is None:
+                job.completed_iterations = job.total_iterations
+            job.finished_at = time.time()
+            job.version += 1
+            if self._inflight.get(job.key) == job.id:
+                self._inflight.pop(job.key, None)
+
+    def _trim_finished_jobs(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINISHED_STATES]
+        for job_id in finished[: max(0, len(finished) - self.max_finished_jobs)]:
+            self._jobs.pop(job_id, None)
+
+    def report_progress(self, job: SimulationJob, completed_iterations: int, partial: dict[str, Any]) -> None:
+        with self._lock:
+            job.completed_iterations = completed_iterations
+            job.partial = partial
+            job.version += 1
+
+    def mark_cache_hit(self, job: SimulationJob) -> None:
+        with self._lock:
+            job.cache_hit = True
+            job.version += 1
+
+    def get(self, job_id: str) -> SimulationJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def is_requester(self, job: SimulationJob, user_id: int) -> bool:
+        with self._lock:
+            return user_id in job.requester_user_ids
+
+    def snapshot(self, job_id: str, *, include_result: bool = True) -> dict[str, Any] | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.snapshot(include_result=include_result) if job is not None else None
+
+    def cached_result(self, league_id: int, inputs_fingerprint: str, config_fingerprint: str) -> dict[str, Any] | None:
+        cache_key = (league_id, inputs_fingerprint, config_fingerprint)
+        with self._lock:
+            cached = self._results.get(cache_key)
+            if cached is None:
+                return None
+            stored_at, result = cached
+            if time.time() - stored_at > self.result_ttl_seconds:
+                self._results.pop(cache_key, None)
+                return None
+            self._results.move_to_end(cache_key)
+            return result
+
+    def store_result(
+        self,
+        league_id: int,
+        inputs_fingerprint: str,
+        config_fingerprint: str,
+        result: dict[str, Any],
+    ) -> None:
+        cache_key = (league_id, inputs_fingerprint, config_fingerprint)
+        with self._lock:
+            self._results[cache_key] = (time.time(), result)
+            self._results.move_to_end(cache_key)
+            while len(self._results) > self.max_cached_results:
+                self._results.popitem(last=False)
+
+    def invalidate_league(self, league_id: int) -> int:
+        """Drop cached results for ``league_id``; returns how many were dropped."""
+        with self._lock:
+            stale = [cache_key for cache_key in self._results if cache_key[0] == league_id]
+            for cache_key in stale:
+                self._results.pop(cache_key, None)
+            return len(stale)
+
+
+_QUEUE: SimulationJobQueue | None = None
+_QUEUE_LOCK = threading.Lock()
+
+
+def get_simulation_job_queue() -> SimulationJobQueue:
+    global _QUEUE
+    with _QUEUE_LOCK:
+        if _QUEUE is None:
+            _QUEUE = SimulationJobQueue(
+                max_workers=max(1, int(os.getenv("DRAFT_SIMULATION_MAX_WORKERS", "2"))),
+                max_pending=max(1, int(os.getenv("DRAFT_SIMULATION_MAX_PENDING", "16"))),
+                result_ttl_seconds=float(os.getenv("DRAFT_SIMULATION_RESULT_TTL_SECONDS", "900")),
+            )
+        return _QUEUE
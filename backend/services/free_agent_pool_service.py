@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from sqlalchemy import BigInteger, cast, func, select
+from sqlalchemy.orm import Session
+
+from .. import models
+from .league_position_service import get_active_positions_for_league
+
+
+# Shared free-agent pool used by the waiver wire, top free agents and the
+# waiver opportunity tracker. Two pieces are cached per database:
+#   * a projection/ADP ranked list of player ids per active-position set
+#   * the owned player-id set per league (maintained incrementally on adds
+#     and drops made through this process)
+# Both are re-validated against stamps so writes from other processes
+# (imports, admin scripts) invalidate them automatically. The owned set is
+# checked on every read with one indexed per-league aggregate. The ranking
+# stamp has to read every player row (name and position have no update
+# stamp), so it is re-checked at most once per
+# FREE_AGENT_POOL_REVALIDATE_SECONDS per position set.
+
+
+@dataclass
+class _RankedPlayers:
+    stamp: str
+    player_ids: list[int]
+    checked_at: float
+
+
+@dataclass
+class _OwnedPlayers:
+    stamp: tuple
+    player_ids: set[int] = field(default_factory=set)
+
+
+_RANKED_CACHE: dict[tuple[str, tuple[str, ...]], _RankedPlayers] = {}
+_OWNED_CACHE: dict[tuple[str, int], _OwnedPlayers] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _bind_key(db: Session) -> str:
+    return str(db.get_bind().url)
+
+
+def _revalidate_seconds() -> float:
+    return max(0.0, float(os.getenv("FREE_AGENT_POOL_REVALIDATE_SECONDS", "15")))
+
+
+def _players_stamp(db: Session) -> str:
+    """Version of every Player column the ranking reads."""
+    player = models.Player
+    player_id = cast(player.id, BigInteger)
+    # id-weighted sums tie each value to its row, so swaps change the stamp
+    row = db.query(
+        func.count(player.id),
+        func.max(player.id),
+        func.sum(player_id * player.projected_points),
+        func.sum(player_id * player.adp),
+    ).one()
+    digest = hashlib.sha256(repr(tuple(row)).encode("utf-8"))
+    for player_row in db.execute(select(player.id, player.name, player.position).order_by(player.id)):
+        digest.update(repr(tuple(player_row)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _owned_stamp(db: Session, league_id: int) -> tuple:
+    row = (
+        db.query(
+            func.count(models.DraftPick.id),
+            func.max(models.DraftPick.id),
+            func.sum(models.DraftPick.player_id),
+        )
+        .filter(
+            models.DraftPick.league_id == league_id,
+            models.DraftPick.player_id.isnot(None),
+        )
+        .one()
+    )
+    return tuple(row)
+
+
+def _load_ranked_player_ids(db: Session, positions: tuple[str, ...]) -> list[int]:
+    rows = (
+        db.query(models.Player.id)
+        .filter(models.Player.position.in_(positions))
+        .order_by(
+            models.Player.projected_points.desc(),
+            models.Player.adp.asc(),
+            models.Player.name.asc(),
+        )
+        .all()
+    )
+    return [int(row[0]) for row in rows]
+
+
+def _load_owned_player_ids(db: Session, league_id: int) -> set[int]:
+    rows = (
+        db.query(models.DraftPick.player_id)
+        .filter(
+            models.DraftPick.league_id == league_id,
+            models.DraftPick.player_id.isnot(None),
+        )
+        .all()
+    )
+    return {int(row[0]) for row in rows}
+
+
+def _ranked_player_ids(db: Session, positions: tuple[str, ...]) -> list[int]:
+    key = (_bind_key(db), positions)
+    now = time.monotonic()
+    with _POOL_LOCK:
+        cached = _RANKED_CACHE.get(key)
+    if cached and now - cached.checked_at < _revalidate_seconds():
+        return cached.player_ids
+
+    stamp = _players_stamp(db)
+    if cached and cached.stamp == stamp:
+        cached.checked_at = now
+        return cached.player_ids
+
+    ranked = _RankedPlayers(stamp=stamp, player_ids=_load_ranked_player_ids(db, positions), checked_at=now)
+    with _POOL_LOCK:
+        _RANKED_CACHE[key] = ranked
+    return ranked.player_ids
+
+
+def get_owned_player_ids(db: Session, league_id: int) -> set[int]:
+    """Return the ids of players rostered in ``league_id`` (read-only copy)."""
+    key = (_bind_key(db), int(league_id))
+    stamp = _owned_stamp(db, league_id)
+    with _POOL_LOCK:
+        cached = _OWNED_CACHE.get(key)
+        if cached and cached.stamp == stamp:
+            return set(cached.player_ids)
+
+    owned = _OwnedPlayers(stamp=stamp, player_ids=_load_owned_player_ids(db, league_id))
+    with _POOL_LOCK:
+        _OWNED_CACHE[key] = owned
+    return set(owned.player_ids)
+
+
+def note_roster_change(
+    db: Session,
+    *,
+    league_id: int,
+    acquired: Iterable[int] = (),
+    released: Iterable[int] = (),
+) -> None:
+    """Apply one flushed roster change (e.g. a claim with a drop) to the owned set."""
+    key = (_bind_key(db), int(league_id))
+    with _POOL_LOCK:
+        cached = _OWNED_CACHE.get(key)
+    if cached is None:
+        return
+
+    # The caller has flushed its DraftPick changes, so the new stamp reflects
+    # the whole delta we are about to apply and the next read stays a cache hit.
+    stamp = _owned_stamp(db, league_id)
+    with _POOL_LOCK:
+        cached.player_ids.difference_update(int(player_id) for player_id in released)
+        cached.player_ids.update(int(player_id) for player_id in acquired)
+        if int(stamp[0] or 0) != len(cached.player_ids):
+            # Someone else changed the roster too; rebuild on next read.
+            _OWNED_CACHE.pop(key, None)
+            return
+        cached.stamp = stamp
+
+
+def note_player_acquired(db: Session, *, league_id: int, player_id: int) -> None:
+    """Record a draft pick or waiver add without rebuilding the owned set."""
+    note_roster_change(db, league_id=league_id, acquired=[player_id])
+
+
+def note_player_released(db: Session, *, league_id: int, player_id: int) -> None:
+    """Record a drop without rebuilding the owned set."""
+    note_roster_change(db, league_id=league_id, released=[player_id])
+
+
+def invalidate_free_agent_pool(league_id: int | None = None) -> None:
+    with _POOL_LOCK:
+        if league_id is None:
+            _RANKED_CACHE.clear()
+            _OWNED_CACHE.clear()
+            return
+        for key in [key for key in _OWNED_CACHE if key[1] == int(league_id)]:
+            _OWNED_CACHE.pop(key, None)
+
+
+def get_available_player_ids(
+    db: Session,
+    league_id: int,
+    *,
+    limit: int | None = None,
+    positions: list[str] | None = None,
+) -> list[int]:
+    """Return unowned player ids for ``league_id`` in projection/ADP order."""
+    active_positions = positions or get_active_positions_for_league(db, league_id)
+    ranked = _ranked_player_ids(db, tuple(sorted({str(p).upper() for p in active_positions})))
+    owned = get_owned_player_ids(db, league_id)
+
+    available: list[int] = []
+    for player_id in ranked:
+        if player_id in owned:
+            continue
+        available.append(player_id)
+        if limit is not None and len(available) >= limit:
+            break
+    return available
+
+
+def get_available_players(
+    db: Session,
+    league_id: int,
+    *,
+    limit: int,
+    positions: list[str] | None = None,
+) -> list[models.Player]:
+    """Load the top ``limit`` available players as ORM rows, ranking preserved."""
+    player_ids = get_available_player_ids(db, league_id, limit=limit, positions=positions)
+    if not player_ids:
+        return []
+    rows = db.query(models.Player).filter(models.Player.id.in_(player_ids)).all()
+    order = {player_id: index for index, player_id in enumerate(player_ids)}
+    return sorted(rows, key=lambda row: order.get(int(row.id), len(order)))
@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from .. import models
+
+
+# Head-to-head aggregate store. Completed matchups are folded into one
+# HeadToHeadSeasonAggregate per (league, season, owner pair); the rivalry graph
+# and all-time series endpoints combine those season rows instead of
+# re-reading every matchup. Seasons are rebuilt when a week is finalized or a
+# matchup first completes (scoring_service) and when they are loaded from MFL
+# history (import_mfl_csv).
+
+NO_SEASON = 0
+
+AGGREGATE_VALUE_COLUMNS = (
+    "games",
+    "a_wins",
+    "b_wins",
+    "ties",
+    "a_points",
+    "b_points",
+    "biggest_margin",
+    "biggest_margin_winner_id",
+    "biggest_margin_week",
+    "opening_streak_owner_id",
+    "opening_streak_length",
+    "closing_streak_owner_id",
+    "closing_streak_length",
+    "longest_streak_owner_id",
+    "longest_streak_length",
+)
+
+
+def _completed_matchups_query(db: Session, *, league_id: int):
+    matchup = models.Matchup
+    return db.query(
+        matchup.season,
+        matchup.week,
+        matchup.home_team_id,
+        matchup.away_team_id,
+        matchup.home_score,
+        matchup.away_score,
+    ).filter(
+        matchup.league_id == league_id,
+        matchup.is_completed.is_(True),
+        matchup.home_team_id.isnot(None),
+        matchup.away_team_id.isnot(None),
+    )
+
+
+def _season_filter(seasons: set[int]):
+    clauses = []
+    named = sorted(season for season in seasons if season != NO_SEASON)
+    if named:
+        clauses.append(models.Matchup.season.in_(named))
+    if NO_SEASON in seasons:
+        clauses.append(models.Matchup.season.is_(None))
+    return or_(*clauses)
+
+
+def build_season_aggregates(games: Iterable[tuple]) -> Dict[tuple[int, int, int], Dict[str, Any]]:
+    """Fold ``(season, week, home_id, away_id, home_score, away_score)`` rows.
+
+    Rows must be in play order (season, week). Returns column values keyed by
+    ``(season, owner_a_id, owner_b_id)``.
+    """
+    aggregates: Dict[tuple[int, int, int], Dict[str, Any]] = {}
+    opening_open: Dict[tuple[int, int, int], bool] = {}
+
+    for season, week, home_id, away_id, home_score, away_score in games:
+        home_id, away_id = int(home_id), int(away_id)
+        owner_a, owner_b = sorted((home_id, away_id))
+        key = (int(season) if season is not None else NO_SEASON, owner_a, owner_b)
+        values = aggregates.get(key)
+        if values is None:
+            values = {column: 0 for column in AGGREGATE_VALUE_COLUMNS}
+            values.update(
+                a_points=0.0,
+                b_points=0.0,
+                biggest_margin=0.0,
+                biggest_margin_winner_id=None,
+                biggest_margin_week=None,
+                opening_streak_owner_id=None,
+                closing_streak_owner_id=None,
+                longest_streak_owner_id=None,
+            )
+            aggregates[key] = values
+            opening_open[key] = True
+
+        home = float(home_score or 0.0)
+        away = float(away_score or 0.0)
+        scores = {home_id: home, away_id: away}
+        values["games"] += 1
+        values["a_points"] += scores[owner_a] if owner_a != owner_b else home
+        values["b_points"] += scores[owner_b] if owner_a != owner_b else away
+
+        if home == away:
+            values["ties"] += 1
+            values["closing_streak_owner_id"] = None
+            values["closing_streak_length"] = 0
+            opening_open[key] = False
+            continue
+
+        winner = home_id if home > away else away_id
+        # Matches the legacy rivalry tally: a win goes to side "a" when the
+        # winner is the lower id.
+        values["a_wins" if winner == owner_a else "b_wins"] += 1
+
+        margin = abs(home - away)
+        if margin > values["biggest_margin"]:
+            values["biggest_margin"] = margin
+            values["biggest_margin_winner_id"] = winner
+            values["biggest_margin_week"] = week
+
+        if values["closing_streak_owner_id"] == winner:
+            values["closing_streak_length"] += 1
+        else:
+            values["closing_streak_owner_id"] = winner
+            values["closing_streak_length"] = 1
+
+        if opening_open[key]:
+            if values["opening_streak_length"] == 0 or values["opening_streak_owner_id"] == winner:
+                values["opening_streak_owner_id"] = winner
+                values["opening_streak_length"] += 1
+            else:
+                opening_open[key] = False
+
+        if values["closing_streak_length"] > values["longest_streak_length"]:
+            values["longest_streak_owner_id"] = winner
+            values["longest_streak_length"] = values["closing_streak_length"]
+
+    for values in aggregates.values():
+        values["a_points"] = round(values["a_points"], 4)
+        values["b_points"] = round(values["b_points"], 4)
+        values["biggest_margin"] = round(values["biggest_margin"], 4)
+    return aggregates
+
+
+def refresh_head_to_head_aggregates(
+    db: Session,
+    *,
+    league_id: int,
+    seasons: Iterable[int | None] | None = None,
+) -> int:
+    """Rebuild the store for ``seasons`` (or every season) of one league.
+
+    ``None`` in ``seasons`` means matchups stored without a season. Returns
+    the number of pair-season rows written. Caller commits.
+    """
+    season_set = None if seasons is None else {NO_SEASON if s is None else int(s) for s in seasons}
+    if season_set is not None and not season_set:
+        return 0
+
+    delete_query = db.query(models.HeadToHeadSeasonAggregate).filter(
+        models.HeadToHeadSeasonAggregate.league_id == league_id
+    )
+    games_query = _completed_matchups_query(db, league_id=league_id)
+    if season_set is not None:
+        delete_query = delete_query.filter(models.HeadToHeadSeasonAggregate.season.in_(season_set))
+        games_query = games_query.filter(_season_filter(season_set))
+    delete_query.delete(synchronize_session=False)
+
+    games = games_query.order_by(
+        func.coalesce(models.Matchup.season, NO_SEASON),
+        models.Matchup.week,
+        models.Matchup.id,
+    ).all()
+    aggregates = build_season_aggregates(games)
+    db.add_all(
+        models.HeadToHeadSeasonAggregate(
+            league_id=league_id,
+            season=season,
+            owner_a_id=owner_a,
+            owner_b_id=owner_b,
+            **values,
+        )
+        for (season, owner_a, owner_b), values in aggregates.items()
+    )
+    db.flush()
+    return len(aggregates)
+
+
+def head_to_head_store_ready(db: Session, *, league_id: int) -> bool:
+    """True when the store accounts for every completed matchup in the league."""
+    stored_games = (
+        db.query(func.coalesce(func.sum(models.HeadToHeadSeasonAggregate.games), 0))
+        .filter(models.HeadToHeadSeasonAggregate.league_id == league_id)
+        .scalar()
+    )
+    completed_games = _completed_matchups_query(db, league_id=league_id).with_entities(func.count()).scalar()
+    return int(stored_games or 0) == int(completed_games or 0)
+
+
+def load_head_to_head_seasons(db: Session, *, league_id: int) -> List[Dict[str, Any]]:
+    """Pair-season rows for a league, ordered by pair then season.
+
+    Served from the store when it is current; otherwise (store not yet built
+    for this league) aggregated from matchups for this request only.
+    """
+    if head_to_head_store_ready(db, league_id=league_id):
+        rows = (
+            db.query(models.HeadToHeadSeasonAggregate)
+            .filter(models.HeadToHeadSeasonAggregate.league_id == league_id)
+            .order_by(
+                models.HeadToHeadSeasonAggregate.owner_a_id,
+                models.HeadToHeadSeasonAggregate.owner_b_id,
+                models.HeadToHeadSeasonAggregate.season,
+            )
+            .all()
+        )
+        return [
+            {
+                "season": row.season,
+                "owner_a_id": row.owner_a_id,
+                "owner_b_id": row.owner_b_id,
+                **{column: getattr(row, column) for column in AGGREGATE_VALUE_COLUMNS},
+            }
+            for row in rows
+        ]
+
+    games = (
+        _completed_matchups_query(db, league_id=league_id)
+        .order_by(func.coalesce(models.Matchup.season, NO_SEASON), models.Matchup.week, models.Matchup.id)
+        .all()
+    )
+    aggregates = build_season_aggregates(games)
+    return [
+        {"season": season, "owner_a_id": owner_a, "owner_b_id": owner_b, **values}
+        for (season, owner_a, owner_b), values in sorted(
+            aggregates.items(), key=lambda item: (item[0][1], item[0][2], item[0][0])
+        )
+    ]
+
+
+def summarize_pairs(season_rows: List[Dict[str, Any]]) -> Dict[tuple[int, int], Dict[str, Any]]:
+    """Combine pair-season rows (ordered by pair, season) into all-time totals."""
+    pairs: Dict[tuple[int, int], Dict[str, Any]] = {}
+    for row in season_rows:
+        key = (row["owner_a_id"], row["owner_b_id"])
+        total = pairs.get(key)
+        if total is None:
+            total = {
+                "games": 0,
+                "a_wins": 0,
+                "b_wins": 0,
+                "ties": 0,
+                "a_points": 0.0,
+                "b_points": 0.0,
+                "biggest_margin": 0.0,
+                "biggest_margin_winner_id": None,
+                "biggest_margin_season": None,
+                "biggest_margin_week": None,
+                "current_streak_owner_id": None,
+                "current_streak_length": 0,
+                "longest_streak_owner_id": None,
+                "longest_streak_length": 0,
+                "seasons": [],
+            }
+            pairs[key] = total
+
+        for column in ("games", "a_wins", "b_wins", "ties", "a_points", "b_points"):
+            total[column] += row[column]
+        if row["biggest_margin"] > total["biggest_margin"]:
+            total["biggest_margin"] = row["biggest_margin"]
+            total["biggest_margin_winner_id"] = row["biggest_margin_winner_id"]
+            total["biggest_margin_season"] = row["season"]
+            total["biggest_margin_week"] = row["biggest_margin_week"]
+
+        # Chain streaks across seasons: the running streak carries into this
+        # season's opening streak, and survives it only if that streak covers
+        # every game of the season.
+        candidates = [(row["longest_streak_owner_id"], row["longest_streak_length"])]
+        running_owner, running_length = total["current_streak_owner_id"], total["current_streak_length"]
+        if running_owner is not None and row["opening_streak_owner_id"] == running_owner:
+            joined = running_length + row["opening_streak_length"]
+            candidates.append((running_owner, joined))
+            if row["opening_streak_length"] == row["games"]:
+                total["current_streak_length"] = joined
+            else:
+                total["current_streak_owner_id"] = row["closing_streak_owner_id"]
+                total["current_streak_length"] = row["closing_streak_length"]
+        else:
+            total["current_streak_owner_id"] = row["closing_streak_owner_id"]
+            total["current_streak_length"] = row["closing_streak_length"]
+        for owner_id, length in candidates:
+            if length > total["longest_streak_length"]:
+                total["longest_streak_owner_id"] = owner_id
+                total["longest_streak_length"] = length
+
+        total["seasons"].append(row)
+
+    for total in pairs.values():
+        total["a_points"] = round(total["a_points"], 2)
+        total["b_points"] = round(total["b_points"], 2)
+    return pairs
+
+
+def _record_text(wins: int, losses: int, ties: int) -> str:
+    return f"{wins}-{losses}-{ties}"
+
+
+def _pct(wins: int, ties: int, games: int) -> float:
+    return round((wins + 0.5 * ties) / games, 3) if games else 0.0
+
+
+def build_all_time_series_records(
+    pairs: Dict[tuple[int, int], Dict[str, Any]],
+    *,
+    owner_names: Dict[int, str],
+    team_names: Dict[int, str],
+) -> List[Dict[str, Any]]:
+    """One record per owner perspective per season, in all-time-series shape."""
+    records: List[Dict[str, Any]] = []
+    for (owner_a, owner_b), total in pairs.items():
+        if owner_a == owner_b:
+            continue
+        for owner_id, opponent_id, side, other in ((owner_a, owner_b, "a", "b"), (owner_b, owner_a, "b", "a")):
+            wins, losses = total[f"{side}_wins"], total[f"{other}_wins"]
+            streak_owner = total["current_streak_owner_id"]
+            streak_length = total["current_streak_length"]
+            for season_row in total["seasons"]:
+                season_wins, season_losses = season_row[f"{side}_wins"], season_row[f"{other}_wins"]
+                records.append(
+                    {
+                        "series_season": season_row["season"],
+                        "season": season_row["season"],
+                        "perspective_owner_id": owner_id,
+                        "perspective_owner_name": owner_names.get(owner_id, "-"),
+                        "perspective_team_name": team_names.get(owner_id, "-"),
+                        "opponent_owner_id": opponent_id,
+                        "opponent_owner_name": owner_names.get(opponent_id, "-"),
+                        "opponent_team_name": team_names.get(opponent_id, "Unknown"),
+                        "season_w_l_t_raw": _record_text(season_wins, season_losses, season_row["ties"]),
+                        "season_pct": _pct(season_wins, season_row["ties"], season_row["games"]),
+                        "season_points_for": round(season_row[f"{side}_points"], 2),
+                        "season_points_against": round(season_row[f"{other}_points"], 2),
+                        "total_w_l_t_raw": _record_text(wins, losses, total["ties"]),
+                        "total_pct": _pct(wins, total["ties"], total["games"]),
+                        "total_points_for": total[f"{side}_points"],
+                        "total_points_against": total[f"{other}_points"],
+                        "current_streak": (
+                            f"{'W' if streak_owner == owner_id else 'L'}{streak_length}"
+                            if streak_owner is not None
+                            else "-"
+                        ),
+                        "biggest_margin": total["biggest_margin"],
+                        "biggest_margin_winner_id": total["biggest_margin_winner_id"],
+                        "source": "head_to_head_aggregates",
+                    }
+                )
+    records.sort(key=lambda record: (record["total_pct"], record["series_season"]), reverse=True)
+    return records
@@ -1,8 +1,58 @@
 from datetime import UTC, datetime
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from .. import models
-from .transaction_service import get_owner_at_time, get_acquisition_method, log_transaction
-from .ledger_service import record_ledger_entry
+from .transaction_service import DROP_TRANSACTION_TYPES, log_transaction, owners_at_time
+from .ledger_service import record_ledger_entries
+
+
+def compute_keeper_flags_bulk(
+    db: Session,
+    league_id: int,
+    candidates: list[tuple[int, int]],
+    rule: models.KeeperRules,
+) -> dict[tuple[int, int], dict]:
+    """`compute_keeper_flags` for many (player_id, owner_id) pairs at once.
+
+    Reads the ownership timeline with at most two queries regardless of the
+    number of candidates.
+    """
+    flags_by_candidate = {
+        (int(player_id), int(owner_id)): {"flag_waiver": False, "flag_trade": False, "flag_drop": False}
+        for player_id, owner_id in candidates
+    }
+    if rule is None or not flags_by_candidate:
+        return flags_by_candidate
+
+    player_ids = {player_id for player_id, _ in flags_by_candidate}
+    if rule.waiver_policy or rule.drafted_only:
+        span = models.PlayerOwnershipSpan
+        spans = (
+            db.query(span.player_id, span.owner_id, span.transaction_type, span.ended_by)
+            .filter(span.league_id == league_id, span.player_id.in_(player_ids))
+            .all()
+        )
+        for player_id, owner_id, transaction_type, ended_by in spans:
+            flags = flags_by_candidate.get((int(player_id), int(owner_id)))
+            if flags is None:
+                continue
+            # waiver wire rule: the owner ever picked the player up via waiver
+            if rule.waiver_policy and transaction_type == "waiver_add":
+                flags["flag_waiver"] = True
+            # drafted-only rule: the player left this owner's roster via a drop
+            if rule.drafted_only and ended_by in DROP_TRANSACTION_TYPES:
+                flags["flag_drop"] = True
+
+    # trade deadline rule
+    if rule.trade_deadline:
+        owners_at_deadline = owners_at_time(
+            db, league_id=league_id, player_ids=player_ids, target_date=rule.trade_deadline
+        )
+        for (player_id, owner_id), flags in flags_by_candidate.items():
+            if owners_at_deadline.get(player_id) != owner_id:
+                flags["flag_trade"] = True
+
+    return flags_by_candidate
 
 
 def compute_keeper_flags(
@@ -17,47 +67,7 @@ def compute_keeper_flags(
     Used when an owner selects a player as a keeper; values are written to
     the Keeper.flag_* columns and also may be surfaced to the UI.
     """
-    flags = {"flag_waiver": False, "flag_trade": False, "flag_drop": False}
-
-    if rule is None:
-        return flags
-
-    # waiver wire rule
-    if rule.waiver_policy:
-        # flag if the owner ever picked the player up via waiver
-        wtxn = (
-            db.query(models.TransactionHistory)
-            .filter(
-                models.TransactionHistory.player_id == player_id,
-                models.TransactionHistory.transaction_type == "waiver_add",
-                models.TransactionHistory.new_owner_id == owner_id,
-            )
-            .first()
-        )
-        if wtxn:
-            flags["flag_waiver"] = True
-
-    # trade deadline rule
-    if rule.trade_deadline:
-        owner_at_deadline = get_owner_at_time(db, player_id, rule.trade_deadline)
-        if owner_at_deadline != owner_id:
-            flags["flag_trade"] = True
-
-    # drafted‑only rule: ensure player never left roster (i.e. owner never dropped it)
-    if rule.drafted_only:
-        t = (
-            db.query(models.TransactionHistory)
-            .filter(
-                models.TransactionHistory.player_id == player_id,
-                models.TransactionHistory.transaction_type.in_(["drop","waiver_drop"]),
-                models.TransactionHistory.old_owner_id == owner_id,
-            )
-            .first()
-        )
-        if t:
-            flags["flag_drop"] = True
-
-    return flags
+    return compute_keeper_flags_bulk(db, league_id, [(player_id, owner_id)], rule)[(int(player_id), int(owner_id))]
 
 
 def get_effective_budget(db: Session, owner_id: int) -> int:
@@ -124,50 +134,131 @@ def compute_surplus_recommendations(db: Session, owner_id: int, season: int) ->
     owner = db.query(models.User).filter(models.User.id == owner_id).first()
     if not owner or not owner.league_id:
         return []
-    rules = (
-        db.query(models.KeeperRules)
-        .filter(models.KeeperRules.league_id == owner.league_id)
-        .first()
-    )
+    evaluation = evaluate_league_keepers(db, owner.league_id, season, owner_ids=[owner_id])
+    return evaluation[owner_id]["recommended"] if owner_id in evaluation else []
+
+
+def keeper_ineligibility_reason(years_kept: int, max_years: int | None) -> str | None:
+    """Why a player kept ``years_kept`` times cannot be kept again, or None."""
+    if max_years is not None and years_kept > 0 and years_kept >= max_years:
+        return f"Already designated as keeper for {years_kept} year(s); max allowed is {max_years}"
+    return None
+
+
+def _recommend_keepers(candidates: list[dict], *, limit: int | None, max_years: int | None) -> list[dict]:
+    recommended = [
+        {
+            "player_id": c["player_id"],
+            "surplus": c["surplus"],
+            "years_kept_count": c["years_kept_count"],
+            "keep_cost": c["keep_cost"],
+            "projected_value": c["projected_value"],
+        }
+        for c in candidates
+    ]
+    # filter by max_years
+    if max_years is not None:
+        recommended = [c for c in recommended if c["years_kept_count"] < max_years]
+    recommended.sort(key=lambda x: x["surplus"], reverse=True)
+    if limit is not None:
+        recommended = recommended[:limit]
+    for c in recommended:
+        c["recommended"] = True
+    return recommended
+
+
+def evaluate_league_keepers(
+    db: Session,
+    league_id: int,
+    season: int,
+    owner_ids: list[int] | None = None,
+) -> dict[int, dict]:
+    """Keeper eligibility, costs, years kept, surplus and budgets for every owner.
+
+    Loads the league's owners, rules, keepers, projections, pending costs and
+    ownership timeline once (a fixed number of queries however many owners
+    and keepers there are) and evaluates all owners in memory. Pass
+    ``owner_ids`` to restrict the result to some owners. Shared by the owner
+    keeper page and the commissioner admin view.
+    """
+    owner_query = db.query(models.User).filter(models.User.league_id == league_id)
+    if owner_ids is not None:
+        owner_query = owner_query.filter(models.User.id.in_(owner_ids))
+    owners = owner_query.all()
+    if not owners:
+        return {}
+    owner_id_set = {owner.id for owner in owners}
+
+    rules = db.query(models.KeeperRules).filter(models.KeeperRules.league_id == league_id).first()
     limit = rules.max_keepers if rules else None
     max_years = rules.max_years_per_player if rules else None
 
-    # fetch all pending or locked keepers for this owner to compute cost
     keepers = (
         db.query(models.Keeper)
         .filter(
-            models.Keeper.owner_id == owner_id,
+            models.Keeper.owner_id.in_(owner_id_set),
             models.Keeper.season == season,
         )
+        .order_by(models.Keeper.id)
+        .all()
+    )
+    # project_budget counts an owner's pending keepers from every season
+    pending_costs = dict(
+        db.query(models.Keeper.owner_id, func.coalesce(func.sum(models.Keeper.keep_cost), 0))
+        .filter(
+            models.Keeper.owner_id.in_(owner_id_set),
+            models.Keeper.status == "pending",
+        )
+        .group_by(models.Keeper.owner_id)
         .all()
     )
-    # we want roster players - so we need to query owner roster (via transactions?)
-    # for simplicity assume `DraftPick` or roster table exists; to keep this self-contained
-    # we'll just treat keeper entries themselves as the candidate set for now.
 
-    # fetch projection values
-    from .projection_service import get_projected_auction_value
+    from .projection_service import get_projected_auction_values
+
+    projections = get_projected_auction_values(db, {k.player_id for k in keepers}, season)
+    flags_by_candidate = compute_keeper_flags_bulk(
+        db, league_id, [(k.player_id, k.owner_id) for k in keepers], rules
+    )
+
+    evaluation: dict[int, dict] = {}
+    for owner in owners:
+        effective_budget = int(owner.future_draft_budget or 0)
+        evaluation[owner.id] = {
+            "owner_id": owner.id,
+            "username": owner.username,
+            "owner_name": owner.team_name or owner.username,
+            "keepers": [],
+            "recommended": [],
+            "ineligible": [],
+            "effective_budget": effective_budget,
+            "estimated_budget": int(effective_budget - (pending_costs.get(owner.id) or 0)),
+        }
 
-    candidates = []
     for k in keepers:
-        proj = get_projected_auction_value(db, k.player_id, season)
-        surplus = (proj or 0) - float(k.keep_cost)
-        candidates.append({
-            "player_id": k.player_id,
-            "surplus": surplus,
-            "years_kept_count": k.years_kept_count,
-            "keep_cost": k.keep_cost,
-            "projected_value": proj,
-        })
-    # filter by max_years
-    if max_years is not None:
-        candidates = [c for c in candidates if c["years_kept_count"] < max_years]
-    candidates.sort(key=lambda x: x["surplus"], reverse=True)
-    if limit is not None:
-        candidates = candidates[:limit]
-    for c in candidates:
-        c["recommended"] = True
-    return candidates
+        entry = evaluation[k.owner_id]
+        years_kept = int(k.years_kept_count or 0)
+        projected = projections.get(k.player_id)
+        reason = keeper_ineligibility_reason(years_kept, max_years)
+        entry["keepers"].append(
+            {
+                "player_id": k.player_id,
+                "keep_cost": k.keep_cost,
+                "years_kept_count": k.years_kept_count,
+                "status": k.status,
+                "approved_by_commish": k.approved_by_commish,
+                "projected_value": projected,
+                "surplus": (projected or 0) - float(k.keep_cost),
+                "is_eligible": reason is None,
+                "reason_ineligible": reason,
+                **flags_by_candidate[(k.player_id, k.owner_id)],
+            }
+        )
+        if max_years is not None and years_kept >= max_years:
+            entry["ineligible"].append(k.player_id)
+
+    for entry in evaluation.values():
+        entry["recommended"] = _recommend_keepers(entry["keepers"], limit=limit, max_years=max_years)
+    return evaluation
 
 
 def veto_keepers(db: Session, owner_id: int, league_id: int, season: int):
@@ -269,22 +360,29 @@ def lock_keepers_for_league(db: Session, league_id: int, season: int):
         owner_updates.setdefault(k.owner_id, 0)
         owner_updates[k.owner_id] += int(k.keep_cost)
     # apply budget deductions
-    for owner_id, cost in owner_updates.items():
-        owner = db.query(models.User).filter(models.User.id == owner_id).first()
-        if owner and hasattr(owner, "future_draft_budget"):
-            owner.future_draft_budget = int((owner.future_draft_budget or 0) - cost)
-            record_ledger_entry(
-                db,
-                league_id=league_id,
-                season_year=season,
-                currency_type="DRAFT_DOLLARS",
-                amount=cost,
-                from_owner_id=owner_id,
-                to_owner_id=None,
-                transaction_type="KEEPER_LOCK",
-                reference_type="LEAGUE_KEEPER_LOCK",
-                reference_id=f"{league_id}:{season}:{owner_id}",
-                notes="keeper lock budget deduction",
-            )
+    owners = (
+        db.query(models.User).filter(models.User.id.in_(owner_updates)).all()
+        if owner_updates
+        else []
+    )
+    ledger_entries = []
+    for owner in owners:
+        cost = owner_updates[owner.id]
+        owner.future_draft_budget = int((owner.future_draft_budget or 0) - cost)
+        ledger_entries.append(
+            {
+                "league_id": league_id,
+                "season_year": season,
+                "currency_type": "DRAFT_DOLLARS",
+                "amount": cost,
+                "from_owner_id": owner.id,
+                "to_owner_id": None,
+                "transaction_type": "KEEPER_LOCK",
+                "reference_type": "LEAGUE_KEEPER_LOCK",
+                "reference_id": f"{league_id}:{season}:{owner.id}",
+                "notes": "keeper lock budget deduction",
+            }
+        )
+    record_ledger_entries(db, ledger_entries)
     db.commit()
     return len(keepers)
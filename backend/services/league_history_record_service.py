@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from .. import models
+from .league_history_enrichment_service import normalize_history_team_key
+
+
+# Typed read model for MFL history record facts. Each MflHtmlRecordFact gets
+# one MflHistoryRecordRow carrying the values the history endpoints sort and
+# filter on, so a page is one indexed ORDER BY ... LIMIT instead of loading
+# and sorting every JSON blob in the dataset on each request.
+
+HISTORY_RECORD_ORDERS = ("record_year", "wins")
+
+
+def _parse_int(record: Dict[str, Any], *keys: str) -> int | None:
+    for key in keys:
+        value = record.get(key)
+        if value is None:
+            continue
+        try:
+            return int(float(str(value).strip()))
+        except (TypeError, ValueError, OverflowError):
+            continue
+    return None
+
+
+def _parse_float(record: Dict[str, Any], *keys: str) -> float | None:
+    for key in keys:
+        value = record.get(key)
+        if value is None:
+            continue
+        try:
+            parsed = float(str(value).strip())
+        except (TypeError, ValueError):
+            continue
+        if math.isnan(parsed):
+            continue
+        return parsed
+    return None
+
+
+def _parse_text(record: Dict[str, Any], *keys: str) -> str | None:
+    for key in keys:
+        text = str(record.get(key) or "").strip()
+        if text:
+            return text
+    return None
+
+
+def history_record_row_values(record_json: Any) -> Dict[str, Any]:
+    """Typed columns for one record; non-dict payloads project to empty values."""
+    record = record_json if isinstance(record_json, dict) else {}
+    record_year = _parse_int(record, "record_year", "season")
+    team_name = _parse_text(record, "team_name", "franchise_name")
+    return {
+        "record_year": record_year if record_year is not None else -1,
+        "season": _parse_int(record, "season"),
+        "record_week": _parse_int(record, "record_week", "week"),
+        "wins": _parse_int(record, "wins"),
+        "points": _parse_float(record, "points", "record_value", "value"),
+        "owner_name": _parse_text(record, "owner_name"),
+        "team_name": team_name,
+        "team_key": normalize_history_team_key(team_name) or None,
+    }
+
+
+def build_history_record_row(fact: models.MflHtmlRecordFact) -> models.MflHistoryRecordRow:
+    return models.MflHistoryRecordRow(
+        fact=fact,
+        dataset_key=fact.dataset_key,
+        target_league_id=fact.target_league_id,
+        source_league_id=fact.league_id,
+        **history_record_row_values(fact.record_json),
+    )
+
+
+def rebuild_history_record_rows(db: Session, *, dataset_key: str | None = None) -> int:
+    """Re-project facts (one dataset or all) into the read model. Caller commits."""
+    delete_query = db.query(models.MflHistoryRecordRow)
+    fact_query = db.query(models.MflHtmlRecordFact)
+    if dataset_key is not None:
+        delete_query = delete_query.filter(models.MflHistoryRecordRow.dataset_key == dataset_key)
+        fact_query = fact_query.filter(models.MflHtmlRecordFact.dataset_key == dataset_key)
+    delete_query.delete(synchronize_session=False)
+
+    count = 0
+    for fact in fact_query.order_by(models.MflHtmlRecordFact.id.asc()).yield_per(1000):
+        db.add(build_history_record_row(fact))
+        count += 1
+    db.flush()
+    return count
+
+
+def history_read_model_ready(db: Session, dataset_key: str) -> bool:
+    """True when every fact in ``dataset_key`` has a projected row."""
+    missing = (
+        db.query(models.MflHtmlRecordFact.id)
+        .outerjoin(
+            models.MflHistoryRecordRow,
+            models.MflHistoryRecordRow.fact_id == models.MflHtmlRecordFact.id,
+        )
+        .filter(
+            models.MflHtmlRecordFact.dataset_key == dataset_key,
+            models.MflHistoryRecordRow.id.is_(None),
+        )
+        .first()
+    )
+    return missing is None
+
+
+def fetch_history_records(
+    db: Session,
+    *,
+    dataset_key: str,
+    league_id: int,
+    order: str = "record_year",
+    limit: int | None = None,
+    offset: int = 0,
+) -> List[Dict[str, Any]]:
+    """Return one page of record payloads, newest (or most wins) first.
+
+    Ties keep fact insertion order, matching the stable in-Python sort the
+    endpoints used before.
+    """
+    if order not in HISTORY_RECORD_ORDERS:
+        raise ValueError(f"unsupported history record order: {order}")
+
+    row = models.MflHistoryRecordRow
+    if order == "wins":
+        sort_expression = func.coalesce(row.wins, row.season, -1).desc()
+    else:
+        sort_expression = row.record_year.desc()
+
+    query = (
+        db.query(models.MflHtmlRecordFact.record_json)
+        .join(row, row.fact_id == models.MflHtmlRecordFact.id)
+        .filter(
+            row.dataset_key == dataset_key,
+            or_(
+                row.target_league_id == league_id,
+                row.source_league_id == str(league_id),
+            ),
+        )
+        .order_by(sort_expression, row.fact_id.asc())
+    )
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return [record_json for (record_json,) in query.all() if isinstance(record_json, dict)]
@@ -1,9 +1,25 @@
-from sqlalchemy import func, case
+import logging
+import threading
+import weakref
+
+from sqlalchemy import case, func, literal, select, union_all
 from sqlalchemy.orm import Session
 
 from .. import models
 
 
+LOGGER = logging.getLogger(__name__)
+
+# Leagues whose owner_ledger_balances rows were found to cover the ledger,
+# per engine. Balances are kept current by the after_flush hook in
+# models.py, but databases that got the table from create_all instead of
+# migration 0031 start with it empty. Until `manage.py rebuild-ledger-balances`
+# backfills such a league, readers aggregate the ledger itself; reads never
+# write the table.
+_COVERED_BALANCE_LEAGUES: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_COVERED_BALANCE_LEAGUES_LOCK = threading.Lock()
+
+
 def record_ledger_entry(
     db: Session,
     *,
@@ -42,37 +58,137 @@ def record_ledger_entry(
     return entry
 
 
-def owner_balance(
+def record_ledger_entries(db: Session, entries: list[dict]) -> list[models.EconomicLedger]:
+    """Batch form of `record_ledger_entry`: one flush for all entries."""
+    rows: list[models.EconomicLedger] = []
+    for values in entries:
+        if int(values.get("amount") or 0) <= 0:
+            raise ValueError("amount must be a positive integer")
+        rows.append(models.EconomicLedger(**{**values, "amount": int(values["amount"])}))
+    if rows:
+        db.add_all(rows)
+        db.flush()
+    return rows
+
+
+def _ledger_balance_rows(league_id: int):
+    """One league's ledger as per-side balance rows, like ``ledger_balance_deltas``.
+
+    Columns match ``owner_ledger_balances``, so readers can sum either one.
+    """
+    ledger = models.EconomicLedger
+    amount = func.coalesce(ledger.amount, 0)
+    season_year = func.coalesce(ledger.season_year, 0)
+    credits = select(
+        ledger.league_id.label("league_id"),
+        ledger.to_owner_id.label("owner_id"),
+        ledger.currency_type.label("currency_type"),
+        season_year.label("season_year"),
+        amount.label("credit_total"),
+        literal(0).label("debit_total"),
+        case((ledger.from_owner_id.is_(None), amount), else_=0).label("issued_total"),
+        literal(0).label("spent_total"),
+        literal(0).label("keeper_lock_total"),
+        literal(1).label("credit_count"),
+        literal(0).label("debit_count"),
+    ).where(ledger.league_id == league_id, ledger.to_owner_id.isnot(None))
+    debits = select(
+        ledger.league_id,
+        ledger.from_owner_id,
+        ledger.currency_type,
+        season_year,
+        literal(0),
+        amount,
+        literal(0),
+        case((ledger.to_owner_id.is_(None), amount), else_=0),
+        case((ledger.transaction_type == "KEEPER_LOCK", amount), else_=0),
+        literal(0),
+        literal(1),
+    ).where(ledger.league_id == league_id, ledger.from_owner_id.isnot(None))
+    return union_all(credits, debits).subquery("ledger_balance_rows")
+
+
+def _balances_cover_ledger(db: Session, *, league_id: int) -> bool:
+    bind = db.get_bind()
+    engine = getattr(bind, "engine", bind)
+    with _COVERED_BALANCE_LEAGUES_LOCK:
+        covered = _COVERED_BALANCE_LEAGUES.setdefault(engine, set())
+        if league_id in covered:
+            return True
+
+    ledger = models.EconomicLedger
+    balance = models.OwnerLedgerBalance
+    ledger_sides = (
+        db.query(func.count(ledger.to_owner_id) + func.count(ledger.from_owner_id))
+        .filter(ledger.league_id == league_id)
+        .scalar()
+    )
+    stored_sides = (
+        db.query(func.coalesce(func.sum(balance.credit_count + balance.debit_count), 0))
+        .filter(balance.league_id == league_id)
+        .scalar()
+    )
+    if int(ledger_sides or 0) != int(stored_sides or 0):
+        LOGGER.warning(
+            "ledger_balances.incomplete league_id=%s ledger_sides=%s stored_sides=%s; "
+            "reading from the ledger until `manage.py rebuild-ledger-balances` runs",
+            league_id,
+            ledger_sides,
+            stored_sides,
+        )
+        return False
+    with _COVERED_BALANCE_LEAGUES_LOCK:
+        covered.add(league_id)
+    return True
+
+
+def _balance_source(db: Session, *, league_id: int):
+    """``owner_ledger_balances``, or the ledger aggregate while it is incomplete."""
+    if _balances_cover_ledger(db, league_id=league_id):
+        return models.OwnerLedgerBalance.__table__
+    return _ledger_balance_rows(league_id)
+
+
+def _balance_query(
     db: Session,
+    columns,
     *,
     league_id: int,
     owner_id: int,
-    currency_type: str,
-    season_year: int | None = None,
-) -> int:
-    query = db.query(
-        func.coalesce(
-            func.sum(
-                case(
-                    (models.EconomicLedger.to_owner_id == owner_id, models.EconomicLedger.amount),
-                    else_=0,
-                )
-                - case(
-                    (models.EconomicLedger.from_owner_id == owner_id, models.EconomicLedger.amount),
-                    else_=0,
-                )
-            ),
-            0,
-        )
-    ).filter(
-        models.EconomicLedger.league_id == league_id,
-        models.EconomicLedger.currency_type == currency_type,
+    currency_type: str | None,
+    season_year: int | None,
+):
+    """Query ``columns(source)`` over one owner's balance rows."""
+    source = _balance_source(db, league_id=league_id)
+    query = db.query(*columns(source.c)).select_from(source).filter(
+        source.c.league_id == league_id,
+        source.c.owner_id == owner_id,
     )
-
+    if currency_type is not None:
+        query = query.filter(source.c.currency_type == currency_type)
     if season_year is not None:
-        query = query.filter(models.EconomicLedger.season_year == season_year)
+        query = query.filter(source.c.season_year == season_year)
+    return query
+
 
-    return int(query.scalar() or 0)
+def owner_balance(
+    db: Session,
+    *,
+    league_id: int,
+    owner_id: int,
+    currency_type: str | None,
+    season_year: int | None = None,
+) -> int:
+    """Net ledger balance; ``currency_type=None`` sums every currency."""
+    total = _balance_query(
+        db,
+        lambda c: [func.coalesce(func.sum(c.credit_total - c.debit_total), 0)],
+        league_id=league_id,
+        owner_id=owner_id,
+        currency_type=currency_type,
+        season_year=season_year,
+    ).scalar()
+    return int(total or 0)
 
 
 def has_owner_ledger_entries(
@@ -83,16 +199,15 @@ def has_owner_ledger_entries(
     currency_type: str,
     season_year: int | None = None,
 ) -> bool:
-    query = db.query(models.EconomicLedger.id).filter(
-        models.EconomicLedger.league_id == league_id,
-        models.EconomicLedger.currency_type == currency_type,
-        (models.EconomicLedger.to_owner_id == owner_id) | (models.EconomicLedger.from_owner_id == owner_id),
-    )
-
-    if season_year is not None:
-        query = query.filter(models.EconomicLedger.season_year == season_year)
-
-    return query.first() is not None
+    total = _balance_query(
+        db,
+        lambda c: [func.coalesce(func.sum(c.credit_count + c.debit_count), 0)],
+        league_id=league_id,
+        owner_id=owner_id,
+        currency_type=currency_type,
+        season_year=season_year,
+    ).scalar()
+    return int(total or 0) > 0
 
 
 def owner_incoming_total(
@@ -103,16 +218,54 @@ def owner_incoming_total(
     currency_type: str,
     season_year: int | None = None,
 ) -> int:
-    query = db.query(func.coalesce(func.sum(models.EconomicLedger.amount), 0)).filter(
-        models.EconomicLedger.league_id == league_id,
-        models.EconomicLedger.currency_type == currency_type,
-        models.EconomicLedger.to_owner_id == owner_id,
-    )
+    total = _balance_query(
+        db,
+        lambda c: [func.coalesce(func.sum(c.credit_total), 0)],
+        league_id=league_id,
+        owner_id=owner_id,
+        currency_type=currency_type,
+        season_year=season_year,
+    ).scalar()
+    return int(total or 0)
+
+
+def owner_balance_summaries(
+    db: Session,
+    *,
+    league_id: int,
+    currency_type: str,
+    season_year: int | None = None,
+) -> dict[int, dict[str, int]]:
+    """Per-owner ledger totals for a whole league in one query.
 
+    Each summary has ``incoming``, ``outgoing``, ``issued`` (credits with no
+    sending owner), ``spent`` (debits with no receiving owner) and ``balance``.
+    Owners without ledger entries are absent.
+    """
+    balance = _balance_source(db, league_id=league_id).c
+    query = db.query(
+        balance.owner_id,
+        func.sum(balance.credit_total),
+        func.sum(balance.debit_total),
+        func.sum(balance.issued_total),
+        func.sum(balance.spent_total),
+    ).filter(
+        balance.league_id == league_id,
+        balance.currency_type == currency_type,
+    )
     if season_year is not None:
-        query = query.filter(models.EconomicLedger.season_year == season_year)
+        query = query.filter(balance.season_year == season_year)
 
-    return int(query.scalar() or 0)
+    summaries: dict[int, dict[str, int]] = {}
+    for owner_id, incoming, outgoing, issued, spent in query.group_by(balance.owner_id).all():
+        summaries[int(owner_id)] = {
+            "incoming": int(incoming or 0),
+            "outgoing": int(outgoing or 0),
+            "issued": int(issued or 0),
+            "spent": int(spent or 0),
+            "balance": int(incoming or 0) - int(outgoing or 0),
+        }
+    return summaries
 
 
 def owner_has_incoming_credits(
@@ -140,22 +293,87 @@ def owner_draft_budget_total(
     season_year: int,
     include_keeper_locks: bool = False,
 ) -> int:
-    incoming = owner_incoming_total(
+    def _columns(c):
+        outgoing = c.debit_total if include_keeper_locks else c.debit_total - c.keeper_lock_total
+        return [func.coalesce(func.sum(c.credit_total - outgoing), 0)]
+
+    total = _balance_query(
         db,
+        _columns,
         league_id=league_id,
         owner_id=owner_id,
         currency_type="DRAFT_DOLLARS",
         season_year=season_year,
-    )
+    ).scalar()
+    return int(total or 0)
 
-    outgoing_query = db.query(func.coalesce(func.sum(models.EconomicLedger.amount), 0)).filter(
-        models.EconomicLedger.league_id == league_id,
-        models.EconomicLedger.currency_type == "DRAFT_DOLLARS",
-        models.EconomicLedger.from_owner_id == owner_id,
-        models.EconomicLedger.season_year == season_year,
+
+def compute_owner_ledger_balances(db: Session, *, league_id: int) -> dict[tuple, dict[str, int]]:
+    """Aggregate one league's ledger into ``OwnerLedgerBalance`` counters."""
+    entries = (
+        db.query(models.EconomicLedger)
+        .filter(models.EconomicLedger.league_id == league_id)
+        .yield_per(1000)
     )
-    if not include_keeper_locks:
-        outgoing_query = outgoing_query.filter(models.EconomicLedger.transaction_type != "KEEPER_LOCK")
+    return models.ledger_balance_deltas(entries)
+
 
-    outgoing = int(outgoing_query.scalar() or 0)
-    return int(incoming - outgoing)
+def _stored_owner_ledger_balances(db: Session, *, league_id: int) -> dict[tuple, dict[str, int]]:
+    rows = db.query(models.OwnerLedgerBalance).filter(models.OwnerLedgerBalance.league_id == league_id).all()
+    return {
+        (row.league_id, row.owner_id, row.currency_type, row.season_year): {
+            name: int(getattr(row, name) or 0) for name in models.LEDGER_BALANCE_COUNTERS
+        }
+        for row in rows
+    }
+
+
+def verify_owner_ledger_balances(db: Session, *, league_id: int) -> list[dict]:
+    """Differences between the stored balances and a fresh ledger aggregate.
+
+    Returns one item per mismatched (owner, currency, season) key with the
+    ``stored`` and ``expected`` counters; an empty list means the table is
+    consistent. All-zero stored rows count as consistent with a missing key.
+    """
+    expected = compute_owner_ledger_balances(db, league_id=league_id)
+    stored = _stored_owner_ledger_balances(db, league_id=league_id)
+    zero = dict.fromkeys(models.LEDGER_BALANCE_COUNTERS, 0)
+    mismatches = []
+    for key in sorted(set(expected) | set(stored), key=lambda item: (item[1], item[2], item[3])):
+        want = expected.get(key, zero)
+        have = stored.get(key, zero)
+        if want != have:
+            _, owner_id, currency_type, season_year = key
+            mismatches.append(
+                {
+                    "owner_id": owner_id,
+                    "currency_type": currency_type,
+                    "season_year": season_year,
+                    "stored": have,
+                    "expected": want,
+                }
+            )
+    return mismatches
+
+
+def rebuild_owner_ledger_balances(db: Session, *, league_id: int) -> int:
+    """Replace one league's stored balances with a fresh ledger aggregate.
+
+    Returns the number of balance rows written. Caller commits.
+    """
+    expected = compute_owner_ledger_balances(db, league_id=league_id)
+    db.query(models.OwnerLedgerBalance).filter(
+        models.OwnerLedgerBalance.league_id == league_id
+    ).delete(synchronize_session=False)
+    db.add_all(
+        models.OwnerLedgerBalance(
+            league_id=key[0],
+            owner_id=key[1],
+            currency_type=key[2],
+            season_year=key[3],
+            **counters,
+        )
+        for key, counters in expected.items()
+    )
+    db.flush()
+    return len(expected)
@@ -21,6 +21,8 @@ import threading
 import time
 from typing import Any
 
+from ..core.metrics import observe_stage, set_sse_client_count
+
 LOGGER = logging.getLogger(__name__)
 
 # Maximum number of items allowed in each client queue.
@@ -66,6 +68,7 @@ def subscribe() -> asyncio.Queue:
     q: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
     with _lock:
         _clients.add(q)
+        set_sse_client_count(len(_clients))
     LOGGER.debug("live_scoring.event_bus client_subscribed total=%s", len(_clients))
     return q
 
@@ -74,6 +77,7 @@ def unsubscribe(q: asyncio.Queue) -> None:
     """Remove the client queue (called when the SSE connection closes)."""
     with _lock:
         _clients.discard(q)
+        set_sse_client_count(len(_clients))
     LOGGER.debug("live_scoring.event_bus client_unsubscribed total=%s", len(_clients))
 
 
@@ -104,12 +108,13 @@ def publish_from_thread(event: dict[str, Any]) -> None:
         return
 
     dropped = 0
-    for q in clients:
-        try:
-            asyncio.run_coroutine_threadsafe(_put(q, event), loop)
-        except Exception as exc:  # pragma: no cover
-            dropped += 1
-            LOGGER.debug("live_scoring.event_bus publish_error err=%s", exc)
+    with observe_stage("live_scoring_sse.fanout"):
+        for q in clients:
+            try:
+                asyncio.run_coroutine_threadsafe(_put(q, event), loop)
+            except Exception as exc:  # pragma: no cover
+                dropped += 1
+                LOGGER.debug("live_scoring.event_bus publish_error err=%s", exc)
 
     LOGGER.debug(
         "live_scoring.event_bus published clients=%s dropped=%s",
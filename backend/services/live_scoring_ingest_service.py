@@ -7,13 +7,17 @@ import logging
 import os
 import threading
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import requests
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
+from backend.core.metrics import record_stage_latency
 from backend.database import SessionLocal
 from backend.services.live_scoring_contract import (
     inspect_play_by_play_contract,
@@ -32,6 +36,8 @@ from backend.services.live_scoring_sources import (
     build_summary_url,
     scoreboard_candidate_urls,
 )
+from backend.services.raw_payload_archive import DEFAULT_SEGMENT_MAX_BYTES, get_raw_payload_archive
+from backend.services.run_log_store import RunLogStore, get_run_log_store
 from backend.services.scoring_service import recalculate_league_week_scores
 import models
 
@@ -45,6 +51,10 @@ _FETCH_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
 _FETCH_CACHE_LOCK = threading.Lock()
 _REQUEST_LAST_CALL_TS: dict[str, float] = {}
 _REQUEST_RATE_LIMIT_LOCK = threading.Lock()
+# Name of the ingest stage running on this thread, so callers instrumenting
+# the engine (e.g. the replay harness) can attribute queries to a stage.
+_CURRENT_INGEST_STAGE: ContextVar[str | None] = ContextVar("live_scoring_ingest_stage", default=None)
+_RAW_ARCHIVE_PRUNED_SEGMENTS: dict[str, str] = {}
 
 
 class IngestFetchError(RuntimeError):
@@ -73,6 +83,25 @@ def _raw_response_max_age_seconds() -> float:
     return max(0.0, float(os.getenv("LIVE_SCORING_RAW_RESPONSE_MAX_AGE_SECONDS", "604800")))
 
 
+def _raw_response_format() -> str:
+    # "archive": compressed weekly segments (default); "files": one JSON file per response.
+    value = os.getenv("LIVE_SCORING_RAW_RESPONSE_FORMAT", "archive").strip().lower()
+    return value if value in {"archive", "files"} else "archive"
+
+
+def _raw_archive_max_segments() -> int:
+    return max(0, int(os.getenv("LIVE_SCORING_RAW_ARCHIVE_MAX_SEGMENTS", "26")))
+
+
+def _raw_archive_segment_max_bytes() -> int:
+    return max(1, int(os.getenv("LIVE_SCORING_RAW_ARCHIVE_SEGMENT_MAX_BYTES", str(DEFAULT_SEGMENT_MAX_BYTES))))
+
+
+def _raw_response_root() -> Path:
+    root = os.getenv("LIVE_SCORING_RAW_RESPONSE_DIR")
+    return Path(root) if root else RAW_RESPONSE_DIR_PATH
+
+
 def _cache_key(source: str, parts: list[str]) -> str:
     base = "|".join([source, *parts])
     return hashlib.sha256(base.encode("utf-8")).hexdigest()
@@ -130,12 +159,28 @@ def _store_raw_payload_snapshot(
     if not _raw_payload_storage_enabled():
         return None
 
-    root = os.getenv("LIVE_SCORING_RAW_RESPONSE_DIR")
-    target_root = Path(root) if root else RAW_RESPONSE_DIR_PATH
-    target_root.mkdir(parents=True, exist_ok=True)
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    target_root = _raw_response_root()
     safe_source = "".join(ch for ch in source if ch.isalnum() or ch in {"_", "-"})
     safe_suffix = "".join(ch for ch in suffix if ch.isalnum() or ch in {"_", "-"})
+
+    if _raw_response_format() == "archive":
+        archive = get_raw_payload_archive(target_root, segment_max_bytes=_raw_archive_segment_max_bytes())
+        entry = archive.append(payload, source=safe_source, key=safe_suffix)
+        # Retention runs once per segment rather than on every write.
+        root_key = str(target_root)
+        if _RAW_ARCHIVE_PRUNED_SEGMENTS.get(root_key) != entry.segment:
+            _RAW_ARCHIVE_PRUNED_SEGMENTS[root_key] = entry.segment
+            try:
+                archive.prune(
+                    max_age_seconds=_raw_response_max_age_seconds(),
+                    max_segments=_raw_archive_max_segments(),
+                )
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.warning("live_scoring.raw_archive_prune_failed path=%s error=%s", target_root, exc)
+        return f"{target_root / entry.segment}.jsonl.gz#{entry.offset}"
+
+    target_root.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
     path = target_root / f"{ts}_{safe_source}_{safe_suffix}.json"
     path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
     try:
@@ -145,6 +190,27 @@ def _store_raw_payload_snapshot(
     return str(path)
 
 
+def load_raw_payload(raw_response_path: str) -> dict[str, Any]:
+    """Read a payload back from a ``raw_response_path`` of either storage format."""
+    location, sep, offset = raw_response_path.rpartition("#")
+    if sep and location.endswith(".jsonl.gz") and offset.isdigit():
+        archive = get_raw_payload_archive(Path(location).parent, segment_max_bytes=_raw_archive_segment_max_bytes())
+        return archive.read_ref(raw_response_path)
+    return json.loads(Path(raw_response_path).read_text(encoding="utf-8"))
+
+
+def replay_raw_payloads(
+    *,
+    source: str | None = None,
+    key: str | None = None,
+    include_duplicates: bool = True,
+) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+    """Yield ``(index entry, payload)`` from the raw archive in capture order."""
+    archive = get_raw_payload_archive(_raw_response_root(), segment_max_bytes=_raw_archive_segment_max_bytes())
+    for entry, payload in archive.replay(source=source, key=key, include_duplicates=include_duplicates):
+        yield entry.to_dict(), payload
+
+
 def _prune_raw_payload_snapshots(target_root: Path) -> dict[str, int]:
     deleted_for_age = 0
     deleted_for_count = 0
@@ -175,6 +241,25 @@ def _prune_raw_payload_snapshots(target_root: Path) -> dict[str, int]:
     }
 
 
+def current_ingest_stage() -> str | None:
+    return _CURRENT_INGEST_STAGE.get()
+
+
+@contextmanager
+def _timed_stage(timings: dict[str, float], name: str) -> Iterator[None]:
+    token = _CURRENT_INGEST_STAGE.set(name)
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        elapsed = time.perf_counter() - started
+        timings[name] = round(elapsed * 1000, 3)
+        record_stage_latency(f"live_scoring_ingest.{name}", elapsed, outcome=outcome)
+        _CURRENT_INGEST_STAGE.reset(token)
+
+
 def _phase_from_status(status: str | None) -> str:
     value = str(status or "").upper()
     if "HALF" in value:
@@ -196,6 +281,28 @@ def _build_game_states(normalized_games: list[Any]) -> dict[str, str]:
     return states
 
 
+def _load_game_kickoffs(db: Session, normalized_games: list[Any], game_states: dict[str, str]) -> dict[str, str]:
+    """Kickoff times for games that have not started, preferring ``NFLGame``."""
+    kickoffs: dict[str, str] = {}
+    for game in normalized_games:
+        event_id = str(getattr(game, "event_id", "") or "")
+        kickoff_utc = getattr(game, "kickoff_utc", None)
+        if game_states.get(event_id) == "pre" and kickoff_utc is not None:
+            kickoffs[event_id] = kickoff_utc.isoformat()
+
+    pending_event_ids = [event_id for event_id, phase in game_states.items() if phase == "pre"]
+    if pending_event_ids:
+        rows = (
+            db.query(models.NFLGame.event_id, models.NFLGame.kickoff)
+            .filter(models.NFLGame.event_id.in_(pending_event_ids))
+            .all()
+        )
+        for event_id, kickoff in rows:
+            if kickoff:
+                kickoffs[str(event_id)] = str(kickoff)
+    return kickoffs
+
+
 def _build_scoreboard_fingerprint(normalized: Any) -> str:
     game_rows = []
     for game in normalized.games:
@@ -622,28 +729,16 @@ def inspect_event_contracts(
     }
 
 
+def _run_log_store() -> RunLogStore:
+    return get_run_log_store(RUN_LOG_PATH)
+
+
 def _append_ingest_run_log(entry: dict[str, Any]) -> None:
-    RUN_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with RUN_LOG_PATH.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry, sort_keys=True, default=str) + "\n")
+    _run_log_store().append(entry)
 
 
 def load_recent_ingest_runs(limit: int = 100) -> list[dict[str, Any]]:
-    if limit <= 0 or not RUN_LOG_PATH.exists():
-        return []
-    with RUN_LOG_PATH.open("r", encoding="utf-8") as handle:
-        lines = handle.readlines()
-    selected = lines[-limit:]
-    rows: list[dict[str, Any]] = []
-    for line in selected:
-        raw = line.strip()
-        if not raw:
-            continue
-        try:
-            rows.append(json.loads(raw))
-        except json.JSONDecodeError:
-            continue
-    return rows
+    return _run_log_store().tail(limit)
 
 
 def summarize_ingest_health(limit: int = 100) -> dict[str, Any]:
@@ -686,6 +781,69 @@ def summarize_ingest_health(limit: int = 100) -> dict[str, Any]:
     }
 
 
+_UPSERT_CHUNK_SIZE = 500
+
+
+def _bulk_upsert(
+    db: Session,
+    model: Any,
+    rows: list[dict[str, Any]],
+    *,
+    conflict_columns: list[str],
+    update_columns: list[str],
+) -> list[int]:
+    """Write ``rows`` with INSERT ... ON CONFLICT DO UPDATE; return the row ids.
+
+    Callers pass only rows that actually changed. Dialects without ON
+    CONFLICT fall back to a bulk insert of new keys plus a bulk update by
+    primary key (rows must then carry ``id`` when they already exist).
+    """
+    if not rows:
+        return []
+
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        ids: list[int] = []
+        for start in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+            chunk = [
+                {key: value for key, value in row.items() if key != "id"}
+                for row in rows[start : start + _UPSERT_CHUNK_SIZE]
+            ]
+            statement = dialect_insert(model).values(chunk)
+            statement = statement.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={column: statement.excluded[column] for column in update_columns},
+            ).returning(model.id)
+            ids.extend(int(row_id) for (row_id,) in db.execute(statement))
+        return ids
+
+    inserts = [row for row in rows if row.get("id") is None]
+    updates = [row for row in rows if row.get("id") is not None]
+    if inserts:
+        db.execute(insert(model), [{key: value for key, value in row.items() if key != "id"} for row in inserts])
+    if updates:
+        db.execute(
+            update(model),
+            [{"id": row["id"], **{column: row[column] for column in update_columns}} for row in updates],
+        )
+    ids = [int(row["id"]) for row in updates]
+    if inserts:
+        key_columns = [getattr(model, column) for column in conflict_columns]
+        wanted = {tuple(row[column] for column in conflict_columns) for row in inserts}
+        for row_id, *key in db.query(model.id, *key_columns).filter(key_columns[0].in_({key[0] for key in wanted})):
+            if tuple(key) in wanted:
+                ids.append(int(row_id))
+    return ids
+
+
+_NFL_GAME_COLUMNS = ("season", "week", "home_team_id", "away_team_id", "kickoff", "status", "home_score", "away_score")
+
+
 def upsert_nfl_games_from_payload(
     db: Session,
     payload: dict[str, Any],
@@ -701,29 +859,43 @@ def upsert_nfl_games_from_payload(
     )
     rows = to_nfl_game_upsert_rows(normalized)
 
+    # Last row wins for an event listed twice, as with sequential upserts.
+    incoming = {row["event_id"]: row for row in rows if row.get("event_id")}
     inserted = 0
     updated = 0
+    unchanged = 0
+    changed_rows: list[dict[str, Any]] = []
 
     try:
-        for row in rows:
-            event_id = row.get("event_id")
-            if not event_id:
-                continue
+        existing_by_event: dict[str, Any] = {}
+        if incoming:
+            existing_by_event = {
+                existing.event_id: existing
+                for existing in db.query(
+                    models.NFLGame.id,
+                    models.NFLGame.event_id,
+                    *(getattr(models.NFLGame, column) for column in _NFL_GAME_COLUMNS),
+                ).filter(models.NFLGame.event_id.in_(list(incoming)))
+            }
 
-            existing = (
-                db.query(models.NFLGame)
-                .filter(models.NFLGame.event_id == event_id)
-                .one_or_none()
-            )
+        for event_id, row in incoming.items():
+            existing = existing_by_event.get(event_id)
             if existing is None:
-                db.add(models.NFLGame(**row))
+                changed_rows.append(dict(row))
                 inserted += 1
-                continue
-
-            for key, value in row.items():
-                setattr(existing, key, value)
-            updated += 1
-
+            elif any(getattr(existing, column) != row.get(column) for column in _NFL_GAME_COLUMNS):
+                changed_rows.append({"id": existing.id, **row})
+                updated += 1
+            else:
+                unchanged += 1
+
+        changed_game_ids = _bulk_upsert(
+            db,
+            models.NFLGame,
+            changed_rows,
+            conflict_columns=["event_id"],
+            update_columns=list(_NFL_GAME_COLUMNS),
+        )
         db.commit()
     except Exception:
         db.rollback()
@@ -735,15 +907,19 @@ def upsert_nfl_games_from_payload(
         "normalized_games": len(rows),
         "inserted": inserted,
         "updated": updated,
+        "unchanged": unchanged,
+        "changed_game_ids": sorted(changed_game_ids),
+        "changed_event_ids": sorted(row["event_id"] for row in changed_rows),
         "missing_required_paths_count": len(inspection.missing_paths),
         "missing_required_paths": inspection.missing_paths,
     }
     LOGGER.info(
-        "live_scoring.ingest_result fetched=%s normalized=%s inserted=%s updated=%s missing_paths=%s",
+        "live_scoring.ingest_result fetched=%s normalized=%s inserted=%s updated=%s unchanged=%s missing_paths=%s",
         result["fetched_events"],
         result["normalized_games"],
         result["inserted"],
         result["updated"],
+        result["unchanged"],
         result["missing_required_paths_count"],
     )
     return result
@@ -757,6 +933,12 @@ def upsert_player_weekly_stats_from_payload(
     week_override: int | None = None,
     source: str = "espn_live_ingest",
 ) -> dict[str, Any]:
+    """Merge scoreboard stat lines into ``player_weekly_stats``.
+
+    Existing rows for the payload's (season, week, source) scope are loaded
+    in one query and diffed in memory; only new or changed rows are written,
+    so ``affected_player_ids`` / ``changed_stat_ids`` list exactly what moved.
+    """
     normalized = map_scoreboard_payload(
         payload,
         season_override=season_override,
@@ -769,25 +951,29 @@ def upsert_player_weekly_stats_from_payload(
             "normalized_player_rows": 0,
             "inserted": 0,
             "updated": 0,
+            "unchanged": 0,
             "unmatched_players": 0,
             "skipped_without_context": 0,
             "affected_player_ids": [],
             "affected_weeks": [],
+            "changed_stat_ids": [],
         }
 
-    players = db.query(models.Player).filter(models.Player.espn_id.in_(espn_ids)).all()
-    player_by_espn = {str(player.espn_id): player for player in players if player.espn_id}
+    player_id_by_espn = {
+        str(espn_id): int(player_id)
+        for player_id, espn_id in db.query(models.Player.id, models.Player.espn_id).filter(
+            models.Player.espn_id.in_(espn_ids)
+        )
+        if espn_id
+    }
 
-    inserted = 0
-    updated = 0
     unmatched_players = 0
     skipped_without_context = 0
-    affected_player_ids: set[int] = set()
-    affected_weeks: set[int] = set()
-
+    # (player_id, season, week) -> (fantasy_points, stats) from this payload.
+    incoming: dict[tuple[int, int, int], tuple[float | None, dict[str, Any]]] = {}
     for row in normalized.player_stats:
-        player = player_by_espn.get(row.player_espn_id)
-        if player is None:
+        player_id = player_id_by_espn.get(row.player_espn_id)
+        if player_id is None:
             unmatched_players += 1
             continue
 
@@ -797,51 +983,98 @@ def upsert_player_weekly_stats_from_payload(
             skipped_without_context += 1
             continue
 
-        existing = (
-            db.query(models.PlayerWeeklyStat)
-            .filter(
-                models.PlayerWeeklyStat.player_id == player.id,
-                models.PlayerWeeklyStat.season == season,
-                models.PlayerWeeklyStat.week == week,
-                models.PlayerWeeklyStat.source == source,
-            )
-            .one_or_none()
-        )
+        key = (player_id, int(season), int(week))
+        fantasy_points, stats = incoming.get(key, (None, {}))
+        stats = {**stats, **(row.stats or {})}
+        if row.fantasy_points is not None:
+            fantasy_points = row.fantasy_points
+        incoming[key] = (fantasy_points, stats)
+
+    existing_by_key: dict[tuple[int, int, int], Any] = {}
+    if incoming:
+        seasons = {season for _, season, _ in incoming}
+        weeks = {week for _, _, week in incoming}
+        for existing in db.query(
+            models.PlayerWeeklyStat.id,
+            models.PlayerWeeklyStat.player_id,
+            models.PlayerWeeklyStat.season,
+            models.PlayerWeeklyStat.week,
+            models.PlayerWeeklyStat.fantasy_points,
+            models.PlayerWeeklyStat.stats,
+        ).filter(
+            models.PlayerWeeklyStat.source == source,
+            models.PlayerWeeklyStat.season.in_(seasons),
+            models.PlayerWeeklyStat.week.in_(weeks),
+        ):
+            existing_by_key[(existing.player_id, existing.season, existing.week)] = existing
+
+    inserted = 0
+    updated = 0
+    unchanged = 0
+    changed_rows: list[dict[str, Any]] = []
+    affected_player_ids: set[int] = set()
+    affected_weeks: set[int] = set()
 
-        merged_stats = dict(row.stats or {})
+    for key, (fantasy_points, stats) in incoming.items():
+        player_id, season, week = key
+        existing = existing_by_key.get(key)
         if existing is None:
-            db.add(
-                models.PlayerWeeklyStat(
-                    player_id=player.id,
-                    season=season,
-                    week=week,
-                    fantasy_points=row.fantasy_points,
-                    stats=merged_stats,
-                    source=source,
-                )
+            changed_rows.append(
+                {
+                    "player_id": player_id,
+                    "season": season,
+                    "week": week,
+                    "fantasy_points": fantasy_points,
+                    "stats": stats,
+                    "source": source,
+                }
             )
             inserted += 1
         else:
-            payload_stats = dict(existing.stats or {})
-            payload_stats.update(merged_stats)
-            existing.stats = payload_stats
-            if row.fantasy_points is not None:
-                existing.fantasy_points = row.fantasy_points
+            merged_stats = {**(existing.stats or {}), **stats}
+            merged_points = fantasy_points if fantasy_points is not None else existing.fantasy_points
+            if merged_stats == (existing.stats or {}) and merged_points == existing.fantasy_points:
+                unchanged += 1
+                continue
+            changed_rows.append(
+                {
+                    "id": existing.id,
+                    "player_id": player_id,
+                    "season": season,
+                    "week": week,
+                    "fantasy_points": merged_points,
+                    "stats": merged_stats,
+                    "source": source,
+                }
+            )
             updated += 1
 
-        affected_player_ids.add(int(player.id))
-        affected_weeks.add(int(week))
+        affected_player_ids.add(player_id)
+        affected_weeks.add(week)
 
-    db.commit()
+    try:
+        changed_stat_ids = _bulk_upsert(
+            db,
+            models.PlayerWeeklyStat,
+            changed_rows,
+            conflict_columns=["player_id", "season", "week", "source"],
+            update_columns=["fantasy_points", "stats"],
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
     return {
         "normalized_player_rows": len(normalized.player_stats),
         "inserted": inserted,
         "updated": updated,
+        "unchanged": unchanged,
         "unmatched_players": unmatched_players,
         "skipped_without_context": skipped_without_context,
         "affected_player_ids": sorted(affected_player_ids),
         "affected_weeks": sorted(affected_weeks),
+        "changed_stat_ids": sorted(changed_stat_ids),
     }
 
 
@@ -1053,22 +1286,45 @@ def run_live_scoreboard_ingest_with_controls(
     inspect_event_contracts_enabled: bool = True,
     event_contracts_limit: int = 3,
     change_guard_fingerprint: str | None = None,
+    scoreboard_payload: dict[str, Any] | None = None,
+    event_contracts_phases: set[str] | frozenset[str] | None = None,
 ) -> dict[str, Any]:
+    """Fetch one scoreboard and push it through upsert -> reconcile -> recalculate.
+
+    ``scoreboard_payload`` skips the fetch and ingests the given payload as-is;
+    the replay harness uses it to feed archived scoreboards. Per-stage wall
+    times are returned under ``stage_timings_ms``. ``event_contracts_phases``
+    limits summary/play-by-play inspection to games in those phases.
+    """
     run_started_at = datetime.now(timezone.utc)
+    stage_timings_ms: dict[str, float] = {}
     db = SessionLocal()
     try:
-        payload, fetch_diagnostics = fetch_scoreboard_payload_with_diagnostics(
-            year=year,
-            week=week,
-            timeout_seconds=timeout_seconds,
-            override_url=override_url,
-            enable_failover=enable_failover,
-        )
+        with _timed_stage(stage_timings_ms, "fetch"):
+            if scoreboard_payload is not None:
+                payload = scoreboard_payload
+                fetch_diagnostics = {
+                    "mode": "replay",
+                    "source": PRIMARY_SCOREBOARD_SOURCE,
+                    "year": year,
+                    "week": week,
+                    "cache_hit": False,
+                    "degraded": False,
+                }
+            else:
+                payload, fetch_diagnostics = fetch_scoreboard_payload_with_diagnostics(
+                    year=year,
+                    week=week,
+                    timeout_seconds=timeout_seconds,
+                    override_url=override_url,
+                    enable_failover=enable_failover,
+                )
 
-        inspection = inspect_scoreboard_contract(payload)
-        normalized = map_scoreboard_payload(payload, season_override=year, week_override=week)
-        scoreboard_fingerprint = _build_scoreboard_fingerprint(normalized)
-        game_states = _build_game_states(normalized.games)
+        with _timed_stage(stage_timings_ms, "normalize"):
+            inspection = inspect_scoreboard_contract(payload)
+            normalized = map_scoreboard_payload(payload, season_override=year, week_override=week)
+            scoreboard_fingerprint = _build_scoreboard_fingerprint(normalized)
+            game_states = _build_game_states(normalized.games)
         change_detected = (
             change_guard_fingerprint is None
             or scoreboard_fingerprint != change_guard_fingerprint
@@ -1077,26 +1333,34 @@ def run_live_scoreboard_ingest_with_controls(
 
         event_contracts: list[dict[str, Any]] = []
         if inspect_event_contracts_enabled:
-            candidate_event_ids: list[str] = []
-            for item in normalized.games:
-                if item.event_id and item.event_id not in candidate_event_ids:
+            with _timed_stage(stage_timings_ms, "event_contracts"):
+                candidate_event_ids: list[str] = []
+                for item in normalized.games:
+                    if not item.event_id or item.event_id in candidate_event_ids:
+                        continue
+                    if (
+                        event_contracts_phases is not None
+                        and game_states.get(item.event_id) not in event_contracts_phases
+                    ):
+                        continue
                     candidate_event_ids.append(item.event_id)
-            for event_id in candidate_event_ids[: max(0, event_contracts_limit)]:
-                event_contracts.append(
-                    inspect_event_contracts(event_id, timeout_seconds=timeout_seconds)
-                )
+                for event_id in candidate_event_ids[: max(0, event_contracts_limit)]:
+                    event_contracts.append(
+                        inspect_event_contracts(event_id, timeout_seconds=timeout_seconds)
+                    )
             if any(result.get("degraded") for result in event_contracts):
                 degraded = True
 
         duplicate_ingest_event = None
         if not dry_run and change_detected:
-            duplicate_ingest_event = _find_persisted_ingest_event(
-                db,
-                source=PRIMARY_SCOREBOARD_SOURCE,
-                season=year,
-                week=week,
-                scoreboard_fingerprint=scoreboard_fingerprint,
-            )
+            with _timed_stage(stage_timings_ms, "idempotency_check"):
+                duplicate_ingest_event = _find_persisted_ingest_event(
+                    db,
+                    source=PRIMARY_SCOREBOARD_SOURCE,
+                    season=year,
+                    week=week,
+                    scoreboard_fingerprint=scoreboard_fingerprint,
+                )
 
         if dry_run:
             result = {
@@ -1166,36 +1430,40 @@ def run_live_scoreboard_ingest_with_controls(
                 },
             }
         else:
-            game_result = upsert_nfl_games_from_payload(
-                db,
-                payload,
-                season_override=year,
-                week_override=week,
-            )
-            player_result = upsert_player_weekly_stats_from_payload(
-                db,
-                payload,
-                season_override=year,
-                week_override=week,
-            )
-            reconcile_result = reconcile_ingested_stats_and_matchups(
-                db,
-                affected_player_ids=set(player_result["affected_player_ids"]),
-                season=year,
-                week=week,
-                season_year=year,
-                affected_weeks=set(player_result["affected_weeks"]),
-            )
-            ingest_event = _persist_ingest_event(
-                db,
-                source=PRIMARY_SCOREBOARD_SOURCE,
-                season=year,
-                week=week,
-                scoreboard_fingerprint=scoreboard_fingerprint,
-                event_count=inspection.event_count,
-                game_states=game_states,
-                fetch_diagnostics=fetch_diagnostics,
-            )
+            with _timed_stage(stage_timings_ms, "upsert_games"):
+                game_result = upsert_nfl_games_from_payload(
+                    db,
+                    payload,
+                    season_override=year,
+                    week_override=week,
+                )
+            with _timed_stage(stage_timings_ms, "upsert_player_stats"):
+                player_result = upsert_player_weekly_stats_from_payload(
+                    db,
+                    payload,
+                    season_override=year,
+                    week_override=week,
+                )
+            with _timed_stage(stage_timings_ms, "reconcile"):
+                reconcile_result = reconcile_ingested_stats_and_matchups(
+                    db,
+                    affected_player_ids=set(player_result["affected_player_ids"]),
+                    season=year,
+                    week=week,
+                    season_year=year,
+                    affected_weeks=set(player_result["affected_weeks"]),
+                )
+            with _timed_stage(stage_timings_ms, "persist_event"):
+                ingest_event = _persist_ingest_event(
+                    db,
+                    source=PRIMARY_SCOREBOARD_SOURCE,
+                    season=year,
+                    week=week,
+                    scoreboard_fingerprint=scoreboard_fingerprint,
+                    event_count=inspection.event_count,
+                    game_states=game_states,
+                    fetch_diagnostics=fetch_diagnostics,
+                )
             result = {
                 "status": "success",
                 "mode": "apply",
@@ -1214,6 +1482,9 @@ def run_live_scoreboard_ingest_with_controls(
                 "downstream_updates_triggered": True,
                 "ingest_event": ingest_event,
             }
+        with _timed_stage(stage_timings_ms, "kickoffs"):
+            result["game_kickoffs"] = _load_game_kickoffs(db, normalized.games, game_states)
+        result["stage_timings_ms"] = stage_timings_ms
 
         _append_ingest_run_log(
             {
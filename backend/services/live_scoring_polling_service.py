@@ -15,38 +15,28 @@ except ImportError:  # pragma: no cover
     BackgroundScheduler = None  # type: ignore[assignment]
 
 from backend.services.live_scoring_ingest_service import run_live_scoreboard_ingest_with_controls
+from backend.services.live_scoring_schedule import ACTIVE_PHASES, plan_next_poll
+from backend.services.run_log_store import RunLogStore, get_run_log_store
 
 
 LOGGER = logging.getLogger(__name__)
 POLL_JOB_ID = "live_scoring_polling"
-ACTIVE_PHASES = {"live", "halftime"}
 CYCLE_LOG_PATH = Path(__file__).resolve().parent.parent / "data" / "ingest_health" / "live_scoring_poll_cycles.jsonl"
 _scheduler: BackgroundScheduler | None = None
 _runtime_lock = threading.Lock()
 _RUNTIME_STATE: dict[str, dict[str, Any]] = {}
 
 
+def _poll_cycle_log_store() -> RunLogStore:
+    return get_run_log_store(CYCLE_LOG_PATH)
+
+
 def _append_poll_cycle_log(entry: dict[str, Any]) -> None:
-    CYCLE_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with CYCLE_LOG_PATH.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry, sort_keys=True, default=str) + "\n")
+    _poll_cycle_log_store().append(entry)
 
 
 def load_recent_poll_cycles(limit: int = 100) -> list[dict[str, Any]]:
-    if limit <= 0 or not CYCLE_LOG_PATH.exists():
-        return []
-    with CYCLE_LOG_PATH.open("r", encoding="utf-8") as handle:
-        lines = handle.readlines()
-    rows: list[dict[str, Any]] = []
-    for raw in lines[-limit:]:
-        line = raw.strip()
-        if not line:
-            continue
-        try:
-            rows.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-    return rows
+    return _poll_cycle_log_store().tail(limit)
 
 
 def summarize_poll_cycles(limit: int = 100) -> dict[str, Any]:
@@ -91,6 +81,18 @@ def _idle_interval_seconds() -> int:
     return max(30, int(os.getenv("LIVE_SCORING_POLL_IDLE_INTERVAL_SECONDS", "90")))
 
 
+def _pregame_lead_seconds() -> int:
+    return max(0, int(os.getenv("LIVE_SCORING_POLL_PREGAME_LEAD_SECONDS", "600")))
+
+
+def _max_sleep_seconds() -> int:
+    return max(60, int(os.getenv("LIVE_SCORING_POLL_MAX_SLEEP_SECONDS", "21600")))
+
+
+def _final_interval_seconds() -> int:
+    return max(60, int(os.getenv("LIVE_SCORING_POLL_FINAL_INTERVAL_SECONDS", "3600")))
+
+
 def _poll_tick_seconds() -> int:
     return max(5, int(os.getenv("LIVE_SCORING_POLL_TICK_SECONDS", "15")))
 
@@ -147,8 +149,15 @@ def run_live_scoring_poll_cycle(
         previous_fingerprint = previous_state.get("fingerprint")
         last_polled_epoch = float(previous_state.get("last_polled_epoch") or 0.0)
         previous_active = _has_active_games(previous_game_states)
-
-    required_interval = active_interval if previous_active else idle_interval
+        next_poll_epoch = previous_state.get("next_poll_epoch")
+        next_poll_reason = previous_state.get("next_poll_reason")
+
+    # The previous successful cycle planned the next poll from per-game
+    # phases and kickoffs; without a plan fall back to active/idle.
+    if next_poll_epoch is None:
+        required_interval = active_interval if previous_active else idle_interval
+    else:
+        required_interval = float(next_poll_epoch) - last_polled_epoch
     elapsed = now_epoch - last_polled_epoch
     if last_polled_epoch > 0 and elapsed < required_interval:
         result = {
@@ -157,7 +166,8 @@ def run_live_scoring_poll_cycle(
             "year": target_year,
             "week": target_week,
             "cycle_started_at": cycle_started_at,
-            "required_interval_seconds": required_interval,
+            "required_interval_seconds": round(required_interval, 2),
+            "next_poll_reason": next_poll_reason,
             "elapsed_seconds": round(elapsed, 2),
             "active_games": sum(1 for value in previous_game_states.values() if value in ACTIVE_PHASES),
             "downstream_updates_triggered": False,
@@ -180,6 +190,7 @@ def run_live_scoring_poll_cycle(
             inspect_event_contracts_enabled=inspect_event_contracts_enabled,
             event_contracts_limit=event_contracts_limit,
             change_guard_fingerprint=previous_fingerprint,
+            event_contracts_phases=ACTIVE_PHASES,
         )
     except Exception as exc:  # noqa: BLE001
         failure = {
@@ -194,6 +205,8 @@ def run_live_scoring_poll_cycle(
         with _runtime_lock:
             record = _RUNTIME_STATE.setdefault(key, {})
             record["last_polled_epoch"] = now_epoch
+            record["next_poll_epoch"] = None
+            record["next_poll_reason"] = None
             record["last_error"] = failure
             record["last_result"] = failure
         _append_poll_cycle_log(failure)
@@ -209,13 +222,25 @@ def run_live_scoring_poll_cycle(
     transitions = _detect_state_transitions(previous_game_states, game_states)
     active_games = sum(1 for value in game_states.values() if value in ACTIVE_PHASES)
     is_active_window = active_games > 0
-    next_interval_seconds = active_interval if is_active_window else idle_interval
+    plan = plan_next_poll(
+        game_states,
+        dict(ingest_result.get("game_kickoffs") or {}),
+        now=datetime.fromtimestamp(now_epoch, tz=timezone.utc),
+        active_interval=active_interval,
+        idle_interval=idle_interval,
+        pregame_lead_seconds=_pregame_lead_seconds(),
+        max_sleep_seconds=_max_sleep_seconds(),
+        final_interval=_final_interval_seconds(),
+    )
+    next_interval_seconds = plan.interval_seconds
 
     with _runtime_lock:
         record = _RUNTIME_STATE.setdefault(key, {})
         record["fingerprint"] = ingest_result.get("scoreboard_fingerprint")
         record["game_states"] = game_states
         record["last_polled_epoch"] = now_epoch
+        record["next_poll_epoch"] = now_epoch + next_interval_seconds
+        record["next_poll_reason"] = plan.reason
         record["last_mode"] = ingest_result.get("mode")
         record["last_error"] = None
         if ingest_result.get("downstream_updates_triggered"):
@@ -234,6 +259,7 @@ def run_live_scoring_poll_cycle(
         "change_detected": bool(ingest_result.get("change_detected", True)),
         "downstream_updates_triggered": bool(ingest_result.get("downstream_updates_triggered", False)),
         "next_interval_seconds": next_interval_seconds,
+        "poll_plan": plan.to_dict(),
         "ingest": ingest_result,
     }
     with _runtime_lock:
@@ -263,11 +289,13 @@ def run_live_scoring_poll_cycle(
             LOGGER.debug("live_scoring.poll_cycle event_bus_publish_failed err=%s", _bus_exc)
 
     LOGGER.info(
-        "live_scoring.poll_cycle mode=%s active_games=%s transitions=%s downstream_updates=%s",
+        "live_scoring.poll_cycle mode=%s active_games=%s transitions=%s downstream_updates=%s next_poll=%ss reason=%s",
         result["mode"],
         active_games,
         len(transitions),
         result["downstream_updates_triggered"],
+        next_interval_seconds,
+        plan.reason,
     )
     return result
 
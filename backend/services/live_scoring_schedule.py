@@ -0,0 +1,103 @@
+"""Per-game poll planning for the live-scoring scheduler.
+
+The poll cycle used to choose between one active and one idle interval for
+the whole slate. `plan_next_poll` looks at every game's phase (from
+``_build_game_states``) and the kickoff times of games that have not started
+(``NFLGame.kickoff``) and decides when the scoreboard is next worth
+fetching:
+
+- any game live or at halftime: the fast active cadence;
+- a pre-game game inside its kickoff window (or past kickoff but not yet
+  flipped to live): the active cadence, so the first snap is not missed;
+- otherwise sleep until the next kickoff window, capped so late schedule
+  changes (flex games) are still picked up;
+- every game final: a slow re-check for stat corrections.
+
+Games whose kickoff is unknown keep the old idle interval.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+ACTIVE_PHASES = frozenset({"live", "halftime"})
+# A game still "pre" this long after its kickoff is treated as postponed.
+POSTPONED_AFTER_SECONDS = 6 * 60 * 60
+
+
+@dataclass(frozen=True)
+class PollPlan:
+    interval_seconds: int
+    reason: str
+    live_event_ids: list[str]
+    pending_event_ids: list[str]
+    next_kickoff: datetime | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "interval_seconds": self.interval_seconds,
+            "reason": self.reason,
+            "live_event_ids": self.live_event_ids,
+            "pending_event_ids": self.pending_event_ids,
+            "next_kickoff": self.next_kickoff.isoformat() if self.next_kickoff else None,
+        }
+
+
+def parse_kickoff(value: Any) -> datetime | None:
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        text = str(value or "").strip()
+        if not text:
+            return None
+        try:
+            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def plan_next_poll(
+    game_states: dict[str, str],
+    kickoffs: dict[str, Any],
+    *,
+    now: datetime,
+    active_interval: int,
+    idle_interval: int,
+    pregame_lead_seconds: int,
+    max_sleep_seconds: int,
+    final_interval: int,
+) -> PollPlan:
+    live = sorted(event_id for event_id, phase in game_states.items() if phase in ACTIVE_PHASES)
+    pending = sorted(
+        event_id
+        for event_id, phase in game_states.items()
+        if phase not in ACTIVE_PHASES and phase != "final"
+    )
+    if live:
+        return PollPlan(active_interval, "games_in_progress", live, pending)
+    if not game_states:
+        return PollPlan(idle_interval, "no_games", live, pending)
+    if not pending:
+        return PollPlan(final_interval, "slate_complete", live, pending)
+
+    upcoming: list[datetime] = []
+    for event_id in pending:
+        kickoff = parse_kickoff(kickoffs.get(event_id))
+        if kickoff is None:
+            return PollPlan(idle_interval, "kickoff_unknown", live, pending)
+        if (now - kickoff).total_seconds() < POSTPONED_AFTER_SECONDS:
+            upcoming.append(kickoff)
+    if not upcoming:
+        return PollPlan(idle_interval, "kickoff_unknown", live, pending)
+
+    next_kickoff = min(upcoming)
+    until_window = (next_kickoff - now).total_seconds() - pregame_lead_seconds
+    if until_window <= 0:
+        return PollPlan(active_interval, "kickoff_window", live, pending, next_kickoff)
+    interval = int(max(active_interval, min(until_window, max_sleep_seconds)))
+    return PollPlan(interval, "awaiting_kickoff", live, pending, next_kickoff)
@@ -0,0 +1,300 @@
+"""Versioned snapshots of the Monte Carlo simulation inputs.
+
+`build_monte_carlo_inputs_from_db` assembles the player pool, draft history,
+budgets and historical rankings from several queries plus pandas work on
+every simulation request, although those inputs only change when a draft
+pick, keeper, budget or the player/ranking tables change.
+
+Snapshots are keyed by (database, league, ranking season, data version). The
+data version is one aggregate query over the tables the inputs are built
+from (row counts, max ids, column sums and id-weighted column sums, so two
+rows swapping values still change it) plus a digest of the player columns
+the build reads, which have no update stamp. Any insert, delete or edit of
+a pick, keeper, budget or player produces a new version and the old snapshot
+is simply never hit again; older versions for the same league and season are
+dropped when a new one is stored. Write paths also call
+`invalidate_monte_carlo_inputs` so the superseded snapshot is freed at once.
+Snapshots live in a small in-memory LRU and as pickled frames on local disk,
+so a restarted worker skips the rebuild too.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from sqlalchemy import BigInteger, cast, func, select
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.models_draft_value import DraftValue
+from etl.transform.monte_carlo_simulation import MonteCarloDbInputs, build_monte_carlo_inputs_from_db
+
+LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_DIR_PATH = Path(__file__).resolve().parent.parent / "data" / "monte_carlo_snapshots"
+SNAPSHOT_SUFFIX = ".pkl"
+DEFAULT_MAX_MEMORY_ENTRIES = 16
+
+SnapshotKey = tuple[str, int, int, str]
+
+
+def monte_carlo_inputs_data_version(
+    db: Session,
+    *,
+    league_id: int | None,
+    ranking_season: int | None,
+) -> str:
+    """Stamp over every table and column `build_monte_carlo_inputs_from_db` reads."""
+
+    def _league_scope(model):
+        return [model.league_id == league_id] if league_id is not None else []
+
+    def _by_id(model, column):
+        # Weighting by id ties each value to its row, so swaps change the sum.
+        return func.sum(cast(model.id, BigInteger) * column)
+
+    draft_value_season = (
+        DraftValue.season == ranking_season
+        if ranking_season
+        else DraftValue.season == select(func.max(DraftValue.season)).scalar_subquery()
+    )
+    aggregates = [
+        (
+            models.PlayerSeason,
+            [models.PlayerSeason.is_active.is_(True)],
+            [
+                func.count(models.PlayerSeason.id),
+                func.max(models.PlayerSeason.id),
+                func.max(models.PlayerSeason.updated_at),
+            ],
+        ),
+        (
+            models.DraftPick,
+            _league_scope(models.DraftPick),
+            [
+                func.count(models.DraftPick.id),
+                func.max(models.DraftPick.id),
+                func.sum(models.DraftPick.amount),
+                func.sum(models.DraftPick.owner_id),
+                func.sum(models.DraftPick.player_id),
+                func.sum(models.DraftPick.year),
+                _by_id(models.DraftPick, models.DraftPick.amount),
+                _by_id(models.DraftPick, models.DraftPick.owner_id),
+                _by_id(models.DraftPick, models.DraftPick.player_id),
+                _by_id(models.DraftPick, models.DraftPick.year),
+            ],
+        ),
+        (
+            models.DraftBudget,
+            _league_scope(models.DraftBudget),
+            [
+                func.count(models.DraftBudget.id),
+                func.max(models.DraftBudget.id),
+                func.sum(models.DraftBudget.total_budget),
+                func.sum(models.DraftBudget.owner_id),
+                func.sum(models.DraftBudget.year),
+                _by_id(models.DraftBudget, models.DraftBudget.total_budget),
+                _by_id(models.DraftBudget, models.DraftBudget.owner_id),
+                _by_id(models.DraftBudget, models.DraftBudget.year),
+            ],
+        ),
+        (
+            models.Keeper,
+            _league_scope(models.Keeper),
+            [
+                func.count(models.Keeper.id),
+                func.max(models.Keeper.id),
+                func.sum(models.Keeper.keep_cost),
+                _by_id(models.Keeper, models.Keeper.keep_cost),
+                _by_id(models.Keeper, models.Keeper.player_id),
+            ],
+        ),
+        (
+            DraftValue,
+            [draft_value_season],
+            [
+                func.count(DraftValue.id),
+                func.max(DraftValue.id),
+                func.max(DraftValue.season),
+                func.sum(DraftValue.avg_auction_value),
+                func.sum(DraftValue.model_score),
+                _by_id(DraftValue, DraftValue.player_id),
+                _by_id(DraftValue, DraftValue.avg_auction_value),
+                _by_id(DraftValue, DraftValue.model_score),
+            ],
+        ),
+    ]
+    if league_id is not None:
+        aggregates.append((models.User, [models.User.league_id == league_id], [func.count(models.User.id)]))
+
+    columns = [
+        select(expression).select_from(model).where(*criteria).scalar_subquery()
+        for model, criteria, expressions in aggregates
+        for expression in expressions
+    ]
+    row = db.execute(select(*columns)).one()
+    digest = hashlib.sha256(repr(tuple(row)).encode("utf-8"))
+    players = db.execute(
+        select(models.Player.id, models.Player.name, models.Player.position).order_by(models.Player.id)
+    )
+    for player_row in players:
+        digest.update(repr(tuple(player_row)).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def _database_identity(db: Session) -> str | None:
+    """Stable id of the bound database; None when it has none (in-memory SQLite)."""
+    url = getattr(db.get_bind(), "url", None)
+    if url is None or (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")):
+        return None
+    rendered = url.render_as_string(hide_password=True)
+    return hashlib.sha256(rendered.encode("utf-8")).hexdigest()[:16]
+
+
+class MonteCarloInputSnapshots:
+    def __init__(self, root: Path | None, *, max_memory_entries: int = DEFAULT_MAX_MEMORY_ENTRIES):
+        self.root = Path(root) if root is not None else None
+        self.max_memory_entries = max_memory_entries
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[SnapshotKey, MonteCarloDbInputs] = OrderedDict()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "builds": 0}
+
+    def _snapshot_path(self, key: SnapshotKey) -> Path:
+        database, league_id, season, version = key
+        assert self.root is not None
+        return self.root / f"{database}_{league_id}_{season}_{version}{SNAPSHOT_SUFFIX}"
+
+    def _scope_prefix(self, database: str, league_id: int) -> str:
+        return f"{database}_{league_id}_"
+
+    def _read_disk(self, key: SnapshotKey) -> MonteCarloDbInputs | None:
+        if self.root is None:
+            return None
+        path = self._snapshot_path(key)
+        try:
+            with path.open("rb") as handle:
+                inputs = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001 - a corrupt snapshot is rebuilt
+            LOGGER.warning("monte_carlo_snapshot.unreadable path=%s", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            return None
+        return inputs if isinstance(inputs, MonteCarloDbInputs) else None
+
+    def _write_disk(self, key: SnapshotKey, inputs: MonteCarloDbInputs) -> None:
+        if self.root is None:
+            return
+        database, league_id, season, _version = key
+        target = self._snapshot_path(key)
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            for stale in self.root.glob(f"{self._scope_prefix(database, league_id)}{season}_*{SNAPSHOT_SUFFIX}"):
+                if stale != target:
+                    stale.unlink(missing_ok=True)
+            temp = target.with_name(target.name + ".tmp")
+            with temp.open("wb") as handle:
+                pickle.dump(inputs, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp, target)
+        except OSError:
+            LOGGER.warning("monte_carlo_snapshot.write_failed path=%s", target, exc_info=True)
+
+    def _remember(self, key: SnapshotKey, inputs: MonteCarloDbInputs) -> None:
+        database, league_id, season, _version = key
+        for existing in [k for k in self._memory if k[:3] == (database, league_id, season) and k != key]:
+            self._memory.pop(existing, None)
+        self._memory[key] = inputs
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def load(
+        self,
+        db: Session,
+        *,
+        league_id: int | None,
+        ranking_season: int | None,
+    ) -> MonteCarloDbInputs:
+        """Simulation inputs for the league, rebuilt only when its data changed."""
+        database = _database_identity(db)
+        if database is None:
+            return build_monte_carlo_inputs_from_db(db, league_id=league_id, ranking_season=ranking_season)
+        key: SnapshotKey = (
+            database,
+            int(league_id or 0),
+            int(ranking_season or 0),
+            monte_carlo_inputs_data_version(db, league_id=league_id, ranking_season=ranking_season),
+        )
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return cached
+
+        inputs = self._read_disk(key)
+        if inputs is not None:
+            with self._lock:
+                self.stats["disk_hits"] += 1
+                self._remember(key, inputs)
+            return inputs
+
+        # Raises ValueError for leagues without a player pool or draft history;
+        # those are not cached so the next request sees newly synced data.
+        inputs = build_monte_carlo_inputs_from_db(db, league_id=league_id, ranking_season=ranking_season)
+        self._write_disk(key, inputs)
+        with self._lock:
+            self.stats["builds"] += 1
+            self._remember(key, inputs)
+        return inputs
+
+    def invalidate(self, league_id: int | None = None) -> None:
+        """Drop snapshots for one league (all leagues when None)."""
+        with self._lock:
+            for key in [k for k in self._memory if league_id is None or k[1] == int(league_id)]:
+                self._memory.pop(key, None)
+        if self.root is None or not self.root.exists():
+            return
+        for path in self.root.glob(f"*{SNAPSHOT_SUFFIX}"):
+            parts = path.name.split("_")
+            if league_id is None or (len(parts) > 1 and parts[1] == str(int(league_id))):
+                path.unlink(missing_ok=True)
+
+
+_SNAPSHOTS: MonteCarloInputSnapshots | None = None
+_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def _snapshot_root() -> Path | None:
+    configured = os.getenv("MONTE_CARLO_SNAPSHOT_DIR")
+    if configured is None:
+        return SNAPSHOT_DIR_PATH
+    # An empty value keeps snapshots in memory only.
+    return Path(configured) if configured.strip() else None
+
+
+def get_monte_carlo_input_snapshots() -> MonteCarloInputSnapshots:
+    global _SNAPSHOTS
+    with _SNAPSHOTS_LOCK:
+        if _SNAPSHOTS is None:
+            _SNAPSHOTS = MonteCarloInputSnapshots(_snapshot_root())
+        return _SNAPSHOTS
+
+
+def load_monte_carlo_inputs(
+    db: Session,
+    *,
+    league_id: int | None,
+    ranking_season: int | None = None,
+) -> MonteCarloDbInputs:
+    return get_monte_carlo_input_snapshots().load(db, league_id=league_id, ranking_season=ranking_season)
+
+
+def invalidate_monte_carlo_inputs(league_id: int | None = None) -> None:
+    get_monte_carlo_input_snapshots().invalidate(league_id)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from .. import models
+from .player_service import PLACEHOLDER_TEAM_CODES
+
+
+# Teams that mark a player without any PlayerSeason row as not rosterable.
+INACTIVE_TEAM_CODES = PLACEHOLDER_TEAM_CODES | {"FA"}
+
+
+@dataclass(frozen=True)
+class PlayerEligibilitySnapshot:
+    anchor_season: int
+    min_recent_season: int
+
+
+def _anchor_season():
+    # Use data freshness from the table itself, not wall-clock year.
+    latest_synced_season = select(func.max(models.PlayerSeason.season)).scalar_subquery()
+    return func.coalesce(latest_synced_season, datetime.now().year)
+
+
+def get_player_eligibility(db: Session) -> PlayerEligibilitySnapshot:
+    """Return the eligibility season window: the latest synced season and the one before."""
+    anchor_season = int(db.query(_anchor_season()).scalar())
+    return PlayerEligibilitySnapshot(
+        anchor_season=anchor_season,
+        min_recent_season=anchor_season - 1,
+    )
+
+
+def eligible_player_filter(db: Session):
+    """SQL filter equivalent to the former correlated EXISTS eligibility check.
+
+    A player is eligible when they have an active PlayerSeason in the latest
+    synced season (or the one before), or when they have never been synced
+    but carry a plausible NFL team. The season window and both player sets
+    are uncorrelated subqueries, so building the filter runs no query and the
+    statement stays the same size however many players are eligible.
+    """
+    active_recent_ids = select(models.PlayerSeason.player_id).where(
+        models.PlayerSeason.is_active.is_(True),
+        models.PlayerSeason.season >= _anchor_season() - 1,
+    )
+    seasoned_ids = select(models.PlayerSeason.player_id)
+    has_unsynced_but_plausible_team = and_(
+        models.Player.id.not_in(seasoned_ids),
+        models.Player.nfl_team.isnot(None),
+        ~models.Player.nfl_team.in_(INACTIVE_TEAM_CODES),
+    )
+    return or_(
+        models.Player.id.in_(active_recent_ids),
+        has_unsynced_but_plausible_team,
+    )
@@ -1,9 +1,7 @@
 # backend/services/player_service.py
 import re
-from datetime import datetime
 from collections import defaultdict
 
-from sqlalchemy import and_, exists, func, or_
 from sqlalchemy.orm import Session
 from .. import models
 from .league_position_service import get_active_positions_for_league
@@ -115,6 +113,66 @@ def canonical_player_identity(name: str | None, position: str | None, nfl_team:
     )
 
 
+class PlayerIdentityIndex:
+    """In-memory equivalent of ``find_existing_player`` for bulk syncs.
+
+    Built once from the players table so feeds of several thousand rows
+    resolve with dict lookups instead of a position-wide scan per row.
+    Callers that create or re-team players must ``add`` them back.
+    """
+
+    def __init__(self, players: list[models.Player] | None = None):
+        self._by_gsis_id: dict[str, models.Player] = {}
+        self._by_espn_id: dict[str, models.Player] = {}
+        self._by_identity: dict[tuple[str, str, str], models.Player] = {}
+        for player in players or []:
+            self.add(player)
+
+    @classmethod
+    def from_db(cls, db: Session) -> "PlayerIdentityIndex":
+        return cls(db.query(models.Player).order_by(models.Player.id.asc()).all())
+
+    def add(self, player: models.Player) -> None:
+        gsis_id = (player.gsis_id or "").strip()
+        if gsis_id:
+            self._by_gsis_id.setdefault(gsis_id, player)
+        espn_id = (player.espn_id or "").strip()
+        if espn_id:
+            self._by_espn_id.setdefault(espn_id, player)
+
+        identity = canonical_player_identity(player.name, player.position, player.nfl_team)
+        if not all(identity):
+            return
+        current = self._by_identity.get(identity)
+        if current is None or _player_rank(player) > _player_rank(current):
+            self._by_identity[identity] = player
+
+    def find(
+        self,
+        *,
+        gsis_id: str | None = None,
+        espn_id: str | None = None,
+        name: str | None = None,
+        position: str | None = None,
+        nfl_team: str | None = None,
+    ) -> models.Player | None:
+        normalized_gsis_id = (gsis_id or "").strip()
+        if normalized_gsis_id and normalized_gsis_id in self._by_gsis_id:
+            return self._by_gsis_id[normalized_gsis_id]
+        normalized_espn_id = (espn_id or "").strip()
+        if normalized_espn_id and normalized_espn_id in self._by_espn_id:
+            return self._by_espn_id[normalized_espn_id]
+
+        identity = canonical_player_identity(name, position, nfl_team)
+        if not all(identity):
+            return None
+        match = self._by_identity.get(identity)
+        # Re-teamed players keep their old key; only trust current identities.
+        if match is not None and canonical_player_identity(match.name, match.position, match.nfl_team) != identity:
+            return None
+        return match
+
+
 def find_existing_player(
     db: Session,
     *,
@@ -123,7 +181,17 @@ def find_existing_player(
     name: str | None = None,
     position: str | None = None,
     nfl_team: str | None = None,
+    index: PlayerIdentityIndex | None = None,
 ) -> models.Player | None:
+    if index is not None:
+        return index.find(
+            gsis_id=gsis_id,
+            espn_id=espn_id,
+            name=name,
+            position=position,
+            nfl_team=nfl_team,
+        )
+
     normalized_gsis_id = (gsis_id or "").strip()
     normalized_espn_id = (espn_id or "").strip()
     if normalized_gsis_id:
@@ -237,32 +305,10 @@ def dedupe_players(players: list[models.Player]) -> list[models.Player]:
 
 
 def _active_player_or_unsynced_filter(db: Session):
-    # Use data freshness from the table itself, not wall-clock year.
-    current_year = datetime.now().year
-    latest_synced_season = db.query(func.max(models.PlayerSeason.season)).scalar()
-    anchor_season = int(latest_synced_season or current_year)
-    min_recent_season = anchor_season - 1
-
-    has_active_recent_season = exists().where(
-        and_(
-            models.PlayerSeason.player_id == models.Player.id,
-            models.PlayerSeason.is_active.is_(True),
-            models.PlayerSeason.season >= min_recent_season,
-        )
-    )
-
-    has_no_season = ~exists().where(
-        models.PlayerSeason.player_id == models.Player.id
-    )
+    # Uncorrelated PlayerSeason subqueries instead of correlated EXISTS filters.
+    from .player_eligibility_service import eligible_player_filter
 
-    inactive_teams = PLACEHOLDER_TEAM_CODES | {"FA"}
-    has_unsynced_but_plausible_team = and_(
-        has_no_season,
-        models.Player.nfl_team.isnot(None),
-        ~models.Player.nfl_team.in_(inactive_teams),
-    )
-
-    return or_(has_active_recent_season, has_unsynced_but_plausible_team)
+    return eligible_player_filter(db)
 
 
 def get_all_relevant_players(db: Session, league_id: int | None = None) -> list[models.Player]:
@@ -280,10 +326,11 @@ def get_all_relevant_players(db: Session, league_id: int | None = None) -> list[
 
 
 def get_player_quality_report(db: Session) -> dict[str, object]:
-    current_year = datetime.now().year
-    latest_synced_season = db.query(func.max(models.PlayerSeason.season)).scalar()
-    anchor_season = int(latest_synced_season or current_year)
-    min_recent_season = anchor_season - 1
+    from .player_eligibility_service import get_player_eligibility
+
+    eligibility = get_player_eligibility(db)
+    anchor_season = eligibility.anchor_season
+    min_recent_season = eligibility.min_recent_season
 
     allowed_rows = (
         db.query(models.Player)
@@ -385,42 +432,19 @@ def search_all_players(
 
 # 1.1.2 SERVICE: Find Available Free Agents in a specific league
 def get_league_free_agents(db: Session, league_id: int):
-    active_positions = get_active_positions_for_league(db, league_id)
-    # Subquery for IDs of all players owned in THIS league
-    owned_ids_query = db.query(models.DraftPick.player_id).filter(
-        models.DraftPick.league_id == league_id
-    )
-    
-    # Return only relevant position players NOT owned in this league
-    rows = db.query(models.Player).filter(
-        ~models.Player.id.in_(owned_ids_query),
-        models.Player.position.in_(active_positions)
-    ).limit(250).all()
+    from .free_agent_pool_service import get_available_players
+
+    # Relevant-position players NOT owned in this league, best projections first
+    rows = get_available_players(db, league_id, limit=250)
     return dedupe_players(rows)[:50]
 
 
 def get_top_free_agents(db: Session, league_id: int, limit: int = 10):
     """Return top available free agents ranked by projection, ADP, and waiver momentum."""
-    safe_limit = max(1, min(int(limit), 25))
-    active_positions = get_active_positions_for_league(db, league_id)
-    owned_ids_query = db.query(models.DraftPick.player_id).filter(
-        models.DraftPick.league_id == league_id
-    )
-    rows = (
-        db.query(models.Player)
-        .filter(
-            ~models.Player.id.in_(owned_ids_query),
-            models.Player.position.in_(active_positions),
-        )
-        .order_by(
-            models.Player.projected_points.desc(),
-            models.Player.adp.asc(),
-            models.Player.name.asc(),
-        )
-        .limit(400)
-        .all()
-    )
+    from .free_agent_pool_service import get_available_players
 
+    safe_limit = max(1, min(int(limit), 25))
+    rows = get_available_players(db, league_id, limit=400)
     deduped = dedupe_players(rows)
 
     momentum_by_player: dict[int, float] = {}
@@ -1,3 +1,4 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from .. import models_draft_value as dv_models
 
@@ -35,3 +36,67 @@ def get_projected_auction_value(db: Session, player_id: int, season: int) -> flo
     if proj and proj.auction_value is not None:
         return proj.auction_value
     return None
+
+
+def get_projected_auction_values(db: Session, player_ids, season: int) -> dict[int, float]:
+    """Bulk `get_projected_auction_value`: two queries for any number of players.
+
+    Players without a DraftValue or platform projection are absent.
+    """
+    player_set = {int(player_id) for player_id in player_ids if player_id}
+    if not player_set or not season:
+        return {}
+
+    values: dict[int, float] = {
+        int(player_id): avg_value
+        for player_id, avg_value in db.query(dv_models.DraftValue.player_id, dv_models.DraftValue.avg_auction_value)
+        .filter(
+            dv_models.DraftValue.player_id.in_(player_set),
+            dv_models.DraftValue.season == season,
+            dv_models.DraftValue.avg_auction_value.isnot(None),
+        )
+    }
+
+    missing = player_set - set(values)
+    if missing:
+        # only the latest projection per player counts, as in the single-player lookup
+        seen: set[int] = set()
+        for player_id, auction_value in (
+            db.query(dv_models.PlatformProjection.player_id, dv_models.PlatformProjection.auction_value)
+            .filter(
+                dv_models.PlatformProjection.player_id.in_(missing),
+                dv_models.PlatformProjection.season == season,
+            )
+            .order_by(dv_models.PlatformProjection.id.desc())
+        ):
+            if int(player_id) in seen:
+                continue
+            seen.add(int(player_id))
+            if auction_value is not None:
+                values[int(player_id)] = auction_value
+    return values
+
+
+def get_projected_points(db: Session, player_ids, season: int) -> dict[int, float]:
+    """Season projected points per player, averaged across platform sources.
+
+    One query for any number of players; players without a platform
+    projection for ``season`` are absent.
+    """
+    player_set = {int(player_id) for player_id in player_ids if player_id}
+    if not player_set or not season:
+        return {}
+    return {
+        int(player_id): float(points)
+        for player_id, points in db.query(
+            dv_models.PlatformProjection.player_id,
+            func.avg(dv_models.PlatformProjection.projected_points),
+        )
+        .filter(
+            dv_models.PlatformProjection.player_id.in_(player_set),
+            dv_models.PlatformProjection.season == season,
+            dv_models.PlatformProjection.projected_points.isnot(None),
+        )
+        .group_by(dv_models.PlatformProjection.player_id)
+        if points is not None
+    }
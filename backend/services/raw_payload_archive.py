@@ -0,0 +1,270 @@
+"""Append-only, compressed archive for raw live-scoring payloads.
+
+Payloads are appended to weekly segments (``2026W41.jsonl.gz``, rolling to
+``2026W41-001.jsonl.gz`` past the size cap). Each payload is written as its
+own gzip member, so a segment is still a valid gzip/JSONL file and any one
+payload can be read back by seeking to its offset. Every capture appends a
+line to the segment's index (``2026W41.idx.jsonl``) with the offset, source,
+key and content fingerprint; a payload already stored in the segment is not
+written again, only indexed.
+
+Compared to one pretty JSON file per response this turns thousands of small
+file creations and directory scans into appends to two open-ended files,
+which matters on SD-card storage. Retention drops whole segments.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+SEGMENT_SUFFIX = ".jsonl.gz"
+INDEX_SUFFIX = ".idx.jsonl"
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+def payload_fingerprint(payload: dict[str, Any]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _week_bucket(moment: datetime) -> str:
+    iso_year, iso_week, _ = moment.isocalendar()
+    return f"{iso_year}W{iso_week:02d}"
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    captured_at: str
+    source: str
+    key: str
+    fingerprint: str
+    segment: str
+    offset: int
+    length: int
+    deduplicated: bool
+
+    @property
+    def ref(self) -> str:
+        return f"{self.segment}#{self.offset}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "captured_at": self.captured_at,
+            "source": self.source,
+            "key": self.key,
+            "fingerprint": self.fingerprint,
+            "segment": self.segment,
+            "offset": self.offset,
+            "length": self.length,
+            "deduplicated": self.deduplicated,
+        }
+
+
+class RawPayloadArchive:
+    def __init__(self, root: Path, *, segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES):
+        self.root = Path(root)
+        self.segment_max_bytes = segment_max_bytes
+        self._lock = threading.Lock()
+        self._segment: str | None = None
+        # fingerprint -> (offset, length) for payloads in the open segment.
+        self._stored: dict[str, tuple[int, int]] = {}
+
+    def _segment_path(self, segment: str) -> Path:
+        return self.root / f"{segment}{SEGMENT_SUFFIX}"
+
+    def _index_path(self, segment: str) -> Path:
+        return self.root / f"{segment}{INDEX_SUFFIX}"
+
+    def _load_segment_index(self, segment: str) -> dict[str, tuple[int, int]]:
+        stored: dict[str, tuple[int, int]] = {}
+        for entry in self._iter_index(segment):
+            stored.setdefault(entry.fingerprint, (entry.offset, entry.length))
+        return stored
+
+    def _open_segment(self, bucket: str) -> str:
+        current = self._segment
+        if current is not None and current.split("-", 1)[0] == bucket:
+            if not self._segment_path(current).exists():
+                self._stored = {}
+            if self._segment_size(current) < self.segment_max_bytes:
+                return current
+
+        part = 0
+        segment = bucket
+        while self._segment_size(segment) >= self.segment_max_bytes:
+            part += 1
+            segment = f"{bucket}-{part:03d}"
+        if segment != current:
+            self._segment = segment
+            self._stored = self._load_segment_index(segment)
+        return segment
+
+    def _segment_size(self, segment: str) -> int:
+        try:
+            return self._segment_path(segment).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def append(
+        self,
+        payload: dict[str, Any],
+        *,
+        source: str,
+        key: str,
+        captured_at: datetime | None = None,
+    ) -> ArchiveEntry:
+        moment = captured_at or datetime.now(timezone.utc)
+        fingerprint = payload_fingerprint(payload)
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            segment = self._open_segment(_week_bucket(moment))
+            existing = self._stored.get(fingerprint)
+            if existing is not None:
+                offset, length = existing
+                deduplicated = True
+            else:
+                member = gzip.compress(json.dumps(payload, sort_keys=True).encode("utf-8") + b"\n")
+                with self._segment_path(segment).open("ab") as handle:
+                    offset = handle.tell()
+                    handle.write(member)
+                length = len(member)
+                self._stored[fingerprint] = (offset, length)
+                deduplicated = False
+
+            entry = ArchiveEntry(
+                captured_at=moment.isoformat(),
+                source=source,
+                key=key,
+                fingerprint=fingerprint,
+                segment=segment,
+                offset=offset,
+                length=length,
+                deduplicated=deduplicated,
+            )
+            with self._index_path(segment).open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(entry.to_dict(), separators=(",", ":")) + "\n")
+        return entry
+
+    def segments(self) -> list[str]:
+        if not self.root.exists():
+            return []
+        return sorted(path.name[: -len(SEGMENT_SUFFIX)] for path in self.root.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def _iter_index(self, segment: str) -> Iterator[ArchiveEntry]:
+        path = self._index_path(segment)
+        if not path.exists():
+            return
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield ArchiveEntry(**json.loads(line))
+                except (TypeError, ValueError):
+                    continue
+
+    def iter_entries(
+        self,
+        *,
+        source: str | None = None,
+        key: str | None = None,
+        include_duplicates: bool = True,
+    ) -> Iterator[ArchiveEntry]:
+        """Index entries in capture order (segments are named chronologically)."""
+        for segment in self.segments():
+            for entry in self._iter_index(segment):
+                if source is not None and entry.source != source:
+                    continue
+                if key is not None and entry.key != key:
+                    continue
+                if not include_duplicates and entry.deduplicated:
+                    continue
+                yield entry
+
+    def read(self, segment: str, offset: int) -> dict[str, Any]:
+        decompressor = zlib.decompressobj(wbits=31)
+        chunks: list[bytes] = []
+        with self._segment_path(segment).open("rb") as handle:
+            handle.seek(offset)
+            while not decompressor.eof:
+                block = handle.read(_READ_CHUNK_BYTES)
+                if not block:
+                    break
+                chunks.append(decompressor.decompress(block))
+        return json.loads(b"".join(chunks))
+
+    def read_ref(self, ref: str) -> dict[str, Any]:
+        """Read a payload from an ``<segment path or name>#<offset>`` reference."""
+        location, _, offset = ref.rpartition("#")
+        segment = Path(location).name
+        if segment.endswith(SEGMENT_SUFFIX):
+            segment = segment[: -len(SEGMENT_SUFFIX)]
+        return self.read(segment, int(offset))
+
+    def replay(
+        self,
+        *,
+        source: str | None = None,
+        key: str | None = None,
+        include_duplicates: bool = True,
+    ) -> Iterator[tuple[ArchiveEntry, dict[str, Any]]]:
+        for entry in self.iter_entries(source=source, key=key, include_duplicates=include_duplicates):
+            yield entry, self.read(entry.segment, entry.offset)
+
+    def prune(self, *, max_age_seconds: float = 0.0, max_segments: int = 0) -> dict[str, int]:
+        """Drop whole segments (and their index) by last-write age and count."""
+        deleted_for_age = 0
+        deleted_for_count = 0
+        with self._lock:
+            segments = self.segments()
+            if max_age_seconds > 0:
+                cutoff = time.time() - max_age_seconds
+                for segment in list(segments):
+                    if segment == self._segment:
+                        continue
+                    if self._segment_path(segment).stat().st_mtime < cutoff:
+                        self._delete_segment(segment)
+                        segments.remove(segment)
+                        deleted_for_age += 1
+
+            if max_segments > 0 and len(segments) > max_segments:
+                for segment in segments[: len(segments) - max_segments]:
+                    if segment == self._segment:
+                        continue
+                    self._delete_segment(segment)
+                    deleted_for_count += 1
+
+        return {
+            "deleted_for_age": deleted_for_age,
+            "deleted_for_count": deleted_for_count,
+        }
+
+    def _delete_segment(self, segment: str) -> None:
+        self._segment_path(segment).unlink(missing_ok=True)
+        self._index_path(segment).unlink(missing_ok=True)
+
+
+_ARCHIVES: dict[str, RawPayloadArchive] = {}
+_ARCHIVES_LOCK = threading.Lock()
+
+
+def get_raw_payload_archive(root: Path, *, segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES) -> RawPayloadArchive:
+    """Process-wide archive per root, so the open segment's index loads once."""
+    resolved = str(Path(root).resolve())
+    with _ARCHIVES_LOCK:
+        archive = _ARCHIVES.get(resolved)
+        if archive is None or archive.segment_max_bytes != segment_max_bytes:
+            archive = RawPayloadArchive(Path(root), segment_max_bytes=segment_max_bytes)
+            _ARCHIVES[resolved] = archive
+        return archive
@@ -0,0 +1,239 @@
+"""Append-only JSONL run logs with a tail index.
+
+The live-scoring ingest and poll-cycle logs are read as "the last N entries"
+by admin dashboards that refresh constantly on game days. Next to each log
+(``runs.jsonl``) the store keeps a binary index (``runs.jsonl.idx``) of
+little-endian uint64 line offsets, so a recent-N read seeks straight to the
+N-th last line instead of reading the whole file. The newest entries are
+also kept in memory, updated on append and validated against the log's
+inode and size, so repeated dashboard reads do not touch the file at all.
+
+Logs rotate past ``max_bytes`` (``runs.jsonl`` -> ``runs.jsonl.1`` ...),
+keeping ``backups`` older files; tail reads continue into the backups.
+
+The log stays plain JSONL. An index that is missing or does not end at the
+log's last line (e.g. lines written by an older version, or a log that was
+truncated or replaced and is now shorter than the last indexed offset) is
+rebuilt with a single scan; the index of a deleted log is discarded.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+DEFAULT_CACHE_SIZE = 1000
+INDEX_SUFFIX = ".idx"
+
+_OFFSET = struct.Struct("<Q")
+
+
+def _stat_stamp(path: Path) -> tuple[int, int]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat.st_ino, stat.st_size)
+
+
+def _index_path(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name + INDEX_SUFFIX)
+
+
+def _rebuild_index(log_path: Path, index_path: Path) -> None:
+    offsets = bytearray()
+    position = 0
+    with log_path.open("rb") as handle:
+        for line in handle:
+            if line.strip():
+                offsets += _OFFSET.pack(position)
+            position += len(line)
+    index_path.write_bytes(bytes(offsets))
+
+
+def _ensure_index(log_path: Path) -> Path:
+    """Return the log's index path, rebuilding it if it does not match the log."""
+    index_path = _index_path(log_path)
+    log_size = log_path.stat().st_size
+    try:
+        index_size = index_path.stat().st_size
+    except FileNotFoundError:
+        index_size = -1
+
+    consistent = False
+    if index_size == 0:
+        consistent = log_size == 0
+    elif index_size > 0 and index_size % _OFFSET.size == 0:
+        with index_path.open("rb") as handle:
+            handle.seek(index_size - _OFFSET.size)
+            (last_offset,) = _OFFSET.unpack(handle.read(_OFFSET.size))
+        # A log shorter than the last indexed offset was truncated or replaced.
+        if last_offset < log_size:
+            with log_path.open("rb") as handle:
+                handle.seek(last_offset)
+                tail = handle.read().strip()
+            consistent = bool(tail) and b"\n" not in tail
+
+    if not consistent:
+        _rebuild_index(log_path, index_path)
+    return index_path
+
+
+def _parse_lines(raw: bytes) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for line in raw.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            rows.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return rows
+
+
+def _read_last_entries(log_path: Path, count: int) -> list[dict[str, Any]]:
+    """The last ``count`` entries of one log file, via its index."""
+    if count <= 0 or not log_path.exists():
+        return []
+    index_path = _ensure_index(log_path)
+    entries = index_path.stat().st_size // _OFFSET.size
+    if entries == 0:
+        return []
+    take = min(count, entries)
+    with index_path.open("rb") as handle:
+        handle.seek((entries - take) * _OFFSET.size)
+        (start,) = _OFFSET.unpack(handle.read(_OFFSET.size))
+    with log_path.open("rb") as handle:
+        handle.seek(start)
+        return _parse_lines(handle.read())
+
+
+class RunLogStore:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self._recent: deque[dict[str, Any]] = deque(maxlen=cache_size)
+        # True when ``_recent`` holds every entry on disk, so any limit is servable.
+        self._exhaustive = False
+        # (inode, size) of the live log that ``_recent`` reflects; None = stale.
+        self._stamp: tuple[int, int] | None = None
+
+    def _backup_path(self, number: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{number}")
+
+    def _log_paths(self) -> list[Path]:
+        return [self.path, *(self._backup_path(number) for number in range(1, self.backups + 1))]
+
+    def append(self, entry: dict[str, Any]) -> None:
+        encoded = json.dumps(entry, sort_keys=True, default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            cache_valid = self._stamp is not None and self._stamp == _stat_stamp(self.path)
+            if self.path.exists():
+                _ensure_index(self.path)
+            else:
+                # The log was deleted or moved away; its leftover index is stale.
+                _index_path(self.path).unlink(missing_ok=True)
+            with self.path.open("ab") as handle:
+                offset = handle.tell()
+                if offset > 0:
+                    with self.path.open("rb") as reader:
+                        reader.seek(offset - 1)
+                        if reader.read(1) != b"\n":
+                            handle.write(b"\n")
+                            offset += 1
+                handle.write(encoded.encode("utf-8") + b"\n")
+            with _index_path(self.path).open("ab") as index:
+                index.write(_OFFSET.pack(offset))
+
+            if cache_valid:
+                if len(self._recent) == self._recent.maxlen:
+                    self._exhaustive = False
+                self._recent.append(json.loads(encoded))
+                self._stamp = _stat_stamp(self.path)
+            else:
+                self._stamp = None
+
+            if self.path.stat().st_size >= self.max_bytes:
+                self._rotate()
+
+    def _rotate(self) -> None:
+        oldest = self._backup_path(self.backups)
+        oldest.unlink(missing_ok=True)
+        _index_path(oldest).unlink(missing_ok=True)
+        for number in range(self.backups - 1, 0, -1):
+            source = self._backup_path(number)
+            if source.exists():
+                target = self._backup_path(number + 1)
+                os.replace(source, target)
+                if _index_path(source).exists():
+                    os.replace(_index_path(source), _index_path(target))
+        if self.backups > 0:
+            os.replace(self.path, self._backup_path(1))
+            os.replace(_index_path(self.path), _index_path(self._backup_path(1)))
+        else:
+            self.path.unlink(missing_ok=True)
+            _index_path(self.path).unlink(missing_ok=True)
+        if self._stamp is not None:
+            self._stamp = _stat_stamp(self.path)
+            self._exhaustive = False
+
+    def _read_tail(self, limit: int) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        for log_path in self._log_paths():
+            needed = limit - len(rows)
+            if needed <= 0:
+                break
+            rows = _read_last_entries(log_path, needed) + rows
+        return rows
+
+    def tail(self, limit: int) -> list[dict[str, Any]]:
+        """The newest ``limit`` entries, oldest first."""
+        if limit <= 0:
+            return []
+        with self._lock:
+            stamp = _stat_stamp(self.path)
+            if self._stamp != stamp or (limit > len(self._recent) and not self._exhaustive):
+                wanted = max(limit, self._recent.maxlen or 0)
+                rows = self._read_tail(wanted)
+                self._recent.clear()
+                self._recent.extend(rows)
+                self._exhaustive = len(rows) < wanted and len(rows) <= len(self._recent)
+                self._stamp = stamp
+                if limit > len(self._recent):
+                    # Requested more than the cache holds: serve the disk read directly.
+                    return [dict(row) for row in rows[-limit:]]
+            recent = list(self._recent)
+        return [dict(row) for row in recent[-limit:]]
+
+
+_STORES: dict[str, RunLogStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_run_log_store(path: Path) -> RunLogStore:
+    """Process-wide store per log path, so the recent-entry cache is shared."""
+    resolved = str(Path(path).resolve())
+    with _STORES_LOCK:
+        store = _STORES.get(resolved)
+        if store is None:
+            store = RunLogStore(Path(path))
+            _STORES[resolved] = store
+        return store
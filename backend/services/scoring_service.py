@@ -8,6 +8,8 @@ from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from .. import models
+from ..core.metrics import observe_stage
+from .head_to_head_service import refresh_head_to_head_aggregates
 
 
 STAT_KEY_ALIASES: dict[str, list[str]] = {
@@ -280,6 +282,7 @@ def recalculate_matchup_scores(
     }
 
 
+@observe_stage("scoring.recalculate_league_week")
 def recalculate_league_week_scores(
     db: Session,
     *,
@@ -287,17 +290,21 @@ def recalculate_league_week_scores(
     week: int,
     season: int,
     season_year: int | None = None,
+    refresh_head_to_head: bool = False,
 ) -> list[dict[str, Any]]:
     matchups = (
         db.query(models.Matchup)
         .filter(
             models.Matchup.league_id == league_id,
             models.Matchup.week == week,
+            # matchups stored without a season are scored as the requested one
+            or_(models.Matchup.season == season, models.Matchup.season.is_(None)),
         )
         .order_by(models.Matchup.id.asc())
         .all()
     )
 
+    newly_completed = [matchup for matchup in matchups if not matchup.is_completed]
     results: list[dict[str, Any]] = []
     for matchup in matchups:
         results.append(
@@ -309,4 +316,12 @@ def recalculate_league_week_scores(
             )
         )
 
+    # live rescores of completed matchups leave head-to-head alone; week
+    # finalization passes refresh_head_to_head for the final scores
+    refreshed = matchups if refresh_head_to_head else newly_completed
+    if refreshed:
+        db.flush()
+        refreshed_seasons = {season if matchup.season is not None else None for matchup in refreshed}
+        refresh_head_to_head_aggregates(db, league_id=league_id, seasons=refreshed_seasons)
+
     return results
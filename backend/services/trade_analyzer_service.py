@@ -0,0 +1,361 @@
+"""Projection-based trade finder.
+
+`analyze_trades` scores 1-for-1, 2-for-1 and 1-for-2 player swaps between one
+owner and the rest of the league by how much each side's optimal projected
+starting lineup changes. Rosters, projections, rankings and trade rules are
+loaded once per request. Every candidate swap with one partner becomes a row
+of a points matrix, and `optimal_lineup_points_batch` solves all the rows
+together, so a request scores thousands of swaps with a few array sorts
+instead of one lineup solve each. Only the best-scoring swaps go through
+trade validation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Iterable
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..utils.efficiency import FLEX_ELIGIBLE_POSITIONS, optimal_lineup_points_batch
+from .draft_rankings_service import get_historical_rankings
+from .league_position_service import normalize_player_position
+from .projection_service import get_projected_points
+from .trade_context_service import (
+    load_league_trade_rules,
+    load_trade_snapshot,
+    validate_trade_against_snapshot,
+)
+from .trade_validation_service import TradeAssetInput
+
+
+DEFAULT_STARTING_SLOTS = {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "K": 1, "DEF": 1, "FLEX": 1}
+
+# shape -> (players the owner gives, players the owner receives)
+TRADE_SHAPES = {"1-for-1": (1, 1), "2-for-1": (2, 1), "1-for-2": (1, 2)}
+DEFAULT_TRADE_SHAPES = ("1-for-1", "2-for-1")
+
+INELIGIBLE_ROSTER_STATUSES = frozenset({"IR"})
+
+# Validation is per candidate; stop looking once this many top-scored swaps
+# per requested result have been rejected (e.g. the trade window is closed).
+VALIDATION_ATTEMPTS_PER_RESULT = 10
+
+
+@dataclass
+class TeamBoard:
+    """One team's roster as parallel arrays; ``points`` is -inf for non-starters."""
+
+    owner_id: int
+    owner_name: str
+    player_ids: np.ndarray
+    positions: list[str]
+    points: np.ndarray
+    position_codes: np.ndarray
+    trade_values: np.ndarray
+
+
+def _lineup_positions(slots: dict[str, int]) -> list[str]:
+    positions = [pos for pos, count in slots.items() if pos != "FLEX" and count]
+    if slots.get("FLEX"):
+        positions += [pos for pos in FLEX_ELIGIBLE_POSITIONS if pos not in positions]
+    return positions
+
+
+def _load_starting_slots(db: Session, league_id: int) -> dict[str, int]:
+    slots = (
+        db.query(models.LeagueSettings.starting_slots)
+        .filter(models.LeagueSettings.league_id == league_id)
+        .scalar()
+    )
+    if not isinstance(slots, dict) or not slots:
+        slots = DEFAULT_STARTING_SLOTS
+    return {
+        normalize_player_position(pos): int(count or 0)
+        for pos, count in slots.items()
+        if normalize_player_position(pos) in DEFAULT_STARTING_SLOTS
+    }
+
+
+def _load_boards(
+    db: Session,
+    *,
+    league_id: int,
+    team_ids: set[int],
+    season: int,
+    lineup_positions: list[str],
+) -> dict[int, TeamBoard]:
+    owner_names = {
+        int(user_id): team_name or username or f"Team {user_id}"
+        for user_id, username, team_name in db.query(
+            models.User.id, models.User.username, models.User.team_name
+        )
+        .filter(models.User.id.in_(team_ids), models.User.league_id == league_id)
+        .all()
+    }
+    roster_rows = (
+        db.query(
+            models.DraftPick.owner_id,
+            models.DraftPick.current_status,
+            models.DraftPick.is_taxi,
+            models.Player.id,
+            models.Player.position,
+            models.Player.projected_points,
+            models.Player.injury_status,
+        )
+        .join(models.Player, models.Player.id == models.DraftPick.player_id)
+        .filter(
+            models.DraftPick.league_id == league_id,
+            models.DraftPick.owner_id.in_(list(owner_names)),
+        )
+        .order_by(models.DraftPick.owner_id, models.Player.id)
+        .all()
+    )
+    player_ids = [int(row.id) for row in roster_rows]
+    projected = get_projected_points(db, player_ids, season)
+    trade_values = {
+        int(row["player_id"]): float(row.get("final_score") or 0.0)
+        for row in get_historical_rankings(db, season=season, limit=1, league_id=league_id, player_ids=player_ids)
+    }
+
+    code_by_position = {pos: code for code, pos in enumerate(lineup_positions)}
+    columns: dict[int, list[tuple]] = {owner_id: [] for owner_id in owner_names}
+    for row in roster_rows:
+        player_id = int(row.id)
+        position = normalize_player_position(row.position)
+        points = projected.get(player_id, float(row.projected_points or 0.0))
+        can_start = (
+            position in code_by_position
+            and not row.is_taxi
+            and (row.current_status or "").upper() not in INELIGIBLE_ROSTER_STATUSES
+            and (row.injury_status or "").upper() not in INELIGIBLE_ROSTER_STATUSES
+        )
+        columns[int(row.owner_id)].append(
+            (
+                player_id,
+                position,
+                points if can_start else -np.inf,
+                code_by_position.get(position, 0),
+                trade_values.get(player_id, 0.0),
+            )
+        )
+
+    boards: dict[int, TeamBoard] = {}
+    for owner_id, players in columns.items():
+        boards[owner_id] = TeamBoard(
+            owner_id=owner_id,
+            owner_name=owner_names[owner_id],
+            player_ids=np.array([p[0] for p in players], dtype=np.int64),
+            positions=[p[1] for p in players],
+            points=np.array([p[2] for p in players], dtype=float),
+            position_codes=np.array([p[3] for p in players], dtype=np.int64),
+            trade_values=np.array([p[4] for p in players], dtype=float),
+        )
+    return boards
+
+
+def _index_sets(size: int, count: int) -> np.ndarray:
+    """Every choice of ``count`` (1 or 2) distinct roster columns, one per row."""
+    if count == 1:
+        return np.arange(size)[:, np.newaxis]
+    first, second = np.triu_indices(size, k=1)
+    return np.column_stack([first, second])
+
+
+def _lineups_after(
+    board: TeamBoard,
+    outgoing: np.ndarray,
+    incoming_points: np.ndarray,
+    incoming_codes: np.ndarray,
+    lineup_positions: list[str],
+    slots: dict[str, int],
+) -> np.ndarray:
+    """Optimal lineup totals for ``board`` after each row's swap.
+
+    Outgoing columns are blanked out; incoming players go into extra columns,
+    ``incoming_points.shape[1]`` per lineup position, so every row shares one
+    column layout whatever positions it receives.
+    """
+    rows, received = incoming_points.shape
+    row_index = np.arange(rows)[:, np.newaxis]
+    kept = np.broadcast_to(board.points, (rows, board.points.size)).copy()
+    kept[row_index, outgoing] = -np.inf
+    added = np.full((rows, len(lineup_positions) * received), -np.inf)
+    added[row_index, incoming_codes * received + np.arange(received)] = incoming_points
+    return optimal_lineup_points_batch(
+        np.hstack([kept, added]),
+        board.positions + [pos for pos in lineup_positions for _ in range(received)],
+        slots,
+    )
+
+
+def _player_payload(board: TeamBoard, columns: Iterable[int]) -> list[dict]:
+    return [
+        {
+            "player_id": int(board.player_ids[column]),
+            "position": board.positions[column],
+            "projected_points": (
+                round(float(board.points[column]), 2) if np.isfinite(board.points[column]) else 0.0
+            ),
+            "trade_value": round(float(board.trade_values[column]), 2),
+        }
+        for column in columns
+        if column >= 0
+    ]
+
+
+def analyze_trades(
+    db: Session,
+    *,
+    league_id: int,
+    owner_id: int,
+    partner_ids: Iterable[int] | None = None,
+    shapes: Iterable[str] = DEFAULT_TRADE_SHAPES,
+    season: int | None = None,
+    limit: int = 25,
+    min_partner_delta: float = 0.0,
+    now: datetime | None = None,
+) -> dict:
+    """Best player swaps for ``owner_id`` by projected starting-lineup gain.
+
+    A swap qualifies when it raises the owner's optimal projected lineup and
+    changes the partner's by at least ``min_partner_delta``. Qualifying swaps
+    are ordered by owner gain, then partner gain, then how close the ranking
+    values on each side are, and the first ``limit`` that pass trade
+    validation are returned. Raises ValueError for an unknown shape.
+    """
+    shape_names = list(dict.fromkeys(shapes))
+    unknown = [shape for shape in shape_names if shape not in TRADE_SHAPES]
+    if unknown:
+        raise ValueError(f"Unknown trade shape(s): {', '.join(unknown)}")
+
+    rules = load_league_trade_rules(db, league_id)
+    season = int(season or rules.current_season or datetime.now(UTC).year)
+    slots = _load_starting_slots(db, league_id)
+    lineup_positions = _lineup_positions(slots)
+
+    if partner_ids is None:
+        partner_set = {
+            int(user_id)
+            for (user_id,) in db.query(models.User.id).filter(models.User.league_id == league_id).all()
+        }
+    else:
+        partner_set = {int(partner_id) for partner_id in partner_ids}
+    partner_set.discard(int(owner_id))
+
+    boards = _load_boards(
+        db,
+        league_id=league_id,
+        team_ids=partner_set | {int(owner_id)},
+        season=season,
+        lineup_positions=lineup_positions,
+    )
+    result = {
+        "league_id": league_id,
+        "owner_id": owner_id,
+        "season": season,
+        "shapes": shape_names,
+        "candidates_scored": 0,
+        "candidates_rejected": 0,
+        "trades": [],
+    }
+    owner = boards.get(int(owner_id))
+    if owner is None:
+        return result
+    owner_before = float(optimal_lineup_points_batch(owner.points, owner.positions, slots)[0])
+
+    # Qualifying swaps from every partner and shape, as parallel arrays.
+    found: dict[str, list[np.ndarray]] = {
+        key: [] for key in ("partner", "give", "get", "owner_delta", "partner_delta", "value_gap")
+    }
+    partner_before: dict[int, float] = {}
+    for partner_id in sorted(partner_set & set(boards)):
+        partner = boards[partner_id]
+        partner_before[partner_id] = float(
+            optimal_lineup_points_batch(partner.points, partner.positions, slots)[0]
+        )
+        for shape in shape_names:
+            give_count, get_count = TRADE_SHAPES[shape]
+            if owner.player_ids.size < give_count or partner.player_ids.size < get_count:
+                continue
+            give_sets = _index_sets(owner.player_ids.size, give_count)
+            get_sets = _index_sets(partner.player_ids.size, get_count)
+            give = np.repeat(give_sets, len(get_sets), axis=0)
+            get = np.tile(get_sets, (len(give_sets), 1))
+            result["candidates_scored"] += len(give)
+
+            owner_delta = _lineups_after(
+                owner, give, partner.points[get], partner.position_codes[get], lineup_positions, slots
+            ) - owner_before
+            partner_delta = _lineups_after(
+                partner, get, owner.points[give], owner.position_codes[give], lineup_positions, slots
+            ) - partner_before[partner_id]
+            keep = (owner_delta > 0) & (partner_delta >= min_partner_delta)
+            if not keep.any():
+                continue
+
+            # pad to two columns so every shape stacks together; -1 = no player
+            found["give"].append(np.pad(give[keep], ((0, 0), (0, 2 - give_count)), constant_values=-1))
+            found["get"].append(np.pad(get[keep], ((0, 0), (0, 2 - get_count)), constant_values=-1))
+            found["partner"].append(np.full(int(keep.sum()), partner_id))
+            found["owner_delta"].append(owner_delta[keep])
+            found["partner_delta"].append(partner_delta[keep])
+            found["value_gap"].append(
+                np.abs(
+                    owner.trade_values[give[keep]].sum(axis=1) - partner.trade_values[get[keep]].sum(axis=1)
+                )
+            )
+
+    if not found["partner"]:
+        return result
+    columns = {key: np.concatenate(parts) for key, parts in found.items()}
+    order = np.lexsort((columns["value_gap"], -columns["partner_delta"], -columns["owner_delta"]))
+
+    snapshot = load_trade_snapshot(
+        db,
+        league_id,
+        set(boards),
+        [int(player_id) for board in boards.values() for player_id in board.player_ids],
+        rules=rules,
+    )
+    check_now = now or datetime.now(UTC)
+    max_attempts = max(1, int(limit)) * VALIDATION_ATTEMPTS_PER_RESULT
+    for attempt, row in enumerate(order):
+        if len(result["trades"]) >= limit or attempt >= max_attempts:
+            break
+        partner = boards[int(columns["partner"][row])]
+        give_players = _player_payload(owner, columns["give"][row])
+        get_players = _player_payload(partner, columns["get"][row])
+        report = validate_trade_against_snapshot(
+            snapshot,
+            team_a_id=owner.owner_id,
+            team_b_id=partner.owner_id,
+            assets_from_a=[TradeAssetInput(asset_type="PLAYER", player_id=p["player_id"]) for p in give_players],
+            assets_from_b=[TradeAssetInput(asset_type="PLAYER", player_id=p["player_id"]) for p in get_players],
+            now=check_now,
+        )
+        if not report.valid:
+            result["candidates_rejected"] += 1
+            continue
+        owner_delta = float(columns["owner_delta"][row])
+        partner_delta = float(columns["partner_delta"][row])
+        result["trades"].append(
+            {
+                "partner_id": partner.owner_id,
+                "partner_name": partner.owner_name,
+                "shape": f"{len(give_players)}-for-{len(get_players)}",
+                "give": give_players,
+                "receive": get_players,
+                "owner_points_before": round(owner_before, 2),
+                "owner_points_after": round(owner_before + owner_delta, 2),
+                "owner_delta": round(owner_delta, 2),
+                "partner_points_before": round(partner_before[partner.owner_id], 2),
+                "partner_points_after": round(partner_before[partner.owner_id] + partner_delta, 2),
+                "partner_delta": round(partner_delta, 2),
+                "trade_value_gap": round(float(columns["value_gap"][row]), 2),
+            }
+        )
+    return result
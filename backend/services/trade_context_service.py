@@ -0,0 +1,316 @@
+"""Database loading for trade validation.
+
+`trade_validation_service` checks a `TradeValidationContext` without touching
+the database. This module fills those contexts in bulk: `load_trade_snapshot`
+reads league trade rules, team budgets, rosters, pick ownership and player
+positions for any number of teams and players in a fixed number of queries,
+and `build_trade_validation_context` turns the snapshot plus one proposal
+into a context without further queries. `validate_trades_batch` uses one
+snapshot for many hypothetical trades, which is what trade-finder tools need
+to score hundreds of candidates per request.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Iterable
+
+from sqlalchemy.orm import Session
+
+from .. import models
+from .commissioner_deadline_service import parse_commissioner_deadline
+from .trade_validation_service import (
+    TradeAssetInput,
+    TradeValidationContext,
+    TradeValidationReport,
+    validate_trade_request,
+)
+
+
+DEFAULT_MAX_ROSTER_SIZE = 14
+MAX_FUTURE_PICK_YEAR_OFFSET = 2
+
+
+@dataclass(frozen=True)
+class LeagueTradeRules:
+    """League-level trade settings shared by every proposal in a request."""
+
+    league_id: int
+    max_roster_size: int = DEFAULT_MAX_ROSTER_SIZE
+    min_roster_size: int = 1
+    trade_deadline: str | None = None
+    trade_start_at: datetime | None = None
+    trade_end_at: datetime | None = None
+    allow_playoff_trades: bool = True
+    is_playoff: bool = False
+    max_future_year_offset: int | None = MAX_FUTURE_PICK_YEAR_OFFSET
+    current_season: int | None = None
+    suppressed_positions: frozenset[str] = frozenset()
+
+
+@dataclass
+class TradeSnapshot:
+    """Everything trade validation reads for a set of teams in one league."""
+
+    rules: LeagueTradeRules
+    team_ids: set[int] = field(default_factory=set)
+    draft_dollars: dict[int, float] = field(default_factory=dict)
+    roster_sizes: dict[int, int] = field(default_factory=dict)
+    owned_pick_ids_by_team: dict[int, set[int]] = field(default_factory=dict)
+    owned_player_ids_by_team: dict[int, set[int]] = field(default_factory=dict)
+    player_positions_by_id: dict[int, str] = field(default_factory=dict)
+
+
+def load_league_trade_rules(db: Session, league_id: int) -> LeagueTradeRules:
+    """Read a league's trade settings (two queries)."""
+    settings = (
+        db.query(models.LeagueSettings)
+        .filter(models.LeagueSettings.league_id == league_id)
+        .first()
+    )
+    current_season = (
+        db.query(models.League.current_season)
+        .filter(models.League.id == league_id)
+        .scalar()
+    )
+    if current_season is None:
+        current_season = datetime.now(UTC).year
+    if settings is None:
+        return LeagueTradeRules(league_id=league_id, current_season=int(current_season))
+
+    return LeagueTradeRules(
+        league_id=league_id,
+        max_roster_size=int(settings.roster_size or DEFAULT_MAX_ROSTER_SIZE),
+        trade_deadline=settings.trade_deadline,
+        trade_start_at=settings.trade_start_at,
+        trade_end_at=settings.trade_end_at or parse_commissioner_deadline(settings.trade_deadline),
+        allow_playoff_trades=(
+            settings.allow_playoff_trades if settings.allow_playoff_trades is not None else True
+        ),
+        current_season=int(current_season),
+    )
+
+
+def load_trade_snapshot(
+    db: Session,
+    league_id: int,
+    team_ids: Iterable[int],
+    player_ids: Iterable[int] = (),
+    *,
+    rules: LeagueTradeRules | None = None,
+) -> TradeSnapshot:
+    """Load trade validation data for ``team_ids`` in a fixed number of queries.
+
+    Teams that are not in the league are left out of ``team_ids`` on the
+    snapshot. Pass ``rules`` to reuse league rules already loaded for this
+    request.
+    """
+    requested_team_ids = {int(team_id) for team_id in team_ids}
+    snapshot = TradeSnapshot(rules=rules or load_league_trade_rules(db, league_id))
+    if not requested_team_ids:
+        return snapshot
+
+    for team_id, budget in (
+        db.query(models.User.id, models.User.future_draft_budget)
+        .filter(
+            models.User.id.in_(requested_team_ids),
+            models.User.league_id == league_id,
+        )
+        .all()
+    ):
+        snapshot.team_ids.add(int(team_id))
+        snapshot.draft_dollars[int(team_id)] = float(budget or 0)
+
+    for team_id in snapshot.team_ids:
+        snapshot.roster_sizes[team_id] = 0
+        snapshot.owned_pick_ids_by_team[team_id] = set()
+        snapshot.owned_player_ids_by_team[team_id] = set()
+
+    # One pass over the teams' draft picks yields roster sizes, pick
+    # ownership and player ownership together.
+    if snapshot.team_ids:
+        for pick_id, owner_id, player_id in (
+            db.query(models.DraftPick.id, models.DraftPick.owner_id, models.DraftPick.player_id)
+            .filter(
+                models.DraftPick.league_id == league_id,
+                models.DraftPick.owner_id.in_(snapshot.team_ids),
+            )
+            .all()
+        ):
+            owner_id = int(owner_id)
+            snapshot.owned_pick_ids_by_team[owner_id].add(int(pick_id))
+            if player_id is not None:
+                snapshot.roster_sizes[owner_id] += 1
+                snapshot.owned_player_ids_by_team[owner_id].add(int(player_id))
+
+    requested_player_ids = {int(player_id) for player_id in player_ids if player_id is not None}
+    if requested_player_ids:
+        snapshot.player_positions_by_id = {
+            int(player_id): str(position or "")
+            for player_id, position in db.query(models.Player.id, models.Player.position)
+            .filter(models.Player.id.in_(requested_player_ids))
+            .all()
+        }
+    return snapshot
+
+
+def trade_player_ids(*asset_lists: Iterable) -> set[int]:
+    """Player ids referenced by any asset in ``asset_lists``."""
+    return {
+        int(asset.player_id)
+        for assets in asset_lists
+        for asset in assets
+        if asset.player_id is not None
+    }
+
+
+def _asset_inputs(assets: Iterable, snapshot: TradeSnapshot) -> list[TradeAssetInput]:
+    return [
+        TradeAssetInput(
+            asset_type=asset.asset_type,
+            player_id=asset.player_id,
+            draft_pick_id=asset.draft_pick_id,
+            amount=asset.amount,
+            season_year=asset.season_year,
+            position=snapshot.player_positions_by_id.get(int(asset.player_id or 0)),
+        )
+        for asset in assets
+    ]
+
+
+def build_trade_validation_context(
+    snapshot: TradeSnapshot,
+    *,
+    team_a_id: int,
+    team_b_id: int,
+    assets_from_a: Iterable,
+    assets_from_b: Iterable,
+    now: datetime | None = None,
+) -> TradeValidationContext:
+    """Context for one proposal, built from ``snapshot`` without queries.
+
+    Assets may be any objects with the `TradeAssetInput` attributes (request
+    schemas, `TradeAsset` rows).
+    """
+    rules = snapshot.rules
+    return TradeValidationContext(
+        team_a_id=team_a_id,
+        team_b_id=team_b_id,
+        assets_from_a=_asset_inputs(assets_from_a, snapshot),
+        assets_from_b=_asset_inputs(assets_from_b, snapshot),
+        roster_sizes={team_id: snapshot.roster_sizes.get(team_id, 0) for team_id in (team_a_id, team_b_id)},
+        max_roster_size=rules.max_roster_size,
+        min_roster_size=rules.min_roster_size,
+        available_draft_dollars=snapshot.draft_dollars,
+        owned_pick_ids_by_team={
+            team_id: snapshot.owned_pick_ids_by_team.get(team_id, set()) for team_id in (team_a_id, team_b_id)
+        },
+        suppressed_positions=set(rules.suppressed_positions),
+        player_positions_by_id=snapshot.player_positions_by_id,
+        trade_start_at=rules.trade_start_at,
+        trade_end_at=rules.trade_end_at,
+        allow_playoff_trades=rules.allow_playoff_trades,
+        is_playoff=rules.is_playoff,
+        max_future_year_offset=rules.max_future_year_offset,
+        current_season=rules.current_season,
+        now=now or datetime.now(UTC),
+    )
+
+
+def missing_player_ownership(
+    snapshot: TradeSnapshot,
+    *,
+    team_id: int,
+    assets: Iterable,
+) -> set[int]:
+    """Player assets offered by ``team_id`` that the team does not roster."""
+    offered = {
+        int(asset.player_id)
+        for asset in assets
+        if (asset.asset_type or "").strip().upper() == "PLAYER" and asset.player_id is not None
+    }
+    return offered - snapshot.owned_player_ids_by_team.get(int(team_id), set())
+
+
+def validate_trade_against_snapshot(
+    snapshot: TradeSnapshot,
+    *,
+    team_a_id: int,
+    team_b_id: int,
+    assets_from_a: list,
+    assets_from_b: list,
+    now: datetime | None = None,
+) -> TradeValidationReport:
+    """Full rule check plus team membership and player ownership, without queries."""
+    report = validate_trade_request(
+        build_trade_validation_context(
+            snapshot,
+            team_a_id=team_a_id,
+            team_b_id=team_b_id,
+            assets_from_a=assets_from_a,
+            assets_from_b=assets_from_b,
+            now=now,
+        )
+    )
+
+    def _error(key: str, message: str) -> None:
+        report.valid = False
+        report.errors.setdefault(key, []).append(message)
+
+    if team_a_id == team_b_id:
+        _error("teams", "trade teams must be different")
+    for side_key, team_id, assets in (
+        ("assets_from_a", team_a_id, assets_from_a),
+        ("assets_from_b", team_b_id, assets_from_b),
+    ):
+        if int(team_id) not in snapshot.team_ids:
+            _error("teams", f"team {team_id} is not in the league")
+            continue
+        missing = missing_player_ownership(snapshot, team_id=team_id, assets=assets)
+        for idx, asset in enumerate(assets):
+            if asset.player_id is not None and int(asset.player_id) in missing:
+                _error(f"{side_key}[{idx}]", "team does not own this player")
+    return report
+
+
+@dataclass
+class TradeCandidate:
+    team_a_id: int
+    team_b_id: int
+    assets_from_a: list
+    assets_from_b: list
+
+
+def validate_trades_batch(
+    db: Session,
+    league_id: int,
+    candidates: list[TradeCandidate],
+    *,
+    now: datetime | None = None,
+) -> list[TradeValidationReport]:
+    """Validate many hypothetical trades against one snapshot of the league.
+
+    The query count does not depend on the number of candidates; reports are
+    returned in candidate order.
+    """
+    if not candidates:
+        return []
+    snapshot = load_trade_snapshot(
+        db,
+        league_id,
+        {team_id for candidate in candidates for team_id in (candidate.team_a_id, candidate.team_b_id)},
+        trade_player_ids(*(assets for c in candidates for assets in (c.assets_from_a, c.assets_from_b))),
+    )
+    check_now = now or datetime.now(UTC)
+    return [
+        validate_trade_against_snapshot(
+            snapshot,
+            team_a_id=candidate.team_a_id,
+            team_b_id=candidate.team_b_id,
+            assets_from_a=candidate.assets_from_a,
+            assets_from_b=candidate.assets_from_b,
+            now=check_now,
+        )
+        for candidate in candidates
+    ]
@@ -1,9 +1,27 @@
+from collections.abc import Iterable
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from datetime import datetime
 
 from .. import models
 
 
+# Ownership timeline. Every history row that hands a player to an owner opens
+# a PlayerOwnershipSpan, closed by the player's next history row in the same
+# league, so "who owned these players at T" is a single indexed interval
+# lookup instead of a latest-row query per player. Spans are rebuilt per
+# player whenever history is written (log_transaction, batch waivers, MFL
+# imports) and for whole leagues by `manage.py rebuild-ownership-spans`.
+# Databases that got the table from create_all instead of migration 0032
+# start with it empty; backfill them once with that command.
+#
+# Spans cover history rows with a timestamp; rows without one cannot be
+# placed on the timeline (the old point-in-time query skipped them too).
+# `get_acquisition_method` still falls back to history for such rows.
+
+DROP_TRANSACTION_TYPES = ("drop", "waiver_drop")
+
+
 def log_transaction(
     db: Session,
     league_id: int,
@@ -28,29 +46,167 @@ def log_transaction(
     )
     db.add(th)
     db.flush()
+    refresh_ownership_spans(db, league_id=league_id, player_ids=[player_id])
     return th
 
 
-def get_owner_at_time(db: Session, player_id: int, target_date: datetime) -> int | None:
+def build_ownership_spans(history: Iterable) -> list[dict]:
+    """Turn history rows ordered by (league, player, timestamp, id) into span dicts."""
+    spans: list[dict] = []
+    open_span: dict | None = None
+    previous_key = None
+    for txn in history:
+        key = (txn.league_id, txn.player_id)
+        if key != previous_key:
+            open_span = None
+            previous_key = key
+        if open_span is not None:
+            open_span["ended_at"] = txn.timestamp
+            open_span["ended_by"] = txn.transaction_type
+            open_span["end_transaction_id"] = txn.id
+            open_span = None
+        if txn.new_owner_id is not None:
+            open_span = {
+                "league_id": txn.league_id,
+                "player_id": txn.player_id,
+                "owner_id": txn.new_owner_id,
+                "started_at": txn.timestamp,
+                "ended_at": None,
+                "transaction_type": txn.transaction_type,
+                "ended_by": None,
+                "start_transaction_id": txn.id,
+                "end_transaction_id": None,
+            }
+            spans.append(open_span)
+    return spans
+
+
+def refresh_ownership_spans(
+    db: Session,
+    *,
+    league_id: int,
+    player_ids: Iterable[int] | None = None,
+) -> int:
+    """Rebuild the spans of ``player_ids`` (or every player) in one league.
+
+    Returns the number of spans written. Caller commits.
+    """
+    player_set = None if player_ids is None else {int(player_id) for player_id in player_ids}
+    if player_set is not None and not player_set:
+        return 0
+
+    span = models.PlayerOwnershipSpan
+    history = models.TransactionHistory
+    delete_query = db.query(span).filter(span.league_id == league_id)
+    history_query = db.query(
+        history.id,
+        history.league_id,
+        history.player_id,
+        history.new_owner_id,
+        history.transaction_type,
+        history.timestamp,
+    ).filter(history.league_id == league_id, history.timestamp.isnot(None))
+    if player_set is not None:
+        delete_query = delete_query.filter(span.player_id.in_(player_set))
+        history_query = history_query.filter(history.player_id.in_(player_set))
+    delete_query.delete(synchronize_session=False)
+
+    rows = build_ownership_spans(
+        history_query.order_by(history.player_id, history.timestamp, history.id).all()
+    )
+    db.add_all(span(**row) for row in rows)
+    db.flush()
+    return len(rows)
+
+
+def _spans_at(db: Session, target_date: datetime):
+    span = models.PlayerOwnershipSpan
+    return db.query(span).filter(
+        span.started_at <= target_date,
+        or_(span.ended_at.is_(None), span.ended_at > target_date),
+    )
+
+
+def owners_at_time(
+    db: Session,
+    *,
+    league_id: int,
+    player_ids: Iterable[int],
+    target_date: datetime,
+) -> dict[int, int]:
+    """Owner of each player at ``target_date``; unowned players are absent."""
+    player_set = {int(player_id) for player_id in player_ids}
+    if not player_set:
+        return {}
+    span = models.PlayerOwnershipSpan
+    rows = (
+        _spans_at(db, target_date)
+        .filter(span.league_id == league_id, span.player_id.in_(player_set))
+        .with_entities(span.player_id, span.owner_id)
+        .all()
+    )
+    return {int(player_id): int(owner_id) for player_id, owner_id in rows}
+
+
+def roster_at_time(db: Session, *, league_id: int, target_date: datetime) -> dict[int, list[int]]:
+    """Every owner's player ids at ``target_date`` as recorded by transaction history."""
+    span = models.PlayerOwnershipSpan
+    rows = (
+        _spans_at(db, target_date)
+        .filter(span.league_id == league_id)
+        .with_entities(span.owner_id, span.player_id)
+        .order_by(span.owner_id, span.player_id)
+        .all()
+    )
+    rosters: dict[int, list[int]] = {}
+    for owner_id, player_id in rows:
+        rosters.setdefault(int(owner_id), []).append(int(player_id))
+    return rosters
+
+
+def get_owner_at_time(
+    db: Session,
+    player_id: int,
+    target_date: datetime,
+    league_id: int | None = None,
+) -> int | None:
     """Return the owner_id for the given player on or before the timestamp.
 
     If no matching record exists, returns None.
     """
-    txn = (
-        db.query(models.TransactionHistory)
-        .filter(
-            models.TransactionHistory.player_id == player_id,
-            models.TransactionHistory.timestamp <= target_date,
-        )
-        .order_by(models.TransactionHistory.timestamp.desc())
-        .first()
-    )
-    return txn.new_owner_id if txn else None
+    span = models.PlayerOwnershipSpan
+    query = _spans_at(db, target_date).filter(span.player_id == player_id)
+    if league_id is not None:
+        query = query.filter(span.league_id == league_id)
+    match = query.order_by(span.started_at.desc(), span.id.desc()).first()
+    return match.owner_id if match else None
+
+
+def acquisition_label(transaction_type: str) -> str:
+    # map our internal types to simple labels
+    if transaction_type == "draft":
+        return "DRAFT"
+    if transaction_type == "trade":
+        return "TRADE"
+    if transaction_type in ("waiver_add", "waiver_drop"):
+        return "WAIVER"
+    return transaction_type.upper()
 
 
 def get_acquisition_method(db: Session, player_id: int, owner_id: int) -> str | None:
     """Return the first transaction_type that brought the player to this owner.
     """
+    span = models.PlayerOwnershipSpan
+    first_span = (
+        db.query(span)
+        .filter(span.player_id == player_id, span.owner_id == owner_id)
+        .order_by(span.started_at, span.id)
+        .first()
+    )
+    if first_span:
+        return acquisition_label(first_span.transaction_type)
+
+    # history rows without a timestamp have no span
     txn = (
         db.query(models.TransactionHistory)
         .filter(
@@ -62,11 +218,4 @@ def get_acquisition_method(db: Session, player_id: int, owner_id: int) -> str |
     )
     if not txn:
         return None
-    # map our internal types to simple labels
-    if txn.transaction_type == "draft":
-        return "DRAFT"
-    if txn.transaction_type == "trade":
-        return "TRADE"
-    if txn.transaction_type in ("waiver_add", "waiver_drop"):
-        return "WAIVER"
-    return txn.transaction_type.upper()
+    return acquisition_label(txn.transaction_type)
@@ -0,0 +1,405 @@
+"""Batch waiver processing for queued (PENDING) waiver claims.
+
+`process_waiver_claims` resolves every pending claim of a league in one
+in-memory pass and writes the outcome in one transaction:
+
+- everything the resolution needs (settings, owners, standings, claims,
+  rosters, target players, FAAB balances) is loaded with a fixed number of
+  bulk queries, independent of the claim count;
+- claims are awarded one at a time, always picking the strongest remaining
+  claim: highest FAAB bid first (bids are ignored under the PRIORITY
+  system), then waiver priority (inverse standings, the winner moving to the
+  back of the order) or claim age for the ``timestamp`` tiebreaker;
+- after each award, claims that can no longer succeed are rejected: the
+  player is gone, the drop player was already dropped, the bid exceeds the
+  owner's remaining FAAB, or the roster is full without a drop;
+- adds, drops, transaction history, FAAB ledger entries and claim statuses
+  are flushed together; ``dry_run`` returns the same report and rolls back.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..utils.waiver_logic import calculate_waiver_priority
+from .free_agent_pool_service import invalidate_free_agent_pool
+from .league_position_service import get_active_positions_for_league, normalize_player_position
+from .ledger_service import owner_balance_summaries, record_ledger_entries
+from .transaction_service import refresh_ownership_spans
+
+PENDING_STATUS = "PENDING"
+APPROVED_STATUS = "APPROVED"
+REJECTED_STATUS = "REJECTED"
+DEFAULT_ROSTER_LIMIT = 14
+
+
+@dataclass
+class _OwnerState:
+    owner_id: int
+    roster: set[int]
+    # None = no FAAB budget configured (claims are not budget-limited).
+    faab_remaining: int | None
+    uses_waiver_budget: bool
+    faab_spent: int = 0
+
+
+@dataclass
+class WaiverRunReport:
+    league_id: int
+    dry_run: bool
+    waiver_system: str
+    tiebreaker: str
+    skipped_reason: str | None = None
+    priority_before: list[int] = field(default_factory=list)
+    priority_after: list[int] = field(default_factory=list)
+    awarded: list[dict[str, Any]] = field(default_factory=list)
+    rejected: list[dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "league_id": self.league_id,
+            "dry_run": self.dry_run,
+            "waiver_system": self.waiver_system,
+            "tiebreaker": self.tiebreaker,
+            "skipped_reason": self.skipped_reason,
+            "claims_processed": len(self.awarded) + len(self.rejected),
+            "awarded_count": len(self.awarded),
+            "rejected_count": len(self.rejected),
+            "priority_before": self.priority_before,
+            "priority_after": self.priority_after,
+            "awarded": self.awarded,
+            "rejected": self.rejected,
+        }
+
+
+def _load_faab_balances(db: Session, league_id: int) -> tuple[dict[int, int], dict[int, int]]:
+    """Per-owner (incoming total, net balance) of FAAB ledger entries."""
+    summaries = owner_balance_summaries(db, league_id=league_id, currency_type="FAAB")
+    incoming = {owner_id: summary["incoming"] for owner_id, summary in summaries.items()}
+    balances = {owner_id: summary["balance"] for owner_id, summary in summaries.items()}
+    return incoming, balances
+
+
+def _claim_rejection(
+    claim: models.WaiverClaim,
+    owner: _OwnerState | None,
+    *,
+    owned_player_ids: set[int],
+    players: dict[int, models.Player],
+    allowed_positions: set[str],
+    roster_limit: int,
+    bid: int,
+) -> str | None:
+    """Why ``claim`` cannot be awarded right now, or None when it can."""
+    if owner is None:
+        return "owner_not_in_league"
+    player = players.get(int(claim.player_id or 0))
+    if player is None:
+        return "player_not_found"
+    if normalize_player_position(player.position) not in allowed_positions:
+        return "position_disabled"
+    if int(claim.player_id) in owned_player_ids:
+        return "player_unavailable"
+    if claim.drop_player_id and int(claim.drop_player_id) not in owner.roster:
+        return "drop_player_not_on_roster"
+    if not claim.drop_player_id and len(owner.roster) >= roster_limit:
+        return "roster_full"
+    if bid < 0:
+        return "invalid_bid"
+    if owner.faab_remaining is not None and bid > owner.faab_remaining:
+        return "insufficient_faab"
+    return None
+
+
+def process_waiver_claims(
+    db: Session,
+    *,
+    league_id: int,
+    dry_run: bool = False,
+    created_by_user_id: int | None = None,
+) -> dict[str, Any]:
+    """Resolve and apply every pending waiver claim for one league.
+
+    A claim that drops a player the same owner is also claiming waits for
+    that claim to resolve instead of being rejected up front. Flushes but
+    does not commit; the caller owns the transaction. ``dry_run`` only
+    reports: claims, rosters and budgets are left untouched.
+    """
+    settings = (
+        db.query(models.LeagueSettings)
+        .filter(models.LeagueSettings.league_id == league_id)
+        .first()
+    )
+    waiver_system = str((settings.waiver_system if settings else None) or "FAAB").strip().upper()
+    tiebreaker = str((settings.waiver_tiebreaker if settings else None) or "standings").strip().lower()
+    roster_limit = int(settings.roster_size) if settings and settings.roster_size else DEFAULT_ROSTER_LIMIT
+    season_year = int(settings.draft_year) if settings and settings.draft_year else datetime.now(UTC).year
+    report = WaiverRunReport(league_id=league_id, dry_run=dry_run, waiver_system=waiver_system, tiebreaker=tiebreaker)
+
+    league = db.query(models.League).filter(models.League.id == league_id).first()
+    if league is None:
+        report.skipped_reason = "league_not_found"
+        return report.to_dict()
+    if (league.draft_status or "PRE_DRAFT") == "ACTIVE":
+        report.skipped_reason = "draft_active"
+        return report.to_dict()
+
+    claims = (
+        db.query(models.WaiverClaim)
+        .filter(
+            models.WaiverClaim.league_id == league_id,
+            func.upper(models.WaiverClaim.status) == PENDING_STATUS,
+        )
+        .order_by(models.WaiverClaim.id.asc())
+        .all()
+    )
+    priority = [owner.id for owner in calculate_waiver_priority(league_id, db)]
+    report.priority_before = list(priority)
+    report.priority_after = list(priority)
+    if not claims:
+        return report.to_dict()
+
+    roster_rows = (
+        db.query(models.DraftPick.id, models.DraftPick.owner_id, models.DraftPick.player_id)
+        .filter(models.DraftPick.league_id == league_id)
+        .all()
+    )
+    owned_player_ids = {int(player_id) for _, _, player_id in roster_rows if player_id is not None}
+    pick_ids: dict[tuple[int, int], int] = {}
+    rosters: dict[int, set[int]] = {owner_id: set() for owner_id in priority}
+    for pick_id, owner_id, player_id in roster_rows:
+        if owner_id is None or player_id is None:
+            continue
+        rosters.setdefault(int(owner_id), set()).add(int(player_id))
+        pick_ids[(int(owner_id), int(player_id))] = int(pick_id)
+
+    claim_player_ids = {int(claim.player_id) for claim in claims if claim.player_id is not None}
+    players = {
+        int(player.id): player
+        for player in db.query(models.Player).filter(models.Player.id.in_(claim_player_ids)).all()
+    }
+    allowed_positions = set(get_active_positions_for_league(db, league_id))
+
+    incoming_faab, faab_balances = _load_faab_balances(db, league_id)
+    waiver_budgets = {
+        int(budget.owner_id): budget
+        for budget in db.query(models.WaiverBudget).filter(models.WaiverBudget.league_id == league_id).all()
+    }
+    owners: dict[int, _OwnerState] = {}
+    for owner_id in priority:
+        # Same budget source as a single claim: the FAAB ledger once the owner
+        # has been credited there, otherwise the legacy waiver budget row.
+        if incoming_faab.get(owner_id, 0) > 0:
+            remaining, uses_waiver_budget = faab_balances.get(owner_id, 0), False
+        elif owner_id in waiver_budgets:
+            remaining, uses_waiver_budget = int(waiver_budgets[owner_id].remaining_budget or 0), True
+        else:
+            remaining, uses_waiver_budget = None, False
+        owners[owner_id] = _OwnerState(
+            owner_id=owner_id,
+            roster=rosters.get(owner_id, set()),
+            faab_remaining=remaining,
+            uses_waiver_budget=uses_waiver_budget,
+        )
+
+    use_bids = waiver_system != "PRIORITY"
+
+    def _bid(claim: models.WaiverClaim) -> int:
+        return int(claim.bid_amount or 0) if use_bids else 0
+
+    def _rank(claim: models.WaiverClaim) -> tuple:
+        owner_position = priority.index(claim.user_id) if claim.user_id in priority else len(priority)
+        if tiebreaker == "timestamp":
+            return (-_bid(claim), claim.id, owner_position)
+        return (-_bid(claim), owner_position, claim.id)
+
+    def _reject(claim: models.WaiverClaim, reason: str) -> None:
+        if not dry_run:
+            claim.status = REJECTED_STATUS
+        report.rejected.append(
+            {
+                "claim_id": claim.id,
+                "owner_id": claim.user_id,
+                "player_id": claim.player_id,
+                "bid_amount": int(claim.bid_amount or 0),
+                "reason": reason,
+            }
+        )
+
+    def _check(claim: models.WaiverClaim) -> str | None:
+        return _claim_rejection(
+            claim,
+            owners.get(claim.user_id),
+            owned_player_ids=owned_player_ids,
+            players=players,
+            allowed_positions=allowed_positions,
+            roster_limit=roster_limit,
+            bid=_bid(claim),
+        )
+
+    def _awaits_own_claim(claim: models.WaiverClaim, pending: list[models.WaiverClaim]) -> bool:
+        # "add X, dropping Y" where the same owner also claims Y this run
+        return any(
+            other is not claim and other.user_id == claim.user_id and other.player_id == claim.drop_player_id
+            for other in pending
+        )
+
+    awards: list[tuple[models.WaiverClaim, int]] = []
+    remaining_claims = list(claims)
+    while remaining_claims:
+        still_valid: list[models.WaiverClaim] = []
+        deferred: dict[int, str] = {}
+        for claim in remaining_claims:
+            reason = _check(claim)
+            if reason is None:
+                still_valid.append(claim)
+            elif reason == "drop_player_not_on_roster" and _awaits_own_claim(claim, remaining_claims):
+                deferred[id(claim)] = reason
+            else:
+                _reject(claim, reason)
+        if not still_valid:
+            for claim in remaining_claims:
+                if id(claim) in deferred:
+                    _reject(claim, deferred[id(claim)])
+            break
+        winner = min(still_valid, key=_rank)
+        valid_ids = {id(claim) for claim in still_valid} | set(deferred)
+        remaining_claims = [
+            claim for claim in remaining_claims if id(claim) in valid_ids and claim is not winner
+        ]
+
+        owner = owners[winner.user_id]
+        bid = _bid(winner)
+        if winner.drop_player_id:
+            owner.roster.discard(int(winner.drop_player_id))
+            owned_player_ids.discard(int(winner.drop_player_id))
+        owner.roster.add(int(winner.player_id))
+        owned_player_ids.add(int(winner.player_id))
+        if owner.faab_remaining is not None:
+            owner.faab_remaining -= bid
+        owner.faab_spent += bid
+        if winner.user_id in priority:
+            priority.remove(winner.user_id)
+            priority.append(winner.user_id)
+        if not dry_run:
+            winner.status = APPROVED_STATUS
+        awards.append((winner, bid))
+        report.awarded.append(
+            {
+                "claim_id": winner.id,
+                "owner_id": winner.user_id,
+                "player_id": winner.player_id,
+                "drop_player_id": winner.drop_player_id,
+                "bid_amount": bid,
+            }
+        )
+
+    report.priority_after = list(priority)
+    if dry_run:
+        return report.to_dict()
+    if not awards:
+        db.flush()
+        return report.to_dict()
+
+    new_picks = [
+        models.DraftPick(
+            owner_id=claim.user_id,
+            player_id=claim.player_id,
+            amount=bid,
+            session_id="WAIVER_WIRE",
+            year=season_year,
+            league_id=league_id,
+        )
+        for claim, bid in awards
+    ]
+    # Replay the awards in order: a drop removes either a pick loaded before
+    # the run or one created by an earlier award in this run, which is then
+    # never written.
+    dropped_pick_ids: list[int] = []
+    run_picks: dict[tuple[int, int], models.DraftPick] = {}
+    for (claim, _), pick in zip(awards, new_picks):
+        if claim.drop_player_id:
+            drop_key = (int(claim.user_id), int(claim.drop_player_id))
+            if drop_key in run_picks:
+                run_picks.pop(drop_key)
+            elif drop_key in pick_ids:
+                dropped_pick_ids.append(pick_ids.pop(drop_key))
+        run_picks[(int(claim.user_id), int(claim.player_id))] = pick
+    if dropped_pick_ids:
+        db.query(models.DraftPick).filter(models.DraftPick.id.in_(dropped_pick_ids)).delete(synchronize_session=False)
+    history: list[models.TransactionHistory] = []
+    for claim, bid in awards:
+        history.append(
+            models.TransactionHistory(
+                league_id=league_id,
+                player_id=claim.player_id,
+                old_owner_id=None,
+                new_owner_id=claim.user_id,
+                transaction_type="waiver_add",
+                notes=f"waiver claim bid={bid}",
+            )
+        )
+        if claim.drop_player_id:
+            history.append(
+                models.TransactionHistory(
+                    league_id=league_id,
+                    player_id=claim.drop_player_id,
+                    old_owner_id=claim.user_id,
+                    new_owner_id=None,
+                    transaction_type="waiver_drop",
+                    notes="auto-drop from waiver claim",
+                )
+            )
+    db.add_all(run_picks.values())
+    db.add_all(history)
+    db.flush()
+    refresh_ownership_spans(db, league_id=league_id, player_ids={row.player_id for row in history})
+
+    record_ledger_entries(
+        db,
+        [
+            {
+                "league_id": league_id,
+                "season_year": season_year,
+                "currency_type": "FAAB",
+                "amount": bid,
+                "from_owner_id": claim.user_id,
+                "to_owner_id": None,
+                "transaction_type": "WAIVER_CLAIM_BID",
+                # the claim, not its pick: a pick dropped later in the run is never written
+                "reference_type": "WAIVER_CLAIM",
+                "reference_id": str(claim.id),
+                "notes": f"waiver claim bid for player_id={claim.player_id}",
+                "created_by_user_id": created_by_user_id or claim.user_id,
+            }
+            for claim, bid in awards
+            if bid > 0
+        ],
+    )
+    for owner in owners.values():
+        budget = waiver_budgets.get(owner.owner_id)
+        if owner.uses_waiver_budget and budget is not None and owner.faab_spent:
+            budget.remaining_budget = int(budget.remaining_budget or 0) - owner.faab_spent
+            budget.spent_budget = int(budget.spent_budget or 0) + owner.faab_spent
+    db.flush()
+    invalidate_free_agent_pool(league_id)
+    return report.to_dict()
+
+
+def pending_waiver_league_ids(db: Session) -> list[int]:
+    rows = (
+        db.query(models.WaiverClaim.league_id)
+        .filter(
+            models.WaiverClaim.league_id.isnot(None),
+            func.upper(models.WaiverClaim.status) == PENDING_STATUS,
+        )
+        .distinct()
+        .all()
+    )
+    return sorted(int(league_id) for (league_id,) in rows)
@@ -1,16 +1,16 @@
 # backend/services/waiver_service.py
 from .. import models
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from fastapi import HTTPException
 from datetime import UTC, datetime
-from .ledger_service import owner_balance, record_ledger_entry
+from .ledger_service import owner_balance, owner_has_incoming_credits, record_ledger_entry
 from .validation_service import (
     validate_waiver_claim_boundary,
     validate_waiver_claim_dynamic_rules,
 )
 from .commissioner_deadline_service import enforce_commissioner_deadline
 from .league_position_service import is_position_allowed_for_league
+from .free_agent_pool_service import note_player_released, note_roster_change
 
 
 def _validate_commissioner_waiver_rules(db: Session, user: models.User) -> int:
@@ -73,17 +73,7 @@ def process_claim(db: Session, user: models.User, player_id: int, bid: int, drop
     if bid < 0:
         raise HTTPException(status_code=400, detail="Bid must be non-negative.")
 
-    owner_total_incoming = (
-        db.query(func.coalesce(func.sum(models.EconomicLedger.amount), 0))
-        .filter(
-            models.EconomicLedger.league_id == user.league_id,
-            models.EconomicLedger.currency_type == "FAAB",
-            models.EconomicLedger.to_owner_id == user.id,
-        )
-        .scalar()
-    )
-
-    if int(owner_total_incoming or 0) > 0:
+    if owner_has_incoming_credits(db, league_id=user.league_id, owner_id=user.id, currency_type="FAAB"):
         remaining_faab = owner_balance(
             db,
             league_id=user.league_id,
@@ -156,6 +146,12 @@ def process_claim(db: Session, user: models.User, player_id: int, bid: int, drop
     
     db.add(new_pick)
     db.flush()
+    note_roster_change(
+        db,
+        league_id=user.league_id,
+        acquired=[player_id],
+        released=[drop_id] if drop_id else [],
+    )
 
     # record transaction history for the acquisition
     from .transaction_service import log_transaction
@@ -231,6 +227,7 @@ def process_drop(db: Session, user: models.User, player_id: int):
 
     db.delete(pick)
     db.commit()
+    note_player_released(db, league_id=user.league_id, player_id=player_id)
 
     # record history of manual drop
     from .transaction_service import log_transaction
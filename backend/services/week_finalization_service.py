@@ -78,6 +78,7 @@ def finalize_league_week(
         week=week,
         season=season,
         season_year=season_year,
+        refresh_head_to_head=True,
     )
 
     # recalculate_league_week_scores marks each matchup FINAL/completed.
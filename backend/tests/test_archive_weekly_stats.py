@@ -0,0 +1,151 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import models
+from scripts import archive_weekly_stats
+
+
+def _summary(event_id, athletes, completed=True):
+    return {
+        "header": {"competitions": [{"id": event_id, "status": {"type": {"completed": completed}}}]},
+        "boxscore": {
+            "players": [
+                {
+                    "team": {"abbreviation": team},
+                    "statistics": [
+                        {
+                            "labels": ["YDS", "TD", "fantasyPoints"],
+                            "athletes": [
+                                {
+                                    "id": espn_id,
+                                    "displayName": name,
+                                    "position": {"abbreviation": position},
+                                    "stats": stats,
+                                }
+                                for espn_id, name, position, stats in group
+                            ],
+                        }
+                    ],
+                }
+                for team, group in athletes
+            ]
+        },
+    }
+
+
+@pytest.fixture
+def archive_env(tmp_path, monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(archive_weekly_stats, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(archive_weekly_stats, "engine", engine)
+
+    summaries = {
+        "401": _summary(
+            "401",
+            [
+                ("BUF", [("1", "Josh Allen", "QB", ["300", "3", "24.5"]), ("2", "James Cook", "RB", ["80", "1", "14"])]),
+                ("KC", [("3", "Travis Kelce", "TE", ["95", "1", "15.5"]), ("9", "Some Lineman", "OT", ["0", "0", "0"])]),
+            ],
+        ),
+        "402": _summary("402", [("DAL", [("4", "CeeDee Lamb", "WR", ["120", "2", "24"])])]),
+        "403": _summary("403", [("NYJ", [("5", "Breece Hall", "RB", ["60", "0", "6"])])], completed=False),
+    }
+    calls = []
+
+    def fake_get_json(url, params=None, timeout=30):
+        calls.append((url, dict(params or {})))
+        if url == archive_weekly_stats.ESPN_SCOREBOARD_URL:
+            return {
+                "events": [
+                    {"id": "401", "status": {"type": {"completed": True}}},
+                    {"id": "402", "status": {"type": {"completed": True}}},
+                ]
+            }
+        return summaries[params["event"]]
+
+    monkeypatch.setattr(archive_weekly_stats, "get_json", fake_get_json)
+
+    session = TestingSessionLocal()
+    session.add_all(
+        [
+            models.Player(name="Josh Allen", position="QB", nfl_team="BUF", espn_id="1"),
+            models.Player(name="Travis Kelce", position="TE", nfl_team="KC"),
+        ]
+    )
+    session.commit()
+    session.close()
+    return TestingSessionLocal, calls, tmp_path / "cache"
+
+
+def test_backfill_bulk_upserts_stats_and_reuses_disk_cache(archive_env):
+    session_factory, calls, cache_dir = archive_env
+
+    report = archive_weekly_stats.backfill_weekly_stats(2024, [1], max_workers=4, cache_dir=cache_dir)
+    assert report["created"] == 4
+    assert report["updated"] == 0
+    assert report["players_created"] == 2
+    assert report["players_linked"] == 1
+    assert report["failed_events"] == []
+
+    session = session_factory()
+    try:
+        kelce = session.query(models.Player).filter(models.Player.name == "Travis Kelce").one()
+        assert kelce.espn_id == "3"
+        assert session.query(models.Player).count() == 4
+        allen_stat = (
+            session.query(models.PlayerWeeklyStat)
+            .join(models.Player)
+            .filter(models.Player.espn_id == "1")
+            .one()
+        )
+        assert allen_stat.fantasy_points == 24.5
+        assert allen_stat.stats["YDS"] == "300"
+    finally:
+        session.close()
+
+    network_calls = len(calls)
+    rerun = archive_weekly_stats.backfill_weekly_stats(2024, [1], max_workers=4, cache_dir=cache_dir)
+    assert len(calls) == network_calls
+    assert rerun["cached_summaries"] == 2
+    assert (rerun["created"], rerun["updated"]) == (0, 4)
+
+    session = session_factory()
+    try:
+        assert session.query(models.PlayerWeeklyStat).count() == 4
+    finally:
+        session.close()
+
+
+def test_backfill_skips_failed_events_and_does_not_cache_live_games(archive_env, monkeypatch):
+    _, _, cache_dir = archive_env
+
+    assert archive_weekly_stats.fetch_summary_cached("403", cache_dir=cache_dir)[1] is False
+    assert not (cache_dir / "summaries" / "403.json").exists()
+
+    original = archive_weekly_stats.get_json
+
+    def flaky_get_json(url, params=None, timeout=30):
+        if params and params.get("event") == "402":
+            raise RuntimeError("espn 503")
+        return original(url, params=params, timeout=timeout)
+
+    monkeypatch.setattr(archive_weekly_stats, "get_json", flaky_get_json)
+    report = archive_weekly_stats.backfill_weekly_stats(2024, [1], max_workers=2, cache_dir=cache_dir)
+
+    assert [failure["event_id"] for failure in report["failed_events"]] == ["402"]
+    assert report["created"] == 3
+    assert (cache_dir / "summaries" / "401.json").exists()
+    assert not (cache_dir / "summaries" / "402.json").exists()
@@ -1,4 +1,7 @@
+import asyncio
 import sys
+import threading
+import time
 from pathlib import Path
 
 import pandas as pd
@@ -6,11 +9,13 @@ import pytest
 from fastapi import HTTPException
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import models
 from backend.routers import draft as draft_router
+from backend.services.draft_simulation_jobs import SimulationJobQueue
 from etl.transform.monte_carlo_simulation import MonteCarloSimulationResult, build_monte_carlo_inputs_from_db
 
 
@@ -372,3 +377,165 @@ def test_simulation_uses_commissioner_league_position_limits(db_session, monkeyp
         "DEF": 1,
         "K": 0,
     }
+
+
+def _wait_for_job(queue, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        snapshot = queue.snapshot(job_id)
+        if snapshot["status"] in ("completed", "failed"):
+            return snapshot
+        time.sleep(0.01)
+    raise AssertionError(f"simulation job {job_id} did not finish")
+
+
+@pytest.fixture
+def threaded_session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    models.Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def test_simulation_jobs_coalesce_stream_progress_and_cache_results(threaded_session_factory, monkeypatch):
+    TestingSessionLocal = threaded_session_factory
+    db = TestingSessionLocal()
+    league, commissioner, owner_a, owner_b = _create_league_and_users(db)
+    db.add(models.Player(id=101, name="Player One", position="RB", nfl_team="AAA"))
+    db.add(models.DraftPick(owner_id=owner_a.id, player_id=101, league_id=league.id, amount=45.0, year=2026))
+    db.commit()
+
+    queue = SimulationJobQueue(max_workers=1)
+    monkeypatch.setattr(draft_router, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(draft_router, "get_simulation_job_queue", lambda: queue)
+    monkeypatch.setattr(draft_router, "_SIMULATION_EVENTS_POLL_SECONDS", 0.01)
+
+    release = threading.Event()
+    calls = []
+
+    def _fake_run_monte_carlo_simulation(*, config, progress=None, **_kwargs):
+        calls.append(config.iterations)
+        progress(1, [{"owner_id": owner_a.id, "projected_points": 150.0, "total_spend": 180.0}])
+        assert release.wait(5)
+        progress(2, [{"owner_id": owner_a.id, "projected_points": 130.0, "total_spend": 160.0}])
+        return MonteCarloSimulationResult(
+            draft_picks=pd.DataFrame(),
+            team_metrics=pd.DataFrame(
+                [
+                    {"iteration": 1, "owner_id": owner_a.id, "projected_points": 150.0, "total_spend": 180.0},
+                    {"iteration": 2, "owner_id": owner_a.id, "projected_points": 130.0, "total_spend": 160.0},
+                ]
+            ),
+            owner_summary=pd.DataFrame([{"owner_id": owner_a.id, "expected_total_points": 140.0}]),
+            assumptions={},
+        )
+
+    monkeypatch.setattr(draft_router, "run_monte_carlo_draft_simulation", _fake_run_monte_carlo_simulation)
+    payload = draft_router.DraftSimulationRequest(perspective_owner_id=owner_a.id, iterations=100)
+
+    first = draft_router.submit_draft_simulation_job(payload=payload, db=db, current_user=commissioner)
+    second = draft_router.submit_draft_simulation_job(payload=payload, db=db, current_user=owner_a)
+    assert first["coalesced"] is False
+    assert second == {**first, "coalesced": True, "status": second["status"]}
+
+    deadline = time.monotonic() + 5
+    while queue.snapshot(first["job_id"])["progress"]["completed_iterations"] < 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    running = draft_router.get_draft_simulation_job(job_id=first["job_id"], current_user=owner_a)
+    assert running["status"] == "running"
+    assert running["partial"]["focal_avg_projected_points"] == 150.0
+    assert running["coalesced_requests"] == 1
+    with pytest.raises(HTTPException) as exc_info:
+        draft_router.get_draft_simulation_job(job_id=first["job_id"], current_user=owner_b)
+    assert exc_info.value.status_code == 404
+
+    release.set()
+    finished = _wait_for_job(queue, first["job_id"])
+    assert finished["status"] == "completed"
+    assert finished["partial"]["focal_avg_projected_points"] == 140.0
+    assert finished["result"]["focal_owner_summary"]["expected_total_points"] == 140.0
+    assert finished["result"]["league_context"]["focal_avg_projected_points"] == 140.0
+
+    async def _collect_events():
+        return [chunk async for chunk in draft_router._simulation_job_event_stream(first["job_id"])]
+
+    events = asyncio.run(_collect_events())
+    assert len(events) == 1 and events[0].startswith("event: completed\n")
+
+    # Unchanged inputs and config: the rerun is served from the result cache.
+    rerun = draft_router.submit_draft_simulation_job(payload=payload, db=db, current_user=commissioner)
+    assert rerun["job_id"] != first["job_id"]
+    cached = _wait_for_job(queue, rerun["job_id"])
+    assert cached["cache_hit"] is True
+    assert cached["result"] == finished["result"]
+    assert calls == [100]
+
+    # New draft data changes the inputs fingerprint and forces a fresh run.
+    db.add(models.DraftPick(owner_id=owner_b.id, player_id=101, league_id=league.id, amount=30.0, year=2025))
+    db.commit()
+    fresh = draft_router.submit_draft_simulation_job(payload=payload, db=db, current_user=commissioner)
+    assert _wait_for_job(queue, fresh["job_id"])["cache_hit"] is False
+    assert calls == [100, 100]
+    db.close()
+
+
+def test_simulation_job_reports_input_errors_and_queue_limits(threaded_session_factory, monkeypatch):
+    db_session = threaded_session_factory()
+    _, commissioner, _, _ = _create_league_and_users(db_session)
+    queue = SimulationJobQueue(max_workers=1, max_pending=1)
+    monkeypatch.setattr(draft_router, "SessionLocal", threaded_session_factory)
+    monkeypatch.setattr(draft_router, "get_simulation_job_queue", lambda: queue)
+
+    # No draft history in the league: the worker surfaces the input error.
+    job = draft_router.submit_draft_simulation_job(
+        payload=draft_router.DraftSimulationRequest(iterations=60),
+        db=db_session,
+        current_user=commissioner,
+    )
+    failed = _wait_for_job(queue, job["job_id"])
+    assert failed["status"] == "failed"
+    assert failed["error_status_code"] == 400
+
+    blocker = threading.Event()
+    queue.submit("busy", lambda _job: blocker.wait(5) and {}, league_id=1, owner_id=1, requested_by_user_id=1, total_iterations=1)
+    with pytest.raises(HTTPException) as exc_info:
+        draft_router.submit_draft_simulation_job(
+            payload=draft_router.DraftSimulationRequest(iterations=70),
+            db=db_session,
+            current_user=commissioner,
+        )
+    assert exc_info.value.status_code == 429
+    blocker.set()
+    db_session.close()
+
+
+def test_coalesced_requesters_can_read_the_shared_job(threaded_session_factory, monkeypatch):
+    db_session = threaded_session_factory()
+    league, commissioner, owner_a, owner_b = _create_league_and_users(db_session)
+    queue = SimulationJobQueue(max_workers=1)
+    monkeypatch.setattr(draft_router, "get_simulation_job_queue", lambda: queue)
+
+    release = threading.Event()
+
+    def _runner(_job):
+        assert release.wait(5)
+        return {}
+
+    submit = dict(league_id=league.id, owner_id=owner_a.id, total_iterations=1)
+    job, coalesced = queue.submit("same-request", _runner, requested_by_user_id=commissioner.id, **submit)
+    shared, coalesced = queue.submit("same-request", _runner, requested_by_user_id=owner_b.id, **submit)
+    assert coalesced is True and shared is job
+
+    snapshot = draft_router.get_draft_simulation_job(job_id=job.id, current_user=owner_b)
+    assert snapshot["coalesced_requests"] == 1
+    release.set()
+    assert _wait_for_job(queue, job.id)["status"] == "completed"
+
+    queue.store_result(league.id, "inputs", "config", {"ok": True})
+    assert queue.invalidate_league(league.id) == 1
+    assert queue.cached_result(league.id, "inputs", "config") is None
+    db_session.close()
@@ -53,3 +53,31 @@ def test_calculate_optimal_missing_scores():
     opt, _ = calculate_optimal_score(roster, settings, return_lineup=True)
     # optimal: QB0 + RB14 + WR9 = 23 (no additional flex eligible)
     assert opt == 23.0
+
+
+def test_optimal_lineup_points_batch_matches_scalar():
+    import random
+
+    import numpy as np
+
+    from backend.utils.efficiency import optimal_lineup_points_batch
+
+    settings = {"starting_slots": {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "K": 1, "DEF": 0, "FLEX": 2}}
+    positions = ["QB", "QB", "RB", "RB", "RB", "WR", "WR", "WR", "WR", "TE", "TE", "K", "DEF", "LB"]
+    rng = random.Random(7)
+    rosters = []
+    for _ in range(50):
+        rosters.append(
+            [
+                {"player_id": idx + 1, "position": pos, "actual_score": rng.uniform(0, 30), "is_ir": rng.random() < 0.15}
+                for idx, pos in enumerate(positions)
+            ]
+        )
+    values = np.array(
+        [[-np.inf if p["is_ir"] else p["actual_score"] for p in roster] for roster in rosters]
+    )
+
+    totals = optimal_lineup_points_batch(values, positions, settings["starting_slots"])
+
+    expected = [calculate_optimal_score(roster, settings) for roster in rosters]
+    assert totals == pytest.approx(expected)
@@ -0,0 +1,169 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import models
+from backend.services import free_agent_pool_service
+from backend.services.player_service import get_league_free_agents
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    free_agent_pool_service.invalidate_free_agent_pool()
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        free_agent_pool_service.invalidate_free_agent_pool()
+
+
+def make_league(db):
+    league = models.League(name="L-POOL")
+    db.add(league)
+    db.commit()
+    db.refresh(league)
+    return league
+
+
+def make_user(db, league, username="pool-owner"):
+    user = models.User(username=username, hashed_password="pw", league_id=league.id)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def make_player(db, name, projected_points, position="WR"):
+    player = models.Player(name=name, position=position, nfl_team="KC", projected_points=projected_points, adp=50.0)
+    db.add(player)
+    db.commit()
+    db.refresh(player)
+    return player
+
+
+def roster(db, league, owner, player):
+    pick = models.DraftPick(league_id=league.id, owner_id=owner.id, player_id=player.id, amount=1, year=2026)
+    db.add(pick)
+    db.flush()
+    return pick
+
+
+def test_available_players_exclude_owned_and_keep_projection_order(db_session):
+    league = make_league(db_session)
+    owner = make_user(db_session, league)
+    low = make_player(db_session, "Low Projection", 40.0)
+    high = make_player(db_session, "High Projection", 120.0)
+    owned = make_player(db_session, "Owned Star", 200.0)
+    roster(db_session, league, owner, owned)
+    db_session.commit()
+
+    assert free_agent_pool_service.get_available_player_ids(db_session, league.id) == [high.id, low.id]
+    rows = free_agent_pool_service.get_available_players(db_session, league.id, limit=1)
+    assert [row.id for row in rows] == [high.id]
+    assert {p.id for p in get_league_free_agents(db_session, league.id)} == {high.id, low.id}
+
+
+def test_noted_acquisition_updates_owned_set_without_reload(db_session, monkeypatch):
+    league = make_league(db_session)
+    owner = make_user(db_session, league)
+    target = make_player(db_session, "Waiver Target", 90.0)
+    assert free_agent_pool_service.get_owned_player_ids(db_session, league.id) == set()
+
+    loads = []
+    original_loader = free_agent_pool_service._load_owned_player_ids
+    monkeypatch.setattr(
+        free_agent_pool_service,
+        "_load_owned_player_ids",
+        lambda db, league_id: loads.append(league_id) or original_loader(db, league_id),
+    )
+
+    roster(db_session, league, owner, target)
+    free_agent_pool_service.note_player_acquired(db_session, league_id=league.id, player_id=target.id)
+    db_session.commit()
+
+    assert free_agent_pool_service.get_owned_player_ids(db_session, league.id) == {target.id}
+    assert loads == []
+
+
+def test_external_roster_write_invalidates_owned_set(db_session):
+    league = make_league(db_session)
+    owner = make_user(db_session, league)
+    player = make_player(db_session, "Imported Player", 70.0)
+    assert free_agent_pool_service.get_available_player_ids(db_session, league.id) == [player.id]
+
+    # A roster import that never calls the note_* hooks.
+    roster(db_session, league, owner, player)
+    db_session.commit()
+
+    assert free_agent_pool_service.get_available_player_ids(db_session, league.id) == []
+
+
+def test_ranking_revalidates_on_swapped_values_and_position_edits(db_session, monkeypatch):
+    league = make_league(db_session)
+    first = make_player(db_session, "First", 100.0)
+    second = make_player(db_session, "Second", 50.0)
+    monkeypatch.setenv("FREE_AGENT_POOL_REVALIDATE_SECONDS", "0")
+    assert free_agent_pool_service.get_available_player_ids(db_session, league.id) == [first.id, second.id]
+
+    # same count, max id and column sums; only the row/value pairing changes
+    first.projected_points, second.projected_points = 50.0, 100.0
+    db_session.commit()
+    assert free_agent_pool_service.get_available_player_ids(db_session, league.id) == [second.id, first.id]
+
+    second.position = "K"
+    db_session.commit()
+    assert free_agent_pool_service.get_available_player_ids(db_session, league.id, positions=["WR"]) == [first.id]
+
+
+def test_ranking_stamp_is_checked_at_most_once_per_window(db_session, monkeypatch):
+    league = make_league(db_session)
+    make_player(db_session, "Steady", 80.0)
+    stamps = []
+    original_stamp = free_agent_pool_service._players_stamp
+    monkeypatch.setattr(
+        free_agent_pool_service,
+        "_players_stamp",
+        lambda db: stamps.append(1) or original_stamp(db),
+    )
+
+    for _ in range(3):
+        free_agent_pool_service.get_available_player_ids(db_session, league.id)
+
+    assert len(stamps) == 1
+
+
+def test_claim_with_drop_keeps_owned_set_cached(db_session, monkeypatch):
+    league = make_league(db_session)
+    owner = make_user(db_session, league)
+    kept, dropped, claimed = (make_player(db_session, name, 60.0) for name in ("Kept", "Dropped", "Claimed"))
+    roster(db_session, league, owner, kept)
+    drop_pick = roster(db_session, league, owner, dropped)
+    db_session.commit()
+    assert free_agent_pool_service.get_owned_player_ids(db_session, league.id) == {kept.id, dropped.id}
+
+    loads = []
+    original_loader = free_agent_pool_service._load_owned_player_ids
+    monkeypatch.setattr(
+        free_agent_pool_service,
+        "_load_owned_player_ids",
+        lambda db, league_id: loads.append(league_id) or original_loader(db, league_id),
+    )
+
+    db_session.delete(drop_pick)
+    roster(db_session, league, owner, claimed)
+    free_agent_pool_service.note_roster_change(
+        db_session, league_id=league.id, acquired=[claimed.id], released=[dropped.id]
+    )
+    db_session.commit()
+
+    assert free_agent_pool_service.get_owned_player_ids(db_session, league.id) == {kept.id, claimed.id}
+    assert loads == []
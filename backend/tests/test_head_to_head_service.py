@@ -0,0 +1,228 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import models
+from backend.routers.analytics import get_rivalry_graph
+from backend.routers.league import get_all_time_series_records
+from backend.services import head_to_head_service
+from backend.services.scoring_service import recalculate_league_week_scores
+from backend.services.week_finalization_service import finalize_league_week
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _seed_league(db):
+    league = models.League(name="Rivalry League")
+    db.add(league)
+    db.flush()
+    alice = models.User(username="alice", hashed_password="pw", league_id=league.id, team_name="Alpha")
+    bob = models.User(username="bob", hashed_password="pw", league_id=league.id, team_name="Bravo")
+    db.add_all([alice, bob])
+    db.commit()
+    return league, alice, bob
+
+
+def _matchup(league, season, week, home, away, home_score, away_score, completed=True):
+    return models.Matchup(
+        league_id=league.id,
+        season=season,
+        week=week,
+        home_team_id=home.id,
+        away_team_id=away.id,
+        home_score=home_score,
+        away_score=away_score,
+        is_completed=completed,
+    )
+
+
+def test_season_aggregates_track_record_points_margin_and_streaks(db_session):
+    league, alice, bob = _seed_league(db_session)
+    db_session.add_all(
+        [
+            # 2022: bob, alice, alice -> alice closes on a 2-game streak
+            _matchup(league, 2022, 1, alice, bob, 90, 110),
+            _matchup(league, 2022, 5, bob, alice, 80, 120.5),
+            _matchup(league, 2022, 9, alice, bob, 101, 100),
+            # 2023: alice sweeps -> streak carries across seasons to 4
+            _matchup(league, 2023, 2, bob, alice, 70, 95),
+            _matchup(league, 2023, 7, alice, bob, 88, 87),
+            # 2024: tie breaks it, then bob wins
+            _matchup(league, 2024, 3, alice, bob, 99, 99),
+            _matchup(league, 2024, 8, bob, alice, 130, 90),
+            _matchup(league, 2024, 12, alice, bob, 0, 0, completed=False),
+        ]
+    )
+    db_session.commit()
+
+    written = head_to_head_service.refresh_head_to_head_aggregates(db_session, league_id=league.id)
+    db_session.commit()
+    assert written == 3
+    assert head_to_head_service.head_to_head_store_ready(db_session, league_id=league.id)
+
+    row_2022 = (
+        db_session.query(models.HeadToHeadSeasonAggregate)
+        .filter(models.HeadToHeadSeasonAggregate.season == 2022)
+        .one()
+    )
+    assert (row_2022.owner_a_id, row_2022.owner_b_id) == (alice.id, bob.id)
+    assert (row_2022.games, row_2022.a_wins, row_2022.b_wins, row_2022.ties) == (3, 2, 1, 0)
+    assert row_2022.a_points == pytest.approx(311.5)
+    assert row_2022.b_points == pytest.approx(290.0)
+    assert (row_2022.biggest_margin, row_2022.biggest_margin_winner_id, row_2022.biggest_margin_week) == (40.5, alice.id, 5)
+    assert (row_2022.opening_streak_owner_id, row_2022.opening_streak_length) == (bob.id, 1)
+    assert (row_2022.closing_streak_owner_id, row_2022.closing_streak_length) == (alice.id, 2)
+
+    pair = head_to_head_service.summarize_pairs(
+        head_to_head_service.load_head_to_head_seasons(db_session, league_id=league.id)
+    )[(alice.id, bob.id)]
+    assert (pair["games"], pair["a_wins"], pair["b_wins"], pair["ties"]) == (7, 4, 2, 1)
+    assert (pair["longest_streak_owner_id"], pair["longest_streak_length"]) == (alice.id, 4)
+    assert (pair["current_streak_owner_id"], pair["current_streak_length"]) == (bob.id, 1)
+    assert (pair["biggest_margin"], pair["biggest_margin_season"]) == (40.5, 2022)
+
+
+def test_store_and_per_request_fallback_agree_and_refresh_is_incremental(db_session):
+    league, alice, bob = _seed_league(db_session)
+    db_session.add_all(
+        [
+            _matchup(league, 2023, 1, alice, bob, 100, 90),
+            _matchup(league, 2024, 1, bob, alice, 100, 90),
+        ]
+    )
+    db_session.commit()
+
+    # Nothing stored yet: rows are aggregated from matchups for the request.
+    assert not head_to_head_service.head_to_head_store_ready(db_session, league_id=league.id)
+    fallback = head_to_head_service.load_head_to_head_seasons(db_session, league_id=league.id)
+
+    head_to_head_service.refresh_head_to_head_aggregates(db_session, league_id=league.id)
+    db_session.commit()
+    stored = head_to_head_service.load_head_to_head_seasons(db_session, league_id=league.id)
+    assert stored == fallback
+
+    # A new 2024 result goes stale until its season is refreshed; 2023 is untouched.
+    db_session.add(_matchup(league, 2024, 2, alice, bob, 120, 60))
+    db_session.commit()
+    assert not head_to_head_service.head_to_head_store_ready(db_session, league_id=league.id)
+    row_2023_id = (
+        db_session.query(models.HeadToHeadSeasonAggregate.id)
+        .filter(models.HeadToHeadSeasonAggregate.season == 2023)
+        .scalar()
+    )
+    head_to_head_service.refresh_head_to_head_aggregates(db_session, league_id=league.id, seasons=[2024])
+    db_session.commit()
+    assert head_to_head_service.head_to_head_store_ready(db_session, league_id=league.id)
+    assert (
+        db_session.query(models.HeadToHeadSeasonAggregate.id)
+        .filter(models.HeadToHeadSeasonAggregate.season == 2023)
+        .scalar()
+        == row_2023_id
+    )
+
+
+def test_rivalry_graph_and_all_time_series_served_from_store(db_session):
+    league, alice, bob = _seed_league(db_session)
+    db_session.add_all(
+        [
+            _matchup(league, 2023, 1, alice, bob, 100, 90),
+            _matchup(league, 2023, 2, bob, alice, 100, 80),
+            _matchup(league, 2024, 1, alice, bob, 110, 70),
+        ]
+    )
+    db_session.commit()
+    head_to_head_service.refresh_head_to_head_aggregates(db_session, league_id=league.id)
+    db_session.commit()
+
+    graph = get_rivalry_graph(league.id, season=2024, db=db_session)
+    edge = graph["edges"][0]
+    assert edge["games"] == 3
+    assert edge["wins"] == {alice.id: 2, bob.id: 1}
+    assert edge["current_streak"] == {"owner_id": alice.id, "length": 1}
+    assert edge["biggest_margin"]["margin"] == 40.0
+
+    response = get_all_time_series_records(league_id=league.id, db=db_session, current_user=alice)
+    assert response.count == 4
+    alice_2023 = next(
+        row for row in response.records if row["perspective_owner_id"] == alice.id and row["series_season"] == 2023
+    )
+    assert alice_2023["season_w_l_t_raw"] == "1-1-0"
+    assert alice_2023["total_w_l_t_raw"] == "2-1-0"
+    assert alice_2023["opponent_owner_name"] == "bob"
+    assert response.records[0]["perspective_owner_id"] == alice.id
+
+    # MFL series facts for a season without matchups keep the MFL records.
+    db_session.add(
+        models.MflHtmlRecordFact(
+            dataset_key="html_all_time_series_normalized",
+            season=2010,
+            target_league_id=league.id,
+            league_id=str(league.id),
+            normalization_version="v1",
+            row_fingerprint="series-2010",
+            record_json={"series_season": 2010, "opponent_franchise_raw": "Old Team", "total_pct": 0.5},
+        )
+    )
+    db_session.commit()
+    response = get_all_time_series_records(league_id=league.id, db=db_session, current_user=alice)
+    assert response.count == 1
+    assert response.records[0]["series_season"] == 2010
+
+
+def test_week_rescore_only_touches_the_requested_season(db_session):
+    league, alice, bob = _seed_league(db_session)
+    old_game = _matchup(league, 2024, 3, alice, bob, 100, 90)
+    db_session.add_all([old_game, _matchup(league, 2025, 3, alice, bob, 0, 0, completed=False)])
+    db_session.commit()
+    head_to_head_service.refresh_head_to_head_aggregates(db_session, league_id=league.id)
+    db_session.commit()
+    row_2024_id = (
+        db_session.query(models.HeadToHeadSeasonAggregate.id)
+        .filter(models.HeadToHeadSeasonAggregate.season == 2024)
+        .scalar()
+    )
+
+    results = recalculate_league_week_scores(db_session, league_id=league.id, week=3, season=2025)
+    db_session.commit()
+
+    assert [row["season"] for row in results] == [2025]
+    db_session.refresh(old_game)
+    assert (old_game.home_score, old_game.away_score) == (100, 90)
+    seasons = {
+        row.season: row.id for row in db_session.query(models.HeadToHeadSeasonAggregate).all()
+    }
+    assert set(seasons) == {2024, 2025} and seasons[2024] == row_2024_id
+
+
+def test_live_rescore_of_completed_week_waits_for_finalization(db_session):
+    league, alice, bob = _seed_league(db_session)
+    db_session.add(_matchup(league, 2025, 4, alice, bob, 100, 90))
+    db_session.commit()
+    head_to_head_service.refresh_head_to_head_aggregates(db_session, league_id=league.id)
+    db_session.commit()
+
+    # no stats loaded, so a rescore zeroes the already completed matchup
+    recalculate_league_week_scores(db_session, league_id=league.id, week=4, season=2025)
+    db_session.commit()
+    row = db_session.query(models.HeadToHeadSeasonAggregate).one()
+    assert (row.a_points, row.b_points) == (100, 90)
+
+    finalize_league_week(db_session, league_id=league.id, week=4, season=2025)
+    db_session.commit()
+    row = db_session.query(models.HeadToHeadSeasonAggregate).one()
+    assert (row.a_points, row.b_points) == (0, 0)
@@ -15,6 +15,7 @@ from backend.services.keeper_service import (
     project_budget,
     lock_keepers_for_league,
     compute_surplus_recommendations,
+    evaluate_league_keepers,
     veto_keepers,
     reset_keepers,
     send_window_open_notifications,
@@ -184,6 +185,54 @@ def test_recommendations_and_years(db_session, monkeypatch):
     assert recs[0]["recommended"] is True
 
 
+def test_league_keeper_evaluation_uses_fixed_query_count(db_session):
+    from sqlalchemy import event
+    from backend import models_draft_value as dv_models
+
+    league = make_league(db_session)
+    make_rules(db_session, league, max_keepers=1, max_years_per_player=2, waiver_policy=True)
+    owners = [make_user(db_session, league, f"eval-{index}") for index in range(4)]
+    for owner in owners:
+        owner.future_draft_budget = 200
+        cheap, pricey = make_player(db_session), make_player(db_session)
+        db_session.add_all(
+            [
+                models.Keeper(league_id=league.id, owner_id=owner.id, player_id=cheap.id, season=2026,
+                              keep_cost=10, years_kept_count=0, status="pending"),
+                models.Keeper(league_id=league.id, owner_id=owner.id, player_id=pricey.id, season=2026,
+                              keep_cost=30, years_kept_count=2, status="locked"),
+                dv_models.DraftValue(player_id=cheap.id, season=2026, avg_auction_value=25.0),
+                dv_models.PlatformProjection(player_id=pricey.id, season=2026, source="test", auction_value=70.0),
+            ]
+        )
+        log_transaction(db_session, league.id, cheap.id, None, owner.id, "waiver_add")
+    db_session.commit()
+
+    statements = []
+
+    def _count(*_args, **_kwargs):
+        statements.append(1)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        evaluation = evaluate_league_keepers(db_session, league.id, 2026)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(statements) <= 8
+    assert set(evaluation) == {owner.id for owner in owners}
+    entry = evaluation[owners[0].id]
+    assert entry["effective_budget"] == 200
+    assert entry["estimated_budget"] == 190
+    assert entry["ineligible"] == [entry["keepers"][1]["player_id"]]
+    cheap_row, pricey_row = entry["keepers"]
+    assert (cheap_row["projected_value"], cheap_row["surplus"], cheap_row["flag_waiver"]) == (25.0, 15.0, True)
+    assert (pricey_row["projected_value"], pricey_row["is_eligible"]) == (70.0, False)
+    # the higher-surplus keeper is out of years, so the one slot goes to the other
+    assert [r["player_id"] for r in entry["recommended"]] == [cheap_row["player_id"]]
+
+
 def test_veto_and_reset(db_session):
     league = make_league(db_session)
     owner = make_user(db_session, league, "owner2")
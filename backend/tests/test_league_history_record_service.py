@@ -0,0 +1,115 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import models
+from backend.routers.league import get_career_records, get_league_champions
+from backend.services import league_history_enrichment_service, league_history_record_service
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def make_league(db):
+    league = models.League(name="History League")
+    db.add(league)
+    db.commit()
+    db.refresh(league)
+    return league
+
+
+def make_user(db, league):
+    user = models.User(username="historian", hashed_password="pw", league_id=league.id)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def add_fact(db, league, dataset_key, record_json, *, fingerprint, project=True, source_league_id=None):
+    fact = models.MflHtmlRecordFact(
+        dataset_key=dataset_key,
+        target_league_id=None if source_league_id else league.id,
+        league_id=source_league_id,
+        row_fingerprint=fingerprint,
+        record_json=record_json,
+    )
+    db.add(fact)
+    if project:
+        db.add(league_history_record_service.build_history_record_row(fact))
+    return fact
+
+
+def test_row_values_follow_endpoint_fallback_keys():
+    values = league_history_record_service.history_record_row_values(
+        {"season": "2019", "points": "nan", "value": "41.5", "team_name": "Step Brothers!"}
+    )
+
+    assert values["record_year"] == 2019
+    assert values["points"] == 41.5
+    assert values["team_key"] == "step brothers"
+    assert league_history_record_service.history_record_row_values("not-a-dict")["record_year"] == -1
+
+
+def test_champions_page_matches_legacy_sort_and_paginates(db_session):
+    league = make_league(db_session)
+    user = make_user(db_session, league)
+    dataset = "html_league_champions_normalized"
+    payloads = [
+        {"record_year": 2019, "owner_name": "A"},
+        {"season": 2021, "owner_name": "B"},
+        {"record_year": 2019, "owner_name": "C"},
+        {"owner_name": "no year"},
+        {"record_year": "2023", "owner_name": "D"},
+    ]
+    for index, payload in enumerate(payloads):
+        add_fact(db_session, league, dataset, payload, fingerprint=f"c{index}")
+    # Matched through the MFL league id string rather than target_league_id.
+    add_fact(db_session, league, dataset, {"record_year": 2020, "owner_name": "E"}, fingerprint="c-src", source_league_id=str(league.id))
+    db_session.commit()
+
+    facts = db_session.query(models.MflHtmlRecordFact).order_by(models.MflHtmlRecordFact.id).all()
+    expected = league_history_enrichment_service.sorted_record_json(facts, sort_keys=["record_year", "season"])
+
+    assert league_history_record_service.history_read_model_ready(db_session, dataset)
+    response = get_league_champions(league_id=league.id, limit=None, offset=0, db=db_session, current_user=user)
+    assert response.records == expected
+    assert [r["owner_name"] for r in expected] == ["D", "B", "E", "A", "C", "no year"]
+
+    page = get_league_champions(league_id=league.id, limit=2, offset=2, db=db_session, current_user=user)
+    assert [r["owner_name"] for r in page.records] == ["E", "A"]
+
+
+def test_unprojected_facts_fall_back_to_json_sort(db_session):
+    league = make_league(db_session)
+    user = make_user(db_session, league)
+    dataset = "html_career_records_normalized"
+    add_fact(db_session, league, dataset, {"wins": 40, "owner_name": "A"}, fingerprint="w1")
+    add_fact(db_session, league, dataset, {"wins": 90, "owner_name": "B"}, fingerprint="w2", project=False)
+    add_fact(db_session, league, dataset, {"season": 2001, "owner_name": "C"}, fingerprint="w3")
+    db_session.commit()
+
+    assert not league_history_record_service.history_read_model_ready(db_session, dataset)
+    fallback = get_career_records(league_id=league.id, limit=None, offset=0, db=db_session, current_user=user)
+
+    league_history_record_service.rebuild_history_record_rows(db_session, dataset_key=dataset)
+    db_session.commit()
+
+    assert league_history_record_service.history_read_model_ready(db_session, dataset)
+    projected = get_career_records(league_id=league.id, limit=None, offset=0, db=db_session, current_user=user)
+    assert [r["owner_name"] for r in projected.records] == ["C", "B", "A"]
+    assert projected.records == fallback.records
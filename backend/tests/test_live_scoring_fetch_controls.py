@@ -48,6 +48,7 @@ def test_summary_fetch_persists_raw_payload_snapshot(monkeypatch, tmp_path):
         return _FakeResponse(payload)
 
     monkeypatch.setenv("LIVE_SCORING_STORE_RAW_RESPONSES", "1")
+    monkeypatch.setenv("LIVE_SCORING_RAW_RESPONSE_FORMAT", "files")
     monkeypatch.setenv("LIVE_SCORING_RAW_RESPONSE_DIR", str(tmp_path))
     monkeypatch.setenv("LIVE_SCORING_CACHE_TTL_SECONDS", "0")
     monkeypatch.setattr(ingest.requests, "get", fake_get)
@@ -58,6 +59,69 @@ def test_summary_fetch_persists_raw_payload_snapshot(monkeypatch, tmp_path):
     assert raw_path is not None
     stored = json.loads(Path(raw_path).read_text(encoding="utf-8"))
     assert stored["header"]["id"] == "401772001"
+    assert ingest.load_raw_payload(raw_path) == stored
+
+
+def test_raw_payloads_archive_to_compressed_segments_with_dedupe(monkeypatch, tmp_path):
+    payloads = [
+        {"events": [{"id": "401772001", "status": "pre"}]},
+        {"events": [{"id": "401772001", "status": "pre"}]},
+        {"events": [{"id": "401772001", "status": "live", "home": 7}]},
+    ]
+    responses = iter(payloads)
+
+    def fake_get(url, timeout=30):
+        return _FakeResponse(next(responses))
+
+    monkeypatch.setenv("LIVE_SCORING_STORE_RAW_RESPONSES", "1")
+    monkeypatch.delenv("LIVE_SCORING_RAW_RESPONSE_FORMAT", raising=False)
+    monkeypatch.setenv("LIVE_SCORING_RAW_RESPONSE_DIR", str(tmp_path))
+    monkeypatch.setenv("LIVE_SCORING_CACHE_TTL_SECONDS", "0")
+    monkeypatch.setenv("LIVE_SCORING_RATE_LIMIT_SECONDS", "0")
+    monkeypatch.setattr(ingest.requests, "get", fake_get)
+
+    raw_paths = [
+        ingest.fetch_scoreboard_payload_with_diagnostics(2026, week=3)[1]["raw_response_path"]
+        for _ in payloads
+    ]
+
+    # Identical payloads share one stored copy; every capture is indexed.
+    assert raw_paths[0] == raw_paths[1] != raw_paths[2]
+    segments = list(tmp_path.glob("*.jsonl.gz"))
+    assert len(segments) == 1
+    assert not list(tmp_path.glob("*.json"))
+    assert [ingest.load_raw_payload(path) for path in raw_paths] == payloads
+
+    replayed = list(ingest.replay_raw_payloads(key="2026_3"))
+    assert [payload for _, payload in replayed] == payloads
+    assert [entry["deduplicated"] for entry, _ in replayed] == [False, True, False]
+    assert [payload for _, payload in ingest.replay_raw_payloads(include_duplicates=False)] == [payloads[0], payloads[2]]
+
+    # A segment is a plain concatenated-gzip JSONL file.
+    import gzip
+
+    lines = gzip.decompress(segments[0].read_bytes()).decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [payloads[0], payloads[2]]
+
+
+def test_raw_archive_rolls_segments_and_prunes_whole_segments(tmp_path):
+    from datetime import datetime, timedelta, timezone
+
+    from backend.services.raw_payload_archive import RawPayloadArchive
+
+    archive = RawPayloadArchive(tmp_path, segment_max_bytes=1)
+    start = datetime(2026, 9, 7, tzinfo=timezone.utc)
+    for week in range(3):
+        archive.append({"week": week}, source="scoreboard", key=str(week), captured_at=start + timedelta(weeks=week))
+        archive.append({"week": week, "n": 2}, source="scoreboard", key=str(week), captured_at=start + timedelta(weeks=week))
+
+    assert archive.segments() == ["2026W37", "2026W37-001", "2026W38", "2026W38-001", "2026W39", "2026W39-001"]
+
+    result = archive.prune(max_segments=2)
+    assert result["deleted_for_count"] == 4
+    assert archive.segments() == ["2026W39", "2026W39-001"]
+    assert [payload for _, payload in archive.replay()] == [{"week": 2}, {"week": 2, "n": 2}]
+    assert not list(tmp_path.glob("2026W37*"))
 
 
 def test_rate_limit_sleeps_between_same_source_calls(monkeypatch):
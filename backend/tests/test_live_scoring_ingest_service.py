@@ -217,6 +217,67 @@ def test_upsert_player_weekly_stats_from_payload_persists_rows_by_espn_id():
         db.close()
 
 
+def test_upserts_write_only_changed_rows_and_report_their_ids():
+    db = _db_session()
+    try:
+        _seed_league_for_reconciliation(db)
+        games = upsert_nfl_games_from_payload(db, _payload_with_leaders(home_score=24, away_score=17))
+        stats = upsert_player_weekly_stats_from_payload(
+            db,
+            _payload_with_leaders(home_score=24, away_score=17),
+            season_override=2026,
+            week_override=1,
+        )
+        game_id = db.query(models.NFLGame.id).scalar()
+        stat_ids = sorted(row_id for (row_id,) in db.query(models.PlayerWeeklyStat.id))
+        assert games["changed_game_ids"] == [game_id]
+        assert stats["changed_stat_ids"] == stat_ids
+
+        same_games = upsert_nfl_games_from_payload(db, _payload_with_leaders(home_score=24, away_score=17))
+        same_stats = upsert_player_weekly_stats_from_payload(
+            db,
+            _payload_with_leaders(home_score=24, away_score=17),
+            season_override=2026,
+            week_override=1,
+        )
+        assert (same_games["inserted"], same_games["updated"], same_games["unchanged"]) == (0, 0, 1)
+        assert same_games["changed_game_ids"] == []
+        assert (same_stats["inserted"], same_stats["updated"], same_stats["unchanged"]) == (0, 0, 2)
+        assert same_stats["affected_player_ids"] == []
+        assert same_stats["changed_stat_ids"] == []
+
+        payload = _payload_with_leaders(home_score=24, away_score=17)
+        payload["events"][0]["competitions"][0]["competitors"][0]["leaders"][0]["leaders"][0]["value"] = 20.5
+        changed = upsert_player_weekly_stats_from_payload(db, payload, season_override=2026, week_override=1)
+        assert (changed["updated"], changed["unchanged"]) == (1, 1)
+        assert len(changed["changed_stat_ids"]) == 1
+        assert len(changed["affected_player_ids"]) == 1
+        assert db.query(models.PlayerWeeklyStat).count() == 2
+    finally:
+        db.close()
+
+
+def test_bulk_upsert_falls_back_without_on_conflict_support(monkeypatch):
+    db = _db_session()
+    try:
+        upsert_nfl_games_from_payload(db, _payload(home_score=7, away_score=0))
+        existing_id = db.query(models.NFLGame.id).scalar()
+        monkeypatch.setattr(db.get_bind().dialect, "name", "generic")
+
+        second = _payload(home_score=14, away_score=0)
+        added = _payload(home_score=3, away_score=3)["events"][0]
+        added["id"] = "401888002"
+        second["events"].append(added)
+        result = upsert_nfl_games_from_payload(db, second)
+
+        assert (result["inserted"], result["updated"]) == (1, 1)
+        new_id = db.query(models.NFLGame.id).filter(models.NFLGame.event_id == "401888002").scalar()
+        assert result["changed_game_ids"] == sorted([existing_id, new_id])
+        assert db.query(models.NFLGame.home_score).filter(models.NFLGame.id == existing_id).scalar() == 14
+    finally:
+        db.close()
+
+
 def test_reconcile_ingested_stats_and_matchups_recalculates_scores_for_affected_starters():
     db = _db_session()
     try:
@@ -323,3 +384,95 @@ def test_run_live_ingest_persists_event_and_skips_duplicate(monkeypatch):
         assert events[0].raw_response_path == "backend/data/ingest_raw/fake.json"
     finally:
         verify_db.close()
+
+
+def test_replay_harness_feeds_archived_scoreboards_through_ingest(monkeypatch, tmp_path):
+    from datetime import datetime, timedelta, timezone
+
+    from backend.scripts.replay_live_scoring import run_live_scoring_replay
+    from backend.services.raw_payload_archive import RawPayloadArchive
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+
+    seed_db = TestingSessionLocal()
+    try:
+        _seed_league_for_reconciliation(seed_db)
+    finally:
+        seed_db.close()
+
+    monkeypatch.setattr(ingest, "SessionLocal", TestingSessionLocal)
+    # Other suites swap this attribute out without restoring it.
+    monkeypatch.setattr(ingest, "run_live_scoreboard_ingest_with_controls", run_live_scoreboard_ingest_with_controls)
+
+    def fail_fetch(**kwargs):
+        raise AssertionError("replay must not fetch")
+
+    monkeypatch.setattr(ingest, "fetch_scoreboard_payload_with_diagnostics", fail_fetch)
+
+    archive = RawPayloadArchive(tmp_path)
+    captured_at = datetime(2026, 9, 13, 17, 0, tzinfo=timezone.utc)
+    for offset, scores in enumerate([(7, 0), (7, 0), (14, 3)]):
+        archive.append(
+            _payload_with_leaders(*scores),
+            source="espn_scoreboard_primary",
+            key="2026_1",
+            captured_at=captured_at + timedelta(seconds=20 * offset),
+        )
+    archive.append({"events": []}, source="espn_summary_primary", key="401888001")
+
+    report = run_live_scoring_replay(raw_root=str(tmp_path))
+
+    assert report["frames_found"] == 3
+    assert report["frames_failed"] == 0
+    assert report["mode_counts"] == {"apply": 2, "apply_skipped": 1}
+    assert report["publishes"] == 2
+    assert report["end_to_end_publish_ms"]["count"] == 2
+    assert report["stage_latency_ms"]["upsert_games"]["count"] == 2
+    assert report["stage_latency_ms"]["normalize"]["count"] == 3
+    assert report["queries"]["total"] > 0
+    assert report["queries"]["by_stage"]["reconcile"] > 0
+
+    verify_db = TestingSessionLocal()
+    try:
+        assert verify_db.query(models.LiveScoringIngestEvent).count() == 2
+    finally:
+        verify_db.close()
+
+
+def test_run_live_ingest_reports_pregame_kickoffs_from_nfl_games(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    seed_db = TestingSessionLocal()
+    try:
+        seed_db.add(models.NFLGame(event_id="401888001", season=2026, week=1, kickoff="2026-09-10T21:25:00+00:00"))
+        seed_db.commit()
+    finally:
+        seed_db.close()
+
+    monkeypatch.setattr(ingest, "SessionLocal", TestingSessionLocal)
+
+    payload = _payload(home_score=0, away_score=0)
+    payload["events"][0]["competitions"][0]["status"]["type"]["name"] = "STATUS_SCHEDULED"
+    result = run_live_scoreboard_ingest_with_controls(
+        year=2026,
+        week=1,
+        dry_run=True,
+        inspect_event_contracts_enabled=False,
+        scoreboard_payload=payload,
+    )
+
+    assert result["game_states"] == {"401888001": "pre"}
+    # The stored (possibly rescheduled) kickoff wins over the scoreboard date.
+    assert result["game_kickoffs"] == {"401888001": "2026-09-10T21:25:00+00:00"}
+    assert "kickoffs" in result["stage_timings_ms"]
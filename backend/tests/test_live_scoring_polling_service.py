@@ -130,3 +130,85 @@ def test_summarize_poll_cycles_counts_statuses(monkeypatch, tmp_path):
     assert summary["status_counts"]["failed"] == 1
     assert summary["mode_counts"]["apply"] == 1
     assert summary["mode_counts"]["apply_skipped"] == 1
+
+
+def test_plan_next_poll_follows_game_phases_and_kickoffs():
+    from datetime import datetime, timedelta, timezone
+
+    from backend.services.live_scoring_schedule import plan_next_poll
+
+    now = datetime(2026, 9, 13, 15, 0, tzinfo=timezone.utc)
+    settings = {
+        "now": now,
+        "active_interval": 20,
+        "idle_interval": 90,
+        "pregame_lead_seconds": 600,
+        "max_sleep_seconds": 3 * 3600,
+        "final_interval": 3600,
+    }
+    early = (now + timedelta(hours=2)).isoformat()
+    late = (now + timedelta(hours=5)).isoformat()
+
+    live = plan_next_poll({"401": "live", "402": "pre"}, {"402": early}, **settings)
+    assert (live.reason, live.interval_seconds, live.live_event_ids) == ("games_in_progress", 20, ["401"])
+
+    waiting = plan_next_poll({"401": "pre", "402": "pre"}, {"401": late, "402": early}, **settings)
+    assert waiting.reason == "awaiting_kickoff"
+    assert waiting.interval_seconds == 2 * 3600 - 600
+    assert waiting.next_kickoff == now + timedelta(hours=2)
+
+    capped = plan_next_poll({"402": "pre"}, {"402": late}, **settings)
+    assert capped.interval_seconds == 3 * 3600
+
+    window = plan_next_poll({"402": "pre"}, {"402": (now + timedelta(minutes=5)).isoformat()}, **settings)
+    assert (window.reason, window.interval_seconds) == ("kickoff_window", 20)
+
+    assert plan_next_poll({"401": "final"}, {}, **settings).reason == "slate_complete"
+    assert plan_next_poll({"401": "final"}, {}, **settings).interval_seconds == 3600
+    assert plan_next_poll({"402": "pre"}, {}, **settings).reason == "kickoff_unknown"
+    postponed = plan_next_poll({"402": "pre"}, {"402": (now - timedelta(hours=8)).isoformat()}, **settings)
+    assert (postponed.reason, postponed.interval_seconds) == ("kickoff_unknown", 90)
+
+
+def test_poll_cycle_sleeps_until_kickoff_window(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    start = datetime(2026, 9, 13, 15, 0, tzinfo=timezone.utc)
+    kickoff = (start + timedelta(hours=2)).isoformat()
+    calls = []
+
+    def fake_ingest(**kwargs):
+        calls.append(kwargs)
+        return {
+            "mode": "apply_skipped",
+            "scoreboard_fingerprint": "abc",
+            "game_states": {"401": "pre"},
+            "game_kickoffs": {"401": kickoff},
+            "change_detected": False,
+            "downstream_updates_triggered": False,
+        }
+
+    clock = {"now": start.timestamp()}
+    monkeypatch.setenv("LIVE_SCORING_POLL_PREGAME_LEAD_SECONDS", "600")
+    monkeypatch.setattr(polling, "run_live_scoreboard_ingest_with_controls", fake_ingest)
+    monkeypatch.setattr(polling, "_append_poll_cycle_log", lambda entry: None)
+    monkeypatch.setattr(polling.time, "time", lambda: clock["now"])
+    polling._RUNTIME_STATE.clear()
+
+    first = polling.run_live_scoring_poll_cycle(year=2026, week=2)
+    assert first["poll_plan"]["reason"] == "awaiting_kickoff"
+    assert first["next_interval_seconds"] == 2 * 3600 - 600
+    assert calls[0]["event_contracts_phases"] == polling.ACTIVE_PHASES
+
+    # Well past the idle interval, but still before the kickoff window.
+    clock["now"] += 3600
+    skipped = polling.run_live_scoring_poll_cycle(year=2026, week=2)
+    assert skipped["status"] == "skipped"
+    assert skipped["next_poll_reason"] == "awaiting_kickoff"
+    assert len(calls) == 1
+
+    clock["now"] = start.timestamp() + 2 * 3600 - 600
+    polled = polling.run_live_scoring_poll_cycle(year=2026, week=2)
+    assert polled["status"] == "success"
+    assert polled["poll_plan"]["reason"] == "kickoff_window"
+    assert len(calls) == 2
@@ -0,0 +1,87 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.core import metrics
+
+pytestmark = pytest.mark.skipif(not metrics.PROMETHEUS_ENABLED, reason="prometheus_client not installed")
+
+
+def _sample(name, labels):
+    from prometheus_client import REGISTRY
+
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_request_metrics_are_recorded_per_route_template_with_query_counts():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine("sqlite:///:memory:")
+    metrics.instrument_engine(engine)
+    metrics.instrument_engine(engine)  # idempotent
+    app = FastAPI()
+    app.middleware("http")(metrics.request_metrics_middleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        return {"item_id": item_id, "db": metrics.current_request_db_stats()}
+
+    labels = {"method": "GET", "route": "/items/{item_id}"}
+    requests_before = _sample("ffpi_http_requests_total", {**labels, "status": "200"})
+    queries_before = _sample("ffpi_db_queries_per_request_sum", labels)
+
+    with TestClient(app) as test_client:
+        assert test_client.get("/items/1").json()["db"]["queries"] == 2
+        test_client.get("/items/2")
+
+    assert _sample("ffpi_http_requests_total", {**labels, "status": "200"}) == requests_before + 2
+    assert _sample("ffpi_db_queries_per_request_sum", labels) == queries_before + 4
+
+
+def test_metrics_endpoint_exposes_request_latency(client):
+    client.get("/")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert 'ffpi_http_request_latency_seconds_count{method="GET",route="/"}' in response.text
+
+
+def test_unmatched_paths_share_one_route_label(client):
+    labels = {"method": "GET", "route": metrics.UNMATCHED_ROUTE, "status": "404"}
+    before = _sample("ffpi_http_requests_total", labels)
+
+    client.get("/no-such-path/123")
+    client.get("/no-such-path/456")
+
+    assert _sample("ffpi_http_requests_total", labels) == before + 2
+
+
+def test_metrics_endpoint_requires_configured_token(client, monkeypatch):
+    monkeypatch.setenv("METRICS_AUTH_TOKEN", "scrape-secret")
+
+    assert client.get("/metrics").status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+
+
+def test_observe_stage_records_outcome():
+    ok_before = _sample("ffpi_stage_latency_seconds_count", {"stage": "test.stage", "outcome": "ok"})
+    error_before = _sample("ffpi_stage_latency_seconds_count", {"stage": "test.stage", "outcome": "error"})
+
+    with metrics.observe_stage("test.stage"):
+        pass
+    with pytest.raises(RuntimeError):
+        with metrics.observe_stage("test.stage"):
+            raise RuntimeError("boom")
+
+    assert _sample("ffpi_stage_latency_seconds_count", {"stage": "test.stage", "outcome": "ok"}) == ok_before + 1
+    assert _sample("ffpi_stage_latency_seconds_count", {"stage": "test.stage", "outcome": "error"}) == error_before + 1
@@ -0,0 +1,147 @@
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import models
+from backend.scripts import load_mfl_html_normalized, mfl_html_pipeline
+from backend.scripts.normalize_mfl_html_records import run_normalize_mfl_html_records
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    models.Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(load_mfl_html_normalized, "SessionLocal", factory)
+    monkeypatch.setattr(mfl_html_pipeline, "SessionLocal", factory)
+    return factory
+
+
+def _shared(season, endpoint):
+    return {
+        "season": season,
+        "league_id": "11422",
+        "source_system": "mfl_html",
+        "source_endpoint": endpoint,
+        "source_url": f"https://example.test/{endpoint}",
+        "extracted_at_utc": "2026-03-19T00:00:00Z",
+    }
+
+
+def _write_extract_root(root):
+    for season in (2023, 2024):
+        awards = root / "league_awards" / f"{season}.csv"
+        awards.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(
+            [
+                {**_shared(season, "league_awards"), "report_season": season, "award_title": "MVP", "franchise": "Tuamanji"},
+                {**_shared(season, "league_awards"), "report_season": season, "award_title": "Rookie", "franchise": None},
+            ]
+        ).to_csv(awards, index=False)
+
+        records = root / "franchise_records" / f"{season}.csv"
+        records.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(
+            [
+                {**_shared(season, "franchise_records"), "value": "1", "franchise": "Step Brothers", "year": season, "week": 3, "pts": "1,204.5"},
+                {**_shared(season, "franchise_records"), "value": "2", "franchise": "Tuamanji", "year": season, "week": 9, "pts": 198.25},
+            ]
+        ).to_csv(records, index=False)
+
+
+def _fact_fingerprints(factory):
+    session = factory()
+    try:
+        return sorted(
+            (row.dataset_key, row.row_fingerprint)
+            for row in session.query(models.MflHtmlRecordFact).all()
+        )
+    finally:
+        session.close()
+
+
+def test_row_fingerprints_match_per_row_fingerprint():
+    frame = pd.DataFrame(
+        [
+            {"season": 2024, "league_id": 11422, "points": 10.5, "name": "Amon-Ra St. Brown", "note": None},
+            {"season": 2023, "league_id": 11422, "points": float("nan"), "name": "Zoë", "note": "x"},
+        ]
+    )
+
+    vectorized = load_mfl_html_normalized._row_fingerprints("html_player_records_normalized", frame)
+    per_row = [
+        load_mfl_html_normalized._row_fingerprint(
+            "html_player_records_normalized",
+            load_mfl_html_normalized._json_safe(row),
+        )
+        for row in frame.to_dict(orient="records")
+    ]
+
+    assert vectorized == per_row
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_pipeline_loads_same_facts_as_file_based_path(tmp_path, session_factory, max_workers):
+    extract_root = tmp_path / "history_html"
+    _write_extract_root(extract_root)
+
+    report_keys = ["league_awards", "franchise_records"]
+    pipeline_summary = mfl_html_pipeline.run_mfl_html_pipeline(
+        input_root=str(extract_root),
+        report_keys=report_keys,
+        dry_run=False,
+        target_league_id=None,
+        max_workers=max_workers,
+    )
+    assert pipeline_summary["files_parsed"] == 4
+    assert pipeline_summary["load"]["rows_inserted"] == 8
+    pipeline_facts = _fact_fingerprints(session_factory)
+
+    # The file-based path over the same extract finds every row already loaded.
+    normalized_root = tmp_path / "normalized"
+    run_normalize_mfl_html_records(
+        input_root=str(extract_root),
+        output_root=str(normalized_root),
+        report_keys=report_keys,
+    )
+    file_summary = load_mfl_html_normalized.run_load_mfl_html_normalized(
+        input_roots=[str(normalized_root)],
+        dry_run=False,
+    )
+    assert file_summary["rows_inserted"] == 0
+    assert file_summary["rows_skipped_existing"] == 8
+    assert _fact_fingerprints(session_factory) == pipeline_facts
+
+    session = session_factory()
+    try:
+        assert session.query(models.MflHistoryRecordRow).count() == 8
+        points = sorted(
+            row.points
+            for row in session.query(models.MflHistoryRecordRow)
+            .filter(models.MflHistoryRecordRow.dataset_key == "html_franchise_records_normalized")
+            .all()
+        )
+        assert points == [198.25, 198.25, 1204.5, 1204.5]
+    finally:
+        session.close()
+
+
+def test_pipeline_dry_run_writes_nothing(tmp_path, session_factory):
+    extract_root = tmp_path / "history_html"
+    _write_extract_root(extract_root)
+
+    summary = mfl_html_pipeline.run_mfl_html_pipeline(
+        input_root=str(extract_root),
+        report_keys=["league_awards"],
+        dry_run=True,
+        max_workers=1,
+    )
+
+    assert summary["load"]["rows_inserted"] == 4
+    assert _fact_fingerprints(session_factory) == []
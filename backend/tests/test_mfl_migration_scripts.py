@@ -82,6 +82,106 @@ def test_run_mfl_history_extract_writes_raw_and_normalized_files(tmp_path, monke
     assert raw_payload["players"]["player"][0]["team"] == "BUF"
 
 
+class _FakePlayersResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, team="BUF"):
+        self.team = team
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return {"players": {"player": [{"id": "1001", "name": "Player One", "position": "QB", "team": self.team}]}}
+
+
+def test_run_mfl_history_extract_resume_skips_completed_and_unchanged_reports(tmp_path, monkeypatch):
+    calls = []
+    team = {"value": "BUF"}
+
+    def fake_get(self, url, params, headers, timeout):
+        calls.append(url)
+        return _FakePlayersResponse(team["value"])
+
+    monkeypatch.setattr(extract_mfl_history.requests.Session, "get", fake_get)
+    options = dict(
+        start_year=2023,
+        end_year=2024,
+        report_types=["players"],
+        output_root=str(tmp_path),
+        min_interval_seconds=0,
+        resume=True,
+        refresh_from_season=2024,
+    )
+
+    first = extract_mfl_history.run_mfl_history_extract(**options)
+    assert first["extracted_reports"] == 2
+    manifest = json.loads((tmp_path / "_manifest.json").read_text(encoding="utf-8"))
+    assert set(manifest["reports"]) == {"2023/players", "2024/players"}
+
+    # 2023 is closed history: skipped without a request. 2024 is re-checked
+    # but its content hash is unchanged, so nothing is rewritten.
+    calls.clear()
+    csv_2024 = tmp_path / "players" / "2024.csv"
+    before = csv_2024.stat().st_mtime_ns
+    second = extract_mfl_history.run_mfl_history_extract(**options)
+    assert calls == [f"{extract_mfl_history.API_BASE}/2024/export"]
+    assert second["extracted_reports"] == 0
+    assert second["skipped_unchanged_reports"] == 2
+    assert csv_2024.stat().st_mtime_ns == before
+
+    # Changed content is rewritten; a deleted output is re-extracted.
+    team["value"] = "MIA"
+    (tmp_path / "players" / "2023.csv").unlink()
+    third = extract_mfl_history.run_mfl_history_extract(**options)
+    assert third["extracted_reports"] == 2
+    rows = list(csv.DictReader(csv_2024.open("r", encoding="utf-8", newline="")))
+    assert rows[0]["nfl_team"] == "MIA"
+
+
+def test_run_mfl_history_extract_concurrent_workers_share_429_backoff(tmp_path, monkeypatch):
+    class ThrottledResponse(_FakePlayersResponse):
+        status_code = 429
+        headers = {"Retry-After": "0.2"}
+
+    import threading
+    import time
+
+    lock = threading.Lock()
+    request_times = []
+    state = {"throttled": False}
+
+    def fake_get(self, url, params, headers, timeout):
+        with lock:
+            request_times.append(time.monotonic())
+            if not state["throttled"]:
+                state["throttled"] = True
+                return ThrottledResponse()
+        return _FakePlayersResponse()
+
+    monkeypatch.setattr(extract_mfl_history.requests.Session, "get", fake_get)
+
+    started = time.monotonic()
+    summary = extract_mfl_history.run_mfl_history_extract(
+        start_year=2019,
+        end_year=2024,
+        report_types=["players"],
+        output_root=str(tmp_path),
+        min_interval_seconds=0,
+        jitter_seconds=0,
+        max_concurrency=3,
+    )
+
+    assert summary["extracted_reports"] == 6
+    assert summary["throttled_retries"] == 1
+    assert len(request_times) == 7
+    # Only the requests already in flight beat the 429; every later request,
+    # from any worker, waited out the shared Retry-After pause.
+    assert sum(1 for t in request_times if t - request_times[0] < 0.15) <= 3
+    assert time.monotonic() - started >= 0.2
+
+
 def test_import_and_reconcile_mfl_csv_round_trip(tmp_path, monkeypatch):
     engine = create_engine(
         "sqlite://",
@@ -230,6 +330,153 @@ def test_import_and_reconcile_mfl_csv_round_trip(tmp_path, monkeypatch):
     assert persisted_summary["mismatch_count"] == 0
 
 
+def _seed_streaming_import_fixture(tmp_path):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+
+    session = TestingSessionLocal()
+    try:
+        league = models.League(name="Legacy League")
+        session.add(league)
+        session.flush()
+        for franchise_id in ("A", "B", "C", "D"):
+            session.add(
+                models.User(
+                    username=f"hist_{franchise_id.lower()}",
+                    email=f"{franchise_id.lower()}@example.com",
+                    hashed_password="x",
+                    league_id=league.id,
+                    team_name=f"Team {franchise_id}",
+                )
+            )
+        session.add(models.Player(name="Player 0", position="QB", nfl_team="BUF", adp=1.0, projected_points=10.0))
+        session.commit()
+    finally:
+        session.close()
+
+    for season in (2022, 2023):
+        shared = {"season": str(season), "league_id": "11422"}
+        _write_csv(
+            tmp_path / "franchises" / f"{season}.csv",
+            [
+                {**shared, "franchise_id": fid, "franchise_name": f"Team {fid}", "owner_name": f"Owner {fid}", "division": div}
+                for fid, div in (("A", "East"), ("B", "East"), ("C", "West"), ("D", "West"))
+            ],
+        )
+        _write_csv(
+            tmp_path / "players" / f"{season}.csv",
+            [
+                {**shared, "player_mfl_id": str(1000 + idx), "player_name": f"Player {idx}", "position": "WR" if idx else "QB", "nfl_team": "BUF"}
+                for idx in range(7)
+            ],
+        )
+        _write_csv(
+            tmp_path / "draftResults" / f"{season}.csv",
+            [
+                {**shared, "franchise_id": "ABCD"[idx % 4], "player_mfl_id": str(1000 + idx), "round": str(idx // 4 + 1), "pick_number": str(idx + 1), "winning_bid": f"${idx + 5}"}
+                for idx in range(7)
+            ],
+        )
+        _write_csv(
+            tmp_path / "schedule" / f"{season}.csv",
+            [
+                {**shared, "week": "1", "home_franchise_id": "A", "away_franchise_id": "B", "home_score": "101.5", "away_score": "99"},
+                {**shared, "week": "1", "home_franchise_id": "C", "away_franchise_id": "D", "home_score": "88", "away_score": "120"},
+                {**shared, "week": "2", "home_franchise_id": "A", "away_franchise_id": "C", "home_score": "", "away_score": ""},
+                {**shared, "week": "2", "home_franchise_id": "B", "away_franchise_id": "BYE", "home_score": "", "away_score": ""},
+            ],
+        )
+        _write_csv(
+            tmp_path / "transactions" / f"{season}.csv",
+            [
+                {**shared, "franchise_id": "A", "transaction_type": "waiver_add", "player_mfl_id": "1005", "amount": "$3", "week": "2"},
+                {**shared, "franchise_id": "B", "transaction_type": "drop", "player_mfl_id": "1006", "amount": "", "week": "3"},
+                {**shared, "franchise_id": "C", "transaction_type": "mystery", "player_mfl_id": "1001", "amount": "", "week": "4"},
+            ],
+        )
+    return TestingSessionLocal
+
+
+def _imported_rows(session_factory):
+    session = session_factory()
+    try:
+        picks = sorted(
+            (row.year, row.owner_id, row.player_id, row.round_num, row.pick_num, row.amount)
+            for row in session.query(models.DraftPick).all()
+        )
+        matchups = sorted(
+            (row.season, row.week, row.home_team_id, row.away_team_id, row.is_completed, row.is_playoff, row.is_division_matchup)
+            for row in session.query(models.Matchup).all()
+        )
+        transactions = sorted(
+            (row.season, row.player_id, row.old_owner_id or 0, row.new_owner_id or 0, row.transaction_type, row.notes)
+            for row in session.query(models.TransactionHistory).all()
+        )
+        players = session.query(models.Player).count()
+        return picks, matchups, transactions, players
+    finally:
+        session.close()
+
+
+def test_import_mfl_csv_streaming_matches_single_batch_import(tmp_path, monkeypatch):
+    batch_factory = _seed_streaming_import_fixture(tmp_path)
+    monkeypatch.setattr(import_mfl_csv, "SessionLocal", batch_factory)
+    batch_summary = import_mfl_csv.run_import_mfl_csv(
+        input_root=str(tmp_path),
+        target_league_id=1,
+        start_year=2022,
+        end_year=2023,
+        dry_run=False,
+        source_mode="csv",
+    )
+    batch_rows = _imported_rows(batch_factory)
+
+    stream_factory = _seed_streaming_import_fixture(tmp_path)
+    monkeypatch.setattr(import_mfl_csv, "SessionLocal", stream_factory)
+    progress = []
+    stream_summary = import_mfl_csv.run_import_mfl_csv(
+        input_root=str(tmp_path),
+        target_league_id=1,
+        start_year=2022,
+        end_year=2023,
+        dry_run=False,
+        source_mode="csv",
+        chunk_size=3,
+        progress=lambda report_type, rows: progress.append((report_type, rows)),
+    )
+
+    assert stream_summary == batch_summary
+    assert _imported_rows(stream_factory) == batch_rows
+    assert batch_summary["players_inserted"] == 6
+    assert batch_summary["players_matched"] == 8
+    assert batch_summary["draft_picks_inserted"] == 14
+    assert batch_summary["matchups_inserted"] == 6
+    assert batch_summary["bye_matchups_skipped"] == 2
+    assert batch_summary["transactions_inserted"] == 4
+    assert progress[:5] == [("players", 3), ("players", 6), ("players", 9), ("players", 12), ("players", 14)]
+    assert ("transactions", 6) in progress
+
+    # Re-running the streamed import skips everything already loaded.
+    rerun = import_mfl_csv.run_import_mfl_csv(
+        input_root=str(tmp_path),
+        target_league_id=1,
+        start_year=2022,
+        end_year=2023,
+        dry_run=False,
+        source_mode="csv",
+        chunk_size=3,
+    )
+    assert rerun["draft_picks_inserted"] == 0
+    assert rerun["matchups_inserted"] == 0
+    assert rerun["transactions_inserted"] == 0
+    assert _imported_rows(stream_factory) == batch_rows
+
+
 def test_run_scaffold_mfl_manual_csv_creates_header_only_templates(tmp_path):
     summary = scaffold_mfl_manual_csv.run_scaffold_mfl_manual_csv(
         start_year=2002,
@@ -0,0 +1,130 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import models
+from backend.models_draft_value import DraftValue
+from backend.services import monte_carlo_input_snapshots as snapshots_module
+from backend.services.monte_carlo_input_snapshots import MonteCarloInputSnapshots
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'league.db'}")
+    models.Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _seed_league(db):
+    league = models.League(name="Snapshot League")
+    db.add(league)
+    db.commit()
+    owner = models.User(username="snapshot-owner", hashed_password="pw", league_id=league.id)
+    db.add_all([owner, models.Player(id=301, name="Snapshot Player", position="WR", nfl_team="AAA")])
+    db.commit()
+    db.add_all(
+        [
+            models.PlayerSeason(player_id=301, season=2026, position="WR", nfl_team="AAA", is_active=True),
+            models.DraftPick(owner_id=owner.id, player_id=301, league_id=league.id, amount=20, year=2025),
+            models.DraftBudget(owner_id=owner.id, league_id=league.id, year=2026, total_budget=200),
+            DraftValue(player_id=301, season=2026, avg_auction_value=25.0, model_score=3.0),
+        ]
+    )
+    db.commit()
+    return league, owner
+
+
+def test_snapshots_reuse_inputs_until_draft_keeper_or_budget_data_changes(file_db, tmp_path, monkeypatch):
+    league, owner = _seed_league(file_db)
+    builds = []
+    original_build = snapshots_module.build_monte_carlo_inputs_from_db
+
+    def _counting_build(db, **kwargs):
+        builds.append(kwargs)
+        return original_build(db, **kwargs)
+
+    monkeypatch.setattr(snapshots_module, "build_monte_carlo_inputs_from_db", _counting_build)
+    store = MonteCarloInputSnapshots(tmp_path / "snapshots")
+
+    first = store.load(file_db, league_id=league.id, ranking_season=2026)
+    assert store.load(file_db, league_id=league.id, ranking_season=2026) is first
+    assert len(builds) == 1 and store.stats["memory_hits"] == 1
+
+    # A fresh process picks the snapshot up from disk.
+    restarted = MonteCarloInputSnapshots(tmp_path / "snapshots")
+    from_disk = restarted.load(file_db, league_id=league.id, ranking_season=2026)
+    assert restarted.stats == {"memory_hits": 0, "disk_hits": 1, "builds": 0}
+    assert from_disk.draft_results_df.equals(first.draft_results_df)
+
+    # Editing a pick in place, adding a keeper and changing a budget each rebuild.
+    pick = file_db.query(models.DraftPick).one()
+    pick.amount = 35
+    file_db.commit()
+    edited = store.load(file_db, league_id=league.id, ranking_season=2026)
+    assert edited.draft_results_df.iloc[0]["WinningBid"] == 35.0
+
+    file_db.add(models.Keeper(league_id=league.id, owner_id=owner.id, player_id=301, season=2026, keep_cost=22))
+    file_db.commit()
+    store.load(file_db, league_id=league.id, ranking_season=2026)
+
+    file_db.query(models.DraftBudget).one().total_budget = 210
+    file_db.commit()
+    rebudgeted = store.load(file_db, league_id=league.id, ranking_season=2026)
+    assert rebudgeted.budget_df.iloc[0]["DraftBudget"] == 210
+    assert len(builds) == 4
+
+    # Only the latest version of a league/season stays on disk.
+    assert len(list((tmp_path / "snapshots").glob("*.pkl"))) == 1
+    store.invalidate(league.id)
+    assert list((tmp_path / "snapshots").glob("*.pkl")) == []
+    store.load(file_db, league_id=league.id, ranking_season=2026)
+    assert len(builds) == 5
+
+
+def test_snapshots_do_not_cache_missing_history_or_in_memory_databases(file_db, tmp_path):
+    league = models.League(name="Empty League")
+    file_db.add_all([league, models.Player(id=401, name="Pool Player", position="RB", nfl_team="BBB")])
+    file_db.commit()
+    store = MonteCarloInputSnapshots(tmp_path / "snapshots")
+
+    with pytest.raises(ValueError):
+        store.load(file_db, league_id=league.id, ranking_season=2026)
+    assert store.stats["builds"] == 0
+    assert not (tmp_path / "snapshots").exists()
+
+    memory_engine = create_engine("sqlite:///:memory:")
+    models.Base.metadata.create_all(bind=memory_engine)
+    memory_db = sessionmaker(bind=memory_engine)()
+    _seed_league(memory_db)
+    store.load(memory_db, league_id=1, ranking_season=2026)
+    assert store.stats == {"memory_hits": 0, "disk_hits": 0, "builds": 0}
+    memory_db.close()
+
+
+def test_snapshot_version_tracks_player_edits_and_swapped_values(file_db):
+    league, owner = _seed_league(file_db)
+    other = models.User(username="snapshot-rival", hashed_password="pw", league_id=league.id)
+    file_db.add_all([other, models.Player(id=302, name="Second Player", position="RB", nfl_team="BBB")])
+    file_db.commit()
+    file_db.add(models.DraftPick(owner_id=other.id, player_id=302, league_id=league.id, amount=10, year=2025))
+    file_db.commit()
+
+    def _version():
+        return snapshots_module.monte_carlo_inputs_data_version(file_db, league_id=league.id, ranking_season=2026)
+
+    baseline = _version()
+    first, second = file_db.query(models.DraftPick).order_by(models.DraftPick.id).all()
+    first.owner_id, second.owner_id = second.owner_id, first.owner_id
+    first.amount, second.amount = second.amount, first.amount
+    file_db.commit()
+    swapped = _version()
+    assert swapped != baseline
+
+    file_db.get(models.Player, 302).position = "WR"
+    file_db.commit()
+    assert _version() != swapped
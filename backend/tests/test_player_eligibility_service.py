@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import models
+from backend.services import player_eligibility_service
+from backend.services.player_identity_service import upsert_player_season
+from backend.services.player_service import search_all_players
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def make_player(db, name, team="KC", position="WR"):
+    p = models.Player(name=name, position=position, nfl_team=team)
+    db.add(p)
+    db.commit()
+    db.refresh(p)
+    return p
+
+
+def _eligible_ids(db):
+    rows = db.query(models.Player.id).filter(
+        player_eligibility_service.eligible_player_filter(db)
+    )
+    return {int(row[0]) for row in rows.all()}
+
+
+def test_eligibility_matches_active_recent_and_unsynced_rules(db_session):
+    active = make_player(db_session, "Active Receiver")
+    inactive = make_player(db_session, "Inactive Receiver")
+    stale = make_player(db_session, "Stale Receiver")
+    unsynced = make_player(db_session, "Unsynced Receiver")
+    free_agent = make_player(db_session, "Free Agent Receiver", team="FA")
+
+    upsert_player_season(db_session, player_id=active.id, season=2025, nfl_team="KC", position="WR", bye_week=None)
+    upsert_player_season(
+        db_session, player_id=inactive.id, season=2025, nfl_team="KC", position="WR", bye_week=None, is_active=False
+    )
+    upsert_player_season(db_session, player_id=stale.id, season=2020, nfl_team="KC", position="WR", bye_week=None)
+    db_session.commit()
+
+    snapshot = player_eligibility_service.get_player_eligibility(db_session)
+    assert snapshot.anchor_season == 2025
+    assert snapshot.min_recent_season == 2024
+    assert _eligible_ids(db_session) == {active.id, unsynced.id}
+    assert free_agent.id not in _eligible_ids(db_session)
+
+
+def test_eligibility_window_follows_latest_synced_season(db_session):
+    player = make_player(db_session, "Window Receiver")
+    upsert_player_season(db_session, player_id=player.id, season=2024, nfl_team="KC", position="WR", bye_week=None)
+    db_session.commit()
+    assert player.id in _eligible_ids(db_session)
+
+    # a newer synced season moves the window past 2024
+    other = make_player(db_session, "Rookie Receiver")
+    upsert_player_season(db_session, player_id=other.id, season=2026, nfl_team="KC", position="WR", bye_week=None)
+    db_session.commit()
+
+    assert player_eligibility_service.get_player_eligibility(db_session).min_recent_season == 2025
+    assert _eligible_ids(db_session) == {other.id}
+
+
+def test_eligibility_detects_writes_that_bypass_identity_service(db_session):
+    player = make_player(db_session, "Direct Write Receiver")
+    assert _eligible_ids(db_session) == {player.id}
+
+    db_session.add(
+        models.PlayerSeason(player_id=player.id, season=2025, nfl_team="KC", position="WR", is_active=False)
+    )
+    db_session.commit()
+
+    assert _eligible_ids(db_session) == set()
+
+
+def test_search_applies_eligibility(db_session):
+    active = make_player(db_session, "Search Target")
+    inactive = make_player(db_session, "Search Target Benched", team="BUF")
+    upsert_player_season(db_session, player_id=active.id, season=2025, nfl_team="KC", position="WR", bye_week=None)
+    upsert_player_season(
+        db_session, player_id=inactive.id, season=2025, nfl_team="BUF", position="WR", bye_week=None, is_active=False
+    )
+    db_session.commit()
+
+    results = search_all_players(db_session, "Search Target")
+    assert [p.id for p in results] == [active.id]
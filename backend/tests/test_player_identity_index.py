@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import models
+from backend.services.player_service import PlayerIdentityIndex, find_existing_player
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_index_matches_query_based_lookup(db_session):
+    db_session.add_all(
+        [
+            models.Player(name="Chris Olave", position="WR", nfl_team="NO"),
+            models.Player(name="Chris Olave", position="WR", nfl_team="NO", espn_id="4361370"),
+            models.Player(name="Bijan Robinson", position="RB", nfl_team="ATL", gsis_id="00-0038"),
+        ]
+    )
+    db_session.commit()
+    index = PlayerIdentityIndex.from_db(db_session)
+
+    lookups = [
+        {"name": "chris olave", "position": "WR", "nfl_team": "NO"},
+        {"espn_id": "4361370"},
+        {"gsis_id": "00-0038"},
+        {"name": "Bijan Robinson", "position": "RB", "nfl_team": "ATL"},
+        {"name": "Nobody", "position": "RB", "nfl_team": "ATL"},
+    ]
+    for lookup in lookups:
+        assert find_existing_player(db_session, index=index, **lookup) is find_existing_player(db_session, **lookup)
+
+
+def test_index_tracks_reteamed_players(db_session):
+    player = models.Player(name="Traded Back", position="RB", nfl_team="NYJ")
+    db_session.add(player)
+    db_session.commit()
+    index = PlayerIdentityIndex.from_db(db_session)
+
+    player.nfl_team = "MIA"
+    index.add(player)
+
+    assert index.find(name="Traded Back", position="RB", nfl_team="MIA") is player
+    assert index.find(name="Traded Back", position="RB", nfl_team="NYJ") is None
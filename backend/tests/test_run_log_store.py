@@ -0,0 +1,73 @@
+import json
+
+from backend.services.run_log_store import RunLogStore
+
+
+def test_tail_returns_newest_entries_and_tracks_appends(tmp_path):
+    store = RunLogStore(tmp_path / "runs.jsonl", cache_size=3)
+    assert store.tail(5) == []
+
+    for run in range(5):
+        store.append({"run": run})
+
+    assert store.tail(2) == [{"run": 3}, {"run": 4}]
+    # Past the in-memory window the read falls through to the index.
+    assert [row["run"] for row in store.tail(10)] == [0, 1, 2, 3, 4]
+    assert (tmp_path / "runs.jsonl.idx").stat().st_size == 5 * 8
+
+
+def test_tail_rebuilds_index_for_lines_written_without_it(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    path.write_text('{"run": 0}\n\n{"run": 1}\nnot json\n{"run": 2}', encoding="utf-8")
+    store = RunLogStore(path)
+
+    assert store.tail(2) == [{"run": 1}, {"run": 2}]
+    assert store.tail(10) == [{"run": 0}, {"run": 1}, {"run": 2}]
+
+    store.append({"run": 3})
+    assert store.tail(2) == [{"run": 2}, {"run": 3}]
+
+    # A second writer appending directly invalidates the cache and the index.
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"run": 4}) + "\n")
+    assert store.tail(1) == [{"run": 4}]
+    store.append({"run": 5})
+    assert [row["run"] for row in RunLogStore(path).tail(3)] == [3, 4, 5]
+
+
+def test_rotation_keeps_backups_and_tail_reads_across_them(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    store = RunLogStore(path, max_bytes=40, backups=2, cache_size=2)
+    for run in range(8):
+        store.append({"run": run, "status": "success"})
+
+    assert sorted(item.name for item in tmp_path.iterdir()) == [
+        "runs.jsonl.1",
+        "runs.jsonl.1.idx",
+        "runs.jsonl.2",
+        "runs.jsonl.2.idx",
+    ]
+    # Two entries fill a file; the oldest files were dropped on rotation.
+    assert [row["run"] for row in store.tail(10)] == [4, 5, 6, 7]
+    assert [row["run"] for row in RunLogStore(path, backups=2).tail(1)] == [7]
+
+
+def test_append_rebuilds_index_after_log_is_deleted_or_truncated(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    store = RunLogStore(path)
+    for run in range(3):
+        store.append({"run": run})
+
+    # Deleted (or moved by external logrotate) while the index stays behind.
+    path.unlink()
+    store.append({"run": 3})
+    assert RunLogStore(path).tail(10) == [{"run": 3}]
+    assert (tmp_path / "runs.jsonl.idx").stat().st_size == 8
+
+    for run in range(4, 7):
+        store.append({"run": run})
+    # Truncated to a shorter log than the last indexed offset.
+    path.write_text(json.dumps({"run": "fresh"}) + "\n", encoding="utf-8")
+    store.append({"run": 7})
+    assert RunLogStore(path).tail(10) == [{"run": "fresh"}, {"run": 7}]
+    assert (tmp_path / "runs.jsonl.idx").stat().st_size == 2 * 8
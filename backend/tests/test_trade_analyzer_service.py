@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import models
+from backend.routers.trades import TradeAnalysisRequest, analyze_trade_options
+from backend.services.trade_analyzer_service import analyze_trades
+from fastapi import HTTPException
+
+
+def setup_db():
+    engine = create_engine("sqlite:///:memory:")
+    testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    return testing_session_local()
+
+
+def seed_league(db):
+    league = models.League(name="Analyzer League", current_season=2026)
+    db.add(league)
+    db.commit()
+    db.add(
+        models.LeagueSettings(
+            league_id=league.id,
+            starting_slots={"QB": 1, "RB": 2, "WR": 0, "TE": 0, "K": 0, "DEF": 0, "FLEX": 0},
+        )
+    )
+    owner = models.User(username="owner", hashed_password="pw", league_id=league.id)
+    partner = models.User(username="partner", hashed_password="pw", league_id=league.id)
+    db.add_all([owner, partner])
+    db.commit()
+
+    rosters = {
+        owner.id: [("QB1", "QB", 25), ("QB2", "QB", 20), ("RB1", "RB", 15)],
+        partner.id: [("RB2", "RB", 18), ("RB3", "RB", 16), ("RB4", "RB", 12)],
+    }
+    players = {}
+    for owner_id, roster in rosters.items():
+        for name, position, points in roster:
+            player = models.Player(name=name, position=position, nfl_team="AAA", projected_points=points)
+            db.add(player)
+            db.flush()
+            db.add(models.DraftPick(league_id=league.id, owner_id=owner_id, player_id=player.id, year=2026))
+            players[name] = player
+    db.commit()
+    return league, owner, partner, players
+
+
+def test_analyze_trades_scores_both_lineups_and_ranks_by_owner_gain():
+    db = setup_db()
+    league, owner, partner, players = seed_league(db)
+
+    result = analyze_trades(db, league_id=league.id, owner_id=owner.id, limit=5)
+
+    # 3x3 one-for-one swaps plus 3 pairs x 3 players two-for-one swaps
+    assert result["candidates_scored"] == 18
+    best = result["trades"][0]
+    assert best["partner_id"] == partner.id
+    assert best["shape"] == "1-for-1"
+    assert [p["player_id"] for p in best["give"]] == [players["QB2"].id]
+    assert [p["player_id"] for p in best["receive"]] == [players["RB2"].id]
+    assert best["owner_points_before"] == pytest.approx(40.0)
+    assert best["owner_delta"] == pytest.approx(18.0)
+    assert best["partner_points_before"] == pytest.approx(34.0)
+    assert best["partner_delta"] == pytest.approx(14.0)
+    assert all(trade["owner_delta"] > 0 and trade["partner_delta"] >= 0 for trade in result["trades"])
+    owner_gains = [trade["owner_delta"] for trade in result["trades"]]
+    assert owner_gains == sorted(owner_gains, reverse=True)
+
+
+def test_analyze_trade_options_rejects_unknown_shape():
+    db = setup_db()
+    league, owner, _partner, _players = seed_league(db)
+
+    with pytest.raises(HTTPException) as exc:
+        analyze_trade_options(TradeAnalysisRequest(shapes=["3-for-1"]), db=db, current_user=owner)
+    assert exc.value.status_code == 400
+
+    result = analyze_trade_options(TradeAnalysisRequest(shapes=["1-for-1"], limit=1), db=db, current_user=owner)
+    assert result["league_id"] == league.id
+    assert len(result["trades"]) == 1
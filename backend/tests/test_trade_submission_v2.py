@@ -9,7 +9,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import models
 import backend.services.notifications as notifications_module
-from backend.routers.trades import submit_trade_v2, TradeSubmissionCreate, TradeAssetCreate
+from backend.routers.trades import (
+    TradeAssetCreate,
+    TradeBatchValidationRequest,
+    TradeCandidateCreate,
+    TradeSubmissionCreate,
+    submit_trade_v2,
+    validate_trade_batch,
+)
 from fastapi import HTTPException
 
 
@@ -214,3 +221,65 @@ def test_submit_trade_v2_requires_submitter_to_be_team_a():
 
     assert exc.value.status_code == 403
     assert "team A" in str(exc.value.detail)
+
+
+def test_validate_trade_batch_checks_many_candidates_with_fixed_queries():
+    from sqlalchemy import event
+
+    db = setup_db()
+    league = make_league(db)
+    db.add(models.LeagueSettings(league_id=league.id, roster_size=16, trade_deadline=None))
+    db.commit()
+    team_a = make_user(db, league, "batch-a", budget=30)
+    team_b = make_user(db, league, "batch-b", budget=10)
+    players_a = [make_player(db, f"A{index}") for index in range(5)]
+    players_b = [make_player(db, f"B{index}", position="WR") for index in range(5)]
+    for player in players_a:
+        make_pick(db, league.id, team_a.id, player.id)
+    for player in players_b:
+        make_pick(db, league.id, team_b.id, player.id)
+
+    def player_asset(player):
+        return TradeAssetCreate(asset_type="PLAYER", player_id=player.id)
+
+    candidates = [
+        TradeCandidateCreate(
+            team_a_id=team_a.id,
+            team_b_id=team_b.id,
+            assets_from_a=[player_asset(players_a[index])],
+            assets_from_b=[player_asset(players_b[index])],
+        )
+        for index in range(5)
+    ]
+    candidates.append(
+        TradeCandidateCreate(
+            team_a_id=team_a.id,
+            team_b_id=team_b.id,
+            assets_from_a=[player_asset(players_b[0])],
+            assets_from_b=[TradeAssetCreate(asset_type="DRAFT_DOLLARS", amount=25)],
+        )
+    )
+
+    statements = []
+
+    def _count(*_args, **_kwargs):
+        statements.append(1)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        response = validate_trade_batch(
+            league_id=league.id,
+            payload=TradeBatchValidationRequest(candidates=candidates),
+            db=db,
+            current_user=CU(team_a),
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(statements) <= 6
+    assert response["valid_count"] == 5
+    invalid = response["results"][5]
+    assert invalid["valid"] is False
+    assert invalid["errors"]["assets_from_a[0]"] == ["team does not own this player"]
+    assert invalid["errors"]["assets_from_b"] == ["team B cannot trade more draft dollars than available"]
@@ -13,6 +13,9 @@ from backend.services.transaction_service import (
     log_transaction,
     get_owner_at_time,
     get_acquisition_method,
+    owners_at_time,
+    refresh_ownership_spans,
+    roster_at_time,
 )
 
 
@@ -108,3 +111,109 @@ def test_owner_at_time_and_acquisition(db_session):
 def test_no_history_returns_none(db_session):
     assert get_owner_at_time(db_session, 999, datetime.now(UTC)) is None
     assert get_acquisition_method(db_session, 999, 1) is None
+
+
+def test_bulk_owners_and_roster_at_time_from_spans(db_session):
+    league = make_league(db_session)
+    u1 = make_user(db_session, league, "u1")
+    u2 = make_user(db_session, league, "u2")
+    players = [make_player(db_session, f"P{index}") for index in range(3)]
+    base = datetime(2025, 9, 1, tzinfo=UTC)
+
+    history = [
+        (players[0], None, u1, "draft", base),
+        (players[1], None, u1, "draft", base),
+        (players[2], None, u2, "draft", base),
+        (players[0], u1, u2, "trade", base + timedelta(days=10)),
+        (players[1], u1, None, "drop", base + timedelta(days=12)),
+    ]
+    for player, old_owner, new_owner, transaction_type, timestamp in history:
+        db_session.add(
+            models.TransactionHistory(
+                league_id=league.id,
+                player_id=player.id,
+                old_owner_id=old_owner.id if old_owner else None,
+                new_owner_id=new_owner.id if new_owner else None,
+                transaction_type=transaction_type,
+                timestamp=timestamp,
+            )
+        )
+    db_session.flush()
+    assert refresh_ownership_spans(db_session, league_id=league.id) == 4
+    db_session.commit()
+
+    player_ids = [player.id for player in players]
+    assert owners_at_time(
+        db_session, league_id=league.id, player_ids=player_ids, target_date=base + timedelta(days=5)
+    ) == {players[0].id: u1.id, players[1].id: u1.id, players[2].id: u2.id}
+    assert owners_at_time(
+        db_session, league_id=league.id, player_ids=player_ids, target_date=base + timedelta(days=20)
+    ) == {players[0].id: u2.id, players[2].id: u2.id}
+    assert roster_at_time(db_session, league_id=league.id, target_date=base + timedelta(days=11)) == {
+        u1.id: [players[1].id],
+        u2.id: [players[0].id, players[2].id],
+    }
+    assert get_owner_at_time(db_session, players[1].id, base + timedelta(days=20), league_id=league.id) is None
+
+    spans = (
+        db_session.query(models.PlayerOwnershipSpan)
+        .filter_by(player_id=players[1].id)
+        .all()
+    )
+    assert [(span.owner_id, span.transaction_type, span.ended_by) for span in spans] == [(u1.id, "draft", "drop")]
+
+
+def test_lookups_read_spans_backfilled_for_existing_history(db_session):
+    league = make_league(db_session)
+    u1 = make_user(db_session, league, "u1")
+    u2 = make_user(db_session, league, "u2")
+    drafted, undated = make_player(db_session, "Drafted"), make_player(db_session, "Undated")
+    base = datetime(2025, 9, 1, tzinfo=UTC)
+    # history written before the span table existed: no spans at all
+    db_session.add_all(
+        [
+            models.TransactionHistory(
+                league_id=league.id,
+                player_id=drafted.id,
+                new_owner_id=u1.id,
+                transaction_type="draft",
+                timestamp=base,
+            ),
+            models.TransactionHistory(
+                league_id=league.id,
+                player_id=drafted.id,
+                old_owner_id=u1.id,
+                new_owner_id=u2.id,
+                transaction_type="trade",
+                timestamp=base + timedelta(days=3),
+            ),
+            models.TransactionHistory(
+                league_id=league.id,
+                player_id=undated.id,
+                new_owner_id=u1.id,
+                transaction_type="waiver_add",
+            ),
+        ]
+    )
+    db_session.flush()
+    db_session.execute(
+        models.TransactionHistory.__table__.update()
+        .where(models.TransactionHistory.player_id == undated.id)
+        .values(timestamp=None)
+    )
+    db_session.commit()
+    assert db_session.query(models.PlayerOwnershipSpan).count() == 0
+
+    # reads leave the span table alone; the backfill is an explicit rebuild
+    assert get_owner_at_time(db_session, drafted.id, base + timedelta(days=1)) is None
+    assert not db_session.new and not db_session.dirty
+    assert db_session.query(models.PlayerOwnershipSpan).count() == 0
+
+    assert refresh_ownership_spans(db_session, league_id=league.id) == 2
+    db_session.commit()
+    assert get_owner_at_time(db_session, drafted.id, base + timedelta(days=1)) == u1.id
+    assert get_owner_at_time(db_session, drafted.id, base + timedelta(days=5), league_id=league.id) == u2.id
+    assert get_acquisition_method(db_session, drafted.id, u2.id) == "TRADE"
+    # rows without a timestamp have no span but still answer acquisition lookups
+    assert get_acquisition_method(db_session, undated.id, u1.id) == "WAIVER"
+    assert get_owner_at_time(db_session, undated.id, base, league_id=league.id) is None
@@ -49,26 +49,32 @@ def test_send_invite_email_simulation(monkeypatch, capsys):
 
 
 def test_calculate_waiver_priority_simple():
-    # Create fake owners with wins attribute
-    Owner = lambda w: types.SimpleNamespace(wins=w)
-    owners = [Owner(2), Owner(5), Owner(1)]
+    # Fake owners plus completed matchups: owner 3 is 0-2, owner 1 is 1-1, owner 2 is 2-0
+    Owner = lambda owner_id: types.SimpleNamespace(id=owner_id, username=f"owner{owner_id}", team_name=None)
+    owners = [Owner(1), Owner(2), Owner(3)]
+    Game = lambda home, away, home_score, away_score, done=True: types.SimpleNamespace(
+        home_team_id=home, away_team_id=away, home_score=home_score, away_score=away_score, is_completed=done
+    )
+    matchups = [
+        Game(1, 3, 100, 90),
+        Game(2, 1, 110, 80),
+        Game(2, 3, 95, 94),
+        Game(3, 1, 200, 0, done=False),
+    ]
 
     class FakeQuery:
-        def __init__(self, owners):
-            self._owners = owners
+        def __init__(self, rows):
+            self._rows = rows
 
         def filter(self, *args, **kwargs):
             return self
 
         def all(self):
-            return self._owners
+            return self._rows
 
     class FakeDB:
-        def __init__(self, owners):
-            self._owners = owners
-
         def query(self, model):
-            return FakeQuery(self._owners)
+            return FakeQuery(owners if model.__name__ == "User" else matchups)
 
-    sorted_owners = waiver_logic.calculate_waiver_priority(1, FakeDB(owners))
-    assert [o.wins for o in sorted_owners] == [1, 2, 5]
+    sorted_owners = waiver_logic.calculate_waiver_priority(1, FakeDB())
+    assert [o.id for o in sorted_owners] == [3, 1, 2]
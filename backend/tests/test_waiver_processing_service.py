@@ -0,0 +1,213 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import models
+from backend.services.ledger_service import owner_balance, record_ledger_entry
+from backend.services.waiver_processing_service import process_waiver_claims
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _league_with_owners(db, owner_count=3, roster_size=14):
+    league = models.League(name="Waiver Night League")
+    db.add(league)
+    db.commit()
+    db.add(models.LeagueSettings(league_id=league.id, roster_size=roster_size, draft_year=2026))
+    owners = [
+        models.User(username=f"waiver-owner-{index}", hashed_password="pw", league_id=league.id)
+        for index in range(owner_count)
+    ]
+    db.add_all(owners)
+    db.commit()
+    # owners[0] lost every game, so it holds the top waiver priority.
+    for winner, loser in ((owners[1], owners[0]), (owners[2], owners[0]), (owners[2], owners[1])):
+        db.add(
+            models.Matchup(
+                league_id=league.id,
+                season=2026,
+                week=1,
+                home_team_id=winner.id,
+                away_team_id=loser.id,
+                home_score=120,
+                away_score=90,
+                is_completed=True,
+            )
+        )
+    for owner in owners:
+        record_ledger_entry(
+            db,
+            league_id=league.id,
+            season_year=2026,
+            currency_type="FAAB",
+            amount=100,
+            to_owner_id=owner.id,
+            transaction_type="FAAB_GRANT",
+        )
+    db.commit()
+    return league, owners
+
+
+def _players(db, count):
+    players = [models.Player(name=f"Waiver Target {index}", position="RB", nfl_team="AAA") for index in range(count)]
+    db.add_all(players)
+    db.commit()
+    return players
+
+
+def _claim(db, league, owner, player, bid=0, drop=None):
+    claim = models.WaiverClaim(
+        league_id=league.id,
+        user_id=owner.id,
+        player_id=player.id,
+        bid_amount=bid,
+        drop_player_id=drop.id if drop else None,
+    )
+    db.add(claim)
+    db.commit()
+    return claim
+
+
+def test_faab_bids_win_before_priority_and_budgets_roll_forward(db_session):
+    league, (worst, middle, best) = _league_with_owners(db_session)
+    star, backup, sleeper = _players(db_session, 3)
+
+    tie_worst = _claim(db_session, league, worst, sleeper, bid=60)
+    tie_middle = _claim(db_session, league, middle, sleeper, bid=60)
+    over_budget = _claim(db_session, league, worst, backup, bid=50)
+    winning_bid = _claim(db_session, league, best, star, bid=45)
+    lost_bid = _claim(db_session, league, worst, star, bid=30)
+    fallback = _claim(db_session, league, middle, backup, bid=10)
+
+    report = process_waiver_claims(db_session, league_id=league.id)
+    db_session.commit()
+
+    assert report["priority_before"] == [worst.id, middle.id, best.id]
+    # Equal bids go to the better waiver priority; each winner drops to the back.
+    assert [row["claim_id"] for row in report["awarded"]] == [tie_worst.id, winning_bid.id, fallback.id]
+    assert {row["claim_id"]: row["reason"] for row in report["rejected"]} == {
+        tie_middle.id: "player_unavailable",
+        over_budget.id: "insufficient_faab",
+        lost_bid.id: "player_unavailable",
+    }
+    assert report["priority_after"] == [worst.id, best.id, middle.id]
+
+    assert {(pick.owner_id, pick.player_id, pick.amount) for pick in db_session.query(models.DraftPick).all()} == {
+        (worst.id, sleeper.id, 60),
+        (best.id, star.id, 45),
+        (middle.id, backup.id, 10),
+    }
+    balances = [
+        owner_balance(db_session, league_id=league.id, owner_id=owner.id, currency_type="FAAB")
+        for owner in (worst, middle, best)
+    ]
+    assert balances == [40, 90, 55]
+    statuses = {claim.id: claim.status for claim in db_session.query(models.WaiverClaim).all()}
+    assert statuses[winning_bid.id] == "APPROVED" and statuses[lost_bid.id] == "REJECTED"
+    assert db_session.query(models.TransactionHistory).filter_by(transaction_type="waiver_add").count() == 3
+
+
+def test_roster_limits_and_drops_are_validated_against_earlier_awards(db_session):
+    league, (owner, other, _) = _league_with_owners(db_session, roster_size=2)
+    rostered_a, rostered_b, target_a, target_b, target_c = _players(db_session, 5)
+    db_session.add_all(
+        [
+            models.DraftPick(owner_id=owner.id, player_id=rostered_a.id, league_id=league.id, amount=1, year=2026),
+            models.DraftPick(owner_id=owner.id, player_id=rostered_b.id, league_id=league.id, amount=1, year=2026),
+        ]
+    )
+    db_session.commit()
+
+    first_swap = _claim(db_session, league, owner, target_a, bid=20, drop=rostered_a)
+    same_drop = _claim(db_session, league, owner, target_b, bid=10, drop=rostered_a)
+    no_drop = _claim(db_session, league, owner, target_c, bid=5)
+    other_add = _claim(db_session, league, other, target_b, bid=1)
+
+    report = process_waiver_claims(db_session, league_id=league.id)
+    db_session.commit()
+
+    assert [row["claim_id"] for row in report["awarded"]] == [first_swap.id, other_add.id]
+    assert {row["claim_id"]: row["reason"] for row in report["rejected"]} == {
+        same_drop.id: "drop_player_not_on_roster",
+        no_drop.id: "roster_full",
+    }
+    owner_players = {
+        pick.player_id for pick in db_session.query(models.DraftPick).filter_by(owner_id=owner.id).all()
+    }
+    assert owner_players == {rostered_b.id, target_a.id}
+    assert db_session.query(models.TransactionHistory).filter_by(transaction_type="waiver_drop").count() == 1
+
+
+def test_dry_run_reports_without_writing_and_queries_stay_bounded(db_session):
+    league, owners = _league_with_owners(db_session, roster_size=50)
+    players = _players(db_session, 40)
+    engine = db_session.get_bind()
+
+    def _run_counting_queries():
+        statements = []
+
+        def _count(*_args, **_kwargs):
+            statements.append(1)
+
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            report = process_waiver_claims(db_session, league_id=league.id, dry_run=True)
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+        return report, len(statements)
+
+    # the once-per-process balance coverage check is not part of the per-run cost
+    owner_balance(db_session, league_id=league.id, owner_id=owners[0].id, currency_type="FAAB")
+    for index, player in enumerate(players[:4]):
+        _claim(db_session, league, owners[index % 3], player, bid=index % 3)
+    small_report, small_queries = _run_counting_queries()
+    for index, player in enumerate(players[4:]):
+        _claim(db_session, league, owners[index % 3], player, bid=index % 3)
+    large_report, large_queries = _run_counting_queries()
+
+    assert small_report["awarded_count"] == 4
+    assert large_report["awarded_count"] == 40
+    assert large_queries == small_queries
+    assert db_session.query(models.DraftPick).count() == 0
+    assert not db_session.dirty
+    assert {claim.status for claim in db_session.query(models.WaiverClaim).all()} == {"PENDING"}
+
+
+def test_player_awarded_and_dropped_in_same_run_leaves_no_pick(db_session):
+    league, (owner, _, _) = _league_with_owners(db_session, roster_size=2)
+    rostered, first_target, second_target = _players(db_session, 3)
+    db_session.add(models.DraftPick(owner_id=owner.id, player_id=rostered.id, league_id=league.id, amount=1, year=2026))
+    db_session.commit()
+
+    add_first = _claim(db_session, league, owner, first_target, bid=20)
+    swap_out_first = _claim(db_session, league, owner, second_target, bid=10, drop=first_target)
+
+    report = process_waiver_claims(db_session, league_id=league.id)
+    db_session.commit()
+
+    assert [row["claim_id"] for row in report["awarded"]] == [add_first.id, swap_out_first.id]
+    owner_players = [
+        pick.player_id for pick in db_session.query(models.DraftPick).filter_by(owner_id=owner.id).all()
+    ]
+    assert sorted(owner_players) == sorted([rostered.id, second_target.id])
+    assert owner_balance(db_session, league_id=league.id, owner_id=owner.id, currency_type="FAAB") == 70
+    bid_references = {
+        (entry.reference_type, entry.reference_id)
+        for entry in db_session.query(models.EconomicLedger).filter_by(transaction_type="WAIVER_CLAIM_BID").all()
+    }
+    assert bid_references == {("WAIVER_CLAIM", str(add_first.id)), ("WAIVER_CLAIM", str(swap_out_first.id))}
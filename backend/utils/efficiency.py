@@ -1,6 +1,10 @@
 """Utility functions for manager efficiency analytics."""
 
-from typing import List, Dict
+from typing import List, Dict, Iterable, Mapping
+
+import numpy as np
+
+FLEX_ELIGIBLE_POSITIONS = ("RB", "WR", "TE")
 
 
 def calculate_optimal_score(roster_history: List[Dict], settings: Dict, return_lineup: bool = False) -> float:
@@ -73,3 +77,45 @@ def calculate_optimal_score(roster_history: List[Dict], settings: Dict, return_l
     if return_lineup:
         return optimal_total, opt_lineup
     return optimal_total
+
+
+def optimal_lineup_points_batch(
+    values: np.ndarray,
+    positions: Iterable[str],
+    starting_slots: Mapping[str, int],
+) -> np.ndarray:
+    """Vectorized `calculate_optimal_score` over many rosters at once.
+
+    ``values`` is an (n_rosters, n_players) array of points; column ``j`` of
+    every row holds a player at ``positions[j]``. Entries of ``-inf`` or NaN
+    are empty or ineligible (IR, taxi, traded away) and never start. Slots are
+    filled the same way as the scalar version: every non-flex slot takes the
+    best players at its position, then FLEX takes the best RB/WR/TE left.
+    Returns one optimal total per row.
+    """
+    scores = np.asarray(values, dtype=float)
+    if scores.ndim == 1:
+        scores = scores[np.newaxis, :]
+    scores = np.where(np.isnan(scores), -np.inf, scores)
+    columns = np.array([str(pos or "").upper() for pos in positions])
+
+    slots = {str(pos).upper(): int(count or 0) for pos, count in starting_slots.items()}
+    flex_slots = slots.pop("FLEX", 0)
+    totals = np.zeros(scores.shape[0])
+    flex_pool = []
+
+    for pos in sorted(set(slots) | set(FLEX_ELIGIBLE_POSITIONS)):
+        mask = columns == pos
+        if not mask.any():
+            continue
+        ranked = -np.sort(-scores[:, mask], axis=1)
+        count = slots.get(pos, 0)
+        starters = ranked[:, :count]
+        totals += np.where(np.isfinite(starters), starters, 0.0).sum(axis=1)
+        if flex_slots and pos in FLEX_ELIGIBLE_POSITIONS:
+            flex_pool.append(ranked[:, count:])
+
+    if flex_slots and flex_pool:
+        remaining = -np.sort(-np.concatenate(flex_pool, axis=1), axis=1)[:, :flex_slots]
+        totals += np.where(np.isfinite(remaining), remaining, 0.0).sum(axis=1)
+    return totals
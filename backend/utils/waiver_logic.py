@@ -1,11 +1,88 @@
 import models
+from sqlalchemy import func, or_, select
+
+from backend.services.standings_service import owner_standings_sort_key
 # backend/utils/waiver_logic.py
-def calculate_waiver_priority(league_id, db):
+
+
+def waiver_priority_order(owners, matchups):
+    """
+    Orders owners for waiver priority from completed matchups.
+    Logic: Inverse of standings (last place gets #1 priority), using the same
+    tie-break chain as the standings page.
+    """
+    rows = {
+        owner.id: {
+            "id": owner.id,
+            "wins": 0,
+            "losses": 0,
+            "ties": 0,
+            "pf": 0.0,
+            "pa": 0.0,
+            "team_name": getattr(owner, "team_name", None),
+            "username": getattr(owner, "username", None),
+        }
+        for owner in owners
+    }
+    for matchup in matchups:
+        if not matchup.is_completed:
+            continue
+        home_score = float(matchup.home_score or 0)
+        away_score = float(matchup.away_score or 0)
+        for owner_id, score, opponent in (
+            (matchup.home_team_id, home_score, away_score),
+            (matchup.away_team_id, away_score, home_score),
+        ):
+            row = rows.get(owner_id)
+            if row is None:
+                continue
+            row["pf"] += score
+            row["pa"] += opponent
+            if score > opponent:
+                row["wins"] += 1
+            elif score < opponent:
+                row["losses"] += 1
+            else:
+                row["ties"] += 1
+
+    owners_by_id = {owner.id: owner for owner in owners}
+    ranked = sorted(rows.values(), key=owner_standings_sort_key)
+    return [owners_by_id[row["id"]] for row in reversed(ranked)]
+
+
+def calculate_waiver_priority(league_id, db, season=None):
     """
     Returns a list of owners sorted by priority.
-    Logic: Inverse of standings (last place gets #1 priority).
+    Logic: Inverse of standings (last place gets #1 priority) for `season`,
+    defaulting to the league's latest season with matchups.
     """
-    owners = db.query(models.User).filter(models.User.league_id == league_id).all()
-    # Mock standings sort - in real test, this will use Win/Loss record
-    sorted_owners = sorted(owners, key=lambda x: x.wins, reverse=False)
-    return sorted_owners
+    owners = (
+        db.query(models.User)
+        .filter(
+            models.User.league_id == league_id,
+            models.User.is_superuser.is_(False),
+            ~models.User.username.like("hist_%"),
+        )
+        .all()
+    )
+    if season is None:
+        latest_season = (
+            select(func.max(models.Matchup.season))
+            .where(models.Matchup.league_id == league_id)
+            .scalar_subquery()
+        )
+        # Leagues without season-stamped matchups rank on every completed game.
+        season_filter = or_(models.Matchup.season == latest_season, latest_season.is_(None))
+    else:
+        season_filter = models.Matchup.season == season
+    matchups = (
+        db.query(models.Matchup)
+        .filter(
+            models.Matchup.league_id == league_id,
+            models.Matchup.is_completed.is_(True),
+            models.Matchup.is_playoff.is_(False),
+            season_filter,
+        )
+        .all()
+    )
+    return waiver_priority_order(owners, matchups)
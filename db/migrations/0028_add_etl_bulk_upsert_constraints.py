@@ -0,0 +1,68 @@
+"""0028 - add unique keys used by ETL bulk upserts
+
+Projection and id-mapping loads merge rows with INSERT ... ON CONFLICT, which
+needs a unique key on each conflict target. Existing duplicates are collapsed
+to the lowest id first, matching what the per-row loader kept.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0028_add_etl_bulk_upsert_constraints"
+down_revision = "0027_add_refresh_tokens_table"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def _has_unique_key(table: str, name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    names = {index["name"] for index in inspector.get_indexes(table)}
+    names.update(constraint["name"] for constraint in inspector.get_unique_constraints(table))
+    return name in names
+
+
+def upgrade() -> None:
+    # Tables are created by metadata.create_all, so guard older databases.
+    if _has_table("platform_projections") and not _has_unique_key(
+        "platform_projections", "uq_platform_projection_player_source_season"
+    ):
+        # NULL player ids never collide in a unique index; leave those rows alone.
+        op.execute(
+            "DELETE FROM platform_projections WHERE player_id IS NOT NULL AND id NOT IN ("
+            "SELECT MIN(id) FROM platform_projections WHERE player_id IS NOT NULL "
+            "GROUP BY player_id, source, season)"
+        )
+        op.create_index(
+            "uq_platform_projection_player_source_season",
+            "platform_projections",
+            ["player_id", "source", "season"],
+            unique=True,
+        )
+
+    if _has_table("player_id_mappings") and not _has_unique_key(
+        "player_id_mappings", "uq_player_id_mapping_player"
+    ):
+        op.execute(
+            "DELETE FROM player_id_mappings WHERE player_id IS NOT NULL AND id NOT IN ("
+            "SELECT MIN(id) FROM player_id_mappings WHERE player_id IS NOT NULL GROUP BY player_id)"
+        )
+        op.create_index(
+            "uq_player_id_mapping_player",
+            "player_id_mappings",
+            ["player_id"],
+            unique=True,
+        )
+
+
+def downgrade() -> None:
+    if _has_table("player_id_mappings"):
+        op.drop_index("uq_player_id_mapping_player", table_name="player_id_mappings")
+    if _has_table("platform_projections"):
+        op.drop_index("uq_platform_projection_player_source_season", table_name="platform_projections")
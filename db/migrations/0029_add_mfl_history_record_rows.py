@@ -0,0 +1,76 @@
+"""0029 - add mfl_history_record_rows read model
+
+Typed projection of mfl_html_record_facts (year, week, wins, points, owner,
+team key) with composite indexes so history endpoints can page records in
+SQL. Existing facts are projected by `manage.py rebuild-mfl-history-read-model`;
+until then the endpoints fall back to sorting the JSON payloads.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0029_add_mfl_history_record_rows"
+down_revision = "0028_add_etl_bulk_upsert_constraints"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "mfl_history_record_rows" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "mfl_history_record_rows",
+        sa.Column("id", sa.Integer, primary_key=True, index=True, autoincrement=True),
+        sa.Column(
+            "fact_id",
+            sa.Integer,
+            sa.ForeignKey("mfl_html_record_facts.id", ondelete="CASCADE"),
+            nullable=False,
+            unique=True,
+        ),
+        sa.Column("dataset_key", sa.String(length=80), nullable=False),
+        sa.Column("target_league_id", sa.Integer, sa.ForeignKey("leagues.id"), nullable=True),
+        sa.Column("source_league_id", sa.String(length=32), nullable=True),
+        sa.Column("record_year", sa.Integer, nullable=False, server_default="-1"),
+        sa.Column("season", sa.Integer, nullable=True),
+        sa.Column("record_week", sa.Integer, nullable=True),
+        sa.Column("wins", sa.Integer, nullable=True),
+        sa.Column("points", sa.Float, nullable=True),
+        sa.Column("owner_name", sa.String, nullable=True),
+        sa.Column("team_name", sa.String, nullable=True),
+        sa.Column("team_key", sa.String, nullable=True),
+    )
+
+    op.create_index(
+        "ix_mfl_history_row_dataset_target_year",
+        "mfl_history_record_rows",
+        ["dataset_key", "target_league_id", "record_year"],
+    )
+    op.create_index(
+        "ix_mfl_history_row_dataset_source_year",
+        "mfl_history_record_rows",
+        ["dataset_key", "source_league_id", "record_year"],
+    )
+    op.create_index(
+        "ix_mfl_history_row_dataset_target_points",
+        "mfl_history_record_rows",
+        ["dataset_key", "target_league_id", "points"],
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "mfl_history_record_rows" not in inspector.get_table_names():
+        return
+
+    op.drop_index("ix_mfl_history_row_dataset_target_points", table_name="mfl_history_record_rows")
+    op.drop_index("ix_mfl_history_row_dataset_source_year", table_name="mfl_history_record_rows")
+    op.drop_index("ix_mfl_history_row_dataset_target_year", table_name="mfl_history_record_rows")
+    op.drop_table("mfl_history_record_rows")
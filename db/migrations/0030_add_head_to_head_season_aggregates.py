@@ -0,0 +1,67 @@
+"""0030 - add head_to_head_season_aggregates
+
+Owner pair x season totals (W/L/T, points for/against, biggest margin,
+opening/closing/longest streaks) built from completed matchups, used by the
+rivalry graph and all-time series endpoints. Existing leagues are filled by
+`manage.py rebuild-head-to-head`; until then those endpoints aggregate
+matchups per request.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0030_add_head_to_head_season_aggregates"
+down_revision = "0029_add_mfl_history_record_rows"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "head_to_head_season_aggregates" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "head_to_head_season_aggregates",
+        sa.Column("id", sa.Integer, primary_key=True, index=True, autoincrement=True),
+        sa.Column("league_id", sa.Integer, sa.ForeignKey("leagues.id"), nullable=False),
+        sa.Column("season", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("owner_a_id", sa.Integer, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("owner_b_id", sa.Integer, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("games", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("a_wins", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("b_wins", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("ties", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("a_points", sa.Float, nullable=False, server_default="0"),
+        sa.Column("b_points", sa.Float, nullable=False, server_default="0"),
+        sa.Column("biggest_margin", sa.Float, nullable=False, server_default="0"),
+        sa.Column("biggest_margin_winner_id", sa.Integer, nullable=True),
+        sa.Column("biggest_margin_week", sa.Integer, nullable=True),
+        sa.Column("opening_streak_owner_id", sa.Integer, nullable=True),
+        sa.Column("opening_streak_length", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("closing_streak_owner_id", sa.Integer, nullable=True),
+        sa.Column("closing_streak_length", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("longest_streak_owner_id", sa.Integer, nullable=True),
+        sa.Column("longest_streak_length", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("league_id", "season", "owner_a_id", "owner_b_id", name="uq_h2h_league_season_pair"),
+    )
+    op.create_index(
+        "ix_h2h_league_pair",
+        "head_to_head_season_aggregates",
+        ["league_id", "owner_a_id", "owner_b_id"],
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "head_to_head_season_aggregates" not in inspector.get_table_names():
+        return
+
+    op.drop_index("ix_h2h_league_pair", table_name="head_to_head_season_aggregates")
+    op.drop_table("head_to_head_season_aggregates")
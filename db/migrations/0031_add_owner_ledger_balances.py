@@ -0,0 +1,109 @@
+"""0031 - add owner_ledger_balances
+
+Materialized per (league, owner, currency, season) totals of economic_ledger,
+kept current in the same flush that inserts ledger rows so balance reads no
+longer aggregate the whole ledger. Existing ledger rows are folded in here;
+`manage.py rebuild-ledger-balances --verify` checks the table against the
+ledger afterwards, and without `--verify` rebuilds it.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0031_add_owner_ledger_balances"
+down_revision = "0030_add_head_to_head_season_aggregates"
+branch_labels = None
+depends_on = None
+
+
+_BACKFILL_SQL = """
+INSERT INTO owner_ledger_balances (
+    league_id, owner_id, currency_type, season_year,
+    credit_total, debit_total, credit_count, debit_count,
+    issued_total, spent_total, keeper_lock_total
+)
+SELECT
+    league_id, owner_id, currency_type, season_year,
+    SUM(credit_total), SUM(debit_total), SUM(credit_count), SUM(debit_count),
+    SUM(issued_total), SUM(spent_total), SUM(keeper_lock_total)
+FROM (
+    SELECT
+        league_id,
+        to_owner_id AS owner_id,
+        currency_type,
+        COALESCE(season_year, 0) AS season_year,
+        amount AS credit_total,
+        0 AS debit_total,
+        1 AS credit_count,
+        0 AS debit_count,
+        CASE WHEN from_owner_id IS NULL THEN amount ELSE 0 END AS issued_total,
+        0 AS spent_total,
+        0 AS keeper_lock_total
+    FROM economic_ledger
+    WHERE to_owner_id IS NOT NULL
+    UNION ALL
+    SELECT
+        league_id,
+        from_owner_id AS owner_id,
+        currency_type,
+        COALESCE(season_year, 0) AS season_year,
+        0 AS credit_total,
+        amount AS debit_total,
+        0 AS credit_count,
+        1 AS debit_count,
+        0 AS issued_total,
+        CASE WHEN to_owner_id IS NULL THEN amount ELSE 0 END AS spent_total,
+        CASE WHEN transaction_type = 'KEEPER_LOCK' THEN amount ELSE 0 END AS keeper_lock_total
+    FROM economic_ledger
+    WHERE from_owner_id IS NOT NULL
+) AS entries
+GROUP BY league_id, owner_id, currency_type, season_year
+"""
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "owner_ledger_balances" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "owner_ledger_balances",
+        sa.Column("id", sa.Integer, primary_key=True, index=True, autoincrement=True),
+        sa.Column("league_id", sa.Integer, sa.ForeignKey("leagues.id"), nullable=False),
+        sa.Column("owner_id", sa.Integer, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("currency_type", sa.String, nullable=False),
+        sa.Column("season_year", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("credit_total", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("debit_total", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("credit_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("debit_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("issued_total", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("spent_total", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("keeper_lock_total", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint(
+            "league_id", "owner_id", "currency_type", "season_year", name="uq_owner_ledger_balance"
+        ),
+    )
+    op.create_index(
+        "ix_owner_ledger_balances_league_currency",
+        "owner_ledger_balances",
+        ["league_id", "currency_type", "season_year"],
+    )
+
+    if "economic_ledger" in inspector.get_table_names():
+        op.execute(sa.text(_BACKFILL_SQL))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "owner_ledger_balances" not in inspector.get_table_names():
+        return
+
+    op.drop_index("ix_owner_ledger_balances_league_currency", table_name="owner_ledger_balances")
+    op.drop_table("owner_ledger_balances")
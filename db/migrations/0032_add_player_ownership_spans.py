@@ -0,0 +1,98 @@
+"""0032 - add player_ownership_spans
+
+Interval index of player ownership derived from transaction_history: one
+span per row that hands a player to an owner, closed by the player's next
+row in the same league. Point-in-time owner lookups, keeper eligibility
+flags and historical rosters read it instead of scanning history per
+player. Existing history is folded in here; `manage.py
+rebuild-ownership-spans` rebuilds it from history afterwards.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0032_add_player_ownership_spans"
+down_revision = "0031_add_owner_ledger_balances"
+branch_labels = None
+depends_on = None
+
+
+_BACKFILL_SQL = """
+INSERT INTO player_ownership_spans (
+    league_id, player_id, owner_id, started_at, ended_at,
+    transaction_type, ended_by, start_transaction_id, end_transaction_id
+)
+SELECT
+    league_id, player_id, new_owner_id, timestamp, next_timestamp,
+    transaction_type, next_transaction_type, id, next_id
+FROM (
+    SELECT
+        id,
+        league_id,
+        player_id,
+        new_owner_id,
+        timestamp,
+        transaction_type,
+        LEAD(timestamp) OVER player_history AS next_timestamp,
+        LEAD(transaction_type) OVER player_history AS next_transaction_type,
+        LEAD(id) OVER player_history AS next_id
+    FROM transaction_history
+    WHERE timestamp IS NOT NULL
+    WINDOW player_history AS (PARTITION BY league_id, player_id ORDER BY timestamp, id)
+) AS ordered_history
+WHERE new_owner_id IS NOT NULL
+"""
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "player_ownership_spans" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "player_ownership_spans",
+        sa.Column("id", sa.Integer, primary_key=True, index=True, autoincrement=True),
+        sa.Column("league_id", sa.Integer, sa.ForeignKey("leagues.id"), nullable=False),
+        sa.Column("player_id", sa.Integer, sa.ForeignKey("players.id"), nullable=False),
+        sa.Column("owner_id", sa.Integer, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("ended_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("transaction_type", sa.String, nullable=False),
+        sa.Column("ended_by", sa.String, nullable=True),
+        sa.Column("start_transaction_id", sa.Integer, sa.ForeignKey("transaction_history.id"), nullable=False),
+        sa.Column("end_transaction_id", sa.Integer, sa.ForeignKey("transaction_history.id"), nullable=True),
+    )
+    op.create_index(
+        "ix_ownership_spans_league_player_start",
+        "player_ownership_spans",
+        ["league_id", "player_id", "started_at"],
+    )
+    op.create_index(
+        "ix_ownership_spans_league_window",
+        "player_ownership_spans",
+        ["league_id", "started_at", "ended_at"],
+    )
+    op.create_index(
+        "ix_ownership_spans_player_owner",
+        "player_ownership_spans",
+        ["player_id", "owner_id"],
+    )
+
+    if "transaction_history" in inspector.get_table_names():
+        op.execute(sa.text(_BACKFILL_SQL))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if "player_ownership_spans" not in inspector.get_table_names():
+        return
+
+    op.drop_index("ix_ownership_spans_player_owner", table_name="player_ownership_spans")
+    op.drop_index("ix_ownership_spans_league_window", table_name="player_ownership_spans")
+    op.drop_index("ix_ownership_spans_league_player_start", table_name="player_ownership_spans")
+    op.drop_table("player_ownership_spans")
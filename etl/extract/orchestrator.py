@@ -0,0 +1,251 @@
+"""
+Concurrent extraction stage for draft-value sources.
+
+Each source runs in its own worker thread with a wall-clock timeout and a
+bounded number of retries, so a full extract takes about as long as the
+slowest source instead of the sum of all of them. Successful frames are
+written to ``etl/outputs/_source_snapshots/extract`` and reused when a fresh
+snapshot is good enough (``max_snapshot_age``) or when the site fails.
+
+Results are yielded as sources finish so the caller can transform and load
+fast sources while slow ones are still fetching.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pandas as pd
+
+logger = logging.getLogger("etl.extract.orchestrator")
+
+SNAPSHOT_DIR = Path(__file__).resolve().parents[1] / "outputs" / "_source_snapshots" / "extract"
+
+# Read back as text so ids like "00-0033873" keep their leading zeros.
+SNAPSHOT_TEXT_COLUMNS = ("espn_id", "yahoo_id", "draftsharks_id", "gsis_id", "player_id")
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    name: str
+    extract: Callable[[], pd.DataFrame | None]
+    timeout_seconds: float = 120.0
+    retries: int = 1
+    retry_backoff_seconds: float = 2.0
+    max_snapshot_age: timedelta | None = None
+    fallback_to_snapshot: bool = True
+
+
+@dataclass
+class SourceResult:
+    name: str
+    frame: pd.DataFrame | None
+    status: str
+    attempts: int = 0
+    elapsed_seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.frame is not None and not self.frame.empty
+
+
+class _SourceRun:
+    def __init__(self) -> None:
+        self.attempts = 0
+
+
+def snapshot_path(name: str, snapshot_key: str, snapshot_dir: Path = SNAPSHOT_DIR) -> Path:
+    return Path(snapshot_dir) / f"{name}_{snapshot_key}.csv"
+
+
+def write_source_snapshot(
+    name: str,
+    snapshot_key: str,
+    frame: pd.DataFrame,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+) -> Path:
+    path = snapshot_path(name, snapshot_key, snapshot_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".csv.tmp")
+    frame.to_csv(tmp_path, index=False)
+    tmp_path.replace(path)
+    return path
+
+
+def read_source_snapshot(
+    name: str,
+    snapshot_key: str,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+    max_age: timedelta | None = None,
+) -> pd.DataFrame | None:
+    """Return the stored frame, or None if missing/unreadable/older than ``max_age``."""
+    path = snapshot_path(name, snapshot_key, snapshot_dir)
+    if not path.exists():
+        return None
+    if max_age is not None:
+        modified = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+        if datetime.now(timezone.utc) - modified > max_age:
+            return None
+    try:
+        return pd.read_csv(path, dtype={column: str for column in SNAPSHOT_TEXT_COLUMNS})
+    except (OSError, ValueError, pd.errors.EmptyDataError) as exc:
+        logger.warning("Ignoring unreadable snapshot %s: %s", path, exc)
+        return None
+
+
+def _run_source(spec: SourceSpec, run: _SourceRun, deadline: float) -> tuple[pd.DataFrame | None, str | None]:
+    last_error: str | None = None
+    while True:
+        run.attempts += 1
+        try:
+            return spec.extract(), None
+        except Exception as exc:
+            last_error = f"{type(exc).__name__}: {exc}"
+            logger.warning("%s: attempt %d failed: %s", spec.name, run.attempts, last_error)
+
+        if run.attempts > spec.retries:
+            return None, last_error
+        delay = spec.retry_backoff_seconds * (2 ** (run.attempts - 1))
+        if time.monotonic() + delay >= deadline:
+            return None, last_error
+        time.sleep(delay)
+
+
+def _fallback_result(
+    spec: SourceSpec,
+    *,
+    status: str,
+    attempts: int,
+    elapsed: float,
+    error: str | None,
+    snapshot_key: str,
+    snapshot_dir: Path,
+) -> SourceResult:
+    if spec.fallback_to_snapshot:
+        frame = read_source_snapshot(spec.name, snapshot_key, snapshot_dir)
+        if frame is not None and not frame.empty:
+            logger.warning("%s: %s, using last snapshot (%d rows)", spec.name, error or status, len(frame))
+            return SourceResult(spec.name, frame, "stale_snapshot", attempts, elapsed, error)
+    return SourceResult(spec.name, None, status, attempts, elapsed, error)
+
+
+def iter_source_extractions(
+    specs: list[SourceSpec],
+    *,
+    snapshot_key: str,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+    max_workers: int | None = None,
+) -> Iterator[SourceResult]:
+    """Run ``specs`` concurrently and yield one result per source as it finishes.
+
+    Status is one of ``fetched``, ``snapshot`` (fresh cache hit, no fetch),
+    ``stale_snapshot`` (fetch failed, last good snapshot used), ``empty``,
+    ``error`` or ``timeout``. A timed-out worker thread is abandoned rather
+    than killed, so extractors should still pass their own HTTP timeouts.
+    """
+    pending_specs: list[SourceSpec] = []
+    for spec in specs:
+        if spec.max_snapshot_age is not None:
+            cached = read_source_snapshot(spec.name, snapshot_key, snapshot_dir, max_age=spec.max_snapshot_age)
+            if cached is not None and not cached.empty:
+                yield SourceResult(spec.name, cached, "snapshot")
+                continue
+        pending_specs.append(spec)
+
+    if not pending_specs:
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or len(pending_specs),
+        thread_name_prefix="etl-extract",
+    )
+    futures = {}
+    try:
+        for spec in pending_specs:
+            run = _SourceRun()
+            started = time.monotonic()
+            deadline = started + spec.timeout_seconds
+            future = executor.submit(_run_source, spec, run, deadline)
+            futures[future] = (spec, run, started, deadline)
+
+        while futures:
+            next_deadline = min(entry[3] for entry in futures.values())
+            done, _ = wait(
+                list(futures),
+                timeout=max(0.0, next_deadline - time.monotonic()),
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                spec, run, started, _deadline = futures.pop(future)
+                elapsed = time.monotonic() - started
+                frame, error = future.result()
+                if error is not None:
+                    yield _fallback_result(
+                        spec,
+                        status="error",
+                        attempts=run.attempts,
+                        elapsed=elapsed,
+                        error=error,
+                        snapshot_key=snapshot_key,
+                        snapshot_dir=snapshot_dir,
+                    )
+                elif frame is None or frame.empty:
+                    yield _fallback_result(
+                        spec,
+                        status="empty",
+                        attempts=run.attempts,
+                        elapsed=elapsed,
+                        error=None,
+                        snapshot_key=snapshot_key,
+                        snapshot_dir=snapshot_dir,
+                    )
+                else:
+                    try:
+                        write_source_snapshot(spec.name, snapshot_key, frame, snapshot_dir)
+                    except OSError as exc:
+                        logger.warning("%s: could not write snapshot: %s", spec.name, exc)
+                    yield SourceResult(spec.name, frame, "fetched", run.attempts, elapsed)
+
+            now = time.monotonic()
+            for future, (spec, run, started, deadline) in list(futures.items()):
+                if now < deadline:
+                    continue
+                futures.pop(future)
+                future.cancel()
+                yield _fallback_result(
+                    spec,
+                    status="timeout",
+                    attempts=run.attempts,
+                    elapsed=now - started,
+                    error=f"timed out after {spec.timeout_seconds:g}s",
+                    snapshot_key=snapshot_key,
+                    snapshot_dir=snapshot_dir,
+                )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_source_extractions(
+    specs: list[SourceSpec],
+    *,
+    snapshot_key: str,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+    max_workers: int | None = None,
+) -> dict[str, SourceResult]:
+    """Collect :func:`iter_source_extractions` into a dict keyed by source name."""
+    return {
+        result.name: result
+        for result in iter_source_extractions(
+            specs,
+            snapshot_key=snapshot_key,
+            snapshot_dir=snapshot_dir,
+            max_workers=max_workers,
+        )
+    }
@@ -0,0 +1,155 @@
+"""
+Set-based upsert helpers for ETL loads.
+
+PostgreSQL: rows are streamed into a temporary staging table with ``COPY``
+and merged into the target with one ``INSERT ... SELECT ... ON CONFLICT``.
+Other dialects (SQLite in tests/dev): one ``executemany`` of
+``INSERT ... ON CONFLICT DO UPDATE``.
+
+The target table must have a unique constraint on ``conflict_columns``.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import math
+import uuid
+from typing import Any, Iterable
+
+from sqlalchemy import Table, text
+from sqlalchemy.engine import Connection
+
+COPY_NULL_TOKEN = r"\N"
+
+
+def _copy_value(value: Any) -> Any:
+    if value is None:
+        return COPY_NULL_TOKEN
+    if isinstance(value, float) and math.isnan(value):
+        return COPY_NULL_TOKEN
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def _rows_to_csv_buffer(rows: Iterable[dict[str, Any]], columns: list[str]) -> io.StringIO:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(row.get(column)) for column in columns])
+    buffer.seek(0)
+    return buffer
+
+
+def _quote(connection: Connection, name: str) -> str:
+    return connection.dialect.identifier_preparer.quote(name)
+
+
+def _postgres_copy_merge(
+    connection: Connection,
+    table: Table,
+    rows: list[dict[str, Any]],
+    columns: list[str],
+    conflict_columns: list[str],
+    update_columns: list[str],
+) -> None:
+    stage_name = f"_stage_{table.name}_{uuid.uuid4().hex[:8]}"
+    column_list = ", ".join(_quote(connection, column) for column in columns)
+    target_name = _quote(connection, table.name)
+
+    connection.execute(
+        text(
+            f"CREATE TEMP TABLE {stage_name} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {target_name} WITH NO DATA"
+        )
+    )
+
+    buffer = _rows_to_csv_buffer(rows, columns)
+    raw_connection = connection.connection
+    with raw_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {stage_name} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL_TOKEN}')",
+            buffer,
+        )
+
+    conflict_list = ", ".join(_quote(connection, column) for column in conflict_columns)
+    if update_columns:
+        assignments = ", ".join(
+            f"{_quote(connection, column)} = EXCLUDED.{_quote(connection, column)}"
+            for column in update_columns
+        )
+        on_conflict = f"ON CONFLICT ({conflict_list}) DO UPDATE SET {assignments}"
+    else:
+        on_conflict = f"ON CONFLICT ({conflict_list}) DO NOTHING"
+
+    connection.execute(
+        text(
+            f"INSERT INTO {target_name} ({column_list}) "
+            f"SELECT {column_list} FROM {stage_name} {on_conflict}"
+        )
+    )
+    connection.execute(text(f"DROP TABLE IF EXISTS {stage_name}"))
+
+
+def _executemany_upsert(
+    connection: Connection,
+    table: Table,
+    rows: list[dict[str, Any]],
+    columns: list[str],
+    conflict_columns: list[str],
+    update_columns: list[str],
+) -> None:
+    if connection.dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+    statement = dialect_insert(table)
+    if update_columns:
+        statement = statement.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={column: statement.excluded[column] for column in update_columns},
+        )
+    else:
+        statement = statement.on_conflict_do_nothing(index_elements=conflict_columns)
+
+    connection.execute(statement, [{column: row.get(column) for column in columns} for row in rows])
+
+
+def bulk_upsert(
+    connection: Connection,
+    table: Table,
+    rows: list[dict[str, Any]],
+    *,
+    conflict_columns: list[str],
+    update_columns: list[str] | None = None,
+) -> int:
+    """Insert or update ``rows`` into ``table`` in one merge statement.
+
+    Rows with the same conflict key are collapsed (last one wins) before
+    staging, since one ``INSERT ... ON CONFLICT`` cannot touch a row twice.
+    Returns the number of distinct rows merged.
+    """
+    if not rows:
+        return 0
+
+    available = set(table.c.keys())
+    columns = [column for column in rows[0].keys() if column in available]
+    if update_columns is None:
+        update_columns = [column for column in columns if column not in conflict_columns]
+    else:
+        update_columns = [column for column in update_columns if column in columns]
+
+    deduped: dict[tuple, dict[str, Any]] = {}
+    for row in rows:
+        deduped[tuple(row.get(column) for column in conflict_columns)] = row
+    staged_rows = list(deduped.values())
+
+    if connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2":
+        _postgres_copy_merge(connection, table, staged_rows, columns, conflict_columns, update_columns)
+    else:
+        _executemany_upsert(connection, table, staged_rows, columns, conflict_columns, update_columns)
+    return len(staged_rows)
@@ -4,10 +4,10 @@ Load normalized Yahoo draft value data into PostgreSQL tables.
 - Inserts new Player records if no match is found.
 - Updates player_id_mappings with Yahoo ID.
 """
+import math
 import os
 import sys
 import re
-from difflib import SequenceMatcher
 from pathlib import Path
 import pandas as pd
 from sqlalchemy import MetaData, Table, create_engine, select
@@ -24,7 +24,9 @@ if str(repo_root) not in sys.path:
 from backend.models import Player
 from backend.models_draft_value import DraftValue, PlayerIDMapping, PlatformProjection
 from backend.db_config import load_backend_env_file, resolve_database_url
-from etl.transform.normalize import extract_position_rank, normalize_player_name
+from etl.transform.normalize import extract_position_rank
+from etl.transform.player_identity_resolver import PlayerIdentityResolver
+from etl.load.bulk_upsert import bulk_upsert
 from etl.validation.dataframe_validation import validate_normalized_players_dataframe
 from etl.validation.great_expectations_runner import run_normalized_players_expectations
 
@@ -80,65 +82,6 @@ def _row_source_id(row, source_key: str):
     return None
 
 
-def _find_player_by_source_mapping(session, source_key: str, source_id):
-    if source_id in (None, ""):
-        return None
-
-    source_id = str(source_id)
-    query = session.query(PlayerIDMapping)
-    if source_key == "espn":
-        mapping = query.filter(PlayerIDMapping.espn_id == source_id).first()
-    elif source_key == "draftsharks":
-        mapping = query.filter(PlayerIDMapping.draftsharks_id == source_id).first()
-    elif source_key == "yahoo":
-        mapping = query.filter(PlayerIDMapping.yahoo_id == source_id).first()
-    else:
-        mapping = None
-
-    if mapping and mapping.player_id:
-        return session.get(Player, int(mapping.player_id))
-    return None
-
-
-def _find_player_by_exact_identity(session, normalized_name: str, base_position: str | None, team_code: str | None):
-    if not normalized_name or not base_position:
-        return None
-    query = session.query(Player).filter(
-        Player.name == normalized_name,
-        Player.position == base_position,
-    )
-    if team_code:
-        query = query.filter(Player.nfl_team == team_code)
-    return query.order_by(Player.id.desc()).first()
-
-
-def _find_player_by_fuzzy_identity(session, normalized_name: str, base_position: str | None, team_code: str | None):
-    if not normalized_name or not base_position:
-        return None
-    if len(normalized_name) < 4:
-        return None
-
-    query = session.query(Player).filter(Player.position == base_position)
-    if team_code:
-        query = query.filter(Player.nfl_team == team_code)
-
-    candidates = query.limit(500).all()
-    best = None
-    best_score = 0.0
-    target = normalize_player_name(normalized_name)
-    for candidate in candidates:
-        candidate_name = normalize_player_name(candidate.name or "")
-        score = SequenceMatcher(None, target, candidate_name).ratio()
-        if score > best_score:
-            best = candidate
-            best_score = score
-
-    threshold = 0.90 if team_code else 0.96
-    if best is not None and best_score >= threshold:
-        return best
-    return None
-
-
 def _upsert_platform_projection(session, *, player_id: int, source: str, season: int, row_dict: dict):
     existing_rows = (
         session.query(PlatformProjection)
@@ -163,7 +106,40 @@ def _upsert_platform_projection(session, *, player_id: int, source: str, season:
         session.delete(duplicate)
 
 
-def load_normalized_source_to_db(norm_df: pd.DataFrame, season: int, source: str):
+SOURCE_MAPPING_COLUMNS = {
+    "yahoo": "yahoo_id",
+    "espn": "espn_id",
+    "draftsharks": "draftsharks_id",
+}
+
+
+def _python_value(value):
+    # numpy scalars -> builtins, NaN -> None, so rows bind on every driver.
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        try:
+            value = value.item()
+        except (TypeError, ValueError):
+            pass
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _prepare_identity_frame(norm_df: pd.DataFrame) -> pd.DataFrame:
+    work_df = norm_df.copy()
+    work_df['normalized_name'] = work_df['normalized_name'].map(
+        lambda value: str(value or '').strip().lower()
+    )
+    records = work_df.to_dict('records')
+    work_df['_team_code'] = [
+        _normalize_team_code(row.get('team') or row.get('pro_team_id'))
+        for row in records
+    ]
+    work_df['_base_position'] = [_base_position_from_row(row) for row in records]
+    return work_df
+
+
+def _validate_normalized_frame(norm_df: pd.DataFrame) -> None:
     dataframe_report = validate_normalized_players_dataframe(norm_df)
     if not dataframe_report.valid:
         raise ValueError(
@@ -176,38 +152,144 @@ def load_normalized_source_to_db(norm_df: pd.DataFrame, season: int, source: str
             f"Expectation validation failed ({expectation_report.engine}): {expectation_report.details}"
         )
 
+
+def load_normalized_source_to_db(norm_df: pd.DataFrame, season: int, source: str, bulk: bool = True):
+    """Load one normalized source frame into players/mappings/projections.
+
+    ``bulk=True`` (default) resolves identities in memory, creates missing
+    players with a single flush and merges ``player_id_mappings`` and
+    ``platform_projections`` with one ``INSERT ... ON CONFLICT`` each
+    (staged through ``COPY`` on PostgreSQL). ``bulk=False`` keeps the
+    per-row ORM path.
+    """
+    _validate_normalized_frame(norm_df)
+
     session = SessionLocal()
+    try:
+        if bulk:
+            _load_normalized_rows_bulk(session, norm_df, season=season, source=source)
+        else:
+            _load_normalized_rows_individually(session, norm_df, season=season, source=source)
+        session.commit()
+    finally:
+        session.close()
+
+
+def _load_normalized_rows_bulk(session, norm_df: pd.DataFrame, *, season: int, source: str) -> None:
     source_key = _source_key(source)
-    for _, row in norm_df.iterrows():
-        row_data = row.to_dict()
-        normalized_name = str(row_data.get('normalized_name') or '').strip().lower()
-        team_code = _normalize_team_code(row_data.get('team') or row_data.get('pro_team_id'))
-        base_position = _base_position_from_row(row_data)
-
-        # Try to find Player by gsis_id, fallback to name/position/team
-        player = None
-        if row_data.get('gsis_id'):
-            player = session.query(Player).filter_by(gsis_id=row_data['gsis_id']).first()
-        if not player:
-            player = _find_player_by_source_mapping(
-                session,
+    work_df = _prepare_identity_frame(norm_df)
+    resolver = PlayerIdentityResolver.from_session(session)
+    resolved_ids = resolver.resolve_frame(work_df, source_key=source_key)
+
+    # Unresolved rows get pending Player objects registered under negative
+    # placeholder ids so later rows in the same frame still match them.
+    pending_players: dict[int, Player] = {}
+    row_player_refs: list[tuple[dict, int]] = []
+    for index, row in norm_df.iterrows():
+        row_data = {key: _python_value(value) for key, value in row.to_dict().items()}
+        player_ref = resolved_ids.at[index]
+        if player_ref is None:
+            player_ref = resolver.resolve(
+                normalized_name=work_df.at[index, 'normalized_name'],
+                position=work_df.at[index, '_base_position'],
+                team=work_df.at[index, '_team_code'],
+                gsis_id=row_data.get('gsis_id'),
                 source_key=source_key,
                 source_id=_row_source_id(row_data, source_key),
             )
-        if not player:
-            player = _find_player_by_exact_identity(
-                session,
-                normalized_name=normalized_name,
-                base_position=base_position,
-                team_code=team_code,
+        if player_ref is None:
+            player_ref = -(len(pending_players) + 1)
+            player = Player(
+                name=work_df.at[index, 'normalized_name'],
+                position=work_df.at[index, '_base_position'],
+                nfl_team=work_df.at[index, '_team_code'],
+                bye_week=row_data.get('bye_week'),
+                gsis_id=row_data.get('gsis_id'),
             )
-        if not player:
-            player = _find_player_by_fuzzy_identity(
-                session,
+            pending_players[player_ref] = player
+            resolver.register(
+                player_id=player_ref,
+                name=player.name,
+                position=player.position,
+                team=player.nfl_team,
+                gsis_id=player.gsis_id,
+            )
+        resolver.register_source_id(source_key, _row_source_id(row_data, source_key), player_ref)
+        row_player_refs.append((row_data, player_ref))
+
+    if pending_players:
+        session.add_all(pending_players.values())
+        session.flush()  # one round trip for every new player id
+
+    def _player_id(player_ref: int) -> int:
+        if player_ref < 0:
+            return int(pending_players[player_ref].id)
+        return int(player_ref)
+
+    mapping_column = SOURCE_MAPPING_COLUMNS.get(source_key)
+    mapping_rows = []
+    projection_rows = []
+    for row_data, player_ref in row_player_refs:
+        player_id = _player_id(player_ref)
+        mapping_row = {"player_id": player_id}
+        if mapping_column:
+            mapping_row[mapping_column] = row_data.get(mapping_column)
+        mapping_rows.append(mapping_row)
+        projection_rows.append(
+            {
+                "player_id": player_id,
+                "source": source,
+                "season": season,
+                "projected_points": row_data.get('projected_points'),
+                "adp": row_data.get('adp'),
+                "auction_value": row_data.get('auction_value'),
+                "position_rank": extract_position_rank(row_data.get('position_rank')),
+                "raw_json": row_data,
+            }
+        )
+
+    connection = session.connection()
+    bulk_upsert(
+        connection,
+        PlayerIDMapping.__table__,
+        mapping_rows,
+        conflict_columns=["player_id"],
+    )
+    bulk_upsert(
+        connection,
+        PlatformProjection.__table__,
+        projection_rows,
+        conflict_columns=["player_id", "source", "season"],
+    )
+
+
+def _load_normalized_rows_individually(session, norm_df: pd.DataFrame, *, season: int, source: str) -> None:
+    source_key = _source_key(source)
+
+    # Resolve every row against an in-memory identity index built once per
+    # load instead of up to four queries (and a 500-row fuzzy scan) per row.
+    work_df = _prepare_identity_frame(norm_df)
+    resolver = PlayerIdentityResolver.from_session(session)
+    resolved_ids = resolver.resolve_frame(work_df, source_key=source_key)
+
+    for index, row in norm_df.iterrows():
+        row_data = row.to_dict()
+        normalized_name = work_df.at[index, 'normalized_name']
+        team_code = work_df.at[index, '_team_code']
+        base_position = work_df.at[index, '_base_position']
+
+        player_id = resolved_ids.at[index]
+        if player_id is None:
+            # Rows earlier in this load may have created the player already.
+            player_id = resolver.resolve(
                 normalized_name=normalized_name,
-                base_position=base_position,
-                team_code=team_code,
+                position=base_position,
+                team=team_code,
+                gsis_id=row_data.get('gsis_id'),
+                source_key=source_key,
+                source_id=_row_source_id(row_data, source_key),
             )
+        player = session.get(Player, int(player_id)) if player_id is not None else None
         if not player:
             player = Player(
                 name=normalized_name,
@@ -218,6 +300,14 @@ def load_normalized_source_to_db(norm_df: pd.DataFrame, season: int, source: str
             )
             session.add(player)
             session.flush()  # Get new player.id
+            resolver.register(
+                player_id=int(player.id),
+                name=player.name,
+                position=player.position,
+                team=player.nfl_team,
+                gsis_id=player.gsis_id,
+            )
+        resolver.register_source_id(source_key, _row_source_id(row_data, source_key), int(player.id))
 
         # Update player_id_mappings for each source
         mapping = session.query(PlayerIDMapping).filter_by(player_id=player.id).first()
@@ -239,11 +329,23 @@ def load_normalized_source_to_db(norm_df: pd.DataFrame, season: int, source: str
             row_dict=row_data,
         )
 
-    session.commit()
-    session.close()
+
+def _draft_value_row_values(row, available_columns: set[str]) -> dict[str, object]:
+    values: dict[str, object] = {}
+    if "avg_auction_value" in available_columns:
+        values["avg_auction_value"] = float(row.get("predicted_auction_value") or 0)
+    if "median_adp" in available_columns:
+        values["median_adp"] = float(row.get("median_bid") or 0)
+    if "consensus_tier" in available_columns:
+        values["consensus_tier"] = str(row.get("consensus_tier") or "C")
+    if "value_over_replacement" in available_columns:
+        values["value_over_replacement"] = float(row.get("value_over_replacement") or 0)
+    if "last_updated" in available_columns:
+        values["last_updated"] = pd.Timestamp.utcnow().isoformat()
+    return values
 
 
-def load_historical_rankings_to_db(rankings_df: pd.DataFrame, season: int):
+def load_historical_rankings_to_db(rankings_df: pd.DataFrame, season: int, bulk: bool = True):
     required_columns = {
         "player_id",
         "predicted_auction_value",
@@ -262,20 +364,27 @@ def load_historical_rankings_to_db(rankings_df: pd.DataFrame, season: int):
         draft_values = Table("draft_values", MetaData(), autoload_with=engine)
         available_columns = set(draft_values.c.keys())
 
+        if bulk:
+            rows = [
+                {
+                    "player_id": int(row["player_id"]),
+                    "season": season,
+                    **_draft_value_row_values(row, available_columns),
+                }
+                for _, row in rankings_df.iterrows()
+            ]
+            bulk_upsert(
+                session.connection(),
+                draft_values,
+                rows,
+                conflict_columns=["player_id", "season"],
+            )
+            session.commit()
+            return
+
         for _, row in rankings_df.iterrows():
             player_id = int(row["player_id"])
-
-            values: dict[str, object] = {}
-            if "avg_auction_value" in available_columns:
-                values["avg_auction_value"] = float(row.get("predicted_auction_value") or 0)
-            if "median_adp" in available_columns:
-                values["median_adp"] = float(row.get("median_bid") or 0)
-            if "consensus_tier" in available_columns:
-                values["consensus_tier"] = str(row.get("consensus_tier") or "C")
-            if "value_over_replacement" in available_columns:
-                values["value_over_replacement"] = float(row.get("value_over_replacement") or 0)
-            if "last_updated" in available_columns:
-                values["last_updated"] = pd.Timestamp.utcnow().isoformat()
+            values = _draft_value_row_values(row, available_columns)
 
             existing_id = session.execute(
                 select(draft_values.c.id).where(
@@ -0,0 +1,115 @@
+import time
+from datetime import timedelta
+
+import pandas as pd
+
+from etl.extract.orchestrator import (
+    SourceSpec,
+    iter_source_extractions,
+    run_source_extractions,
+    write_source_snapshot,
+)
+
+
+def _fixture_frame(name, rows=2):
+    return pd.DataFrame(
+        [
+            {"normalized_name": f"{name} player {i}", "position": "WR", "team": "KC", "adp": float(i), "espn_id": f"00{i}"}
+            for i in range(1, rows + 1)
+        ]
+    )
+
+
+def _slow_source(name, delay, rows=2):
+    def _extract():
+        time.sleep(delay)
+        return _fixture_frame(name, rows)
+
+    return SourceSpec(name, _extract, timeout_seconds=5)
+
+
+def test_sources_run_concurrently_and_yield_in_completion_order(tmp_path):
+    specs = [_slow_source("slow", 0.6), _slow_source("fast", 0.1), _slow_source("medium", 0.3)]
+
+    started = time.monotonic()
+    results = list(iter_source_extractions(specs, snapshot_key="2026", snapshot_dir=tmp_path))
+    elapsed = time.monotonic() - started
+
+    assert [r.name for r in results] == ["fast", "medium", "slow"]
+    assert all(r.status == "fetched" and r.ok for r in results)
+    # Close to the slowest source (0.6s), well under the 1.0s sequential sum.
+    assert elapsed < 0.95
+    assert (tmp_path / "fast_2026.csv").exists()
+
+
+def test_failed_attempt_is_retried(tmp_path):
+    calls = []
+
+    def _flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ConnectionError("reset by peer")
+        return _fixture_frame("flaky")
+
+    results = run_source_extractions(
+        [SourceSpec("flaky", _flaky, retries=2, retry_backoff_seconds=0.01)],
+        snapshot_key="2026",
+        snapshot_dir=tmp_path,
+    )
+
+    assert results["flaky"].status == "fetched"
+    assert results["flaky"].attempts == 2
+
+
+def test_timeout_falls_back_to_last_snapshot(tmp_path):
+    write_source_snapshot("hung", "2026", _fixture_frame("hung", rows=3), tmp_path)
+
+    def _hung():
+        time.sleep(2)
+        return _fixture_frame("hung")
+
+    started = time.monotonic()
+    results = run_source_extractions(
+        [SourceSpec("hung", _hung, timeout_seconds=0.2), _slow_source("ok", 0.05)],
+        snapshot_key="2026",
+        snapshot_dir=tmp_path,
+    )
+
+    assert time.monotonic() - started < 1.0
+    assert results["ok"].status == "fetched"
+    assert results["hung"].status == "stale_snapshot"
+    assert "timed out" in results["hung"].error
+    assert len(results["hung"].frame) == 3
+    # Ids round-trip as text, leading zeros intact.
+    assert results["hung"].frame["espn_id"].tolist() == ["001", "002", "003"]
+
+
+def test_fresh_snapshot_skips_extract(tmp_path):
+    write_source_snapshot("cached", "2026", _fixture_frame("cached"), tmp_path)
+
+    def _should_not_run():
+        raise AssertionError("extract called despite fresh snapshot")
+
+    results = run_source_extractions(
+        [SourceSpec("cached", _should_not_run, max_snapshot_age=timedelta(hours=1))],
+        snapshot_key="2026",
+        snapshot_dir=tmp_path,
+    )
+
+    assert results["cached"].status == "snapshot"
+    assert results["cached"].ok
+
+
+def test_error_without_snapshot_reports_failure(tmp_path):
+    def _broken():
+        raise ValueError("bad payload")
+
+    results = run_source_extractions(
+        [SourceSpec("broken", _broken, retries=0)],
+        snapshot_key="2026",
+        snapshot_dir=tmp_path,
+    )
+
+    assert results["broken"].status == "error"
+    assert results["broken"].frame is None
+    assert "bad payload" in results["broken"].error
@@ -20,3 +20,87 @@ def test_load_normalized_source_to_db_rejects_invalid_dataframe_before_db_write(
         load_normalized_source_to_db(invalid_df, season=2026, source="Yahoo")
 
     assert "validation failed" in str(exc.value).lower()
+
+
+def test_load_normalized_source_to_db_resolves_identities_in_memory(monkeypatch):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    import etl.load.load_to_postgres as loader
+    from backend.database import Base
+    from backend.models import Player
+    from backend.models_draft_value import PlatformProjection, PlayerIDMapping
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(bind=engine)
+    monkeypatch.setattr(loader, "SessionLocal", TestingSessionLocal)
+
+    seed = TestingSessionLocal()
+    seed.add(Player(name="justin jefferson", position="WR", nfl_team="MIN"))
+    seed.commit()
+    existing_id = seed.query(Player.id).scalar()
+    seed.close()
+
+    norm_df = pd.DataFrame(
+        [
+            {"normalized_name": "justin jeferson", "position": "WR", "team": "MIN", "adp": 1.5, "espn_id": "4262921"},
+            {"normalized_name": "new rookie", "position": "RB", "team": "NYJ", "adp": 80.0, "espn_id": "500"},
+            {"normalized_name": "new rookie", "position": "RB", "team": "NYJ", "adp": 81.0, "espn_id": "500"},
+        ]
+    )
+    loader.load_normalized_source_to_db(norm_df, season=2026, source="ESPN")
+
+    check = TestingSessionLocal()
+    try:
+        players = check.query(Player).order_by(Player.id).all()
+        assert [p.name for p in players] == ["justin jefferson", "new rookie"]
+        mapping = check.query(PlayerIDMapping).filter_by(player_id=existing_id).one()
+        assert mapping.espn_id == "4262921"
+        assert check.query(PlatformProjection).count() == 2
+    finally:
+        check.close()
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+def test_load_normalized_source_to_db_reload_updates_rows_in_place(monkeypatch, bulk):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    import etl.load.load_to_postgres as loader
+    from backend.database import Base
+    from backend.models_draft_value import PlatformProjection, PlayerIDMapping
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(bind=engine)
+    monkeypatch.setattr(loader, "SessionLocal", TestingSessionLocal)
+
+    first = pd.DataFrame(
+        [
+            {"normalized_name": "bijan robinson", "position": "RB", "team": "ATL", "adp": 3.0, "espn_id": "1"},
+            {"normalized_name": "puka nacua", "position": "WR", "team": "LAR", "adp": 9.0, "espn_id": "2"},
+        ]
+    )
+    second = first.assign(adp=[2.0, 11.0])
+
+    loader.load_normalized_source_to_db(first, season=2026, source="ESPN", bulk=bulk)
+    loader.load_normalized_source_to_db(second, season=2026, source="ESPN", bulk=bulk)
+
+    check = TestingSessionLocal()
+    try:
+        projections = check.query(PlatformProjection).order_by(PlatformProjection.player_id).all()
+        assert [p.adp for p in projections] == [2.0, 11.0]
+        assert check.query(PlayerIDMapping).count() == 2
+    finally:
+        check.close()
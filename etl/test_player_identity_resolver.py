@@ -0,0 +1,76 @@
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from etl.transform.normalize import normalize_player_name
+from etl.transform.player_identity_resolver import PlayerIdentityResolver
+
+
+def _resolver():
+    resolver = PlayerIdentityResolver()
+    resolver.register(player_id=1, name="patrick mahomes", position="QB", team="KC", gsis_id="00-001")
+    resolver.register(player_id=2, name="travis kelce", position="TE", team="KC")
+    resolver.register(player_id=3, name="amon-ra st brown", position="WR", team="DET")
+    resolver.register(player_id=4, name="travis kelce", position="TE", team="KC")
+    resolver.register_source_id("espn", "3139477", 1)
+    return resolver
+
+
+def _frame(rows):
+    frame = pd.DataFrame(rows)
+    frame["_base_position"] = frame["position"]
+    frame["_team_code"] = frame["team"]
+    return frame
+
+
+def test_resolve_frame_follows_gsis_mapping_exact_then_fuzzy_order():
+    frame = _frame(
+        [
+            {"normalized_name": "someone else", "position": "QB", "team": "KC", "gsis_id": "00-001", "espn_id": None},
+            {"normalized_name": "pat mahomes ii", "position": "QB", "team": "KC", "gsis_id": None, "espn_id": "3139477"},
+            {"normalized_name": "travis kelce", "position": "TE", "team": "KC", "gsis_id": None, "espn_id": None},
+            {"normalized_name": "amon-ra st. brown", "position": "WR", "team": "DET", "gsis_id": None, "espn_id": None},
+            {"normalized_name": "unknown rookie", "position": "RB", "team": "NYJ", "gsis_id": None, "espn_id": None},
+        ]
+    )
+
+    resolved = _resolver().resolve_frame(frame, source_key="espn")
+
+    # Exact matches prefer the newest player id, mirroring ORDER BY id DESC.
+    assert resolved.tolist() == [1, 1, 4, 3, None]
+
+
+def test_registered_players_resolve_for_later_rows_in_same_load():
+    resolver = PlayerIdentityResolver()
+    assert resolver.resolve(normalized_name="new rookie", position="RB", team="NYJ") is None
+
+    resolver.register(player_id=10, name="new rookie", position="RB", team="NYJ")
+
+    assert resolver.resolve(normalized_name="new rookie", position="RB", team="NYJ") == 10
+    assert resolver.resolve(normalized_name="new rookie", position="RB", team=None) == 10
+
+
+def test_fuzzy_match_agrees_with_full_sequence_matcher_scan():
+    names = [
+        "justin jefferson",
+        "justin jeffers",
+        "jaylen waddle",
+        "jalen hurts",
+        "ja'marr chase",
+        "jamarr chase",
+        "jordan addison",
+    ]
+    resolver = PlayerIdentityResolver()
+    for player_id, name in enumerate(names, start=1):
+        resolver.register(player_id=player_id, name=name, position="WR", team="MIN")
+
+    for target in ["justin jeferson", "jamar chase", "jordan adison", "nobody here"]:
+        best_id, best_score = None, 0.0
+        normalized_target = normalize_player_name(target)
+        for player_id, name in enumerate(names, start=1):
+            score = SequenceMatcher(None, normalized_target, normalize_player_name(name)).ratio()
+            if score > best_score:
+                best_id, best_score = player_id, score
+        expected = best_id if best_score >= 0.90 else None
+
+        assert resolver.resolve(normalized_name=target, position="WR", team="MIN") == expected
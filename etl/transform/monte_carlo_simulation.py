@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, TYPE_CHECKING
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, TYPE_CHECKING
+import hashlib
+import json
 import math
 import random
 
@@ -94,6 +96,36 @@ class MonteCarloDbInputs:
     ranking_season: int
 
 
+# Called with (iterations completed, team metric rows produced since the last call).
+SimulationProgressCallback = Callable[[int, list[dict[str, object]]], None]
+
+
+def _frame_digest(frame: pd.DataFrame) -> bytes:
+    if frame.empty:
+        return b"|".join(str(column).encode("utf-8") for column in frame.columns)
+    try:
+        hashed = pd.util.hash_pandas_object(frame, index=False).values.tobytes()
+    except TypeError:
+        hashed = frame.to_json(orient="split", index=False, default_handler=str).encode("utf-8")
+    return "|".join(str(column) for column in frame.columns).encode("utf-8") + hashed
+
+
+def monte_carlo_inputs_fingerprint(inputs: MonteCarloDbInputs) -> str:
+    """Content hash of the simulation inputs, for caching simulation results."""
+    digest = hashlib.sha256()
+    for frame in (inputs.draft_results_df, inputs.players_df, inputs.historical_rankings_df, inputs.budget_df):
+        digest.update(_frame_digest(frame))
+        digest.update(b"\x00")
+    digest.update(json.dumps(inputs.bid_stats_map, sort_keys=True, default=str).encode("utf-8"))
+    digest.update(str(inputs.ranking_season).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def simulation_config_fingerprint(config: SimulationConfig) -> str:
+    encoded = json.dumps(asdict(config), sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
 def _parse_money(value: object, fallback: float = 0.0) -> float:
     if value is None:
         return fallback
@@ -576,8 +608,11 @@ def run_monte_carlo_draft_simulation(
     budget_df: pd.DataFrame | None = None,
     yearly_results_df: pd.DataFrame | None = None,
     config: SimulationConfig | None = None,
+    progress: SimulationProgressCallback | None = None,
+    progress_every: int | None = None,
 ) -> MonteCarloSimulationResult:
     cfg = config or SimulationConfig()
+    report_every = max(1, int(progress_every or math.ceil(cfg.iterations / 20)))
     budget_df = budget_df if budget_df is not None else pd.DataFrame()
     yearly_results_df = yearly_results_df if yearly_results_df is not None else pd.DataFrame()
 
@@ -601,6 +636,7 @@ def run_monte_carlo_draft_simulation(
 
     all_picks: list[dict[str, object]] = []
     all_team_metrics: list[dict[str, object]] = []
+    reported_metrics = 0
     for iteration_index in range(1, cfg.iterations + 1):
         iteration_seed = rng.randint(1, 10_000_000)
         iteration_rng = random.Random(iteration_seed)
@@ -615,6 +651,9 @@ def run_monte_carlo_draft_simulation(
         )
         all_picks.extend(picks)
         all_team_metrics.extend(metrics)
+        if progress is not None and (iteration_index % report_every == 0 or iteration_index == cfg.iterations):
+            progress(iteration_index, all_team_metrics[reported_metrics:])
+            reported_metrics = len(all_team_metrics)
 
     draft_picks_df = pd.DataFrame(
         all_picks,
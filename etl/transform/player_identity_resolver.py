@@ -0,0 +1,271 @@
+"""
+In-memory player identity resolution for ETL loads.
+
+Builds blocked indexes of existing players once per load and resolves whole
+normalized source DataFrames against them, replacing the per-row
+gsis/mapping/exact/fuzzy query chain in ``load_normalized_source_to_db``.
+
+Resolution order matches the original loader:
+1. gsis_id
+2. source-specific id mapping (espn / draftsharks / yahoo)
+3. exact (name, position[, team]) match, newest player id wins
+4. fuzzy name match within the (position[, team]) block
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from etl.transform.normalize import normalize_player_name
+
+FUZZY_MIN_NAME_LENGTH = 4
+FUZZY_THRESHOLD_WITH_TEAM = 0.90
+FUZZY_THRESHOLD_WITHOUT_TEAM = 0.96
+
+SOURCE_ID_COLUMNS = {
+    "espn": "espn_id",
+    "draftsharks": "draftsharks_id",
+    "yahoo": "yahoo_id",
+}
+
+
+@dataclass
+class _Candidate:
+    player_id: int
+    fuzzy_name: str
+    matcher: SequenceMatcher
+
+
+def _clean_id(value) -> str | None:
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    text = str(value).strip()
+    if not text or text.lower() in {"nan", "none", "null"}:
+        return None
+    return text
+
+
+class PlayerIdentityResolver:
+    """Blocked index over known players, built once and updated as new
+    players are created during the same load."""
+
+    def __init__(self) -> None:
+        self._by_gsis: dict[str, int] = {}
+        self._by_source: dict[str, dict[str, int]] = defaultdict(dict)
+        self._exact_with_team: dict[tuple[str, str, str], int] = {}
+        self._exact_any_team: dict[tuple[str, str], int] = {}
+        self._block_with_team: dict[tuple[str, str], list[_Candidate]] = defaultdict(list)
+        self._block_any_team: dict[str, list[_Candidate]] = defaultdict(list)
+
+    @classmethod
+    def from_session(cls, session) -> "PlayerIdentityResolver":
+        from backend.models import Player
+        from backend.models_draft_value import PlayerIDMapping
+
+        resolver = cls()
+        player_rows = (
+            session.query(Player.id, Player.name, Player.position, Player.nfl_team, Player.gsis_id)
+            .order_by(Player.id.asc())
+            .all()
+        )
+        for player_id, name, position, nfl_team, gsis_id in player_rows:
+            resolver.register(
+                player_id=int(player_id),
+                name=name,
+                position=position,
+                team=nfl_team,
+                gsis_id=gsis_id,
+            )
+
+        mapping_rows = session.query(
+            PlayerIDMapping.player_id,
+            PlayerIDMapping.espn_id,
+            PlayerIDMapping.draftsharks_id,
+            PlayerIDMapping.yahoo_id,
+        ).order_by(PlayerIDMapping.id.asc()).all()
+        for player_id, espn_id, draftsharks_id, yahoo_id in mapping_rows:
+            if player_id is None:
+                continue
+            for source_key, source_id in (
+                ("espn", espn_id),
+                ("draftsharks", draftsharks_id),
+                ("yahoo", yahoo_id),
+            ):
+                resolver.register_source_id(source_key, source_id, int(player_id))
+        return resolver
+
+    def register(
+        self,
+        *,
+        player_id: int,
+        name: str | None,
+        position: str | None,
+        team: str | None,
+        gsis_id: str | None = None,
+    ) -> None:
+        """Add a player to every index. Later (higher) ids win exact matches."""
+        gsis = _clean_id(gsis_id)
+        if gsis and gsis not in self._by_gsis:
+            self._by_gsis[gsis] = player_id
+
+        raw_name = name or ""
+        position_key = str(position or "").strip()
+        team_key = str(team or "").strip()
+        if not position_key:
+            return
+
+        self._exact_any_team[(raw_name, position_key)] = player_id
+        if team_key:
+            self._exact_with_team[(raw_name, position_key, team_key)] = player_id
+
+        fuzzy_name = normalize_player_name(raw_name)
+        candidate = _Candidate(
+            player_id=player_id,
+            fuzzy_name=fuzzy_name,
+            # seq2 is the cached side in difflib; index the candidate once
+            # so each lookup only pays for set_seq1(target).
+            matcher=SequenceMatcher(None, "", fuzzy_name, autojunk=True),
+        )
+        self._block_any_team[position_key].append(candidate)
+        if team_key:
+            self._block_with_team[(position_key, team_key)].append(candidate)
+
+    def register_source_id(self, source_key: str, source_id, player_id: int) -> None:
+        cleaned = _clean_id(source_id)
+        if cleaned and cleaned not in self._by_source[source_key]:
+            self._by_source[source_key][cleaned] = player_id
+
+    def _fuzzy_match(self, normalized_name: str, position: str, team: str | None) -> int | None:
+        if len(normalized_name) < FUZZY_MIN_NAME_LENGTH:
+            return None
+
+        if team:
+            block = self._block_with_team.get((position, team), [])
+            threshold = FUZZY_THRESHOLD_WITH_TEAM
+        else:
+            block = self._block_any_team.get(position, [])
+            threshold = FUZZY_THRESHOLD_WITHOUT_TEAM
+
+        target = normalize_player_name(normalized_name)
+        target_length = len(target)
+        best_id = None
+        best_score = 0.0
+        for candidate in block:
+            # Cheap upper bounds first (length bound, then quick_ratio());
+            # skip anything that cannot beat the current best or reach the
+            # acceptance threshold.
+            floor = max(best_score, threshold - 1e-12)
+            total_length = target_length + len(candidate.fuzzy_name)
+            if total_length == 0:
+                continue
+            if 2.0 * min(target_length, len(candidate.fuzzy_name)) / total_length <= floor:
+                continue
+            matcher = candidate.matcher
+            matcher.set_seq1(target)
+            if matcher.quick_ratio() <= floor:
+                continue
+            score = matcher.ratio()
+            if score > best_score:
+                best_id = candidate.player_id
+                best_score = score
+                if score >= 1.0:
+                    break
+
+        if best_id is not None and best_score >= threshold:
+            return best_id
+        return None
+
+    def resolve(
+        self,
+        *,
+        normalized_name: str,
+        position: str | None,
+        team: str | None,
+        gsis_id=None,
+        source_key: str | None = None,
+        source_id=None,
+    ) -> int | None:
+        gsis = _clean_id(gsis_id)
+        if gsis and gsis in self._by_gsis:
+            return self._by_gsis[gsis]
+
+        cleaned_source_id = _clean_id(source_id)
+        if source_key and cleaned_source_id:
+            mapped = self._by_source.get(source_key, {}).get(cleaned_source_id)
+            if mapped is not None:
+                return mapped
+
+        if not normalized_name or not position:
+            return None
+
+        if team:
+            exact = self._exact_with_team.get((normalized_name, position, team))
+        else:
+            exact = self._exact_any_team.get((normalized_name, position))
+        if exact is not None:
+            return exact
+
+        return self._fuzzy_match(normalized_name, position, team)
+
+    def resolve_frame(
+        self,
+        frame: pd.DataFrame,
+        *,
+        source_key: str | None = None,
+        name_column: str = "normalized_name",
+        position_column: str = "_base_position",
+        team_column: str = "_team_code",
+    ) -> pd.Series:
+        """Resolve every row of ``frame``; unresolved rows are ``None``.
+
+        Id and exact lookups are done with column-wise ``map`` calls; only the
+        rows left over fall through to the per-row fuzzy matcher.
+        """
+        if frame.empty:
+            return pd.Series([], index=frame.index, dtype=object)
+
+        names = frame[name_column].fillna("").astype(str)
+        positions = frame[position_column].fillna("").astype(str)
+        teams = frame[team_column].fillna("").astype(str)
+
+        resolved = pd.Series([None] * len(frame), index=frame.index, dtype=object)
+
+        if "gsis_id" in frame.columns:
+            gsis = frame["gsis_id"].map(_clean_id)
+            resolved = resolved.where(resolved.notna(), gsis.map(self._by_gsis.get))
+
+        id_column = SOURCE_ID_COLUMNS.get(source_key or "")
+        if id_column and id_column in frame.columns:
+            source_ids = frame[id_column].map(_clean_id)
+            resolved = resolved.where(
+                resolved.notna(),
+                source_ids.map(self._by_source.get(source_key, {}).get),
+            )
+
+        identifiable = (names != "") & (positions != "")
+        with_team_keys = pd.Series(list(zip(names, positions, teams)), index=frame.index)
+        any_team_keys = pd.Series(list(zip(names, positions)), index=frame.index)
+        exact = with_team_keys.map(self._exact_with_team.get).where(
+            teams != "",
+            any_team_keys.map(self._exact_any_team.get),
+        )
+        resolved = resolved.where(resolved.notna() | ~identifiable, exact)
+
+        pending = resolved.isna() & identifiable
+        for index in frame.index[pending]:
+            team = teams.at[index] or None
+            resolved.at[index] = self._fuzzy_match(names.at[index], positions.at[index], team)
+
+        return pd.Series(
+            [None if pd.isna(value) else int(value) for value in resolved],
+            index=frame.index,
+            dtype=object,
+        )